@@ -4,14 +4,23 @@
 """
 
 import argparse
+import os
+import random
 import sys
-from typing import Dict, Type
+from typing import Callable, Dict, List, Optional, Type
 
 __version__ = "0.1.0"
-from src.generators.sorting_generator import SortingGenerator
-from src.generators.searching_generator import SearchingGenerator
-from src.generators.math_generator import MathGenerator
+from src.cli import audit, batch, calibrate, dist, fuzz, plan, render, stress, suite
+from src.cli.common import FORMATS, default_answer
+from src.generators import GENERATORS
+from src.generators.base_generator import BaseGenerator
+from src.generators.buffers import ARRAY_TYPES
+from src.utils.append import SuiteAppender, SuiteManifest
 from src.utils.exporter import Exporter
+from src.utils.pipeline import Pipeline
+from src.utils.profiling import Profiler
+from src.utils.reference import ANSWER_FORMATS, ENCODINGS, ReferencePool
+from src.utils.serializers import JSON_SERIALIZERS
 
 # ... остальной код без изменений
 
@@ -19,16 +28,24 @@ from src.utils.exporter import Exporter
 class TestCaseGeneratorCLI:
     """Командный интерфейс для генератора тестовых случаев"""
 
-    GENERATORS: Dict[str, Type] = {
-        "sorting": SortingGenerator,
-        "searching": SearchingGenerator,
-        "math": MathGenerator,
-    }
+    GENERATORS: Dict[str, Type] = GENERATORS
 
-    FORMATS = ["json", "yaml", "python"]
+    FORMATS = FORMATS
 
     def __init__(self) -> None:
         self.parser = self._create_parser()
+        self.commands: Dict[str, Callable[[List[str]], None]] = {
+            "batch": batch.main,
+            "plan": plan.main,
+            "calibrate": calibrate.main,
+            "run": suite.main,
+            "stress": stress.main,
+            "render": render.main,
+            "fuzz": fuzz.main,
+            "dist": dist.main,
+            "validate": audit.validate,
+            "stats": audit.stats,
+        }
 
     def _create_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser(
@@ -38,7 +55,25 @@ class TestCaseGeneratorCLI:
 Примеры использования:
   %(prog)s sorting -n 10 -o tests.json
   %(prog)s searching --format yaml
+  %(prog)s searching -n 100 --queries 1000 -f jsonl
+  %(prog)s sorting -n 1000 -f json,yaml,python,markdown -o suite
+  %(prog)s sorting --seed 42 --counter-rng --case 123456 -o case.json
   %(prog)s math --no-edge-cases
+  %(prog)s sorting -n 100000 --oracle-command ./ref --oracle-encoding tokens
+  %(prog)s spec --spec examples/binary_search_spec.yaml -n 1000
+  %(prog)s batch jobs.yaml -w 8
+  %(prog)s plan suite.jsonl --budget 2.0 -o planned.jsonl
+  %(prog)s calibrate sorting --problem sort --time-limit 1.0
+  %(prog)s sorting -n 50 --calibration calibration.json --problem sort
+  %(prog)s run suite.jsonl --solution solutions.sort:solve --fail-fast
+  %(prog)s run suite.jsonl --solution solutions.sort:solve -w 4 --timeout 2
+  %(prog)s stress -n 100000000 --memory-limit 256 -o stress.jsonl
+  %(prog)s render sorting -n 20 -o statement.md
+  %(prog)s fuzz searching --candidate solutions.search:solve -o fuzz.json
+  %(prog)s dist submit sorting -n 100000000 --seed 1 --queue q.db -o big.jsonl
+  %(prog)s dist worker --queue q.db
+  %(prog)s validate suite.jsonl -w 8 --fail-on-duplicates
+  %(prog)s stats suite.parquet --json
             """,
         )
 
@@ -67,9 +102,11 @@ class TestCaseGeneratorCLI:
         parser.add_argument(
             "-f",
             "--format",
-            choices=self.FORMATS,
+            type=self._parse_formats,
             default="json",
-            help="Формат выходного файла (по умолчанию: json)",
+            help="Формат выходного файла или несколько форматов через запятую: "
+            f"{', '.join(self.FORMATS)} (по умолчанию: json). Для нескольких "
+            "форматов расширение имени -o заменяется расширением формата",
         )
 
         parser.add_argument(
@@ -78,6 +115,233 @@ class TestCaseGeneratorCLI:
             help="Не включать крайние случаи",
         )
 
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="Начальное значение генератора случайных чисел",
+        )
+
+        parser.add_argument(
+            "--counter-rng",
+            action="store_true",
+            help="Вычислять случай k по (--seed, k) независимо от остальных: "
+            "результат не зависит от числа потоков и порядка генерации "
+            "(sorting, searching, math)",
+        )
+
+        parser.add_argument(
+            "--case",
+            type=int,
+            default=None,
+            metavar="K",
+            help="Записать только обычный случай с номером K (с 0); "
+            "требует --counter-rng",
+        )
+
+        parser.add_argument(
+            "--spec",
+            type=str,
+            default=None,
+            help="YAML спецификация входных данных (для типа задачи spec)",
+        )
+
+        parser.add_argument(
+            "--adversarial-size",
+            type=int,
+            default=0,
+            help="Добавить состязательные случаи этой длины (sorting, searching)",
+        )
+
+        parser.add_argument(
+            "--array-type",
+            choices=ARRAY_TYPES,
+            default="list",
+            help="Представление массивов в памяти: list, array('q') или NumPy "
+            "(sorting, searching; по умолчанию: list)",
+        )
+
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=0,
+            help="Количество запросов к одному массиву в случае поиска: ответы "
+            "вычисляются сразу для всех двоичным поиском (searching)",
+        )
+
+        parser.add_argument(
+            "--calibration",
+            type=str,
+            default=None,
+            help="JSON файл профилей калибровки (testgen calibrate)",
+        )
+
+        parser.add_argument(
+            "--problem",
+            type=str,
+            default=None,
+            help="Задача в файле --calibration, параметры размера которой "
+            "подставляются в генератор",
+        )
+
+        parser.add_argument(
+            "--oracle-cache",
+            type=str,
+            default=None,
+            help="SQLite файл кэша ожидаемых результатов эталонных решений",
+        )
+
+        parser.add_argument(
+            "--oracle-command",
+            type=str,
+            default=None,
+            help="Внешняя эталонная программа для ожидаемых результатов: "
+            "получает пакеты \"T, затем T входов\" на stdin и печатает T "
+            "строк ответов и строку #end",
+        )
+
+        parser.add_argument(
+            "--oracle-task",
+            type=str,
+            default=None,
+            help="Задача генератора, ответы которой вычисляет программа "
+            "(по умолчанию: основная задача генератора)",
+        )
+
+        parser.add_argument(
+            "--oracle-encoding",
+            choices=ENCODINGS,
+            default="json",
+            help="Кодировка входов: json - строка JSON, tokens - числа и массивы "
+            "\"длина, элементы\" (по умолчанию: json)",
+        )
+
+        parser.add_argument(
+            "--oracle-answer",
+            choices=list(ANSWER_FORMATS),
+            default=None,
+            help="Формат строки ответа (по умолчанию: json для кодировки json, "
+            "по задаче для tokens)",
+        )
+
+        parser.add_argument(
+            "--oracle-processes",
+            type=int,
+            default=None,
+            help="Количество процессов эталонной программы (по умолчанию: "
+            "число ядер)",
+        )
+
+        parser.add_argument(
+            "--oracle-batch-size",
+            type=int,
+            default=1000,
+            help="Входов в пакете эталонной программы (по умолчанию: 1000)",
+        )
+
+        parser.add_argument(
+            "--oracle-timeout",
+            type=float,
+            default=10.0,
+            help="Предельное время ответа на пакет, секунды (по умолчанию: 10)",
+        )
+
+        parser.add_argument(
+            "--oracle-oneshot",
+            action="store_true",
+            help="Запускать программу заново для каждого пакета (для решений, "
+            "которые обрабатывают один ввод и завершаются)",
+        )
+
+        parser.add_argument(
+            "--append",
+            action="store_true",
+            help="Дописать недостающие случаи до -n в существующий файл (jsonl)",
+        )
+
+        parser.add_argument(
+            "--dedup",
+            action="store_true",
+            help="При дозаписи перегенерировать случаи, уже имеющиеся в файле",
+        )
+
+        parser.add_argument(
+            "--compact",
+            action="store_true",
+            help="Компактная запись JSON/YAML без отступов",
+        )
+
+        parser.add_argument(
+            "--json-backend",
+            choices=["auto"] + list(JSON_SERIALIZERS.keys()),
+            default="auto",
+            help="Реализация JSON (по умолчанию: самая быстрая установленная)",
+        )
+
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Размер фрагмента конвейера генерации (по умолчанию: 1000)",
+        )
+
+        parser.add_argument(
+            "--generator-workers",
+            type=int,
+            default=1,
+            help="Количество потоков генерации; из-за GIL ускоряют только "
+            "генерацию, ожидающую ввода-вывода (кэш ответов, --oracle-command), "
+            "для параллельной генерации на ядрах - --generator-processes "
+            "(по умолчанию: 1)",
+        )
+
+        parser.add_argument(
+            "--serializer-workers",
+            type=int,
+            default=1,
+            help="Количество потоков сериализации (по умолчанию: 1)",
+        )
+
+        parser.add_argument(
+            "--generator-processes",
+            type=int,
+            default=0,
+            help="Генерировать в отдельных процессах; длинные массивы "
+            "передаются через общую память (по умолчанию: 0 - в потоках)",
+        )
+
+        parser.add_argument(
+            "--validate",
+            action="store_true",
+            help="Проверять сгенерированные случаи перед записью",
+        )
+
+        parser.add_argument(
+            "--profile-out",
+            type=str,
+            default=None,
+            help="Файл для метрик профилирования (.json или .prom)",
+        )
+
+        parser.add_argument(
+            "--profile-format",
+            choices=["json", "prometheus"],
+            default=None,
+            help="Формат метрик (по умолчанию: по расширению файла)",
+        )
+
+        parser.add_argument(
+            "--cprofile",
+            action="store_true",
+            help="Сохранить профиль cProfile в <profile-out>.pstats",
+        )
+
+        parser.add_argument(
+            "--trace-memory",
+            action="store_true",
+            help="Отслеживать выделения памяти через tracemalloc",
+        )
+
         parser.add_argument(
             "--verbose",
             action="store_true",
@@ -90,46 +354,237 @@ class TestCaseGeneratorCLI:
 
         return parser
 
-    def run(self) -> None:
+    def _parse_formats(self, value: str) -> List[str]:
+        """Разбор списка форматов через запятую"""
+        formats = [name.strip() for name in value.split(",") if name.strip()]
+        unknown = [name for name in formats if name not in self.FORMATS]
+        if not formats or unknown:
+            raise argparse.ArgumentTypeError(
+                f"неизвестный формат: {', '.join(unknown) or value} "
+                f"(допустимы: {', '.join(self.FORMATS)})"
+            )
+        return formats
+
+    def run(self, argv: Optional[List[str]] = None) -> None:
         """Запуск CLI интерфейса"""
-        args = self.parser.parse_args()
+        argv = sys.argv[1:] if argv is None else argv
+
+        if argv and argv[0] in self.commands:
+            self.commands[argv[0]](argv[1:])
+            return
+
+        args = self.parser.parse_args(argv)
+        oracle_cache = None
+        reference = None
 
         try:
+            if args.counter_rng and args.seed is None:
+                raise ValueError("--counter-rng требует --seed")
+            if args.case is not None and not args.counter_rng:
+                raise ValueError("--case требует --counter-rng")
+            seed = args.seed if args.counter_rng else None
+
             # Создание генератора
             generator_class = self.GENERATORS[args.task_type]
-            generator = generator_class()
+            calibrated = calibrate.calibrated_params(args)
+            if args.task_type == "spec":
+                if calibrated:
+                    raise ValueError("калибровка недоступна для типа задачи spec")
+                if not args.spec:
+                    raise ValueError("для типа задачи spec требуется --spec FILE")
+                generator = generator_class(spec=args.spec)
+            elif args.task_type in ("sorting", "searching"):
+                if args.queries and args.task_type != "searching":
+                    raise ValueError("--queries доступен только для searching")
+                # Параметры командной строки важнее параметров профиля
+                extra = dict(calibrated)
+                if args.queries:
+                    extra["queries"] = args.queries
+                if args.array_type != "list" or "array_type" not in extra:
+                    extra["array_type"] = args.array_type
+                generator = generator_class(
+                    adversarial_size=args.adversarial_size, seed=seed, **extra
+                )
+            elif args.adversarial_size or args.array_type != "list" or args.queries:
+                raise ValueError(
+                    "состязательные случаи, --array-type и --queries доступны "
+                    "для sorting и searching"
+                )
+            else:
+                generator = generator_class(seed=seed, **calibrated)
+
+            if args.counter_rng and not generator.supports_random_access():
+                raise ValueError(
+                    f"--counter-rng недоступен для типа задачи {args.task_type}"
+                )
+
+            if args.oracle_command:
+                reference = self._use_reference(args, generator)
 
-            # Генерация тестовых случаев
-            test_cases = generator.generate_normal_cases(args.normal_cases)
+            if args.oracle_cache:
+                oracle_cache = generator.use_oracle_cache(args.oracle_cache)
 
-            if not args.no_edge_cases:
-                edge_cases = generator.generate_edge_cases()
-                test_cases.extend(edge_cases)
+            Exporter.use_json_backend(args.json_backend)
+
+            if args.seed is not None:
+                random.seed(args.seed)
+
+            outputs = Exporter.output_names(args.output, args.format)
+
+            if args.case is not None:
+                # Случай вычисляется по (seed, K) без генерации предыдущих
+                case = generator.generate_case(args.case)
+                for fmt, filename in outputs.items():
+                    Exporter.export([case], filename, fmt, args.compact)
+                if args.verbose:
+                    print(f"✅ {case.description}")
+                    for filename in outputs.values():
+                        print(f"📁 Результат сохранен в {filename}")
+                return
+
+            if args.append:
+                if (
+                    len(args.format) != 1
+                    or args.format[0] not in Exporter.APPENDABLE_FORMATS
+                ):
+                    raise ValueError(
+                        f"дозапись поддерживается только для форматов "
+                        f"{', '.join(Exporter.APPENDABLE_FORMATS)}"
+                    )
+                if os.path.exists(args.output):
+                    self._append(args, generator)
+                    return
+
+            profiler = None
+            if args.profile_out:
+                profiler = Profiler(
+                    cprofile=args.cprofile, trace_memory=args.trace_memory
+                )
+                profiler.instrument(generator)
+                profiler.start()
+
+            # Генерация, сериализация и запись выполняются конвейером
+            pipeline = Pipeline(
+                generator,
+                fmt=args.format,
+                chunk_size=args.chunk_size,
+                generator_workers=args.generator_workers,
+                serializer_workers=args.serializer_workers,
+                generator_processes=args.generator_processes,
+                compact=args.compact,
+                validate=args.validate,
+                profiler=profiler,
+            )
+            stats = pipeline.run(
+                args.normal_cases,
+                outputs,
+                include_edge_cases=not args.no_edge_cases,
+            )
+
+            if profiler is not None:
+                profiler.stop()
+                profiler.dump(args.profile_out, args.profile_format)
+
+            for fmt, filename in outputs.items():
+                if fmt in Exporter.APPENDABLE_FORMATS:
+                    SuiteManifest.record(
+                        filename,
+                        stats.normal_cases,
+                        stats.edge_cases,
+                        task_type=args.task_type,
+                        seed=args.seed,
+                        counter_rng=args.counter_rng,
+                    )
 
             # Вывод информации
             if args.verbose:
-                print(f"✅ Сгенерировано {len(test_cases)} тестовых случаев")
-                print(f"📊 Нормальных случаев: {args.normal_cases}")
-                print(f"🚨 Крайних случаев: {0 if args.no_edge_cases else len(edge_cases)}")
-
-            # Экспорт
-            if args.format == "json":
-                Exporter.to_json(test_cases, args.output)
-            elif args.format == "yaml":
-                Exporter.to_yaml(test_cases, args.output)
-            elif args.format == "python":
-                Exporter.to_python(test_cases, args.output)
+                print(f"✅ Сгенерировано {stats.total_cases} тестовых случаев")
+                print(f"📊 Нормальных случаев: {stats.normal_cases}")
+                print(f"🚨 Крайних случаев: {stats.edge_cases}")
+                for stage in stats.stages:
+                    print(
+                        f"⏱️  {stage.name}: {stage.busy_time:.3f} с работы, "
+                        f"{stage.wait_time:.3f} с ожидания, "
+                        f"{stage.chunks} фрагментов, потоков: {stage.workers}"
+                    )
+                print(
+                    f"💾 Записано {stats.bytes_written} байт за {stats.elapsed:.3f} с"
+                )
+                for filename in outputs.values():
+                    print(f"📁 Результат сохранен в {filename}")
+                if profiler is not None:
+                    print(f"📈 Метрики профилирования сохранены в {args.profile_out}")
 
-            if args.verbose:
-                print(f"📁 Результат сохранен в {args.output}")
+            if stats.validation_errors:
+                for error in stats.validation_errors:
+                    print(f"⚠️  {error}", file=sys.stderr)
+                sys.exit(1)
 
         except Exception as e:
             print(f"❌ Ошибка: {e}", file=sys.stderr)
             sys.exit(1)
 
+        finally:
+            if oracle_cache is not None:
+                oracle_cache.close()
+            if reference is not None:
+                reference.close()
+
+    def _use_reference(
+        self, args: argparse.Namespace, generator: BaseGenerator
+    ) -> ReferencePool:
+        """Подключение внешней эталонной программы к задаче генератора"""
+        task = args.oracle_task
+        if task is None:
+            task = "searching_many" if args.queries else next(iter(generator.ORACLES))
+        if task not in generator.ORACLES:
+            raise ValueError(
+                f"неизвестная задача оракула {task} "
+                f"(допустимы: {', '.join(generator.ORACLES)})"
+            )
+
+        pool = ReferencePool(
+            args.oracle_command,
+            processes=args.oracle_processes,
+            batch_size=args.oracle_batch_size,
+            timeout=args.oracle_timeout,
+            encoding=args.oracle_encoding,
+            answer=args.oracle_answer
+            or default_answer(args.oracle_encoding, task),
+            persistent=not args.oracle_oneshot,
+        )
+        # Ответы другой программы не должны браться из кэша этой
+        generator.set_oracle(
+            task, pool.solve, version=args.oracle_command, solve_many=pool.solve_many
+        )
+        return pool
+
+    def _append(self, args: argparse.Namespace, generator: BaseGenerator) -> None:
+        """Дозапись недостающих обычных случаев в существующий набор"""
+        appender = SuiteAppender(
+            generator,
+            args.output,
+            fmt=args.format[0],
+            task_type=args.task_type,
+            chunk_size=args.chunk_size,
+        )
+        result = appender.append(args.normal_cases, dedup=args.dedup)
+
+        if args.verbose:
+            print(f"✅ Дописано {result.added} тестовых случаев")
+            print(f"📊 Нормальных случаев в наборе: {result.normal_cases}")
+            print(f"📦 Всего случаев в наборе: {result.total_cases}")
+            if args.dedup:
+                print(f"🔁 Перегенерировано дубликатов: {result.regenerated_duplicates}")
+            print(f"💾 Записано {result.bytes_written} байт в {args.output}")
+
 
 def main() -> None:
     """Точка входа"""
+    # Откалиброванные факториалы и числа Фибоначчи длиннее ограничения
+    # Python на перевод целых в строку (4300 цифр)
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)
     cli = TestCaseGeneratorCLI()
     cli.run()
 
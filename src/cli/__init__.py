@@ -0,0 +1,6 @@
+"""
+Подкоманды командного интерфейса
+
+Каждый модуль содержит парсер аргументов своей команды (create_parser)
+и ее обработчик; main.py связывает их с именами команд.
+"""
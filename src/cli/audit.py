@@ -0,0 +1,162 @@
+"""
+Команды validate и stats: проверка и статистика набора тестов из файла
+"""
+
+import argparse
+import sys
+from typing import List
+
+from src.utils.audit import DEFAULT_CHUNK_SIZE, AuditReport, SuiteAuditor
+from src.utils.loader import LOADABLE_FORMATS
+
+
+def create_parser(command: str, description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog=f"testgen {command}", description=description
+    )
+
+    parser.add_argument(
+        "suite",
+        type=str,
+        help="Файл набора тестов (jsonl, parquet и arrow читаются по частям)",
+    )
+
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=LOADABLE_FORMATS,
+        default=None,
+        help="Формат файла (по умолчанию: по расширению)",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Количество процессов проверки частей (по умолчанию: число ядер)",
+    )
+
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Строк jsonl в части (по умолчанию: {DEFAULT_CHUNK_SIZE})",
+    )
+
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=20,
+        help="Сколько ошибок и пар дубликатов вывести (по умолчанию: 20)",
+    )
+
+    parser.add_argument(
+        "--fail-on-duplicates",
+        action="store_true",
+        help="Завершаться с ошибкой, если в наборе есть дубликаты",
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Вывести отчет в формате JSON",
+    )
+
+    return parser
+
+
+def validate(argv: List[str]) -> None:
+    """Проверка набора из файла"""
+    args = create_parser(
+        "validate", "Проверка набора тестов из файла за один проход"
+    ).parse_args(argv)
+    report = _audit(args)
+
+    if not args.json:
+        for error in report.errors:
+            print(f"💥 {error}")
+        if report.error_count > len(report.errors):
+            print(f"... и еще {report.error_count - len(report.errors)} ошибок")
+        _print_duplicates(report)
+        status = "✅ Набор корректен" if report.ok else (
+            f"❌ Ошибок: {report.error_count}"
+        )
+        print(f"{status}: {report.cases} случаев")
+        _print_throughput(report)
+    _exit_on_audit(args, report)
+
+
+def stats(argv: List[str]) -> None:
+    """Статистика набора из файла"""
+    args = create_parser(
+        "stats", "Покрытие, дубликаты и ошибки набора тестов из файла"
+    ).parse_args(argv)
+    report = _audit(args)
+
+    if not args.json:
+        coverage = report.coverage
+        print(
+            f"📊 Случаев: {coverage['total_cases']} "
+            f"(обычных {coverage['normal_cases']}, "
+            f"крайних {coverage['edge_cases']}, "
+            f"{coverage['edge_percentage']:.1f}%)"
+        )
+        print(
+            f"⚖️  Вес: {coverage['total_weight']:.2f} "
+            f"(обычных {coverage['normal_weight']:.2f}, "
+            f"крайних {coverage['edge_weight']:.2f})"
+        )
+        if coverage["input_size_mean"] is not None:
+            print(
+                f"📏 Размер входных данных: от {coverage['input_size_min']} "
+                f"до {coverage['input_size_max']}, "
+                f"в среднем {coverage['input_size_mean']:.1f}"
+            )
+        _print_duplicates(report)
+        print(f"{'✅' if report.ok else '❌'} Ошибок: {report.error_count}")
+        _print_throughput(report)
+    _exit_on_audit(args, report)
+
+
+def _audit(args: argparse.Namespace) -> AuditReport:
+    """Проверка набора для validate и stats"""
+    try:
+        auditor = SuiteAuditor(
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            max_errors=args.max_errors,
+        )
+        report = auditor.audit(args.suite, args.format)
+    except Exception as e:
+        print(f"❌ Ошибка: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(report.model_dump_json(indent=2))
+    return report
+
+
+def _print_duplicates(report: AuditReport) -> None:
+    if not report.duplicate_count:
+        return
+    pairs = ", ".join(f"{first}={index}" for first, index in report.duplicates)
+    more = report.duplicate_count - len(report.duplicates)
+    print(
+        f"⚠️  Дубликатов: {report.duplicate_count} ({pairs}"
+        + (f" и еще {more}" if more > 0 else "")
+        + ")"
+    )
+
+
+def _print_throughput(report: AuditReport) -> None:
+    print(
+        f"⏱️  {report.bytes} байт ({report.format}) за {report.elapsed:.3f} с: "
+        f"{report.cases_per_second:.0f} случаев/с, "
+        f"{report.megabytes_per_second:.2f} МБ/с, процессов: {report.workers}"
+    )
+
+
+def _exit_on_audit(args: argparse.Namespace, report: AuditReport) -> None:
+    if not report.ok or (args.fail_on_duplicates and report.duplicate_count):
+        sys.exit(1)
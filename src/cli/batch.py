@@ -0,0 +1,72 @@
+"""
+Команда batch: пакетная генерация наборов тестов по YAML-манифесту
+"""
+
+import argparse
+import sys
+from typing import List
+
+from src.utils.batch import BatchRunner
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="testgen batch",
+        description="Пакетная генерация наборов тестов по YAML-манифесту",
+    )
+
+    parser.add_argument(
+        "manifest",
+        type=str,
+        help="YAML файл со списком заданий",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Количество процессов генерации задания (по умолчанию: число ядер)",
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Подробный вывод по каждому заданию",
+    )
+
+    return parser
+
+
+def main(argv: List[str]) -> None:
+    """Выполнение пакета заданий из манифеста"""
+    args = create_parser().parse_args(argv)
+
+    try:
+        runner = BatchRunner.from_yaml(args.manifest, workers=args.workers)
+        report = runner.run()
+
+        if args.verbose:
+            for result in report.results:
+                print(
+                    f"📁 {result.output}: {result.cases} случаев, "
+                    f"{result.bytes} байт "
+                    f"(генерация {result.generation_time:.3f} с, "
+                    f"сериализация {result.serialization_time:.3f} с)"
+                )
+                if result.statement:
+                    print(
+                        f"📝 {result.statement}: {result.statement_bytes} байт "
+                        f"(шаблон {result.render_time:.3f} с)"
+                    )
+
+        print(
+            f"✅ Заданий: {len(report.results)}, случаев: {report.total_cases}, "
+            f"за {report.elapsed:.2f} с "
+            f"({report.cases_per_second:.0f} случаев/с, "
+            f"{report.megabytes_per_second:.2f} МБ/с)"
+        )
+
+    except Exception as e:
+        print(f"❌ Ошибка: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,288 @@
+"""
+Команда calibrate: подбор размеров входных данных по времени
+эталонного решения
+"""
+
+import argparse
+import sys
+from typing import Any, Callable, Dict, List
+
+from src.cli.common import GENERATORS, default_answer
+from src.generators.buffers import ARRAY_TYPES
+from src.utils.calibration import (
+    SIZE_PARAMETERS,
+    CalibrationProfiles,
+    Calibrator,
+    machine_name,
+    size_parameter,
+)
+from src.utils.loader import import_callable
+from src.utils.reference import ANSWER_FORMATS, ENCODINGS, ReferencePool
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="testgen calibrate",
+        description="Подбор размеров входных данных по времени эталонного "
+        "решения на текущей машине",
+    )
+
+    parser.add_argument(
+        "task_type",
+        choices=list(SIZE_PARAMETERS),
+        help="Тип задачи",
+    )
+
+    parser.add_argument(
+        "--problem",
+        type=str,
+        required=True,
+        help="Имя задачи в файле профилей",
+    )
+
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        required=True,
+        help="Ограничение времени задачи, секунды",
+    )
+
+    parser.add_argument(
+        "--fraction",
+        type=float,
+        default=0.5,
+        help="Доля ограничения времени для самых больших случаев "
+        "(по умолчанию: 0.5)",
+    )
+
+    parser.add_argument(
+        "--parameter",
+        type=str,
+        default=None,
+        help="Параметр размера генератора: "
+        + "; ".join(
+            f"{task_type}: {', '.join(parameters)}"
+            for task_type, parameters in SIZE_PARAMETERS.items()
+        )
+        + " (по умолчанию: первый)",
+    )
+
+    parser.add_argument(
+        "--reference",
+        type=str,
+        default=None,
+        help="Эталонное решение module:function (по умолчанию: оракул "
+        "генератора)",
+    )
+
+    parser.add_argument(
+        "--reference-command",
+        type=str,
+        default=None,
+        help="Эталонная программа с протоколом --oracle-command вместо "
+        "--reference",
+    )
+
+    parser.add_argument(
+        "--reference-encoding",
+        choices=ENCODINGS,
+        default="json",
+        help="Кодировка входов эталонной программы (по умолчанию: json)",
+    )
+
+    parser.add_argument(
+        "--reference-answer",
+        choices=list(ANSWER_FORMATS),
+        default=None,
+        help="Формат строки ответа эталонной программы (по умолчанию: как "
+        "у --oracle-answer)",
+    )
+
+    parser.add_argument(
+        "--queries",
+        type=int,
+        default=0,
+        help="Количество запросов к одному массиву (searching)",
+    )
+
+    parser.add_argument(
+        "--array-type",
+        choices=ARRAY_TYPES,
+        default="list",
+        help="Представление массивов (sorting и searching)",
+    )
+
+    parser.add_argument(
+        "--start",
+        type=int,
+        default=None,
+        help="Размер первого измерения",
+    )
+
+    parser.add_argument(
+        "--growth",
+        type=float,
+        default=2.0,
+        help="Множитель размера между измерениями (по умолчанию: 2.0)",
+    )
+
+    parser.add_argument(
+        "--max-size",
+        type=int,
+        default=None,
+        help="Наибольший проверяемый размер",
+    )
+
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=3,
+        help="Количество входов каждого размера (по умолчанию: 3)",
+    )
+
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="Количество запусков на каждом входе (по умолчанию: 3)",
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed входов калибровки (по умолчанию: 0)",
+    )
+
+    parser.add_argument(
+        "--profiles",
+        type=str,
+        default="calibration.json",
+        help="JSON файл профилей (по умолчанию: calibration.json)",
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Вывести измерения",
+    )
+
+    return parser
+
+
+def main(argv: List[str]) -> None:
+    """Калибровка параметра размера генератора"""
+    args = create_parser().parse_args(argv)
+    reference = None
+
+    try:
+        parameter = args.parameter or next(iter(SIZE_PARAMETERS[args.task_type]))
+        if args.time_limit <= 0 or not 0 < args.fraction <= 1:
+            raise ValueError(
+                "ограничение времени должно быть положительным, "
+                "а доля - из (0, 1]"
+            )
+
+        fixed: Dict[str, Any] = {}
+        if args.task_type in ("sorting", "searching"):
+            if args.queries and args.task_type != "searching":
+                raise ValueError("--queries доступен только для searching")
+            if args.array_type != "list":
+                fixed["array_type"] = args.array_type
+            if args.queries:
+                fixed["queries"] = args.queries
+        elif args.queries or args.array_type != "list":
+            raise ValueError(
+                "--queries и --array-type доступны для sorting и searching"
+            )
+
+        oracle = size_parameter(args.task_type, parameter).oracle(fixed)
+        solution: Callable[[Any], Any]
+        if args.reference_command:
+            reference = ReferencePool(
+                args.reference_command,
+                processes=1,
+                batch_size=1,
+                timeout=None,
+                encoding=args.reference_encoding,
+                answer=args.reference_answer
+                or default_answer(args.reference_encoding, oracle),
+            )
+            solution = reference.solve
+        elif args.reference:
+            solution = import_callable(args.reference)
+        else:
+            solution = GENERATORS[args.task_type].ORACLES[oracle]
+
+        calibrator = Calibrator(
+            solution, samples=args.samples, repeats=args.repeats, seed=args.seed
+        )
+        result = calibrator.calibrate(
+            args.task_type,
+            parameter,
+            args.time_limit * args.fraction,
+            params=fixed,
+            start=args.start,
+            growth=args.growth,
+            max_size=args.max_size,
+        )
+
+        profiles = CalibrationProfiles(args.profiles)
+        profile = profiles.record(
+            args.problem,
+            args.task_type,
+            result,
+            args.time_limit,
+            args.fraction,
+            fixed=fixed,
+        )
+        profiles.save()
+
+    except Exception as e:
+        print(f"❌ Ошибка: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if reference is not None:
+            reference.close()
+
+    if args.verbose:
+        for sample in result.samples:
+            print(f"⏱️  {parameter}={sample.size}: {sample.seconds:.6f} с")
+    if result.reached:
+        growth = ""
+        if result.exponent:
+            growth = f", время ~ размер^{result.exponent:.2f}"
+        print(
+            f"✅ {parameter} = {result.size}: {result.target:.3f} с "
+            f"({args.fraction:.0%} ограничения времени){growth}"
+        )
+    else:
+        print(
+            f"⚠️  Целевое время {result.target:.3f} с не достигнуто, "
+            f"{parameter} = {result.size} (граница поиска)"
+        )
+    print(
+        f"📁 Профиль {args.problem} сохранен в {args.profiles}: "
+        + ", ".join(f"{name}={value}" for name, value in profile.params.items())
+    )
+
+
+def calibrated_params(args: argparse.Namespace) -> Dict[str, Any]:
+    """Параметры генератора из профиля калибровки"""
+    if not args.calibration and not args.problem:
+        return {}
+    if not (args.calibration and args.problem):
+        raise ValueError("--calibration и --problem указываются вместе")
+
+    profile = CalibrationProfiles(args.calibration).get(args.problem)
+    if profile.task_type != args.task_type:
+        raise ValueError(
+            f"задача {args.problem} откалибрована для типа {profile.task_type}"
+        )
+    if profile.machine != machine_name():
+        print(
+            f"⚠️  Профиль {args.problem} откалиброван на другой машине "
+            f"({profile.machine})",
+            file=sys.stderr,
+        )
+    return profile.generator_params()
@@ -0,0 +1,16 @@
+"""
+Общие константы и функции подкоманд командного интерфейса
+"""
+
+from src.generators import GENERATORS
+from src.utils.reference import TOKEN_ANSWERS
+
+# Форматы вывода наборов тестов
+FORMATS = ["json", "jsonl", "yaml", "python", "markdown", "parquet", "arrow"]
+
+
+def default_answer(encoding: str, task: str) -> str:
+    """Формат ответа эталонной программы по умолчанию"""
+    if encoding == "tokens":
+        return TOKEN_ANSWERS.get(task, "int")
+    return "json"
@@ -0,0 +1,298 @@
+"""
+Команда dist: распределенная генерация набора тестов
+"""
+
+import argparse
+import sys
+from typing import Any, Dict, List, Optional
+
+from src.cli.common import GENERATORS
+from src.generators.buffers import ARRAY_TYPES
+from src.utils.distributed import (
+    DEFAULT_LEASE,
+    DISTRIBUTED_FORMATS,
+    Coordinator,
+    DistributedJob,
+    Worker,
+    open_queue,
+)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="testgen dist",
+        description="Распределенная генерация: координатор делит задание на "
+        "фрагменты в очереди, исполнители на разных узлах генерируют части "
+        "файла, координатор склеивает их",
+    )
+    actions = parser.add_subparsers(dest="action", required=True)
+
+    queue_help = (
+        "Очередь фрагментов: путь к SQLite файлу на общей файловой системе "
+        "или адрес <схема>://<путь>"
+    )
+
+    submit = actions.add_parser("submit", help="Поставить задание в очередь")
+    submit.add_argument(
+        "task_type",
+        choices=[name for name in sorted(GENERATORS) if name != "spec"],
+        help="Тип задачи",
+    )
+    submit.add_argument("--queue", required=True, help=queue_help)
+    submit.add_argument(
+        "--seed",
+        type=int,
+        required=True,
+        help="Начальное значение: случай k строится по (seed, k)",
+    )
+    submit.add_argument(
+        "-n",
+        "--normal-cases",
+        type=int,
+        default=5,
+        help="Количество обычных тестовых случаев (по умолчанию: 5)",
+    )
+    submit.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default="test_cases.jsonl",
+        help="Итоговый файл (по умолчанию: test_cases.jsonl)",
+    )
+    submit.add_argument(
+        "-f",
+        "--format",
+        choices=DISTRIBUTED_FORMATS,
+        default="jsonl",
+        help="Формат итогового файла (по умолчанию: jsonl)",
+    )
+    submit.add_argument(
+        "--chunk-size",
+        type=int,
+        default=10000,
+        help="Случаев во фрагменте очереди (по умолчанию: 10000)",
+    )
+    submit.add_argument(
+        "--no-edge-cases",
+        action="store_true",
+        help="Не включать крайние случаи",
+    )
+    submit.add_argument(
+        "--compact",
+        action="store_true",
+        help="Компактная запись JSON/YAML без отступов",
+    )
+    submit.add_argument(
+        "--adversarial-size",
+        type=int,
+        default=0,
+        help="Добавить состязательные случаи этой длины (sorting, searching)",
+    )
+    submit.add_argument(
+        "--array-type",
+        choices=ARRAY_TYPES,
+        default="list",
+        help="Представление массивов в памяти (sorting, searching)",
+    )
+    submit.add_argument(
+        "--queries",
+        type=int,
+        default=0,
+        help="Количество запросов к одному массиву (searching)",
+    )
+    submit.add_argument(
+        "--shard-dir",
+        type=str,
+        default=None,
+        help="Общий каталог частей (по умолчанию: <output>.shards)",
+    )
+    submit.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="Сколько раз выполнять фрагмент до отказа (по умолчанию: 3)",
+    )
+    submit.add_argument(
+        "--job-id",
+        type=str,
+        default=None,
+        help="Идентификатор задания (по умолчанию: случайный)",
+    )
+    submit.add_argument(
+        "--wait",
+        action="store_true",
+        help="Дождаться выполнения и склеить итоговый файл",
+    )
+
+    worker = actions.add_parser("worker", help="Выполнять фрагменты из очереди")
+    worker.add_argument("--queue", required=True, help=queue_help)
+    worker.add_argument(
+        "--name",
+        type=str,
+        default=None,
+        help="Имя исполнителя (по умолчанию: узел и номер процесса)",
+    )
+    worker.add_argument(
+        "--lease",
+        type=float,
+        default=DEFAULT_LEASE,
+        help="Время на фрагмент, после которого он выдается другому "
+        f"исполнителю, секунды (по умолчанию: {DEFAULT_LEASE:.0f})",
+    )
+    worker.add_argument(
+        "--max-chunks",
+        type=int,
+        default=None,
+        help="Завершиться после этого числа фрагментов",
+    )
+    worker.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=0.0,
+        help="Сколько ждать новых фрагментов при пустой очереди, секунды "
+        "(по умолчанию: завершиться сразу)",
+    )
+
+    status = actions.add_parser("status", help="Состояние заданий")
+    status.add_argument("--queue", required=True, help=queue_help)
+    status.add_argument(
+        "job_id", nargs="?", default=None, help="Задание (по умолчанию: все)"
+    )
+
+    merge = actions.add_parser("merge", help="Склеить части в итоговый файл")
+    merge.add_argument("--queue", required=True, help=queue_help)
+    merge.add_argument("job_id", help="Идентификатор задания")
+    merge.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        help="Итоговый файл (по умолчанию: из задания)",
+    )
+    merge.add_argument(
+        "--wait",
+        action="store_true",
+        help="Дождаться выполнения всех фрагментов",
+    )
+    merge.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Предельное время ожидания, секунды",
+    )
+    merge.add_argument(
+        "--keep-shards",
+        action="store_true",
+        help="Не удалять части после склейки",
+    )
+
+    return parser
+
+
+def main(argv: List[str]) -> None:
+    """Распределенная генерация через очередь фрагментов"""
+    args = create_parser().parse_args(argv)
+    work_queue = None
+
+    try:
+        work_queue = open_queue(args.queue)
+        coordinator = Coordinator(work_queue)
+
+        if args.action == "submit":
+            params: Dict[str, Any] = {}
+            if args.task_type in ("sorting", "searching"):
+                if args.queries and args.task_type != "searching":
+                    raise ValueError("--queries доступен только для searching")
+                params = {
+                    "adversarial_size": args.adversarial_size,
+                    "array_type": args.array_type,
+                }
+                if args.queries:
+                    params["queries"] = args.queries
+            elif args.adversarial_size or args.array_type != "list" or args.queries:
+                raise ValueError(
+                    "состязательные случаи, --array-type и --queries доступны "
+                    "для sorting и searching"
+                )
+
+            job = DistributedJob(
+                task_type=args.task_type,
+                output=args.output,
+                seed=args.seed,
+                normal_cases=args.normal_cases,
+                edge_cases=not args.no_edge_cases,
+                chunk_size=args.chunk_size,
+                params=params,
+                format=args.format,
+                compact=args.compact,
+                shard_dir=args.shard_dir,
+                max_attempts=args.max_attempts,
+            )
+            job_id = coordinator.submit(job, args.job_id)
+            chunks = len(work_queue.chunks(job_id))
+            print(f"✅ Задание {job_id}: {chunks} фрагментов в очереди")
+            if args.wait:
+                _merge(coordinator, job_id, wait=True)
+
+        elif args.action == "worker":
+            worker = Worker(work_queue, name=args.name, lease=args.lease)
+            report = worker.run(
+                max_chunks=args.max_chunks, idle_timeout=args.idle_timeout
+            )
+            print(
+                f"✅ Исполнитель {report.worker}: {report.chunks} фрагментов, "
+                f"{report.cases} случаев, {report.bytes} байт "
+                f"за {report.elapsed:.2f} с"
+            )
+            if report.failures:
+                print(f"⚠️  Ошибок при выполнении: {report.failures}")
+
+        elif args.action == "status":
+            for job_id in [args.job_id] if args.job_id else work_queue.jobs():
+                status = coordinator.status(job_id)
+                print(
+                    f"📦 {job_id}: готово {status.done} из {status.chunks} "
+                    f"фрагментов ({status.cases} случаев), "
+                    f"выполняется {status.running}, ожидает {status.pending}, "
+                    f"отказов {status.failed}, повторов {status.retries}"
+                )
+                for error in status.errors:
+                    print(f"💥 {error}")
+
+        else:
+            _merge(
+                coordinator,
+                args.job_id,
+                wait=args.wait,
+                timeout=args.timeout,
+                output=args.output,
+                keep_shards=args.keep_shards,
+            )
+
+    except Exception as e:
+        print(f"❌ Ошибка: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    finally:
+        if work_queue is not None:
+            work_queue.close()
+
+
+def _merge(
+    coordinator: Coordinator,
+    job_id: str,
+    wait: bool = False,
+    timeout: Optional[float] = None,
+    output: Optional[str] = None,
+    keep_shards: bool = False,
+) -> None:
+    """Ожидание задания и склейка итогового файла"""
+    if wait:
+        coordinator.wait(job_id, timeout=timeout)
+    report = coordinator.merge(job_id, output=output, keep_shards=keep_shards)
+    print(
+        f"✅ Склеено {report.chunks} частей: {report.normal_cases} обычных и "
+        f"{report.edge_cases} крайних случаев, {report.bytes} байт "
+        f"за {report.elapsed:.2f} с"
+    )
+    print(f"📁 Результат сохранен в {report.output}")
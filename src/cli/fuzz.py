@@ -0,0 +1,172 @@
+"""
+Команда fuzz: поиск минимальных входов, на которых решения-кандидаты
+расходятся с эталоном
+"""
+
+import argparse
+import random
+import sys
+from typing import List
+
+from src.cli.common import FORMATS, GENERATORS
+from src.utils.exporter import Exporter
+from src.utils.fuzzer import KNOWN_BUGS, DifferentialFuzzer, seed_inputs
+from src.utils.loader import detect_format, import_callable
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="testgen fuzz",
+        description="Поиск минимальных входов, на которых решения-кандидаты "
+        "расходятся с эталоном",
+    )
+
+    parser.add_argument(
+        "task_type",
+        choices=[name for name in sorted(GENERATORS) if name != "spec"],
+        help="Тип задачи (исходные входы и эталон берутся из генератора)",
+    )
+
+    parser.add_argument(
+        "--oracle",
+        type=str,
+        default=None,
+        help="Эталон из ORACLES генератора (по умолчанию: первый)",
+    )
+
+    parser.add_argument(
+        "--reference",
+        type=str,
+        default=None,
+        help="Свое эталонное решение module:function вместо оракула",
+    )
+
+    parser.add_argument(
+        "--candidate",
+        action="append",
+        default=[],
+        metavar="MODULE:FUNCTION",
+        help="Проверяемое решение (можно указать несколько раз); по "
+        "умолчанию - заведомо ошибочные варианты для эталона",
+    )
+
+    parser.add_argument(
+        "-n",
+        "--seeds",
+        type=int,
+        default=20,
+        help="Количество исходных входов из генератора (по умолчанию: 20)",
+    )
+
+    parser.add_argument(
+        "--max-inputs",
+        type=int,
+        default=100000,
+        help="Наибольшее количество проверенных входов (по умолчанию: 100000)",
+    )
+
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="Ограничение времени фаззинга, секунды",
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=256,
+        help="Количество входов в пакете проверки (по умолчанию: 256)",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Количество процессов проверки (по умолчанию: 1)",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default="fuzz_cases.json",
+        help="Файл найденных случаев (по умолчанию: fuzz_cases.json)",
+    )
+
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=FORMATS,
+        default=None,
+        help="Формат файла (по умолчанию: по расширению)",
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Начальное значение генератора случайных чисел",
+    )
+
+    return parser
+
+
+def main(argv: List[str]) -> None:
+    """Дифференциальный фаззинг решений-кандидатов"""
+    args = create_parser().parse_args(argv)
+
+    try:
+        if args.seed is not None:
+            random.seed(args.seed)
+
+        generator = GENERATORS[args.task_type]()
+        oracle = args.oracle or next(iter(generator.ORACLES))
+        if oracle not in generator.ORACLES:
+            raise ValueError(
+                f"неизвестный оракул {oracle} "
+                f"(допустимы: {', '.join(generator.ORACLES)})"
+            )
+
+        if args.reference:
+            reference = import_callable(args.reference)
+        else:
+            reference = generator.ORACLES[oracle]
+
+        if args.candidate:
+            candidates = {path: import_callable(path) for path in args.candidate}
+        elif oracle in KNOWN_BUGS:
+            candidates = KNOWN_BUGS[oracle]
+        else:
+            raise ValueError(f"для оракула {oracle} требуется --candidate")
+
+        fuzzer = DifferentialFuzzer(
+            reference,
+            candidates,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            seed=args.seed,
+        )
+        report = fuzzer.run(
+            seed_inputs(generator, oracle, args.seeds),
+            max_inputs=args.max_inputs,
+            time_budget=args.time_budget,
+        )
+        Exporter.export(
+            report.cases, args.output, args.format or detect_format(args.output)
+        )
+
+    except Exception as e:
+        print(f"❌ Ошибка: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"✅ Найдено {len(report.cases)} различающих случаев, "
+        f"проверено {report.executed} входов за {report.elapsed:.3f} с"
+    )
+    for name, index in report.killed.items():
+        print(f"🐞 {name}: случай {index + 1}")
+    for name in report.survivors:
+        print(f"⚠️  {name}: не отличен от эталона")
+    print(f"📁 Результат сохранен в {args.output}")
@@ -0,0 +1,124 @@
+"""
+Команда plan: отбор и упорядочивание случаев в пределах бюджета времени
+"""
+
+import argparse
+import sys
+from typing import List
+
+from src.cli.common import FORMATS
+from src.utils.exporter import Exporter
+from src.utils.loader import detect_format, import_callable, load_test_cases
+from src.utils.planner import CostModel, SuitePlanner
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="testgen plan",
+        description="Отбор и упорядочивание случаев в пределах бюджета времени",
+    )
+
+    parser.add_argument(
+        "suite",
+        type=str,
+        help="Файл набора тестов (json, jsonl, yaml)",
+    )
+
+    parser.add_argument(
+        "--budget",
+        type=float,
+        required=True,
+        help="Бюджет времени на проверку одного решения, секунды",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        required=True,
+        help="Файл для отобранного набора",
+    )
+
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=FORMATS,
+        default=None,
+        help="Формат выходного файла (по умолчанию: как у входного)",
+    )
+
+    parser.add_argument(
+        "--reference",
+        type=str,
+        default=None,
+        help="Эталонное решение module:function для калибровки стоимости",
+    )
+
+    parser.add_argument(
+        "--overhead",
+        type=float,
+        default=1e-3,
+        help="Стоимость запуска случая, секунды (без --reference)",
+    )
+
+    parser.add_argument(
+        "--per-unit",
+        type=float,
+        default=1e-7,
+        help="Стоимость единицы размера входных данных, секунды",
+    )
+
+    parser.add_argument(
+        "--exponent",
+        type=float,
+        default=1.0,
+        help="Степень размера входных данных в модели стоимости",
+    )
+
+    parser.add_argument(
+        "--edge-bonus",
+        type=float,
+        default=2.0,
+        help="Множитель ценности крайних случаев (по умолчанию: 2.0)",
+    )
+
+    return parser
+
+
+def main(argv: List[str]) -> None:
+    """Составление плана проверки набора"""
+    args = create_parser().parse_args(argv)
+
+    try:
+        test_cases = load_test_cases(args.suite)
+
+        if args.reference:
+            cost_model = CostModel.calibrate(
+                test_cases,
+                import_callable(args.reference),
+                exponent=args.exponent,
+            )
+        else:
+            cost_model = CostModel(
+                overhead=args.overhead,
+                per_unit=args.per_unit,
+                exponent=args.exponent,
+            )
+
+        planner = SuitePlanner(
+            args.budget, cost_model=cost_model, edge_bonus=args.edge_bonus
+        )
+        plan = planner.plan(test_cases)
+        Exporter.export(
+            plan.cases, args.output, args.format or detect_format(args.suite)
+        )
+
+        print(
+            f"✅ Отобрано {len(plan.cases)} из {len(test_cases)} случаев, "
+            f"оценка времени {plan.total_cost:.3f} из {plan.budget:.3f} с, "
+            f"покрытие по весу {plan.coverage:.1%}"
+        )
+
+    except Exception as e:
+        print(f"❌ Ошибка: {e}", file=sys.stderr)
+        sys.exit(1)
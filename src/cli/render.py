@@ -0,0 +1,137 @@
+"""
+Команда render: условие задачи по шаблону с разделом примеров
+"""
+
+import argparse
+import random
+import sys
+from typing import List, Optional
+
+from src.cli.common import GENERATORS
+from src.generators import BaseGenerator, SpecGenerator
+from src.utils.loader import load_test_cases
+from src.utils.renderer import default_template, render_statement, statement_context
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="testgen render",
+        description="Условие задачи по шаблону с разделом примеров",
+    )
+
+    parser.add_argument(
+        "task_type",
+        choices=sorted(GENERATORS),
+        help="Тип задачи (определяет генератор и шаблон по умолчанию)",
+    )
+
+    parser.add_argument(
+        "-t",
+        "--template",
+        type=str,
+        default=None,
+        help="Файл шаблона (по умолчанию: templates/<тип>_template.md)",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default="statement.md",
+        help="Имя файла условия (по умолчанию: statement.md)",
+    )
+
+    parser.add_argument(
+        "--suite",
+        type=str,
+        default=None,
+        help="Брать случаи из готового набора вместо генерации",
+    )
+
+    parser.add_argument(
+        "-n",
+        "--normal-cases",
+        type=int,
+        default=5,
+        help="Количество обычных случаев при генерации (по умолчанию: 5)",
+    )
+
+    parser.add_argument(
+        "--spec",
+        type=str,
+        default=None,
+        help="YAML спецификация входных данных (для типа задачи spec)",
+    )
+
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=3,
+        help="Количество примеров в условии (по умолчанию: 3)",
+    )
+
+    parser.add_argument(
+        "--max-items",
+        type=int,
+        default=20,
+        help="Массивы длиннее сокращаются в примерах (по умолчанию: 20)",
+    )
+
+    parser.add_argument(
+        "--max-chars",
+        type=int,
+        default=200,
+        help="Длинные числа и строки сокращаются в примерах (по умолчанию: 200)",
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Начальное значение генератора случайных чисел",
+    )
+
+    return parser
+
+
+def main(argv: List[str]) -> None:
+    """Формирование условия задачи по шаблону"""
+    args = create_parser().parse_args(argv)
+
+    try:
+        if args.seed is not None:
+            random.seed(args.seed)
+
+        generator: Optional[BaseGenerator] = None
+        if args.task_type == "spec":
+            # Готовому набору с собственным шаблоном спецификация не нужна;
+            # иначе из нее берутся случаи или название и описание задачи
+            if args.spec:
+                generator = SpecGenerator(args.spec)
+            elif not (args.suite and args.template):
+                raise ValueError("для типа задачи spec требуется --spec FILE")
+        elif not args.suite:
+            generator = GENERATORS[args.task_type]()
+
+        if args.suite:
+            test_cases = load_test_cases(args.suite)
+        else:
+            assert generator is not None
+            test_cases = generator.generate_all(args.normal_cases)
+
+        statement = render_statement(
+            args.template or default_template(args.task_type),
+            test_cases,
+            samples=args.samples,
+            max_items=args.max_items,
+            max_chars=args.max_chars,
+            context=statement_context(generator) if generator is not None else None,
+        )
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(statement)
+
+        print(f"✅ Условие сохранено в {args.output}")
+
+    except Exception as e:
+        print(f"❌ Ошибка: {e}", file=sys.stderr)
+        sys.exit(1)
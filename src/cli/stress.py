@@ -0,0 +1,96 @@
+"""
+Команда stress: огромный случай сортировки с выгрузкой массивов на диск
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List
+
+from src.generators.sorting_generator import SortingGenerator
+from src.generators.spill import SpillStore
+from src.utils.exporter import Exporter
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="testgen stress",
+        description="Огромный случай сортировки с выгрузкой массивов на диск",
+    )
+
+    parser.add_argument(
+        "-n",
+        "--size",
+        type=int,
+        required=True,
+        help="Длина массива",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default="stress.jsonl",
+        help="Имя выходного файла (по умолчанию: stress.jsonl)",
+    )
+
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["json", "jsonl"],
+        default="jsonl",
+        help="Формат выходного файла (по умолчанию: jsonl)",
+    )
+
+    parser.add_argument(
+        "--memory-limit",
+        type=int,
+        default=256,
+        help="Лимит памяти на сортировку, МБ (по умолчанию: 256)",
+    )
+
+    parser.add_argument(
+        "--spill-dir",
+        type=str,
+        default=None,
+        help="Каталог для временных файлов (по умолчанию: системный)",
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Начальное значение генератора случайных чисел",
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Подробный вывод",
+    )
+
+    return parser
+
+
+def main(argv: List[str]) -> None:
+    """Генерация огромного случая сортировки"""
+    args = create_parser().parse_args(argv)
+
+    try:
+        started = time.perf_counter()
+        memory_limit = args.memory_limit * 1024 * 1024
+        with SpillStore(args.spill_dir, memory_limit=memory_limit) as store:
+            case = SortingGenerator(seed=args.seed).generate_stress_case(
+                args.size, store
+            )
+            Exporter.export([case], args.output, args.format)
+
+        if args.verbose:
+            print(f"⏱️  {time.perf_counter() - started:.2f} с")
+            print(f"💾 Размер файла: {os.path.getsize(args.output)} байт")
+        print(f"✅ Стресс-тест из {args.size} элементов сохранен в {args.output}")
+
+    except Exception as e:
+        print(f"❌ Ошибка: {e}", file=sys.stderr)
+        sys.exit(1)
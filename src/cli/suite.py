@@ -0,0 +1,171 @@
+"""
+Команда run: прогон решения на наборе тестов
+"""
+
+import argparse
+import sys
+from typing import List
+
+from src.utils.grading import GradingReport, GradingRunner
+from src.utils.loader import import_callable
+from src.utils.runner import ORDERINGS, FailureHistory, SuiteRunner
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="testgen run",
+        description="Прогон решения на наборе тестов",
+    )
+
+    parser.add_argument(
+        "suite",
+        type=str,
+        help="Файл набора тестов (json, jsonl, yaml)",
+    )
+
+    parser.add_argument(
+        "--solution",
+        type=str,
+        required=True,
+        help="Проверяемое решение module:function",
+    )
+
+    parser.add_argument(
+        "--order",
+        choices=ORDERINGS,
+        default="file",
+        help="Порядок прогона случаев (по умолчанию: file)",
+    )
+
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Остановиться на первом упавшем случае",
+    )
+
+    parser.add_argument(
+        "--history",
+        type=str,
+        default=None,
+        help="JSON файл истории падений задачи (для --order failure_rate)",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=0,
+        help="Количество процессов-исполнителей, порождаемых fork из "
+        "процесса с уже импортированным решением (по умолчанию: 0 - "
+        "решение вызывается в этом процессе)",
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=64,
+        help="Случаев в пакете исполнителя (по умолчанию: 64)",
+    )
+
+    parser.add_argument(
+        "--max-cases",
+        type=int,
+        default=1000,
+        help="Замена исполнителя после стольких случаев (по умолчанию: 1000)",
+    )
+
+    parser.add_argument(
+        "--max-memory",
+        type=float,
+        default=None,
+        help="Замена исполнителя при росте пиковой памяти больше стольких МБ",
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Предельное время одного случая, секунды (требует --workers)",
+    )
+
+    parser.add_argument(
+        "--preload",
+        action="append",
+        default=[],
+        metavar="MODULE",
+        help="Модуль, импортируемый до решения (можно указать несколько раз)",
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Вывести упавшие случаи",
+    )
+
+    return parser
+
+
+def main(argv: List[str]) -> None:
+    """Прогон решения на наборе тестов"""
+    args = create_parser().parse_args(argv)
+
+    try:
+        history = FailureHistory(args.history) if args.history else None
+        if args.workers > 0:
+            max_memory = None
+            if args.max_memory is not None:
+                max_memory = int(args.max_memory * 1024 * 1024)
+            runner: SuiteRunner = GradingRunner(
+                args.solution,
+                workers=args.workers,
+                batch_size=args.batch_size,
+                max_cases=args.max_cases,
+                max_memory=max_memory,
+                timeout=args.timeout,
+                preload=args.preload,
+                ordering=args.order,
+                fail_fast=args.fail_fast,
+                history=history,
+            )
+        elif args.timeout is not None or args.preload:
+            raise ValueError("--timeout и --preload требуют --workers")
+        else:
+            runner = SuiteRunner(
+                import_callable(args.solution),
+                ordering=args.order,
+                fail_fast=args.fail_fast,
+                history=history,
+            )
+        report = runner.run_file(args.suite)
+
+    except Exception as e:
+        print(f"❌ Ошибка: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.verbose:
+        for failure in report.failures:
+            detail = failure.error or (
+                f"ожидалось {failure.expected!r}, получено {failure.actual!r}"
+            )
+            print(f"💥 Тест {failure.index}: {failure.description}: {detail}")
+
+    status = "остановлен после первого падения" if report.aborted else "завершен"
+    print(
+        f"{'✅' if report.ok else '❌'} Прогон {status}: "
+        f"выполнено {report.executed}, пройдено {report.passed}, "
+        f"упало {report.failed} за {report.elapsed:.3f} с"
+    )
+    latency = report.latency
+    if latency.count:
+        print(
+            f"⏱️  Время случая: среднее {latency.mean * 1000:.3f} мс, "
+            f"p50 {latency.p50 * 1000:.3f}, p90 {latency.p90 * 1000:.3f}, "
+            f"p99 {latency.p99 * 1000:.3f}, max {latency.max * 1000:.3f} мс"
+        )
+    if isinstance(report, GradingReport):
+        print(
+            f"🔁 Исполнителей запущено: {report.workers_started}, "
+            f"заменено: {report.recycled}, потеряно: {report.lost}"
+        )
+    if not report.ok:
+        sys.exit(1)
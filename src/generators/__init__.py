@@ -2,15 +2,32 @@
 Модуль генераторов тестовых случаев
 """
 
+from typing import Dict, Type
+
 from .base_generator import BaseGenerator, TestCase
 from .sorting_generator import SortingGenerator
 from .searching_generator import SearchingGenerator
 from .math_generator import MathGenerator
+from .oracle import Oracle, OracleCache
+from .spec_generator import ProblemSpec, SpecGenerator
+
+# Реестр генераторов по типу задачи
+GENERATORS: Dict[str, Type[BaseGenerator]] = {
+    "sorting": SortingGenerator,
+    "searching": SearchingGenerator,
+    "math": MathGenerator,
+    "spec": SpecGenerator,
+}
 
 __all__ = [
+    "GENERATORS",
     "BaseGenerator",
     "TestCase",
     "SortingGenerator",
     "SearchingGenerator",
     "MathGenerator",
+    "SpecGenerator",
+    "ProblemSpec",
+    "Oracle",
+    "OracleCache",
 ]
\ No newline at end of file
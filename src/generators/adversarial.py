@@ -0,0 +1,133 @@
+"""
+Состязательные входные данные для заведомо медленных реализаций
+
+Каждая функция строит массив за O(n) и подходит для размеров до 10^7.
+Ожидаемый результат сортировки также вычисляется за O(n) подсчетом,
+потому что значения всех семейств лежат в диапазоне не шире длины массива.
+"""
+
+import random
+import sys
+from typing import List
+
+
+# Модуль по умолчанию для ключей с коллизиями хэшей: CPython хэширует целые
+# по модулю sys.hash_info.modulus (2^61 - 1 на 64-битных платформах), поэтому
+# у кратных ему ключей совпадает весь хэш, а не только младшие биты, и
+# вставка в dict или set деградирует до O(n^2). Такие ключи не помещаются
+# в int64
+DEFAULT_HASH_MODULUS = sys.hash_info.modulus
+
+# Наибольшее значение компактных массивов (buffers.ARRAY_TYPES кроме "list")
+INT64_MAX = (1 << 63) - 1
+
+
+def median_of_three_killer(n: int) -> List[int]:
+    """
+    Последовательность Мюссера против быстрой сортировки с медианой из трех
+
+    Быстрая сортировка, выбирающая опорный элемент как медиану первого,
+    среднего и последнего элементов, на этой перестановке чисел 1..n
+    деградирует до O(n^2).
+
+    Args:
+        n: Длина массива
+
+    Returns:
+        Перестановка чисел от 1 до n
+    """
+    # Конструкция определена для длин, кратных 4; остаток дописывается
+    # наибольшими значениями по возрастанию
+    m = n - n % 4
+    k = m // 2
+    first = [i if i % 2 else k + i - 1 for i in range(1, k + 1)]
+    second = list(range(2, m + 1, 2))
+    return first + second + list(range(m + 1, n + 1))
+
+
+def sawtooth(n: int, period: int = 16) -> List[int]:
+    """
+    Пилообразная последовательность 0, 1, ..., period-1, 0, 1, ...
+
+    Args:
+        n: Длина массива
+        period: Длина одного зубца
+
+    Returns:
+        Массив значений от 0 до period-1
+    """
+    period = max(1, period)
+    teeth, rest = divmod(n, period)
+    return list(range(period)) * teeth + list(range(rest))
+
+
+def many_equal(n: int, distinct: int = 3) -> List[int]:
+    """
+    Массив из нескольких различных значений, каждое повторено много раз
+
+    Быстрая сортировка с разбиением на две части без учета равных
+    элементов на таких данных работает за O(n^2).
+
+    Args:
+        n: Длина массива
+        distinct: Количество различных значений
+
+    Returns:
+        Массив значений от 0 до distinct-1
+    """
+    return random.choices(range(max(1, distinct)), k=n)
+
+
+def organ_pipe(n: int) -> List[int]:
+    """
+    Возрастающая, затем убывающая последовательность 0, 1, ..., 1, 0
+
+    Args:
+        n: Длина массива
+
+    Returns:
+        Массив значений от 0 до (n-1)//2
+    """
+    half = (n + 1) // 2
+    return list(range(half)) + list(range(n - half - 1, -1, -1))
+
+
+def hash_collision_keys(n: int, modulus: int = DEFAULT_HASH_MODULUS) -> List[int]:
+    """
+    Различные ключи с одинаковым остатком по модулю modulus
+
+    С модулем по умолчанию у всех ключей совпадает hash() и все они
+    попадают в одну цепочку проб dict и set CPython. Другие модули
+    нацелены на хэш-таблицы, выбирающие ячейку по hash % modulus.
+
+    Args:
+        n: Количество ключей
+        modulus: Модуль коллизий
+
+    Returns:
+        Возрастающий список ключей 0, modulus, 2*modulus, ...
+    """
+    return list(range(0, n * modulus, modulus))
+
+
+def counting_sorted(arr: List[int], low: int, high: int) -> List[int]:
+    """
+    Сортировка подсчетом для значений из диапазона [low, high]
+
+    Args:
+        arr: Исходный массив
+        low: Минимально возможное значение
+        high: Максимально возможное значение
+
+    Returns:
+        Отсортированная копия массива
+    """
+    counts = [0] * (high - low + 1)
+    for value in arr:
+        counts[value - low] += 1
+
+    result: List[int] = []
+    for offset, count in enumerate(counts):
+        if count:
+            result.extend([low + offset] * count)
+    return result
@@ -2,9 +2,39 @@
 Базовый класс для генераторов тестовых случаев
 """
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, List
-from pydantic import BaseModel, Field
+from collections import Counter
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Optional, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field
+
+from . import buffers
+from .oracle import Oracle, OracleCache
+from .rng import case_random, case_rng
+
+
+_COUNTERS_LOCK = threading.Lock()
+_EDGE_TABLES_LOCK = threading.Lock()
+
+# Отложенные ответы пакетных оракулов в текущем потоке:
+# id генератора -> список ожидающих ответов (см. _batch_answers)
+_DEFERRED = threading.local()
+
+# Глубина вложенных вызовов shared_edge_cases в текущем потоке: внутри них
+# static_edge_cases отдает случаи общей таблицы
+_SHARED_EDGE = threading.local()
+
+
+class _PendingAnswer:
+    """Ответ пакетного оракула, вычисляемый после генерации фрагмента"""
+
+    __slots__ = ("task", "data", "pack", "value")
+
+    def __init__(self, task: str, data: Any) -> None:
+        self.task = task
+        self.data = data
+        self.pack = False
+        self.value: Any = None
 
 
 class TestCase(BaseModel):
@@ -23,21 +53,154 @@ class TestCase(BaseModel):
         }
 
 
+class _FrozenTestCase(TestCase):
+    """Случай общей таблицы крайних случаев; присваивание полей запрещено"""
+
+    model_config = ConfigDict(frozen=True)
+
+
 class BaseGenerator(ABC):
     """Абстрактный класс генератора тестовых случаев"""
 
-    @abstractmethod
-    def generate_normal_cases(self, n: int) -> List[TestCase]:
+    # Эталонные решения по имени задачи; ожидаемые результаты
+    # вычисляются через них (см. _expected)
+    ORACLES: Dict[str, Callable[[Any], Any]] = {}
+
+    # Представление генерируемых массивов из buffers.ARRAY_TYPES
+    array_type: str = "list"
+
+    # Начальное значение счетчикового генератора: случай k строится по
+    # (seed, k) независимо от остальных; None - глобальный random
+    seed: Optional[int] = None
+
+    # Общая таблица крайних случаев класса (см. shared_edge_cases); только
+    # аннотация: таблица заводится в __dict__ каждого класса отдельно
+    _edge_table: ClassVar[Tuple[TestCase, ...]]
+
+    def generate_normal_cases(self, n: int, start: int = 0) -> List[TestCase]:
         """
         Генерация обычных тестовых случаев
         
         Args:
             n: Количество тестовых случаев
+            start: Порядковый номер первого случая (для генерации частями)
             
         Returns:
             Список тестовых случаев
         """
-        pass
+        return self._batch_answers(
+            lambda: [
+                self._generate_case(i, self._rng(i)) for i in range(start, start + n)
+            ]
+        )
+
+    def _batch_answers(self, build: Callable[[], List["TestCase"]]) -> List["TestCase"]:
+        """
+        Построение случаев с пакетным вычислением ожидаемых результатов
+
+        Если среди оракулов есть пакетные (Oracle.batched), их ответы на
+        время build откладываются и затем вычисляются одним вызовом
+        lookup_many на задачу.
+
+        Args:
+            build: Функция, строящая список случаев
+
+        Returns:
+            Случаи с вычисленными ожидаемыми результатами
+        """
+        if not any(oracle.batched for oracle in self.oracles.values()):
+            return build()
+
+        deferred = _DEFERRED.__dict__.setdefault("pending", {})
+        if id(self) in deferred:
+            return build()
+        pending: List[_PendingAnswer] = []
+        deferred[id(self)] = pending
+        try:
+            cases = build()
+        finally:
+            del deferred[id(self)]
+
+        by_task: Dict[str, List[_PendingAnswer]] = {}
+        for answer in pending:
+            by_task.setdefault(answer.task, []).append(answer)
+        for task, answers in by_task.items():
+            results = self.oracles[task].lookup_many([a.data for a in answers])
+            hits = 0
+            for answer, (value, cached) in zip(answers, results):
+                if answer.pack:
+                    value = buffers.pack(value, self.array_type)
+                answer.value = value
+                hits += cached
+            if self.oracle_cache is not None:
+                self._count("oracle.cache_hits", hits)
+                self._count("oracle.cache_misses", len(answers) - hits)
+
+        for case in cases:
+            if isinstance(case.expected, _PendingAnswer):
+                case.expected = case.expected.value
+        return cases
+
+    def _generate_case(self, index: int, rng: Any) -> TestCase:
+        """
+        Генерация обычного случая с номером index
+
+        Генератор реализует либо этот метод, либо generate_normal_cases
+        целиком; во втором случае произвольный доступ к случаям недоступен
+        (см. supports_random_access).
+
+        Args:
+            index: Номер случая (с 0)
+            rng: Источник случайных чисел (random.Random или модуль random)
+
+        Returns:
+            Тестовый случай
+
+        Raises:
+            NotImplementedError: Генератор строит случаи только пакетно
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} не реализует _generate_case: случаи строятся "
+            f"только пакетно через generate_normal_cases"
+        )
+
+    @classmethod
+    def supports_random_access(cls) -> bool:
+        """Доступны ли generate_case и iter_cases (реализован _generate_case)"""
+        return cls._generate_case is not BaseGenerator._generate_case
+
+    def _rng(self, index: int) -> Any:
+        """Источник случайных чисел случая index (см. rng.case_rng)"""
+        return case_rng(self.seed, index)
+
+    def generate_case(self, index: int, attempt: int = 0) -> TestCase:
+        """
+        Обычный случай с номером index, вычисленный по (seed, index)
+
+        Совпадает с index-м случаем generate_normal_cases и не требует
+        генерации предыдущих.
+
+        Args:
+            index: Номер случая (с 0)
+            attempt: Номер попытки; ненулевые попытки дают другие случаи
+                с тем же номером (для перегенерации дубликатов)
+
+        Returns:
+            Тестовый случай
+
+        Raises:
+            ValueError: Генератор создан без seed
+            NotImplementedError: Генератор строит случаи только пакетно
+                (см. supports_random_access)
+        """
+        if self.seed is None:
+            raise ValueError("Произвольный доступ к случаям требует seed генератора")
+        return self._generate_case(index, case_random(self.seed, index, attempt))
+
+    def iter_cases(self, start: int, stop: int) -> Iterator[TestCase]:
+        """Обычные случаи с номерами [start, stop) без хранения набора"""
+        for index in range(start, stop):
+            yield self.generate_case(index)
 
     @abstractmethod
     def generate_edge_cases(self) -> List[TestCase]:
@@ -49,6 +212,169 @@ class BaseGenerator(ABC):
         """
         pass
 
+    @property
+    def counters(self) -> Dict[str, int]:
+        """Счетчики служебных событий генерации (например, повторов выборки)"""
+        with _COUNTERS_LOCK:
+            return dict(self.__dict__.get("_counters", {}))
+
+    def _count(self, name: str, value: int = 1) -> None:
+        """Увеличение счетчика name; безопасно при генерации из нескольких потоков"""
+        if value:
+            with _COUNTERS_LOCK:
+                self.__dict__.setdefault("_counters", Counter())[name] += value
+
+    @property
+    def oracles(self) -> Dict[str, Oracle]:
+        """Оракулы генератора по имени задачи"""
+        oracles = self.__dict__.get("_oracles")
+        if oracles is None:
+            prefix = type(self).__name__
+            oracles = self.__dict__["_oracles"] = {
+                task: Oracle(solve, name=f"{prefix}.{task}")
+                for task, solve in self.ORACLES.items()
+            }
+        return oracles
+
+    @property
+    def oracle_cache(self) -> Optional[OracleCache]:
+        """Кэш ответов оракулов (None, если не подключен)"""
+        return self.__dict__.get("_oracle_cache")
+
+    def set_oracle(
+        self,
+        task: str,
+        solve: Callable[[Any], Any],
+        version: str = "",
+        solve_many: Optional[Callable[[List[Any]], List[Any]]] = None,
+    ) -> None:
+        """
+        Замена эталонного решения задачи
+
+        Args:
+            task: Имя задачи из ORACLES
+            solve: Функция, вычисляющая ответ по входным данным
+            version: Версия решения (часть ключа кэша)
+            solve_many: Пакетное решение; с ним ответы обычных случаев
+                фрагмента вычисляются одним вызовом
+        """
+        if task not in self.oracles:
+            raise ValueError(f"Неизвестная задача оракула: {task}")
+        self.oracles[task] = Oracle(
+            solve,
+            name=f"{type(self).__name__}.{task}",
+            version=version,
+            cache=self.oracle_cache,
+            solve_many=solve_many,
+        )
+
+    def use_oracle_cache(
+        self, cache: Union[str, OracleCache, None]
+    ) -> Optional[OracleCache]:
+        """
+        Подключение постоянного кэша ответов ко всем оракулам
+
+        Args:
+            cache: Путь к SQLite файлу, готовый кэш или None (отключить)
+
+        Returns:
+            Подключенный кэш
+        """
+        current = self.oracle_cache
+        if isinstance(cache, str):
+            if current is not None and current.path == cache:
+                return current
+            cache = OracleCache(cache)
+
+        self.__dict__["_oracle_cache"] = cache
+        for oracle in self.oracles.values():
+            oracle.cache = cache
+        return cache
+
+    def _expected(self, task: str, data: Any) -> Any:
+        """
+        Ожидаемый результат задачи task, при наличии кэша - из кэша
+
+        Внутри _batch_answers ответ пакетного оракула откладывается: вместо
+        него возвращается заместитель, который можно только сохранить в
+        TestCase.expected (в том числе через _pack).
+        """
+        pending = getattr(_DEFERRED, "pending", {}).get(id(self))
+        if pending is not None and self.oracles[task].batched:
+            answer = _PendingAnswer(task, data)
+            pending.append(answer)
+            return answer
+
+        value, cached = self.oracles[task].lookup(data)
+        if self.oracle_cache is not None:
+            self._count("oracle.cache_hits" if cached else "oracle.cache_misses")
+        return value
+
+    def _pack(self, values: Any) -> Any:
+        """Массив в представлении array_type генератора"""
+        if isinstance(values, _PendingAnswer):
+            # Упаковка отложенного ответа выполняется после его вычисления
+            values.pack = True
+            return values
+        return buffers.pack(values, self.array_type)
+
+    @classmethod
+    def _build_static_edge_cases(cls) -> List[TestCase]:
+        """
+        Крайние случаи, не зависящие от параметров и seed генератора
+
+        Вызывается один раз на класс в процессе (см. static_edge_cases).
+
+        Returns:
+            Список крайних случаев
+        """
+        return []
+
+    @classmethod
+    def static_edge_cases(cls) -> List[TestCase]:
+        """
+        Статические крайние случаи класса
+
+        Вне shared_edge_cases возвращает новые случаи. Внутри - случаи общей
+        таблицы класса без построения: таблица строится при первом обращении
+        и хранится в классе (процессы, порожденные через fork, получают ее
+        готовой), присваивание полей ее случаев вызывает ошибку, а входы и
+        ответы изменять нельзя.
+
+        Returns:
+            Список крайних случаев
+        """
+        if not getattr(_SHARED_EDGE, "depth", 0):
+            return cls._build_static_edge_cases()
+
+        table: Optional[Tuple[TestCase, ...]] = cls.__dict__.get("_edge_table")
+        if table is None:
+            with _EDGE_TABLES_LOCK:
+                table = cls.__dict__.get("_edge_table")
+                if table is None:
+                    table = cls._edge_table = tuple(
+                        _FrozenTestCase(**tc.__dict__)
+                        for tc in cls._build_static_edge_cases()
+                    )
+        return list(table)
+
+    def shared_edge_cases(self) -> List[TestCase]:
+        """
+        Крайние случаи для вызывающих, которые только сериализуют,
+        проверяют или копируют их
+
+        Вызывает generate_edge_cases, в котором static_edge_cases отдает
+        неизменяемые случаи общей таблицы класса вместо построения новых.
+
+        Returns:
+            Список крайних случаев
+        """
+        _SHARED_EDGE.depth = getattr(_SHARED_EDGE, "depth", 0) + 1
+        try:
+            return self.generate_edge_cases()
+        finally:
+            _SHARED_EDGE.depth -= 1
+
     def generate_all(self, n_normal: int = 5) -> List[TestCase]:
         """
         Генерация всех тестовых случаев
@@ -0,0 +1,156 @@
+"""
+Компактные массивы 64-битных целых в тестовых случаях
+
+Вместо списка Python (около 36 байт на элемент) массив можно хранить в
+array('q'), массиве NumPy или memoryview - 8 байт на элемент. Модуль
+приводит такие буферы к спискам для текстовых форматов и отдает их байты
+без копирования для двоичных.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Any, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - зависит от окружения
+    np = None  # type: ignore[assignment]
+
+
+# Представления массивов в тестовых случаях
+ARRAY_TYPES = ["list", "array", "numpy"]
+
+ITEM_SIZE = array('q').itemsize
+
+
+def is_buffer(value: Any) -> bool:
+    """Является ли значение буферным массивом (array, NumPy, memoryview)"""
+    return isinstance(value, (array, memoryview)) or (
+        np is not None and isinstance(value, np.ndarray)
+    )
+
+
+def check_array_type(array_type: str) -> str:
+    """Проверка, что представление известно и доступно в окружении"""
+    if array_type not in ARRAY_TYPES:
+        raise ValueError(f"Неизвестное представление массива: {array_type}")
+    if array_type == "numpy" and np is None:
+        raise ValueError("Для представления numpy требуется NumPy")
+    return array_type
+
+
+def pack(values: Iterable[int], array_type: str = "list") -> Any:
+    """
+    Упаковка целых чисел в массив заданного представления
+
+    Args:
+        values: Целые числа в диапазоне int64
+        array_type: Представление из ARRAY_TYPES
+
+    Returns:
+        Список, array('q') или массив NumPy int64
+    """
+    if array_type == "list":
+        return values if isinstance(values, list) else list(values)
+    if array_type == "array":
+        return values if isinstance(values, array) else array('q', values)
+    check_array_type(array_type)
+    return np.asarray(values, dtype=np.int64)
+
+
+def to_plain(value: Any) -> Any:
+    """
+    Замена буферных массивов списками (в том числе внутри словарей)
+
+    Остальные значения возвращаются без изменений и без копирования.
+    """
+    if is_buffer(value):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    return value
+
+
+def json_default(value: Any) -> Any:
+    """Параметр default для json.dumps: буферные массивы пишутся списками"""
+    if is_buffer(value):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def int64_view(value: Any) -> Optional[memoryview]:
+    """
+    Байты массива 64-битных целых без копирования
+
+    Args:
+        value: array('q'), массив NumPy int64 или memoryview формата 'q'
+
+    Returns:
+        Представление формата 'q' или None, если значение не является
+        непрерывным массивом 64-битных целых
+    """
+    if not is_buffer(value):
+        return None
+
+    view = memoryview(value)
+    if (
+        view.ndim != 1
+        or view.itemsize != ITEM_SIZE
+        or view.format not in ("q", "l")
+        or not view.c_contiguous
+    ):
+        return None
+    return view if view.format == "q" else view.cast("B").cast("q")
+
+
+def index_of(values: Any, target: int) -> int:
+    """Индекс первого вхождения target в массив или -1"""
+    if np is not None and isinstance(values, np.ndarray):
+        found = np.flatnonzero(values == target)
+        return int(found[0]) if len(found) else -1
+    if isinstance(values, memoryview):
+        values = values.tolist()
+    try:
+        return int(values.index(target))
+    except ValueError:
+        return -1
+
+
+def first_indices(values: Any, targets: Iterable[int]) -> Any:
+    """
+    Индексы первых вхождений каждого из targets в отсортированный массив
+
+    Ответы вычисляются двоичным поиском сразу для всех запросов: для
+    массивов NumPy - одним вызовом np.searchsorted, иначе через bisect.
+
+    Args:
+        values: Массив, упорядоченный по неубыванию
+        targets: Искомые значения
+
+    Returns:
+        Индексы (-1 для отсутствующих): массив NumPy int64 для массива
+        NumPy, иначе список
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        keys = np.asarray(targets, dtype=np.int64)
+        found = np.searchsorted(values, keys, side="left")
+        inside = found < len(values)
+        hit = np.zeros(len(keys), dtype=bool)
+        hit[inside] = values[found[inside]] == keys[inside]
+        return np.where(hit, found, -1)
+
+    if isinstance(values, memoryview):
+        values = values.tolist()
+    length = len(values)
+    result: List[int] = []
+    for target in targets:
+        i = bisect_left(values, target)
+        result.append(i if i < length and values[i] == target else -1)
+    return result
+
+
+def is_sorted(values: Any) -> bool:
+    """Упорядочен ли массив по неубыванию"""
+    if np is not None and isinstance(values, np.ndarray):
+        return bool(np.all(values[:-1] <= values[1:]))
+    return all(a <= b for a, b in zip(values, values[1:]))
@@ -4,15 +4,53 @@
 
 import random
 import math
-from typing import List, Callable
+from typing import Any, List, Optional
 
 from .base_generator import BaseGenerator, TestCase
 
 
+def _fibonacci(x: int) -> int:
+    """x-е число Фибоначчи"""
+    if x <= 1:
+        return x
+    a, b = 0, 1
+    for _ in range(x - 1):
+        a, b = b, a + b
+    return b
+
+
+def _gcd(pair: Any) -> int:
+    """НОД пары чисел"""
+    return math.gcd(*pair)
+
+
 class MathGenerator(BaseGenerator):
     """Генератор для математических задач"""
 
-    def __init__(self) -> None:
+    ORACLES = {
+        "factorial": math.factorial,
+        "fibonacci": _fibonacci,
+        "gcd": _gcd,
+    }
+
+    def __init__(
+        self,
+        max_factorial: int = 10,
+        max_fibonacci: int = 15,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Инициализация генератора
+
+        Args:
+            max_factorial: Наибольшее n в задачах на факториал
+            max_fibonacci: Наибольший номер в задачах на числа Фибоначчи
+            seed: Начальное значение счетчикового генератора (случай k
+                вычисляется по (seed, k)); None - глобальный random
+        """
+        self.max_factorial = max(2, max_factorial)
+        self.max_fibonacci = max(3, max_fibonacci)
+        self.seed = seed
         self.task_types = [
             self._generate_factorial,
             self._generate_fibonacci,
@@ -21,19 +59,15 @@ class MathGenerator(BaseGenerator):
             self._generate_palindrome,
         ]
 
-    def generate_normal_cases(self, n: int = 5) -> List[TestCase]:
-        cases = []
+    def _generate_case(self, index: int, rng: Any) -> TestCase:
+        # Выбираем случайный тип задачи
+        generator = rng.choice(self.task_types)
+        test_case: TestCase = generator(normal_case=True, rng=rng)
+        test_case.description = f"Нормальный случай {index+1}: {test_case.description}"
+        return test_case
 
-        for i in range(n):
-            # Выбираем случайный тип задачи
-            generator = random.choice(self.task_types)
-            test_case = generator(normal_case=True)
-            test_case.description = f"Нормальный случай {i+1}: {test_case.description}"
-            cases.append(test_case)
-
-        return cases
-
-    def generate_edge_cases(self) -> List[TestCase]:
+    @classmethod
+    def _build_static_edge_cases(cls) -> List[TestCase]:
         edge_cases = []
 
         # Факториал крайние случаи
@@ -113,73 +147,76 @@ class MathGenerator(BaseGenerator):
 
         return edge_cases
 
-    def _generate_factorial(self, normal_case: bool = True) -> TestCase:
+    def generate_edge_cases(self) -> List[TestCase]:
+        return self.static_edge_cases()
+
+    def _generate_factorial(
+        self, normal_case: bool = True, rng: Any = random
+    ) -> TestCase:
         if normal_case:
-            n = random.randint(2, 10)  # Ограничиваем для простоты
+            n = rng.randint(2, self.max_factorial)
         else:
-            n = random.choice([0, 1])  # Для edge cases
+            n = rng.choice([0, 1])  # Для edge cases
 
         return TestCase(
             input=n,
-            expected=math.factorial(n),
+            expected=self._expected("factorial", n),
             description=f"Вычислить факториал {n}!",
             is_edge_case=not normal_case,
             weight=1.3 if not normal_case else 1.0,
         )
 
-    def _generate_fibonacci(self, normal_case: bool = True) -> TestCase:
+    def _generate_fibonacci(
+        self, normal_case: bool = True, rng: Any = random
+    ) -> TestCase:
         if normal_case:
-            n = random.randint(3, 15)
+            n = rng.randint(3, self.max_fibonacci)
         else:
-            n = random.choice([0, 1, 2])
-
-        def fib(x: int) -> int:
-            if x <= 1:
-                return x
-            a, b = 0, 1
-            for _ in range(x - 1):
-                a, b = b, a + b
-            return b
+            n = rng.choice([0, 1, 2])
 
         return TestCase(
             input=n,
-            expected=fib(n),
+            expected=self._expected("fibonacci", n),
             description=f"Найти {n}-е число Фибоначчи",
             is_edge_case=not normal_case,
             weight=1.3 if not normal_case else 1.0,
         )
 
-    def _generate_gcd(self, normal_case: bool = True) -> TestCase:
+    def _generate_gcd(
+        self, normal_case: bool = True, rng: Any = random
+    ) -> TestCase:
         if normal_case:
-            a = random.randint(10, 100)
-            b = random.randint(10, 100)
+            a = rng.randint(10, 100)
+            b = rng.randint(10, 100)
         else:
             # Для edge cases
             options = [(0, 5), (5, 0), (1, 100), (17, 17)]
-            a, b = random.choice(options)
+            a, b = rng.choice(options)
 
         return TestCase(
             input=(a, b),
-            expected=math.gcd(a, b),
+            expected=self._expected("gcd", (a, b)),
             description=f"Найти наибольший общий делитель чисел {a} и {b}",
             is_edge_case=not normal_case,
             weight=1.3 if not normal_case else 1.0,
         )
 
-    def _generate_prime(self, normal_case: bool = True) -> TestCase:
+    def _generate_prime(
+        self, normal_case: bool = True, rng: Any = random
+    ) -> TestCase:
         primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31]
         non_primes = [1, 4, 6, 8, 9, 10, 12, 14, 15, 16, 18, 20]
 
         if normal_case:
-            if random.random() > 0.5:
-                n = random.choice(primes)
+            if rng.random() > 0.5:
+                n = rng.choice(primes)
                 expected = True
             else:
-                n = random.choice(non_primes)
+                n = rng.choice(non_primes)
                 expected = False
         else:
             # Edge cases
-            n = random.choice([0, 1, 2])
+            n = rng.choice([0, 1, 2])
             expected = n in [2]
 
         return TestCase(
@@ -190,23 +227,26 @@ class MathGenerator(BaseGenerator):
             weight=1.3 if not normal_case else 1.0,
         )
 
-    def _generate_palindrome(self, normal_case: bool = True) -> TestCase:
+    def _generate_palindrome(
+        self, normal_case: bool = True, rng: Any = random
+    ) -> TestCase:
         if normal_case:
-            if random.random() > 0.5:
+            if rng.random() > 0.5:
                 # Генерируем палиндром
-                half = str(random.randint(10, 999))
+                half = str(rng.randint(10, 999))
                 n = int(half + half[::-1])
                 expected = True
             else:
                 # Генерируем не палиндром
                 while True:
-                    n = random.randint(100, 9999)
+                    n = rng.randint(100, 9999)
                     if str(n) != str(n)[::-1]:
                         expected = False
                         break
+                    self._count("retries.palindrome")
         else:
             # Edge cases для палиндромов
-            n = random.choice([0, 1, 9, 11, 99])
+            n = rng.choice([0, 1, 9, 11, 99])
             expected = str(n) == str(n)[::-1]
 
         return TestCase(
@@ -0,0 +1,204 @@
+"""
+Эталонные решения (оракулы) с постоянным кэшем ответов
+
+Ответ эталонного решения сохраняется в SQLite файле под ключом, равным
+хэшу имени оракула, его версии и входных данных. Повторная генерация или
+перемешивание набора берет уже вычисленные ответы из кэша. Оракул с
+пакетным решением (solve_many, например внешняя программа) получает
+входы фрагмента одним вызовом.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .buffers import json_default
+
+
+# Сколько новых ответов накапливать перед записью транзакции
+CACHE_COMMIT_EVERY = 1000
+
+
+def input_fingerprint(name: str, data: Any) -> bytes:
+    """
+    Ключ кэша: BLAKE2b от имени оракула и канонического JSON входных данных
+
+    Args:
+        name: Имя (и версия) оракула
+        data: Входные данные
+
+    Returns:
+        16 байт хэша
+    """
+    payload = json.dumps(
+        [name, data],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=json_default,
+    )
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+
+
+class OracleCache:
+    """Постоянный кэш ответов в SQLite файле"""
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """
+        Открытие (или создание) кэша
+
+        Args:
+            path: Путь к файлу базы (":memory:" - кэш только в памяти)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending: Dict[bytes, str] = {}
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        if path != ":memory:":
+            # WAL позволяет нескольким процессам читать кэш во время записи
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS answers (key BLOB PRIMARY KEY, value TEXT)"
+        )
+        self._connection.commit()
+
+    def get(self, key: bytes) -> Tuple[bool, Any]:
+        """
+        Поиск ответа
+
+        Returns:
+            Кортеж (найден ли ответ, ответ)
+        """
+        with self._lock:
+            raw = self._pending.get(key)
+            if raw is None:
+                row = self._connection.execute(
+                    "SELECT value FROM answers WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return False, None
+                raw = row[0]
+        return True, json.loads(raw)
+
+    def put(self, key: bytes, value: Any) -> None:
+        """Сохранение ответа (запись на диск - пачками по CACHE_COMMIT_EVERY)"""
+        raw = json.dumps(value, ensure_ascii=False, default=json_default)
+        with self._lock:
+            self._pending[key] = raw
+            if len(self._pending) >= CACHE_COMMIT_EVERY:
+                self._flush()
+
+    def flush(self) -> None:
+        """Запись накопленных ответов"""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO answers (key, value) VALUES (?, ?)",
+            self._pending.items(),
+        )
+        self._connection.commit()
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Запись накопленных ответов и закрытие базы"""
+        self.flush()
+        self._connection.close()
+
+    def __len__(self) -> int:
+        self.flush()
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM answers").fetchone()
+        return int(row[0])
+
+
+class Oracle:
+    """Эталонное решение задачи с необязательным кэшем ответов"""
+
+    def __init__(
+        self,
+        solve: Callable[[Any], Any],
+        name: str,
+        version: str = "",
+        cache: Optional[OracleCache] = None,
+        solve_many: Optional[Callable[[List[Any]], List[Any]]] = None,
+    ) -> None:
+        """
+        Инициализация
+
+        Args:
+            solve: Функция, вычисляющая ответ по входным данным
+            name: Имя оракула (часть ключа кэша)
+            version: Версия решения; смена версии делает старые ответы
+                недоступными
+            cache: Кэш ответов
+            solve_many: Функция, вычисляющая ответы сразу для списка входов
+        """
+        self.solve = solve
+        self.name = name
+        self.version = version
+        self.cache = cache
+        self.solve_many = solve_many
+
+    @property
+    def batched(self) -> bool:
+        """Выгоднее ли вычислять ответы пакетами (см. lookup_many)"""
+        return self.solve_many is not None
+
+    def lookup(self, data: Any) -> Tuple[Any, bool]:
+        """
+        Ответ для входных данных
+
+        Returns:
+            Кортеж (ответ, взят ли он из кэша)
+        """
+        if self.cache is None:
+            return self.solve(data), False
+
+        key = input_fingerprint(f"{self.name}@{self.version}", data)
+        found, value = self.cache.get(key)
+        if found:
+            return value, True
+
+        value = self.solve(data)
+        self.cache.put(key, value)
+        return value, False
+
+    def lookup_many(self, inputs: Sequence[Any]) -> List[Tuple[Any, bool]]:
+        """
+        Ответы для списка входных данных
+
+        Отсутствующие в кэше ответы вычисляются одним вызовом solve_many.
+
+        Returns:
+            Список кортежей (ответ, взят ли он из кэша) в порядке inputs
+        """
+        if self.solve_many is None:
+            return [self.lookup(data) for data in inputs]
+        if self.cache is None:
+            return [(value, False) for value in self.solve_many(list(inputs))]
+
+        name = f"{self.name}@{self.version}"
+        keys = [input_fingerprint(name, data) for data in inputs]
+        results: List[Tuple[Any, bool]] = []
+        missing: List[int] = []
+        for i, key in enumerate(keys):
+            found, value = self.cache.get(key)
+            results.append((value, True))
+            if not found:
+                missing.append(i)
+
+        if missing:
+            values = self.solve_many([inputs[i] for i in missing])
+            for i, value in zip(missing, values):
+                self.cache.put(keys[i], value)
+                results[i] = (value, False)
+        return results
+
+    def __call__(self, data: Any) -> Any:
+        return self.lookup(data)[0]
@@ -0,0 +1,56 @@
+"""
+Счетчиковый генератор случайных чисел для произвольного доступа к случаям
+
+Генератор случая с номером k инициализируется хэшем BLAKE2b от
+(seed, k, поток), поэтому случай k - чистая функция (seed, k): его можно
+построить отдельно от остальных, наборы делятся на части между потоками и
+процессами без общего состояния, а результат не зависит от порядка
+генерации. Без seed используется глобальный модуль random.
+"""
+
+import hashlib
+import random
+from typing import Any, Optional
+
+
+# Номер случая для крайних случаев (обычные случаи нумеруются с 0)
+EDGE_INDEX = -1
+
+
+def derive_seed(seed: int, index: int, stream: int = 0) -> int:
+    """
+    Начальное значение генератора случая
+
+    Args:
+        seed: Начальное значение набора
+        index: Номер случая
+        stream: Номер независимого потока (например, попытки перегенерации)
+
+    Returns:
+        64-битное целое, равномерно зависящее от всех аргументов
+    """
+    key = f"{seed}:{index}:{stream}".encode('ascii')
+    digest = hashlib.blake2b(key, digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def case_random(seed: int, index: int, stream: int = 0) -> random.Random:
+    """Независимый генератор случая index набора seed"""
+    return random.Random(derive_seed(seed, index, stream))
+
+
+def case_rng(seed: Optional[int], index: int, stream: int = 0) -> Any:
+    """
+    Источник случайных чисел для случая index
+
+    Args:
+        seed: Начальное значение набора (None - глобальный random)
+        index: Номер случая
+        stream: Номер независимого потока
+
+    Returns:
+        random.Random случая или модуль random, если seed не задан
+    """
+    if seed is None:
+        return random
+    return case_random(seed, index, stream)
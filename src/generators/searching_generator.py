@@ -2,65 +2,147 @@
 Генератор тестовых случаев для задач поиска
 """
 
-import random
-import copy
-from typing import List, Dict, Any
+from typing import Any, Dict, List, Optional
 
+from . import adversarial, buffers
 from .base_generator import BaseGenerator, TestCase
 
 
+def _first_index(data: Dict[str, Any]) -> int:
+    """Индекс первого вхождения target в array или -1"""
+    return buffers.index_of(data["array"], data["target"])
+
+
+def _first_indices(data: Dict[str, Any]) -> Any:
+    """Индексы первых вхождений каждого из targets в отсортированный array"""
+    return buffers.first_indices(data["array"], data["targets"])
+
+
 class SearchingGenerator(BaseGenerator):
     """Генератор для задач поиска (бинарный поиск, линейный поиск)"""
 
-    def __init__(self, min_len: int = 1, max_len: int = 50) -> None:
+    ORACLES = {"searching": _first_index, "searching_many": _first_indices}
+
+    def __init__(
+        self,
+        min_len: int = 1,
+        max_len: int = 50,
+        adversarial_size: int = 0,
+        hash_modulus: int = adversarial.DEFAULT_HASH_MODULUS,
+        array_type: str = "list",
+        seed: Optional[int] = None,
+        queries: int = 0,
+    ) -> None:
+        """
+        Инициализация генератора
+
+        Args:
+            min_len: Минимальная длина массива
+            max_len: Максимальная длина массива
+            adversarial_size: Длина состязательных массивов, добавляемых
+                к крайним случаям (0 - не добавлять)
+            hash_modulus: Модуль, по которому совпадают ключи с коллизиями
+                (по умолчанию у ключей совпадает hash() CPython; такие ключи
+                не помещаются в int64 и требуют array_type "list")
+            array_type: Представление массивов обычных и состязательных
+                случаев из buffers.ARRAY_TYPES
+            seed: Начальное значение счетчикового генератора (случай k
+                вычисляется по (seed, k)); None - глобальный random
+            queries: Количество запросов к одному массиву в обычном случае
+                (0 - один target на случай)
+        """
         self.min_len = min_len
         self.max_len = max_len
+        self.adversarial_size = max(0, adversarial_size)
+        self.hash_modulus = hash_modulus
+        self.array_type = buffers.check_array_type(array_type)
+        self.seed = seed
+        self.queries = max(0, queries)
 
-    def generate_normal_cases(self, n: int = 5) -> List[TestCase]:
-        cases = []
-
-        for i in range(n):
-            # Генерация отсортированного массива
-            length = random.randint(self.min_len, self.max_len)
-            
-            # Создаем массив с уникальными элементами
-            arr = []
-            while len(arr) < length:
-                num = random.randint(1, 1000)
-                if num not in arr:
-                    arr.append(num)
-            
-            arr.sort()
-
-            # Выбор элемента для поиска
-            if random.random() > 0.3:  # 70% что элемент есть
-                target = random.choice(arr)
-                expected = arr.index(target)
-                desc_suffix = f"элемент {target} присутствует в массиве"
-            else:  # 30% что элемента нет
-                # Генерируем число которого точно нет в массиве
-                target = 1001
-                while target in arr:
-                    target = random.randint(1001, 2000)
-                expected = -1
-                desc_suffix = f"элемент {target} отсутствует в массиве"
-
-            cases.append(
-                TestCase(
-                    input={"array": copy.deepcopy(arr), "target": target},
-                    expected=expected,
-                    description=(
-                        f"Поиск элемента в отсортированном массиве "
-                        f"из {length} элементов. {desc_suffix}"
-                    ),
-                    is_edge_case=False,
-                    weight=1.0,
-                )
-            )
+    def _generate_case(self, index: int, rng: Any) -> TestCase:
+        if self.queries:
+            return self._generate_multi_query_case(index, rng)
 
-        return cases
+        # Генерация отсортированного массива
+        length = rng.randint(self.min_len, self.max_len)
 
-    def generate_edge_cases(self) -> List[TestCase]:
+        # Создаем массив с уникальными элементами
+        arr = []
+        retries = 0
+        while len(arr) < length:
+            num = rng.randint(1, 1000)
+            if num not in arr:
+                arr.append(num)
+            else:
+                retries += 1
+        self._count("retries.unique_values", retries)
+
+        arr.sort()
+
+        # Выбор элемента для поиска
+        if rng.random() > 0.3:  # 70% что элемент есть
+            target = rng.choice(arr)
+            desc_suffix = f"элемент {target} присутствует в массиве"
+        else:  # 30% что элемента нет
+            # Генерируем число которого точно нет в массиве
+            target = 1001
+            while target in arr:
+                target = rng.randint(1001, 2000)
+                self._count("retries.absent_target")
+            desc_suffix = f"элемент {target} отсутствует в массиве"
+
+        data = {"array": self._pack(arr), "target": target}
+        return TestCase(
+            input=data,
+            expected=self._expected("searching", data),
+            description=(
+                f"Поиск элемента в отсортированном массиве "
+                f"из {length} элементов. {desc_suffix}"
+            ),
+            is_edge_case=False,
+            weight=1.0,
+        )
+
+    def _generate_multi_query_case(self, index: int, rng: Any) -> TestCase:
+        """
+        Случай с queries запросами к одному отсортированному массиву
+
+        Массив содержит повторы (ответ - первое вхождение) и пропуски
+        значений; запросы смешивают имеющиеся элементы, произвольные
+        значения и границы. Ответы вычисляются сразу для всех запросов
+        двоичным поиском (buffers.first_indices).
+        """
+        length = max(1, rng.randint(self.min_len, self.max_len))
+        # Значения из [1, 2 * length]: часть повторяется, часть отсутствует
+        high = 2 * length
+        arr = sorted(rng.choices(range(1, high + 1), k=length))
+
+        bounds = [arr[0] - 1, arr[0], arr[-1], arr[-1] + 1][: self.queries]
+        count = self.queries - len(bounds)
+        targets = (
+            bounds
+            + rng.choices(arr, k=count // 2)
+            + rng.choices(range(high + 2), k=count - count // 2)
+        )
+        rng.shuffle(targets)
+
+        data = {"array": self._pack(arr), "targets": self._pack(targets)}
+        present = set(arr)
+        absent = sum(1 for target in targets if target not in present)
+        return TestCase(
+            input=data,
+            expected=self._pack(self._expected("searching_many", data)),
+            description=(
+                f"Нормальный случай {index+1}: {len(targets)} запросов поиска "
+                f"в отсортированном массиве из {length} элементов, "
+                f"отсутствуют: {absent}"
+            ),
+            is_edge_case=False,
+            weight=1.0,
+        )
+
+    @classmethod
+    def _build_static_edge_cases(cls) -> List[TestCase]:
         return [
             TestCase(
                 input={"array": [], "target": 5},
@@ -111,4 +193,93 @@ class SearchingGenerator(BaseGenerator):
                 is_edge_case=True,
                 weight=1.2,
             ),
-        ]
\ No newline at end of file
+        ]
+
+    def generate_edge_cases(self) -> List[TestCase]:
+        edge_cases = self.static_edge_cases()
+
+        if self.queries:
+            edge_cases.append(
+                TestCase(
+                    input={
+                        "array": [1, 2, 2, 2, 3, 5, 5, 8],
+                        "targets": [0, 1, 2, 3, 4, 5, 8, 9],
+                    },
+                    expected=[-1, 0, 1, 4, -1, 5, 7, -1],
+                    description="Несколько запросов: границы, повторы "
+                    "и отсутствующие элементы",
+                    is_edge_case=True,
+                    weight=1.3,
+                )
+            )
+
+        if self.adversarial_size:
+            edge_cases.extend(self.generate_adversarial_cases(self.adversarial_size))
+
+        return edge_cases
+
+    def generate_adversarial_cases(self, size: int) -> List[TestCase]:
+        """
+        Генерация состязательных случаев против медленного поиска
+
+        Ключи с коллизиями хэшей замедляют поиск через словарь или
+        хэш-таблицу без рандомизации, длинная серия дубликатов - поиск
+        первого вхождения шагами назад от найденного, отсутствующий
+        элемент в конце - линейный поиск. Все массивы строятся за O(size).
+
+        Args:
+            size: Длина каждого массива
+
+        Returns:
+            Список состязательных случаев
+
+        Raises:
+            ValueError: Если ключи с коллизиями не помещаются в int64, а
+                array_type - не "list"
+        """
+        size = max(1, size)
+        largest = size * self.hash_modulus
+        if self.array_type != "list" and largest > adversarial.INT64_MAX:
+            raise ValueError(
+                f"Ключи с коллизиями хэшей по модулю {self.hash_modulus} не "
+                f"помещаются в int64 (array_type {self.array_type!r}); "
+                "используйте array_type 'list' или меньший hash_modulus"
+            )
+        # Оба случая с коллизиями ссылаются на один и тот же массив ключей
+        keys = self._pack(adversarial.hash_collision_keys(size, self.hash_modulus))
+        run = size // 4
+        duplicates = self._pack([0] * run + [1] * (size - 2 * run) + [2] * run)
+
+        cases = [
+            (
+                {"array": keys, "target": int(keys[-1])},
+                size - 1,
+                "коллизии хэшей, элемент в конце",
+            ),
+            (
+                {"array": keys, "target": size * self.hash_modulus},
+                -1,
+                "коллизии хэшей, элемент отсутствует",
+            ),
+            (
+                {"array": duplicates, "target": 1},
+                run,
+                "первое вхождение в длинной серии дубликатов",
+            ),
+            (
+                {"array": self._pack(range(size)), "target": size},
+                -1,
+                "элемент больше всех элементов массива",
+            ),
+        ]
+
+        return [
+            TestCase(
+                input=data,
+                expected=expected,
+                description=f"Состязательный случай: {name}, {size} элементов",
+                is_edge_case=True,
+                weight=2.0,
+            )
+            for data, expected, name in cases
+        ]
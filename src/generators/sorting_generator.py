@@ -2,76 +2,106 @@
 Генератор тестовых случаев для задач сортировки
 """
 
-import random
-import copy
-from typing import List
+from array import array
+from typing import Any, Iterator, List, Optional, Sequence
 
+from . import adversarial, buffers
 from .base_generator import BaseGenerator, TestCase
+from .rng import EDGE_INDEX, case_rng
+from .spill import SpillStore, SpilledArray, external_sort
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - зависит от окружения
+    np = None  # type: ignore[assignment]
+
+
+# Поток генератора стресс-теста, независимый от крайних случаев
+_STRESS_STREAM = 1
+
+
+def _sorted(values: Any) -> Any:
+    """Отсортированная копия массива (массивы NumPy сортирует NumPy)"""
+    if np is not None and isinstance(values, np.ndarray):
+        return np.sort(values, kind="stable")
+    return sorted(values)
 
 
 class SortingGenerator(BaseGenerator):
     """Генератор тестовых случаев для задач сортировки"""
 
-    def __init__(self, min_len: int = 0, max_len: int = 100) -> None:
+    ORACLES = {"sorting": _sorted}
+
+    def __init__(
+        self,
+        min_len: int = 0,
+        max_len: int = 100,
+        adversarial_size: int = 0,
+        array_type: str = "list",
+        seed: Optional[int] = None,
+    ) -> None:
         """
         Инициализация генератора
         
         Args:
             min_len: Минимальная длина массива
             max_len: Максимальная длина массива
+            adversarial_size: Длина состязательных массивов, добавляемых
+                к крайним случаям (0 - не добавлять)
+            array_type: Представление массивов обычных и состязательных
+                случаев из buffers.ARRAY_TYPES
+            seed: Начальное значение счетчикового генератора (случай k
+                вычисляется по (seed, k)); None - глобальный random
         """
         self.min_len = max(0, min_len)
         self.max_len = max(min_len, max_len)
+        self.adversarial_size = max(0, adversarial_size)
+        self.array_type = buffers.check_array_type(array_type)
+        self.seed = seed
 
-    def generate_normal_cases(self, n: int = 5) -> List[TestCase]:
-        cases = []
-        
-        for i in range(n):
-            # Разная сложность для разных случаев
-            if i == 0:
-                length = random.randint(5, 10)  # Маленький массив
-            elif i == 1:
-                min_val = max(50, self.min_len)
-                max_val = min(100, self.max_len)
-                if min_val <= max_val:
-                    length = random.randint(min_val, max_val)
-                else:
-                    length = random.randint(self.min_len, self.max_len)
+    def _generate_case(self, index: int, rng: Any) -> TestCase:
+        # Разная сложность для разных случаев
+        if index == 0:
+            length = rng.randint(5, 10)  # Маленький массив
+        elif index == 1:
+            min_val = max(50, self.min_len)
+            max_val = min(100, self.max_len)
+            if min_val <= max_val:
+                length = rng.randint(min_val, max_val)
             else:
-                length = random.randint(self.min_len, self.max_len)
-            
-            # Генерация массива
-            arr = [random.randint(-1000, 1000) for _ in range(length)]
-            
-            # Добавление особенностей
-            if length > 5 and random.random() > 0.5:
-                # Добавляем дубликаты
-                duplicates = random.randint(1, 3)
-                for _ in range(duplicates):
-                    arr.append(arr[random.randint(0, len(arr) - 1)])
-            
-            if random.random() > 0.7:
-                # Добавляем отрицательные числа
-                for j in range(len(arr)):
-                    if random.random() > 0.5:
-                        arr[j] = -arr[j]
-            
-            cases.append(
-                TestCase(
-                    input=arr.copy(),  # Используем copy вместо deepcopy
-                    expected=sorted(arr),
-                    description=f"Нормальный случай {i+1}: "
-                    f"массив из {length} элементов",
-                    is_edge_case=False,
-                    weight=1.0,
-                )
-            )
-    
-        return cases
+                length = rng.randint(self.min_len, self.max_len)
+        else:
+            length = rng.randint(self.min_len, self.max_len)
 
-    def generate_edge_cases(self) -> List[TestCase]:
-        """Генерация крайних случаев для сортировки"""
-        edge_cases = [
+        # Генерация массива
+        arr = [rng.randint(-1000, 1000) for _ in range(length)]
+
+        # Добавление особенностей
+        if length > 5 and rng.random() > 0.5:
+            # Добавляем дубликаты
+            duplicates = rng.randint(1, 3)
+            for _ in range(duplicates):
+                arr.append(arr[rng.randint(0, len(arr) - 1)])
+
+        if rng.random() > 0.7:
+            # Добавляем отрицательные числа
+            for j in range(len(arr)):
+                if rng.random() > 0.5:
+                    arr[j] = -arr[j]
+
+        arr = self._pack(arr)
+        return TestCase(
+            input=arr,
+            expected=self._pack(self._expected("sorting", arr)),
+            description=f"Нормальный случай {index+1}: "
+            f"массив из {length} элементов",
+            is_edge_case=False,
+            weight=1.0,
+        )
+
+    @classmethod
+    def _build_static_edge_cases(cls) -> List[TestCase]:
+        return [
             TestCase(
                 input=[],
                 expected=[],
@@ -109,16 +139,108 @@ class SortingGenerator(BaseGenerator):
             ),
         ]
 
+    def generate_edge_cases(self) -> List[TestCase]:
+        """Генерация крайних случаев для сортировки"""
+        edge_cases = self.static_edge_cases()
+
         # Добавляем случай с очень большими числами
-        large_numbers = [random.randint(10**6, 10**9) for _ in range(20)]
+        rng = self._rng(EDGE_INDEX)
+        large_numbers = self._pack([rng.randint(10**6, 10**9) for _ in range(20)])
         edge_cases.append(
             TestCase(
                 input=large_numbers,
-                expected=sorted(large_numbers),
+                expected=self._pack(self._expected("sorting", large_numbers)),
                 description="Массив с очень большими числами",
                 is_edge_case=True,
                 weight=1.3,
             )
         )
 
-        return edge_cases
\ No newline at end of file
+        if self.adversarial_size:
+            edge_cases.extend(self.generate_adversarial_cases(self.adversarial_size))
+
+        return edge_cases
+
+    def generate_adversarial_cases(self, size: int) -> List[TestCase]:
+        """
+        Генерация состязательных случаев против медленных сортировок
+
+        Массивы и ожидаемые результаты строятся за O(size), поэтому
+        размеры до 10^7 допустимы.
+
+        Args:
+            size: Длина каждого массива
+
+        Returns:
+            Список случаев: убийца медианы из трех, пила, много равных
+            ключей, «органная труба» и обратный порядок
+        """
+        half = (size + 1) // 2
+
+        def family(arr: List[int], name: str, high: Optional[int] = None) -> TestCase:
+            # Значения лежат в [0, high] и сортируются подсчетом; без high
+            # массив - перестановка чисел 1..size. Массив упаковывается
+            # сразу, чтобы временные списки семейств не копились в памяти
+            expected: Sequence[int]
+            if high is None:
+                expected = range(1, size + 1)
+            else:
+                expected = adversarial.counting_sorted(arr, 0, high)
+            return TestCase(
+                input=self._pack(arr),
+                expected=self._pack(expected),
+                description=f"Состязательный случай: {name}, {size} элементов",
+                is_edge_case=True,
+                weight=2.0,
+            )
+
+        return [
+            family(
+                adversarial.median_of_three_killer(size), "медиана из трех (Мюссер)"
+            ),
+            family(adversarial.sawtooth(size), "пила", 15),
+            family(adversarial.many_equal(size), "много равных ключей", 2),
+            family(adversarial.organ_pipe(size), "органная труба", half),
+            family(list(range(size, 0, -1)), "обратный порядок"),
+        ]
+
+    def generate_stress_case(
+        self,
+        length: int,
+        store: SpillStore,
+        low: int = -10**9,
+        high: int = 10**9,
+    ) -> TestCase:
+        """
+        Генерация огромного случая с массивами, выгруженными на диск
+
+        Входной массив пишется в файл фрагментами, ожидаемый результат
+        строится внешней сортировкой слиянием, поэтому память ограничена
+        store.memory_limit, а не длиной массива.
+
+        Args:
+            length: Длина массива
+            store: Хранилище выгружаемых массивов
+            low: Минимальное значение элемента
+            high: Максимальное значение элемента
+
+        Returns:
+            Случай, у которого input и expected - SpilledArray
+        """
+        values = range(low, high + 1)
+        rng = case_rng(self.seed, EDGE_INDEX, _STRESS_STREAM)
+
+        def chunks() -> Iterator[array]:
+            for offset in range(0, length, store.chunk_size):
+                count = min(store.chunk_size, length - offset)
+                yield array('q', rng.choices(values, k=count))
+
+        arr = SpilledArray.from_chunks(store.new_path("input"), chunks())
+
+        return TestCase(
+            input=arr,
+            expected=external_sort(arr, store),
+            description=f"Стресс-тест: массив из {length} элементов",
+            is_edge_case=True,
+            weight=2.0,
+        )
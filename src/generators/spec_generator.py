@@ -0,0 +1,519 @@
+"""
+Генератор тестовых случаев по декларативной спецификации
+
+Спецификация (YAML) описывает структуру входных данных: диапазоны и
+распределения значений, длины массивов, уникальность и упорядоченность,
+а также эталонное решение для вычисления ожидаемого результата.
+Спецификация компилируется один раз в план выборки, который генерирует
+входные данные сразу для всего запроса (через NumPy, если он установлен).
+
+Пример спецификации:
+
+    name: binary_search
+    description: Поиск элемента в отсортированном массиве
+    input:
+      type: object
+      fields:
+        array:
+          type: array
+          length: {min: 1, max: 1000}
+          values: {min: -1000000, max: 1000000}
+          unique: true
+          sorted: asc
+        target:
+          type: element_of
+          field: array
+          probability: 0.7
+          otherwise: {min: -1000000, max: 1000000}
+    expected: index
+"""
+
+import bisect
+import math
+import random
+from typing import Annotated, Any, Callable, Dict, List, Literal, Optional, Union
+
+import yaml
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from .base_generator import BaseGenerator, TestCase
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - зависит от окружения
+    np = None  # type: ignore[assignment]
+
+
+class RangeSpec(BaseModel):
+    """Диапазон целых чисел (включительно)"""
+
+    min: int = 0
+    max: int = 100
+
+    @model_validator(mode="after")
+    def _check_bounds(self) -> "RangeSpec":
+        if self.min > self.max:
+            raise ValueError(f"min ({self.min}) больше max ({self.max})")
+        return self
+
+
+class IntSpec(RangeSpec):
+    """Целое число с заданным распределением"""
+
+    type: Literal["int"] = "int"
+    distribution: Literal["uniform", "normal", "log_uniform"] = "uniform"
+    mean: Optional[float] = None
+    std: Optional[float] = None
+
+    @model_validator(mode="after")
+    def _check_distribution(self) -> "IntSpec":
+        if self.distribution == "log_uniform" and self.min <= 0:
+            raise ValueError("log_uniform требует min > 0")
+        return self
+
+
+class ArraySpec(BaseModel):
+    """Массив целых чисел"""
+
+    type: Literal["array"]
+    length: RangeSpec = Field(default_factory=RangeSpec)
+    values: IntSpec = Field(default_factory=IntSpec)
+    unique: bool = False
+    sorted: Literal["none", "asc", "desc"] = "none"
+
+    @field_validator("length", mode="before")
+    @classmethod
+    def _fixed_length(cls, value: Any) -> Any:
+        if isinstance(value, int):
+            return {"min": value, "max": value}
+        return value
+
+    @field_validator("sorted", mode="before")
+    @classmethod
+    def _sorted_flag(cls, value: Any) -> Any:
+        if value is True:
+            return "asc"
+        if value is False or value is None:
+            return "none"
+        return value
+
+    @model_validator(mode="after")
+    def _check_unique(self) -> "ArraySpec":
+        span = self.values.max - self.values.min + 1
+        if self.unique and self.length.max > span:
+            raise ValueError(
+                f"невозможно выбрать {self.length.max} уникальных значений "
+                f"из диапазона размера {span}"
+            )
+        return self
+
+
+class ElementOfSpec(BaseModel):
+    """Элемент соседнего массива (с вероятностью probability) или число"""
+
+    type: Literal["element_of"]
+    field: str
+    probability: float = Field(default=1.0, ge=0.0, le=1.0)
+    otherwise: IntSpec = Field(default_factory=IntSpec)
+
+
+def _default_int_type(value: Any) -> Any:
+    """Поле без type считается целым числом"""
+    if isinstance(value, dict) and "type" not in value:
+        return {**value, "type": "int"}
+    return value
+
+
+class ObjectSpec(BaseModel):
+    """Словарь с именованными полями"""
+
+    type: Literal["object"]
+    fields: Dict[str, "FieldSpec"]
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def _default_field_types(cls, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {name: _default_int_type(f) for name, f in value.items()}
+        return value
+
+
+class TupleSpec(BaseModel):
+    """Кортеж значений"""
+
+    type: Literal["tuple"]
+    items: List["FieldSpec"]
+
+    @field_validator("items", mode="before")
+    @classmethod
+    def _default_item_types(cls, value: Any) -> Any:
+        if isinstance(value, list):
+            return [_default_int_type(item) for item in value]
+        return value
+
+
+FieldSpec = Annotated[
+    Union[IntSpec, ArraySpec, ElementOfSpec, ObjectSpec, TupleSpec],
+    Field(discriminator="type"),
+]
+ObjectSpec.model_rebuild()
+TupleSpec.model_rebuild()
+
+
+class EdgeCaseSpec(BaseModel):
+    """Явно заданный крайний случай"""
+
+    input: Any
+    expected: Any = None
+    description: str = ""
+    weight: float = 1.5
+
+
+class ProblemSpec(BaseModel):
+    """Спецификация задачи"""
+
+    name: str
+    description: str = ""
+    input: FieldSpec
+    expected: str = Field(description="Имя эталонного решения из ORACLES")
+    weight: float = 1.0
+    edge_cases: List[EdgeCaseSpec] = Field(default_factory=list)
+
+    @field_validator("input", mode="before")
+    @classmethod
+    def _default_input_type(cls, value: Any) -> Any:
+        return _default_int_type(value)
+
+
+def _fibonacci(n: int) -> int:
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def _is_prime(n: int) -> bool:
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    for d in range(3, math.isqrt(n) + 1, 2):
+        if n % d == 0:
+            return False
+    return True
+
+
+def _first_index(data: Dict[str, Any]) -> int:
+    arr, target = data["array"], data["target"]
+    return arr.index(target) if target in arr else -1
+
+
+def _first_index_sorted(data: Dict[str, Any]) -> int:
+    arr, target = data["array"], data["target"]
+    i = bisect.bisect_left(arr, target)
+    return i if i < len(arr) and arr[i] == target else -1
+
+
+# Эталонные решения, доступные в спецификациях
+ORACLES: Dict[str, Callable[[Any], Any]] = {
+    "sorted": sorted,
+    "sorted_desc": lambda data: sorted(data, reverse=True),
+    "index": _first_index,
+    "gcd": lambda data: math.gcd(*data),
+    "factorial": math.factorial,
+    "fibonacci": _fibonacci,
+    "is_prime": _is_prime,
+    "is_palindrome": lambda n: str(n) == str(n)[::-1],
+    "sum": sum,
+    "min": min,
+    "max": max,
+}
+
+
+# Предел раундов довыборки уникальных значений массива
+_MAX_UNIQUE_ROUNDS = 1000
+
+
+class _Sampler:
+    """Узел плана выборки: генерирует значения сразу для count случаев"""
+
+    def sample_many(self, count: int) -> List[Any]:
+        raise NotImplementedError
+
+
+class _IntSampler(_Sampler):
+    def __init__(self, spec: IntSpec, rng: Any) -> None:
+        self.spec = spec
+        self.rng = rng
+        default_std = (spec.max - spec.min) / 6 or 1.0
+        self.mean = spec.mean if spec.mean is not None else (spec.min + spec.max) / 2
+        self.std = spec.std if spec.std is not None else default_std
+
+    def sample_array(self, count: int) -> Any:
+        """Выборка в виде массива NumPy int64 (только при наличии NumPy)"""
+        spec, rng = self.spec, self.rng
+        lo, hi = spec.min, spec.max
+
+        if spec.distribution == "uniform":
+            return rng.integers(lo, hi, size=count, endpoint=True, dtype=np.int64)
+        if spec.distribution == "normal":
+            values = np.rint(rng.normal(self.mean, self.std, size=count))
+        else:
+            log_range = (math.log(lo), math.log(hi + 1))
+            values = np.floor(np.exp(rng.uniform(*log_range, size=count)))
+        return np.clip(values, lo, hi).astype(np.int64)
+
+    def sample_many(self, count: int) -> List[int]:
+        if self.rng is not None:
+            values: List[int] = self.sample_array(count).tolist()
+            return values
+
+        spec = self.spec
+        lo, hi = spec.min, spec.max
+        if spec.distribution == "uniform":
+            return random.choices(range(lo, hi + 1), k=count)
+        if spec.distribution == "normal":
+            return [
+                min(hi, max(lo, round(random.gauss(self.mean, self.std))))
+                for _ in range(count)
+            ]
+        log_lo, log_hi = math.log(lo), math.log(hi + 1)
+        return [
+            min(hi, int(math.exp(random.uniform(log_lo, log_hi))))
+            for _ in range(count)
+        ]
+
+
+class _ArraySampler(_Sampler):
+    def __init__(self, spec: ArraySpec, rng: Any, name: str) -> None:
+        self.spec = spec
+        self.rng = rng
+        self.name = name
+        length = IntSpec(min=spec.length.min, max=spec.length.max)
+        self.lengths = _IntSampler(length, rng)
+        self.values = _IntSampler(spec.values, rng)
+
+    def sample_many(self, count: int) -> List[List[int]]:
+        spec = self.spec
+        lengths = self.lengths.sample_many(count)
+
+        if spec.unique:
+            arrays = [self._sample_unique(length) for length in lengths]
+        elif self.rng is not None:
+            return self._sample_numpy(lengths)
+        else:
+            # Значения всех массивов генерируются одним вызовом и нарезаются
+            flat = self.values.sample_many(sum(lengths))
+            arrays = []
+            offset = 0
+            for length in lengths:
+                arrays.append(flat[offset:offset + length])
+                offset += length
+
+        if spec.sorted != "none":
+            reverse = spec.sorted == "desc"
+            for arr in arrays:
+                arr.sort(reverse=reverse)
+
+        return arrays
+
+    def _sample_numpy(self, lengths: List[int]) -> List[List[int]]:
+        """Векторизованная выборка: один вызов генератора и сортировка в NumPy"""
+        flat = self.values.sample_array(sum(lengths))
+        segments = np.split(flat, np.cumsum(lengths)[:-1]) if lengths else []
+
+        if self.spec.sorted == "none":
+            return [segment.tolist() for segment in segments]
+
+        arrays = []
+        for segment in segments:
+            segment.sort()
+            if self.spec.sorted == "desc":
+                segment = segment[::-1]
+            arrays.append(segment.tolist())
+        return arrays
+
+    def _sample_unique(self, length: int) -> List[int]:
+        values = self.spec.values
+        if values.distribution == "uniform":
+            return random.sample(range(values.min, values.max + 1), length)
+
+        # Для неравномерных распределений - выборка с отбрасыванием повторов.
+        # Диапазон достаточен (см. ArraySpec), но узкое распределение может
+        # почти не давать новых значений, поэтому число раундов ограничено
+        seen: Dict[int, None] = {}
+        for _ in range(_MAX_UNIQUE_ROUNDS):
+            if len(seen) >= length:
+                return list(seen)[:length]
+            for value in self.values.sample_many(length - len(seen)):
+                seen.setdefault(value, None)
+        if len(seen) >= length:
+            return list(seen)[:length]
+        raise ValueError(
+            f"поле {self.name}: распределение {values.distribution} не дало "
+            f"{length} уникальных значений за {_MAX_UNIQUE_ROUNDS} раундов выборки "
+            f"(получено {len(seen)}); увеличьте std или уменьшите длину массива"
+        )
+
+
+class _ElementOfSampler(_Sampler):
+    def __init__(self, spec: ElementOfSpec, rng: Any) -> None:
+        self.spec = spec
+        self.otherwise = _IntSampler(spec.otherwise, rng)
+
+    def sample_from(self, arrays: List[List[int]]) -> List[int]:
+        fallback = self.otherwise.sample_many(len(arrays))
+        probability = self.spec.probability
+        return [
+            random.choice(arr) if arr and random.random() < probability else other
+            for arr, other in zip(arrays, fallback)
+        ]
+
+
+class _ObjectSampler(_Sampler):
+    def __init__(self, spec: ObjectSpec, rng: Any, path: str) -> None:
+        self.fields: Dict[str, _Sampler] = {}
+        self.references: Dict[str, _ElementOfSampler] = {}
+
+        for name, field in spec.fields.items():
+            if isinstance(field, ElementOfSpec):
+                target = spec.fields.get(field.field)
+                if not isinstance(target, ArraySpec):
+                    raise ValueError(
+                        f"поле {name}: element_of ссылается на {field.field}, "
+                        f"который не является массивом этого объекта"
+                    )
+                self.references[name] = _ElementOfSampler(field, rng)
+            else:
+                self.fields[name] = _compile(field, rng, f"{path}.{name}")
+
+        self.order = list(spec.fields)
+
+    def sample_many(self, count: int) -> List[Dict[str, Any]]:
+        columns = {
+            name: sampler.sample_many(count) for name, sampler in self.fields.items()
+        }
+        for name, sampler in self.references.items():
+            columns[name] = sampler.sample_from(columns[sampler.spec.field])
+        return [
+            {name: columns[name][i] for name in self.order} for i in range(count)
+        ]
+
+
+class _TupleSampler(_Sampler):
+    def __init__(self, spec: TupleSpec, rng: Any, name: str) -> None:
+        self.items = [
+            _compile(item, rng, f"{name}[{i}]") for i, item in enumerate(spec.items)
+        ]
+
+    def sample_many(self, count: int) -> List[tuple]:
+        return list(zip(*(item.sample_many(count) for item in self.items)))
+
+
+def _compile(spec: Any, rng: Any, name: str = "input") -> _Sampler:
+    """План выборки для спецификации поля name (имя - для сообщений об ошибках)"""
+    if isinstance(spec, IntSpec):
+        return _IntSampler(spec, rng)
+    if isinstance(spec, ArraySpec):
+        return _ArraySampler(spec, rng, name)
+    if isinstance(spec, ObjectSpec):
+        return _ObjectSampler(spec, rng, name)
+    if isinstance(spec, TupleSpec):
+        return _TupleSampler(spec, rng, name)
+    raise ValueError("element_of допустим только как поле объекта")
+
+
+class _NumpyRandom:
+    """Генератор NumPy, пересеваемый из модуля random для воспроизводимости"""
+
+    def __init__(self) -> None:
+        self.generator = np.random.default_rng(random.getrandbits(64))
+
+    def reseed(self) -> None:
+        self.generator = np.random.default_rng(random.getrandbits(64))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.generator, name)
+
+
+class SpecGenerator(BaseGenerator):
+    """Генератор тестовых случаев по спецификации ProblemSpec"""
+
+    def __init__(
+        self,
+        spec: Union[str, Dict[str, Any], ProblemSpec],
+        use_numpy: Optional[bool] = None,
+    ) -> None:
+        """
+        Инициализация генератора
+
+        Args:
+            spec: Путь к YAML файлу, словарь или готовая спецификация
+            use_numpy: Использовать NumPy (по умолчанию - если установлен)
+        """
+        if isinstance(spec, str):
+            with open(spec, 'r', encoding='utf-8') as f:
+                spec = yaml.safe_load(f)
+        if not isinstance(spec, ProblemSpec):
+            spec = ProblemSpec.model_validate(spec)
+
+        if spec.expected not in ORACLES:
+            raise ValueError(f"Неизвестное эталонное решение: {spec.expected}")
+
+        if use_numpy is None:
+            use_numpy = np is not None
+        if use_numpy and np is None:
+            raise ValueError("NumPy не установлен")
+
+        self.spec = spec
+        self._np_rng = _NumpyRandom() if use_numpy else None
+        self._plan = _compile(spec.input, self._np_rng)
+        # Оракул задачи называется по имени эталонного решения
+        self.ORACLES = {spec.expected: self._choose_oracle()}
+
+    def _choose_oracle(self) -> Callable[[Any], Any]:
+        """Выбор эталонного решения с учетом свойств спецификации"""
+        spec = self.spec
+        if spec.expected == "index" and isinstance(spec.input, ObjectSpec):
+            array = spec.input.fields.get("array")
+            if isinstance(array, ArraySpec) and array.sorted == "asc":
+                return _first_index_sorted
+        return ORACLES[spec.expected]
+
+    def generate_normal_cases(self, n: int = 5, start: int = 0) -> List[TestCase]:
+        # Входы строятся планом пакетно (sample_many) из потока собственного
+        # генератора, поэтому _generate_case не реализован и произвольный
+        # доступ к случаям недоступен (см. supports_random_access)
+        if self._np_rng is not None:
+            self._np_rng.reseed()
+
+        title = self.spec.description or self.spec.name
+        inputs = self._plan.sample_many(n)
+
+        return self._batch_answers(
+            lambda: [
+                TestCase(
+                    input=data,
+                    expected=self._expected(self.spec.expected, data),
+                    description=f"Нормальный случай {i + 1}: {title}",
+                    is_edge_case=False,
+                    weight=self.spec.weight,
+                )
+                for i, data in enumerate(inputs, start)
+            ]
+        )
+
+    def generate_edge_cases(self) -> List[TestCase]:
+        return [
+            TestCase(
+                input=case.input,
+                expected=(
+                    case.expected if case.expected is not None
+                    else self._expected(self.spec.expected, case.input)
+                ),
+                description=case.description or f"Крайний случай {i + 1}",
+                is_edge_case=True,
+                weight=case.weight,
+            )
+            for i, case in enumerate(self.spec.edge_cases)
+        ]
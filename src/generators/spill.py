@@ -0,0 +1,208 @@
+"""
+Массивы, выгруженные на диск, для огромных тестовых случаев
+
+Массив хранится в файле как последовательность 64-битных целых и читается
+фрагментами, ожидаемый результат сортировки строится внешней сортировкой
+слиянием. Объем памяти ограничен memory_limit независимо от длины массива.
+"""
+
+import heapq
+import os
+import shutil
+import tempfile
+from array import array
+from typing import Any, Iterable, Iterator, List, Optional
+
+from .buffers import int64_view
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - зависит от окружения
+    np = None  # type: ignore[assignment]
+
+
+ITEM_SIZE = array('q').itemsize
+
+DEFAULT_MEMORY_LIMIT = 256 * 1024 * 1024
+
+# Оценка памяти на элемент при сортировке в памяти: список Python
+# из целых (~36 байт) плюс буферы чтения и записи
+_BYTES_PER_SORTED_ITEM = 64
+
+
+class SpilledArray:
+    """Массив 64-битных целых, хранящийся в файле"""
+
+    def __init__(self, path: str, length: int = 0) -> None:
+        """
+        Args:
+            path: Путь к файлу с данными
+            length: Количество элементов
+        """
+        self.path = path
+        self.length = length
+
+    @classmethod
+    def from_chunks(cls, path: str, chunks: Iterable[Any]) -> "SpilledArray":
+        """
+        Запись массива фрагментами
+
+        Args:
+            path: Путь к создаваемому файлу
+            chunks: Фрагменты (array('q'), списки целых или массивы NumPy)
+
+        Returns:
+            Массив, ссылающийся на файл
+        """
+        length = 0
+        with open(path, 'wb') as f:
+            for chunk in chunks:
+                # Буферы int64 пишутся в файл как есть, без копирования
+                view = int64_view(chunk)
+                if view is None:
+                    view = memoryview(array('q', chunk))
+                f.write(view)
+                length += len(view)
+        return cls(path, length)
+
+    def iter_chunks(self, chunk_size: int = 1 << 16) -> Iterator[array]:
+        """Последовательное чтение фрагментами по chunk_size элементов"""
+        remaining = self.length
+        with open(self.path, 'rb') as f:
+            while remaining:
+                chunk = array('q')
+                count = min(chunk_size, remaining)
+                chunk.fromfile(f, count)
+                remaining -= count
+                yield chunk
+
+    def __iter__(self) -> Iterator[int]:
+        for chunk in self.iter_chunks():
+            yield from chunk
+
+    def __len__(self) -> int:
+        return self.length
+
+    def to_list(self) -> List[int]:
+        """Загрузка всего массива в память"""
+        return [value for chunk in self.iter_chunks() for value in chunk]
+
+    def is_sorted(self) -> bool:
+        """Проверка упорядоченности по неубыванию за один проход"""
+        previous: Optional[int] = None
+        for chunk in self.iter_chunks():
+            if previous is not None and chunk and chunk[0] < previous:
+                return False
+            if any(a > b for a, b in zip(chunk, chunk[1:])):
+                return False
+            if chunk:
+                previous = chunk[-1]
+        return True
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SpilledArray):
+            if len(other) != self.length:
+                return False
+            return all(
+                a == b for a, b in zip(self.iter_chunks(), other.iter_chunks())
+            )
+        if isinstance(other, (list, tuple)):
+            return len(other) == self.length and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SpilledArray({self.path!r}, length={self.length})"
+
+
+class SpillStore:
+    """Временный каталог для выгружаемых массивов с общим лимитом памяти"""
+
+    def __init__(
+        self, directory: Optional[str] = None, memory_limit: int = DEFAULT_MEMORY_LIMIT
+    ) -> None:
+        """
+        Args:
+            directory: Родительский каталог (по умолчанию - системный)
+            memory_limit: Допустимый объем памяти на сортировку, байты
+        """
+        self.path = tempfile.mkdtemp(prefix="testgen-spill-", dir=directory)
+        self.memory_limit = max(1 << 20, memory_limit)
+        self._counter = 0
+
+    @property
+    def chunk_size(self) -> int:
+        """Количество элементов, сортируемых в памяти за один раз"""
+        return max(1024, self.memory_limit // _BYTES_PER_SORTED_ITEM)
+
+    def new_path(self, name: str = "array") -> str:
+        """Путь к новому файлу в каталоге"""
+        self._counter += 1
+        return os.path.join(self.path, f"{name}-{self._counter}.bin")
+
+    def close(self) -> None:
+        """Удаление каталога со всеми файлами"""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def __enter__(self) -> "SpillStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _sorted_chunk(chunk: array) -> array:
+    if np is not None:
+        values = np.frombuffer(chunk, dtype=np.int64).copy()
+        values.sort()
+        return array('q', values.tobytes())
+    return array('q', sorted(chunk))
+
+
+def external_sort(source: SpilledArray, store: SpillStore) -> SpilledArray:
+    """
+    Внешняя сортировка слиянием
+
+    Массив делится на серии по store.chunk_size элементов, каждая
+    сортируется в памяти и записывается в файл, затем серии сливаются
+    в один файл с буферизованным чтением.
+
+    Args:
+        source: Исходный массив
+        store: Хранилище для серий и результата
+
+    Returns:
+        Отсортированный массив
+    """
+    runs = [
+        SpilledArray.from_chunks(store.new_path("run"), [_sorted_chunk(chunk)])
+        for chunk in source.iter_chunks(store.chunk_size)
+    ]
+    if not runs:
+        return SpilledArray.from_chunks(store.new_path("sorted"), [])
+    if len(runs) == 1:
+        return runs[0]
+
+    # Буферы чтения всех серий и записи результата делят лимит памяти
+    buffer = max(1024, store.chunk_size // (len(runs) + 1))
+    merged = heapq.merge(*(iter_values(run, buffer) for run in runs))
+
+    def output() -> Iterator[array]:
+        chunk = array('q')
+        for value in merged:
+            chunk.append(value)
+            if len(chunk) >= buffer:
+                yield chunk
+                chunk = array('q')
+        if chunk:
+            yield chunk
+
+    result = SpilledArray.from_chunks(store.new_path("sorted"), output())
+    for run in runs:
+        os.remove(run.path)
+    return result
+
+
+def iter_values(spilled: SpilledArray, chunk_size: int) -> Iterator[int]:
+    """Поэлементное чтение массива с буфером chunk_size элементов"""
+    for chunk in spilled.iter_chunks(chunk_size):
+        yield from chunk
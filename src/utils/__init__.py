@@ -4,5 +4,6 @@
 
 from .exporter import Exporter
 from .validator import Validator
+from .batch import BatchJob, BatchRunner
 
-__all__ = ["Exporter", "Validator"]
\ No newline at end of file
+__all__ = ["Exporter", "Validator", "BatchJob", "BatchRunner"]
\ No newline at end of file
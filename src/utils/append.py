@@ -0,0 +1,350 @@
+"""
+Модуль дозаписи новых случаев в существующий набор тестов
+
+Рядом с файлом набора хранится манифест (<файл>.manifest.json) с количеством
+случаев, размером файла и состоянием генератора случайных чисел, а также
+необязательный файл отпечатков (<файл>.fp) по 8 байт на случай для
+исключения дубликатов. Дозапись читает только манифест и последний байт
+файла, поэтому ее стоимость пропорциональна количеству новых случаев.
+Набор, построенный счетчиковым генератором (counter_rng), продолжается
+по seed и номерам случаев без сохраненного состояния random.
+"""
+
+import hashlib
+import json
+import os
+import random
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from pydantic import BaseModel, Field
+
+from src.generators.base_generator import BaseGenerator, TestCase
+from src.generators.buffers import json_default
+from src.utils.exporter import Exporter
+
+
+MANIFEST_SUFFIX = ".manifest.json"
+FINGERPRINTS_SUFFIX = ".fp"
+FINGERPRINT_SIZE = 8
+
+# Сколько раз перегенерировать случай, совпавший с уже существующим
+MAX_DUPLICATE_RETRIES = 100
+
+
+def fingerprint(data: Dict[str, Any]) -> bytes:
+    """
+    Отпечаток тестового случая по входным данным и ожидаемому результату
+
+    Args:
+        data: Словарь с полями input и expected
+
+    Returns:
+        8 байт хэша BLAKE2b
+    """
+    payload = json.dumps(
+        [data["input"], data["expected"]],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=json_default,
+    )
+    digest = hashlib.blake2b(payload.encode('utf-8'), digest_size=FINGERPRINT_SIZE)
+    return digest.digest()
+
+
+class SuiteManifest(BaseModel):
+    """Манифест набора тестов, допускающего дозапись"""
+
+    format: str = "jsonl"
+    task_type: Optional[str] = None
+    seed: Optional[int] = None
+    normal_cases: int = 0
+    edge_cases: int = 0
+    size: int = Field(default=0, description="Размер файла при записи манифеста")
+    rng_state: Optional[List[Any]] = Field(
+        default=None, description="Состояние random после последней генерации"
+    )
+    counter_rng: bool = Field(
+        default=False, description="Случай k построен по (seed, k)"
+    )
+
+    @property
+    def total_cases(self) -> int:
+        return self.normal_cases + self.edge_cases
+
+    @staticmethod
+    def path_for(filename: str) -> str:
+        return filename + MANIFEST_SUFFIX
+
+    @classmethod
+    def load(cls, filename: str) -> Optional["SuiteManifest"]:
+        """Загрузка манифеста набора (None, если манифеста нет)"""
+        path = cls.path_for(filename)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(**json.load(f))
+
+    def save(self, filename: str) -> None:
+        """Сохранение манифеста рядом с файлом набора"""
+        with open(self.path_for(filename), 'w', encoding='utf-8') as f:
+            json.dump(self.model_dump(), f, ensure_ascii=False)
+
+    @classmethod
+    def record(
+        cls,
+        filename: str,
+        normal_cases: int,
+        edge_cases: int,
+        task_type: Optional[str] = None,
+        seed: Optional[int] = None,
+        counter_rng: bool = False,
+    ) -> "SuiteManifest":
+        """
+        Создание манифеста для только что записанного набора
+
+        Сохраняет текущее состояние random, чтобы дозапись продолжила
+        ту же последовательность, и удаляет устаревший файл отпечатков.
+        """
+        manifest = cls(
+            task_type=task_type,
+            seed=seed,
+            counter_rng=counter_rng,
+            normal_cases=normal_cases,
+            edge_cases=edge_cases,
+            size=os.path.getsize(filename),
+            rng_state=_dump_rng_state(),
+        )
+        manifest.save(filename)
+
+        fp_path = filename + FINGERPRINTS_SUFFIX
+        if os.path.exists(fp_path):
+            os.remove(fp_path)
+
+        return manifest
+
+    @classmethod
+    def scan(cls, filename: str) -> "SuiteManifest":
+        """Восстановление манифеста полным чтением файла (без генерации)"""
+        manifest = cls()
+        for data in _iter_jsonl(filename):
+            if data.get("is_edge_case"):
+                manifest.edge_cases += 1
+            else:
+                manifest.normal_cases += 1
+        manifest.size = os.path.getsize(filename)
+        return manifest
+
+
+class AppendResult(BaseModel):
+    """Результат дозаписи"""
+
+    added: int = 0
+    regenerated_duplicates: int = 0
+    normal_cases: int = 0
+    total_cases: int = 0
+    bytes_written: int = 0
+
+
+def _dump_rng_state() -> List[Any]:
+    version, internal, gauss_next = random.getstate()
+    return [version, list(internal), gauss_next]
+
+
+def _load_rng_state(state: List[Any]) -> None:
+    version, internal, gauss_next = state
+    random.setstate((version, tuple(internal), gauss_next))
+
+
+def _iter_jsonl(filename: str) -> Iterator[Dict[str, Any]]:
+    with open(filename, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            if not line.endswith("\n"):
+                raise ValueError(f"{filename}: строка {number} не завершена")
+            if line.strip():
+                yield json.loads(line)
+
+
+def _ends_with_newline(filename: str) -> bool:
+    with open(filename, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+class SuiteAppender:
+    """Дозапись обычных случаев в конец существующего набора"""
+
+    def __init__(
+        self,
+        generator: BaseGenerator,
+        filename: str,
+        fmt: str = "jsonl",
+        task_type: Optional[str] = None,
+        chunk_size: int = 1000,
+    ) -> None:
+        """
+        Инициализация
+
+        Args:
+            generator: Генератор тестовых случаев
+            filename: Существующий файл набора
+            fmt: Формат из Exporter.APPENDABLE_FORMATS
+            task_type: Тип задачи (сверяется с манифестом)
+            chunk_size: Количество случаев, генерируемых за один раз
+        """
+        if fmt not in Exporter.APPENDABLE_FORMATS:
+            raise ValueError(f"Формат {fmt} не поддерживает дозапись")
+
+        self.generator = generator
+        self.filename = filename
+        self.fmt = fmt
+        self.task_type = task_type
+        self.chunk_size = max(1, chunk_size)
+
+    def load_manifest(self) -> SuiteManifest:
+        """
+        Манифест набора; если он отсутствует или не совпадает с размером
+        файла, количество случаев восстанавливается чтением файла. Тип
+        задачи берется только из сохраненного манифеста.
+
+        Raises:
+            ValueError: Файл оборван, создан для другой задачи или тип его
+                задачи неизвестен (манифеста нет), а task_type задан
+        """
+        if not _ends_with_newline(self.filename):
+            raise ValueError(f"{self.filename}: последняя строка файла не завершена")
+
+        recorded = SuiteManifest.load(self.filename)
+        manifest = recorded
+        if manifest is None or manifest.size != os.path.getsize(self.filename):
+            manifest = SuiteManifest.scan(self.filename)
+            if recorded is not None:
+                manifest.task_type = recorded.task_type
+
+        if self.task_type and manifest.task_type != self.task_type:
+            if manifest.task_type is None:
+                raise ValueError(
+                    f"Тип задачи набора {self.filename} неизвестен (нет манифеста), "
+                    f"дозапись случаев {self.task_type} не проверить"
+                )
+            raise ValueError(
+                f"Набор {self.filename} создан для задачи {manifest.task_type}, "
+                f"а не {self.task_type}"
+            )
+
+        return manifest
+
+    def _load_fingerprints(self, manifest: SuiteManifest) -> Set[bytes]:
+        """Отпечатки записанных случаев; файл .fp пересобирается, если устарел"""
+        fp_path = self.filename + FINGERPRINTS_SUFFIX
+        expected_size = manifest.total_cases * FINGERPRINT_SIZE
+
+        if os.path.exists(fp_path) and os.path.getsize(fp_path) == expected_size:
+            with open(fp_path, 'rb') as f:
+                raw = f.read()
+        else:
+            raw = b"".join(fingerprint(data) for data in _iter_jsonl(self.filename))
+            with open(fp_path, 'wb') as f:
+                f.write(raw)
+
+        return {
+            raw[i:i + FINGERPRINT_SIZE] for i in range(0, len(raw), FINGERPRINT_SIZE)
+        }
+
+    def _fingerprints_in_sync(self, manifest: SuiteManifest) -> bool:
+        fp_path = self.filename + FINGERPRINTS_SUFFIX
+        return (
+            os.path.exists(fp_path)
+            and os.path.getsize(fp_path) == manifest.total_cases * FINGERPRINT_SIZE
+        )
+
+    def append(self, target_normal: int, dedup: bool = False) -> AppendResult:
+        """
+        Дозапись обычных случаев до общего количества target_normal
+
+        Args:
+            target_normal: Желаемое общее количество обычных случаев в наборе
+            dedup: Перегенерировать случаи, совпадающие с уже записанными
+
+        Returns:
+            Результат дозаписи
+        """
+        manifest = self.load_manifest()
+        result = AppendResult()
+        delta = target_normal - manifest.normal_cases
+
+        if delta > 0:
+            if manifest.counter_rng and manifest.seed is not None:
+                if not self.generator.supports_random_access():
+                    raise ValueError(
+                        f"Набор {self.filename} построен по номерам случаев, а "
+                        f"{type(self.generator).__name__} не поддерживает "
+                        f"произвольный доступ"
+                    )
+                # Новые случаи вычисляются по номерам, состояние не нужно
+                self.generator.seed = manifest.seed
+            elif manifest.rng_state is not None:
+                _load_rng_state(manifest.rng_state)
+
+            seen = self._load_fingerprints(manifest) if dedup else None
+            track = seen is not None or self._fingerprints_in_sync(manifest)
+
+            fp_path = self.filename + FINGERPRINTS_SUFFIX
+            with open(self.filename, 'ab') as f:
+                fp_file = open(fp_path, 'ab') if track else None
+                try:
+                    for offset in range(0, delta, self.chunk_size):
+                        start = manifest.normal_cases + offset
+                        count = min(self.chunk_size, delta - offset)
+                        cases = self.generator.generate_normal_cases(count, start=start)
+
+                        prints = []
+                        for i, case in enumerate(cases):
+                            if seen is not None:
+                                case, retries = self._unique(case, start + i, seen)
+                                cases[i] = case
+                                result.regenerated_duplicates += retries
+                            if track:
+                                prints.append(fingerprint(case.model_dump()))
+                                if seen is not None:
+                                    seen.add(prints[-1])
+
+                        data = Exporter.dumps_chunk(cases, self.fmt).encode('utf-8')
+                        result.bytes_written += f.write(data)
+                        if fp_file is not None:
+                            fp_file.write(b"".join(prints))
+                finally:
+                    if fp_file is not None:
+                        fp_file.close()
+
+            result.added = delta
+            manifest.normal_cases += delta
+            manifest.size = os.path.getsize(self.filename)
+            manifest.rng_state = _dump_rng_state()
+            manifest.save(self.filename)
+
+        result.normal_cases = manifest.normal_cases
+        result.total_cases = manifest.total_cases
+        return result
+
+    def _unique(
+        self, case: TestCase, index: int, seen: Set[bytes]
+    ) -> Tuple[TestCase, int]:
+        """Перегенерация случая с номером index, пока он совпадает с записанными"""
+        retries = 0
+        while fingerprint(case.model_dump()) in seen:
+            if retries >= MAX_DUPLICATE_RETRIES:
+                raise ValueError(
+                    f"Не удалось сгенерировать уникальный случай {index + 1} "
+                    f"за {MAX_DUPLICATE_RETRIES} попыток"
+                )
+            random_access = self.generator.supports_random_access()
+            if self.generator.seed is not None and random_access:
+                case = self.generator.generate_case(index, attempt=retries + 1)
+            else:
+                case = self.generator.generate_normal_cases(1, start=index)[0]
+            retries += 1
+        return case, retries
@@ -0,0 +1,367 @@
+"""
+Модуль проверки и статистики наборов тестов, записанных Exporter
+
+Набор читается частями и не загружается в память целиком: jsonl - по
+chunk_size строк, parquet и arrow - по группам строк. Части разбираются,
+проверяются Validator и сводятся в процессах-исполнителях; родитель
+только читает строки (или номера групп) и по порядку объединяет итоги
+частей: ошибки, покрытие и отпечатки случаев для поиска дубликатов.
+Форматы json и yaml не допускают чтения по частям и загружаются целиком.
+
+Дубликаты ищутся после прохода сортировкой 8-байтовых отпечатков всех
+случаев, которые родитель хранит подряд в array('Q'): 8 байт на случай
+(10^8 случаев - 800 МБ) и на время сортировки еще около 24 байт на случай
+с NumPy. Без NumPy сортировка идет списком Python, что требует на порядок
+больше памяти и подходит для наборов до нескольких миллионов случаев.
+"""
+
+import heapq
+import json
+import os
+import time
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from src.generators.base_generator import TestCase
+from src.utils import columnar
+from src.utils.append import FINGERPRINT_SIZE, fingerprint
+from src.utils.loader import detect_format, iter_test_cases
+from src.utils.planner import input_size
+from src.utils.validator import Validator
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - зависит от окружения
+    np = None  # type: ignore[assignment]
+
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# Вид части набора для исполнителя
+LINES = "lines"
+ROW_GROUP = "row_group"
+CASES = "cases"
+
+
+class ChunkAudit(BaseModel):
+    """Итог проверки одной части набора"""
+
+    start: int = 0
+    cases: int = 0
+    errors: List[str] = Field(default_factory=list)
+    fingerprints: bytes = b""
+    indices: Optional[List[int]] = Field(
+        default=None,
+        description="Номера случаев отпечатков, если часть содержит "
+        "неразобранные строки (иначе - подряд с start)",
+    )
+    edge_cases: int = 0
+    total_weight: float = 0.0
+    normal_weight: float = 0.0
+    edge_weight: float = 0.0
+    size_min: Optional[int] = None
+    size_max: Optional[int] = None
+    size_sum: int = 0
+
+
+def _audit_cases(
+    test_cases: List[TestCase], start: int, indices: Optional[List[int]] = None
+) -> ChunkAudit:
+    audit = ChunkAudit(start=start, cases=len(test_cases), indices=indices)
+    if not test_cases:
+        return audit
+
+    if indices is None:
+        _, audit.errors = Validator.validate_test_cases(test_cases, start=start)
+    else:
+        for index, tc in zip(indices, test_cases):
+            audit.errors.extend(Validator.validate_test_cases([tc], start=index)[1])
+    audit.fingerprints = b"".join(
+        fingerprint({"input": tc.input, "expected": tc.expected})
+        for tc in test_cases
+    )
+
+    sizes = [input_size(tc.input) for tc in test_cases]
+    audit.size_min = min(sizes)
+    audit.size_max = max(sizes)
+    audit.size_sum = sum(sizes)
+    for tc in test_cases:
+        audit.total_weight += tc.weight
+        if tc.is_edge_case:
+            audit.edge_cases += 1
+            audit.edge_weight += tc.weight
+        else:
+            audit.normal_weight += tc.weight
+    return audit
+
+
+def _audit_chunk(kind: str, payload: Any, start: int) -> ChunkAudit:
+    """Разбор и проверка части набора (выполняется в исполнителе)"""
+    if kind == LINES:
+        errors = []
+        test_cases = []
+        indices = []
+        for i, line in enumerate(payload, start):
+            try:
+                test_cases.append(TestCase(**json.loads(line)))
+                indices.append(i)
+            except (TypeError, ValueError) as e:
+                errors.append(f"Тест {i}: не удалось разобрать строку: {e}")
+        if not errors:
+            return _audit_cases(test_cases, start)
+
+        audit = _audit_cases(test_cases, start, indices)
+        audit.cases = len(payload)
+        audit.errors = errors + audit.errors
+        return audit
+    if kind == ROW_GROUP:
+        filename, fmt, index = payload
+        return _audit_cases(columnar.read_row_group(filename, fmt, index), start)
+    return _audit_cases(payload, start)
+
+
+def _duplicates(
+    fingerprints: array, missing: List[int], limit: int
+) -> Tuple[int, List[Tuple[int, int]]]:
+    """
+    Поиск одинаковых отпечатков
+
+    Args:
+        fingerprints: Отпечатки случаев по номерам (array('Q'))
+        missing: Номера случаев без отпечатка (неразобранные строки)
+        limit: Сколько пар вернуть
+
+    Returns:
+        Кортеж (количество повторов; первые limit пар (первое вхождение,
+        повтор) по номеру повтора)
+    """
+    if np is not None:
+        values = np.frombuffer(fingerprints, dtype=np.uint64)
+        positions = np.arange(len(values), dtype=np.int64)
+        if missing:
+            positions = np.delete(positions, missing)
+            values = values[positions]
+        if not len(values):
+            return 0, []
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        positions = positions[order]
+        starts = np.empty(len(values), dtype=bool)
+        starts[0] = True
+        np.not_equal(values[1:], values[:-1], out=starts[1:])
+        firsts = positions[starts][np.cumsum(starts) - 1]
+        repeats = positions[~starts]
+        firsts = firsts[~starts]
+        take = np.argsort(repeats, kind="stable")[:limit]
+        pairs = list(zip(firsts[take].tolist(), repeats[take].tolist()))
+        return len(repeats), pairs
+
+    skip = set(missing)
+    order = sorted(
+        (i for i in range(len(fingerprints)) if i not in skip),
+        key=fingerprints.__getitem__,
+    )
+    count = 0
+    # Куча из limit пар с наименьшими номерами повторов (номера со знаком минус)
+    heap: List[Tuple[int, int]] = []
+    first = previous = None
+    for index in order:
+        value = fingerprints[index]
+        if value != previous:
+            first, previous = index, value
+            continue
+        count += 1
+        if len(heap) < limit:
+            heapq.heappush(heap, (-index, first))
+        elif heap and -heap[0][0] > index:
+            heapq.heapreplace(heap, (-index, first))
+    return count, [(first, -index) for index, first in sorted(heap, reverse=True)]
+
+
+class AuditReport(BaseModel):
+    """Итог проверки набора"""
+
+    filename: str
+    format: str
+    cases: int = 0
+    error_count: int = 0
+    errors: List[str] = Field(
+        default_factory=list, description="Первые max_errors ошибок"
+    )
+    duplicate_count: int = 0
+    duplicates: List[Tuple[int, int]] = Field(
+        default_factory=list,
+        description="Первые max_errors пар (первое вхождение, повтор)",
+    )
+    coverage: Dict[str, Any] = Field(default_factory=dict)
+    bytes: int = 0
+    elapsed: float = 0.0
+    workers: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return self.error_count == 0
+
+    @property
+    def cases_per_second(self) -> float:
+        return self.cases / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes / 1024 / 1024 / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class SuiteAuditor:
+    """Проверка, поиск дубликатов и покрытие набора за один проход"""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_errors: int = 1000,
+    ) -> None:
+        """
+        Инициализация
+
+        Args:
+            workers: Количество процессов-исполнителей (по умолчанию - число
+                ядер; 1 - в текущем процессе)
+            chunk_size: Количество строк jsonl (случаев json и yaml) в части
+            max_errors: Сколько ошибок и пар дубликатов хранить в отчете
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size)
+        self.max_errors = max(0, max_errors)
+
+    def audit(self, filename: str, fmt: Optional[str] = None) -> AuditReport:
+        """
+        Проверка набора из файла
+
+        Args:
+            filename: Файл набора
+            fmt: Формат файла (по умолчанию - по расширению)
+
+        Returns:
+            Отчет с ошибками, дубликатами и покрытием
+        """
+        fmt = fmt or detect_format(filename)
+        started = time.perf_counter()
+        report = AuditReport(
+            filename=filename,
+            format=fmt,
+            bytes=os.path.getsize(filename),
+            workers=self.workers,
+        )
+        totals = ChunkAudit()
+        fingerprints = array('Q')
+        missing: List[int] = []
+
+        def merge(audit: ChunkAudit) -> None:
+            report.cases += audit.cases
+            report.error_count += len(audit.errors)
+            room = self.max_errors - len(report.errors)
+            report.errors.extend(audit.errors[:max(0, room)])
+
+            # Части объединяются по порядку: отпечаток случая i лежит на
+            # месте i, неразобранные строки получают место с нулем
+            if audit.indices is None:
+                fingerprints.frombytes(audit.fingerprints)
+            else:
+                slots = array('Q', bytes(FINGERPRINT_SIZE * audit.cases))
+                parsed = array('Q', audit.fingerprints)
+                for index, value in zip(audit.indices, parsed):
+                    slots[index - audit.start] = value
+                present = set(audit.indices)
+                missing.extend(
+                    index
+                    for index in range(audit.start, audit.start + audit.cases)
+                    if index not in present
+                )
+                fingerprints.extend(slots)
+
+            totals.edge_cases += audit.edge_cases
+            totals.total_weight += audit.total_weight
+            totals.normal_weight += audit.normal_weight
+            totals.edge_weight += audit.edge_weight
+            totals.size_sum += audit.size_sum
+            lows = [s for s in (totals.size_min, audit.size_min) if s is not None]
+            highs = [s for s in (totals.size_max, audit.size_max) if s is not None]
+            if lows:
+                totals.size_min, totals.size_max = min(lows), max(highs)
+
+        pool = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+        pending: Deque[Future] = deque()
+        try:
+            for kind, payload, start in self._chunks(filename, fmt):
+                if pool is None:
+                    merge(_audit_chunk(kind, payload, start))
+                    continue
+                pending.append(pool.submit(_audit_chunk, kind, payload, start))
+                # Не больше двух частей на исполнителя в памяти
+                if len(pending) >= 2 * self.workers:
+                    merge(pending.popleft().result())
+            while pending:
+                merge(pending.popleft().result())
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        report.duplicate_count, report.duplicates = _duplicates(
+            fingerprints, missing, self.max_errors
+        )
+        if report.cases == 0:
+            report.error_count += 1
+            report.errors.append("Список тестовых случаев пуст")
+        report.coverage = self._coverage(report.cases, totals)
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _chunks(self, filename: str, fmt: str) -> Iterator[Tuple[str, Any, int]]:
+        """Части набора: (вид, данные для исполнителя, номер первого случая)"""
+        start = 0
+        if fmt == "jsonl":
+            with open(filename, 'rb') as f:
+                while True:
+                    block = list(islice(f, self.chunk_size))
+                    if not block:
+                        return
+                    lines = [line for line in block if line.strip()]
+                    yield LINES, lines, start
+                    start += len(lines)
+
+        if fmt in columnar.COLUMNAR_FORMATS:
+            for index, rows in enumerate(columnar.row_groups(filename, fmt)):
+                yield ROW_GROUP, (filename, fmt, index), start
+                start += rows
+            return
+
+        cases = iter_test_cases(filename, fmt)
+        while True:
+            chunk = list(islice(cases, self.chunk_size))
+            if not chunk:
+                return
+            yield CASES, chunk, start
+            start += len(chunk)
+
+    @staticmethod
+    def _coverage(total: int, totals: ChunkAudit) -> Dict[str, Any]:
+        """Метрики с ключами Validator.calculate_coverage и размером входов"""
+        edge = totals.edge_cases
+        return {
+            "total_cases": total,
+            "normal_cases": total - edge,
+            "edge_cases": edge,
+            "total_weight": totals.total_weight,
+            "normal_weight": totals.normal_weight,
+            "edge_weight": totals.edge_weight,
+            "normal_percentage": (total - edge) / total * 100 if total else 0,
+            "edge_percentage": edge / total * 100 if total else 0,
+            "input_size_min": totals.size_min,
+            "input_size_max": totals.size_max,
+            "input_size_mean": totals.size_sum / total if total else None,
+        }
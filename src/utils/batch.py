@@ -0,0 +1,305 @@
+"""
+Модуль пакетной генерации наборов тестов по YAML-манифесту
+"""
+
+import bisect
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+from pydantic import BaseModel, Field, field_validator
+
+from src.generators import GENERATORS
+from src.generators.base_generator import BaseGenerator, TestCase
+from src.generators.oracle import OracleCache
+from src.utils.exporter import Exporter
+from src.utils.pipeline import Pipeline
+from src.utils.planner import input_size
+from src.utils.renderer import default_template, render_statement, statement_context
+
+
+class BatchJob(BaseModel):
+    """Задание пакетной генерации"""
+
+    task_type: str = Field(description="Тип задачи (sorting, searching, math)")
+    output: str = Field(description="Путь к выходному файлу")
+    normal_cases: int = Field(default=5, ge=0, description="Количество обычных случаев")
+    edge_cases: bool = Field(default=True, description="Включать ли крайние случаи")
+    params: Dict[str, Any] = Field(
+        default_factory=dict, description="Параметры конструктора генератора"
+    )
+    format: str = Field(default="json", description="Формат выходного файла")
+    compact: bool = Field(default=False, description="Компактная запись json/yaml")
+    chunk_size: int = Field(
+        default=1000, ge=1, description="Случаев во фрагменте конвейера записи"
+    )
+    oracle_cache: Optional[str] = Field(
+        default=None, description="SQLite файл кэша ожидаемых результатов"
+    )
+    statement: Optional[str] = Field(
+        default=None, description="Путь к условию задачи, сформированному по шаблону"
+    )
+    template: Optional[str] = Field(
+        default=None, description="Шаблон условия (по умолчанию - по типу задачи)"
+    )
+    samples: int = Field(default=3, ge=0, description="Количество примеров в условии")
+
+    @field_validator("task_type")
+    @classmethod
+    def _check_task_type(cls, value: str) -> str:
+        if value not in GENERATORS:
+            raise ValueError(f"неизвестный тип задачи: {value}")
+        return value
+
+    @field_validator("format")
+    @classmethod
+    def _check_format(cls, value: str) -> str:
+        if value not in Exporter.FORMATS:
+            raise ValueError(f"неизвестный формат: {value}")
+        return value
+
+
+class BatchResult(BaseModel):
+    """Результат выполнения одного задания"""
+
+    output: str
+    cases: int
+    bytes: int
+    generation_time: float
+    serialization_time: float
+    statement: Optional[str] = None
+    statement_bytes: int = 0
+    render_time: float = 0.0
+
+
+class BatchReport(BaseModel):
+    """Сводный отчет о пакетной генерации"""
+
+    results: List[BatchResult] = Field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def total_cases(self) -> int:
+        return sum(r.cases for r in self.results)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(r.bytes for r in self.results)
+
+    @property
+    def cases_per_second(self) -> float:
+        return self.total_cases / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return self.total_bytes / self.elapsed / (1024 * 1024)
+
+
+def _detached(value: Any) -> Any:
+    """Копия значения без ссылок на общую память фрагмента"""
+    if isinstance(value, memoryview):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {key: _detached(item) for key, item in value.items()}
+    return value
+
+
+class _StatementSamples:
+    """
+    Сведения о наборе для условия задачи, собираемые по фрагментам конвейера
+
+    Хранит только счетчики и по count наименьших обычных и крайних случаев:
+    select_samples выбирает примеры среди них так же, как среди всего набора.
+    """
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.normal_cases = 0
+        self.edge_cases = 0
+        self.max_input_size = 0
+        # (размер входа, номер случая, случай)
+        self._normal: List[Tuple[int, int, TestCase]] = []
+        self._edge: List[Tuple[int, int, TestCase]] = []
+
+    def add(self, offset: int, test_cases: List[TestCase]) -> None:
+        """Учет фрагмента (см. Pipeline.run, on_chunk)"""
+        for index, tc in enumerate(test_cases, offset):
+            size = input_size(tc.input)
+            self.max_input_size = max(self.max_input_size, size)
+            if tc.is_edge_case:
+                self.edge_cases += 1
+                kept = self._edge
+            else:
+                self.normal_cases += 1
+                kept = self._normal
+            if len(kept) == self.count and (not kept or (size, index) > kept[-1][:2]):
+                continue
+            detached = tc.model_copy(
+                update={
+                    "input": _detached(tc.input),
+                    "expected": _detached(tc.expected),
+                }
+            )
+            # Номера случаев различны, поэтому сами случаи не сравниваются
+            bisect.insort(kept, (size, index, detached))
+            del kept[self.count:]
+
+    def render(self, template: str, context: Dict[str, Any]) -> str:
+        """Текст условия по шаблону с подстановками генератора context"""
+        kept = sorted(self._normal + self._edge, key=lambda item: item[1])
+        context = {
+            **context,
+            "total_cases": self.normal_cases + self.edge_cases,
+            "normal_cases": self.normal_cases,
+            "edge_cases": self.edge_cases,
+            "max_input_size": self.max_input_size,
+        }
+        return render_statement(
+            template, [tc for _, _, tc in kept], samples=self.count, context=context
+        )
+
+
+class BatchRunner:
+    """Исполнитель пакета заданий в одном процессе"""
+
+    def __init__(self, jobs: List[BatchJob], workers: Optional[int] = None) -> None:
+        """
+        Инициализация исполнителя
+
+        Args:
+            jobs: Список заданий
+            workers: Количество процессов генерации задания (1 - генерация
+                в текущем процессе)
+        """
+        self.jobs = jobs
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        # Генераторы и кэши ответов, общие для заданий одного запуска:
+        # задания с одинаковыми параметрами переиспользуют генератор, а
+        # задания с одним файлом кэша - одно подключение к нему
+        self._generators: Dict[Tuple[str, str, Optional[str]], BaseGenerator] = {}
+        self._caches: Dict[str, OracleCache] = {}
+
+    @classmethod
+    def from_yaml(cls, filename: str, workers: Optional[int] = None) -> "BatchRunner":
+        """
+        Загрузка манифеста заданий из YAML файла
+
+        Манифест - это либо список заданий, либо словарь с ключами
+        ``jobs`` и необязательным ``workers``.
+
+        Args:
+            filename: Путь к YAML манифесту
+            workers: Размер пула (переопределяет значение из манифеста)
+
+        Returns:
+            Настроенный исполнитель
+        """
+        with open(filename, 'r', encoding='utf-8') as f:
+            manifest = yaml.safe_load(f)
+
+        if isinstance(manifest, dict):
+            jobs_data = manifest.get("jobs", [])
+            workers = workers or manifest.get("workers")
+        else:
+            jobs_data = manifest or []
+
+        if not jobs_data:
+            raise ValueError(f"Манифест {filename} не содержит заданий")
+
+        return cls([BatchJob(**job) for job in jobs_data], workers=workers)
+
+    def run(self) -> BatchReport:
+        """
+        Выполнение всех заданий
+
+        Каждое задание проходит конвейер Pipeline: фрагменты генерируются
+        (при workers > 1 - в процессах), сериализуются и записываются по
+        мере готовности, так что файл задания не собирается в памяти.
+
+        Returns:
+            Сводный отчет
+        """
+        report = BatchReport()
+        start = time.perf_counter()
+
+        try:
+            for job in self.jobs:
+                report.results.append(self._run_job(job))
+        finally:
+            for cache in self._caches.values():
+                cache.close()
+            self._caches.clear()
+            self._generators.clear()
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _generator(self, job: BatchJob) -> BaseGenerator:
+        """Генератор задания с подключенным кэшем ответов"""
+        key = (job.task_type, json.dumps(job.params, sort_keys=True), job.oracle_cache)
+        generator = self._generators.get(key)
+        if generator is None:
+            generator = GENERATORS[job.task_type](**job.params)
+            if job.oracle_cache is not None:
+                cache = self._caches.get(job.oracle_cache)
+                if cache is None:
+                    cache = self._caches[job.oracle_cache] = OracleCache(
+                        job.oracle_cache
+                    )
+                generator.use_oracle_cache(cache)
+            self._generators[key] = generator
+        return generator
+
+    def _run_job(self, job: BatchJob) -> BatchResult:
+        """Генерация задания конвейером и формирование условия"""
+        generator = self._generator(job)
+        chunks = -(-job.normal_cases // job.chunk_size)
+        # Процессы не получают кэш ответов (см. Pipeline), а задание из
+        # одного фрагмента не распараллеливается
+        parallel = self.workers > 1 and chunks > 1 and job.oracle_cache is None
+        pipeline = Pipeline(
+            generator,
+            fmt=job.format,
+            chunk_size=job.chunk_size,
+            generator_processes=self.workers if parallel else 0,
+            compact=job.compact,
+        )
+        samples = _StatementSamples(job.samples) if job.statement else None
+
+        Path(job.output).parent.mkdir(parents=True, exist_ok=True)
+        stats = pipeline.run(
+            job.normal_cases,
+            {job.format: job.output},
+            include_edge_cases=job.edge_cases,
+            on_chunk=samples.add if samples is not None else None,
+        )
+        if generator.oracle_cache is not None:
+            generator.oracle_cache.flush()
+
+        busy = {stage.name: stage.busy_time for stage in stats.stages}
+        result = BatchResult(
+            output=job.output,
+            cases=stats.total_cases,
+            bytes=stats.bytes_written,
+            generation_time=busy["generation"],
+            serialization_time=busy["serialization"],
+            statement=job.statement,
+        )
+
+        if job.statement and samples is not None:
+            started = time.perf_counter()
+            template = job.template or default_template(job.task_type)
+            text = samples.render(template, statement_context(generator))
+            data = text.encode('utf-8')
+            statement_path = Path(job.statement)
+            statement_path.parent.mkdir(parents=True, exist_ok=True)
+            statement_path.write_bytes(data)
+            result.statement_bytes = len(data)
+            result.render_time = time.perf_counter() - started
+
+        return result
@@ -0,0 +1,420 @@
+"""
+Модуль калибровки размеров входных данных по времени эталонного решения
+
+Эталонное решение запускается на входах геометрически растущего размера,
+пока время не достигнет заданной доли ограничения времени; размер, при
+котором время равно этой доле, находится интерполяцией в логарифмических
+координатах между соседними измерениями. Подобранные параметры генератора
+хранятся в JSON файле профилей по имени задачи и подставляются в генератор
+при следующих запусках.
+"""
+
+import copy
+import gc
+import json
+import math
+import os
+import platform
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+from src.generators import GENERATORS
+
+
+# Граница размера, если ее не задают ни параметр, ни max_size: решение,
+# время которого не растет, не должно увеличивать входы бесконечно
+MAX_SIZE = 2 ** 31
+
+# Вход размера size для случая с номером seed при фиксированных params
+Probe = Callable[[int, int, Dict[str, Any]], Any]
+
+
+class SizeParameter:
+    """Параметр генератора, задающий размер входных данных"""
+
+    def __init__(
+        self,
+        probe: Probe,
+        start: int,
+        oracle: Union[str, Callable[[Dict[str, Any]], str]],
+        limit: Optional[Callable[[Dict[str, Any]], Optional[int]]] = None,
+    ) -> None:
+        """
+        Args:
+            probe: Построение входа заданного размера
+            start: Размер первого измерения
+            oracle: Задача из ORACLES генератора, решающая такие входы
+                (или ее выбор по params)
+            limit: Наибольший допустимый размер при данных params
+                (None - без ограничения)
+        """
+        self.probe = probe
+        self.start = start
+        self.oracle = oracle if callable(oracle) else (lambda params: oracle)
+        self.limit = limit or (lambda params: None)
+
+
+def _array_probe(task_type: str, parameter: str) -> Probe:
+    """Вход обычного случая генератора, в котором параметр равен size"""
+
+    def probe(size: int, seed: int, params: Dict[str, Any]) -> Any:
+        values = {**params, parameter: size, "seed": seed}
+        if parameter == "max_len":
+            values["min_len"] = size
+        elif "max_len" in values:
+            values.setdefault("min_len", values["max_len"])
+        # Длины случаев 0 и 1 не зависят от параметров
+        return GENERATORS[task_type](**values).generate_case(2).input
+
+    return probe
+
+
+def _value_probe(size: int, seed: int, params: Dict[str, Any]) -> Any:
+    return size
+
+
+def _searching_oracle(params: Dict[str, Any]) -> str:
+    return "searching_many" if params.get("queries") else "searching"
+
+
+def _searching_limit(params: Dict[str, Any]) -> Optional[int]:
+    # Без запросов элементы массива уникальны и берутся из [1, 1000]
+    return None if params.get("queries") else 1000
+
+
+SIZE_PARAMETERS: Dict[str, Dict[str, SizeParameter]] = {
+    "sorting": {
+        "max_len": SizeParameter(_array_probe("sorting", "max_len"), 16, "sorting"),
+    },
+    "searching": {
+        "max_len": SizeParameter(
+            _array_probe("searching", "max_len"),
+            16,
+            _searching_oracle,
+            _searching_limit,
+        ),
+        "queries": SizeParameter(
+            _array_probe("searching", "queries"), 16, "searching_many"
+        ),
+    },
+    "math": {
+        "max_factorial": SizeParameter(_value_probe, 16, "factorial"),
+        "max_fibonacci": SizeParameter(_value_probe, 16, "fibonacci"),
+    },
+}
+
+
+def size_parameter(task_type: str, parameter: Optional[str] = None) -> SizeParameter:
+    """
+    Описание параметра размера
+
+    Args:
+        task_type: Тип задачи
+        parameter: Имя параметра (None - первый параметр типа задачи)
+
+    Raises:
+        ValueError: Тип задачи или параметр не поддерживают калибровку
+    """
+    if task_type not in SIZE_PARAMETERS:
+        raise ValueError(f"калибровка недоступна для типа задачи {task_type}")
+    parameters = SIZE_PARAMETERS[task_type]
+    if parameter is None:
+        parameter = next(iter(parameters))
+    if parameter not in parameters:
+        raise ValueError(
+            f"неизвестный параметр размера {parameter} "
+            f"(допустимы: {', '.join(parameters)})"
+        )
+    return parameters[parameter]
+
+
+def machine_name() -> str:
+    """Описание текущей машины для профиля"""
+    return f"{platform.node()} {platform.machine()} {os.cpu_count() or 1} CPU"
+
+
+class CalibrationSample(BaseModel):
+    """Измерение времени решения на входах одного размера"""
+
+    size: int
+    seconds: float = Field(description="Наибольшее время по входам размера")
+
+
+class CalibrationResult(BaseModel):
+    """Подобранное значение одного параметра"""
+
+    parameter: str
+    size: int
+    target: float = Field(description="Целевое время, секунды")
+    reached: bool = Field(
+        description="Цель попала между измерениями (иначе size - граница поиска)"
+    )
+    exponent: Optional[float] = Field(
+        default=None, description="Степень роста времени у найденного размера"
+    )
+    samples: List[CalibrationSample] = Field(default_factory=list)
+
+
+class CalibrationProfile(BaseModel):
+    """Откалиброванные параметры генератора для одной задачи"""
+
+    task_type: str
+    time_limit: float
+    fraction: float
+    fixed: Dict[str, Any] = Field(
+        default_factory=dict, description="Параметры, заданные при калибровке"
+    )
+    params: Dict[str, int] = Field(default_factory=dict)
+    results: Dict[str, CalibrationResult] = Field(default_factory=dict)
+    machine: str = ""
+    calibrated_at: str = ""
+
+    def generator_params(self) -> Dict[str, Any]:
+        """Параметры конструктора генератора"""
+        return {**self.fixed, **self.params}
+
+
+class CalibrationProfiles:
+    """Профили калибровки задач, хранимые в JSON файле"""
+
+    def __init__(self, filename: Optional[str] = None) -> None:
+        """
+        Инициализация набора профилей
+
+        Args:
+            filename: Файл профилей (None - профили только в памяти)
+        """
+        self.filename = filename
+        self.profiles: Dict[str, CalibrationProfile] = {}
+
+        if filename and os.path.exists(filename):
+            with open(filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.profiles = {
+                name: CalibrationProfile(**value) for name, value in data.items()
+            }
+
+    def get(self, problem: str) -> CalibrationProfile:
+        """
+        Профиль задачи
+
+        Raises:
+            ValueError: Задача не откалибрована
+        """
+        if problem not in self.profiles:
+            raise ValueError(
+                f"задача {problem} не откалибрована"
+                + (f" в {self.filename}" if self.filename else "")
+            )
+        return self.profiles[problem]
+
+    def record(
+        self,
+        problem: str,
+        task_type: str,
+        result: CalibrationResult,
+        time_limit: float,
+        fraction: float,
+        fixed: Optional[Dict[str, Any]] = None,
+    ) -> CalibrationProfile:
+        """
+        Учет результата калибровки параметра
+
+        Параметры, откалиброванные ранее с тем же типом задачи, ограничением
+        времени и фиксированными параметрами, сохраняются; иначе профиль
+        создается заново.
+
+        Returns:
+            Обновленный профиль
+        """
+        fixed = dict(fixed or {})
+        profile = self.profiles.get(problem)
+        if profile is None or (
+            profile.task_type,
+            profile.time_limit,
+            profile.fraction,
+            profile.fixed,
+        ) != (task_type, time_limit, fraction, fixed):
+            profile = CalibrationProfile(
+                task_type=task_type,
+                time_limit=time_limit,
+                fraction=fraction,
+                fixed=fixed,
+            )
+            self.profiles[problem] = profile
+
+        profile.params[result.parameter] = result.size
+        profile.results[result.parameter] = result
+        profile.machine = machine_name()
+        profile.calibrated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        return profile
+
+    def save(self) -> None:
+        """Сохранение профилей в файл"""
+        if not self.filename:
+            return
+        data = {name: value.model_dump() for name, value in self.profiles.items()}
+        with open(self.filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+class Calibrator:
+    """
+    Подбор параметра размера генератора по времени эталонного решения
+
+    Время для размера - наибольшее по samples входам из минимумов по repeats
+    запусков; каждый запуск получает свою копию входа (решение может менять
+    его на месте), сборщик мусора на время замера отключается.
+    """
+
+    def __init__(
+        self,
+        solution: Callable[[Any], Any],
+        samples: int = 3,
+        repeats: int = 3,
+        seed: int = 0,
+        timer: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Инициализация калибровщика
+
+        Args:
+            solution: Эталонное решение, принимающее input случая
+            samples: Количество входов каждого размера
+            repeats: Количество запусков на каждом входе
+            seed: Номер первого входа (входы вычисляются по (seed, k))
+            timer: Источник времени
+        """
+        self.solution = solution
+        self.samples = max(1, samples)
+        self.repeats = max(1, repeats)
+        self.seed = seed
+        self.timer = timer
+
+    def measure(self, probe: Probe, size: int, params: Dict[str, Any]) -> float:
+        """Время решения на входах размера size, секунды"""
+        worst = 0.0
+        for i in range(self.samples):
+            data = probe(size, self.seed + i, params)
+            best = math.inf
+            for _ in range(self.repeats):
+                argument = copy.deepcopy(data)
+                enabled = gc.isenabled()
+                gc.disable()
+                try:
+                    started = self.timer()
+                    self.solution(argument)
+                    elapsed = self.timer() - started
+                finally:
+                    if enabled:
+                        gc.enable()
+                best = min(best, elapsed)
+            worst = max(worst, best)
+        return worst
+
+    def calibrate(
+        self,
+        task_type: str,
+        parameter: str,
+        target: float,
+        params: Optional[Dict[str, Any]] = None,
+        start: Optional[int] = None,
+        growth: float = 2.0,
+        max_size: Optional[int] = None,
+    ) -> CalibrationResult:
+        """
+        Поиск размера, на котором решение работает target секунд
+
+        Args:
+            task_type: Тип задачи из SIZE_PARAMETERS
+            parameter: Параметр размера генератора
+            target: Целевое время, секунды
+            params: Остальные параметры генератора
+            start: Размер первого измерения
+            growth: Множитель размера между измерениями
+            max_size: Наибольший проверяемый размер (по умолчанию MAX_SIZE)
+
+        Returns:
+            Результат калибровки
+        """
+        measured_parameter = size_parameter(task_type, parameter)
+        if target <= 0:
+            raise ValueError("Целевое время должно быть положительным")
+        if growth <= 1:
+            raise ValueError("Множитель размера должен быть больше 1")
+
+        params = dict(params or {})
+        limits = [
+            value
+            for value in (max_size, measured_parameter.limit(params))
+            if value is not None
+        ]
+        limit = min(limits) if limits else MAX_SIZE
+        size = min(limit, max(1, start or measured_parameter.start))
+
+        measured: Dict[int, float] = {}
+
+        def measure(value: int) -> float:
+            measured[value] = self.measure(measured_parameter.probe, value, params)
+            return measured[value]
+
+        seconds = measure(size)
+        if seconds >= target:
+            # Уже первый размер слишком велик: уменьшаем до границы
+            while seconds >= target and size > 1:
+                size = max(1, min(size - 1, int(size / growth)))
+                seconds = measure(size)
+        else:
+            while seconds < target and size < limit:
+                size = min(limit, max(size + 1, int(size * growth)))
+                seconds = measure(size)
+
+        samples = [
+            CalibrationSample(size=value, seconds=measured[value])
+            for value in sorted(measured)
+        ]
+        return self._result(parameter, target, samples)
+
+    @staticmethod
+    def _result(
+        parameter: str, target: float, samples: List[CalibrationSample]
+    ) -> CalibrationResult:
+        """Интерполяция размера между последним быстрым и первым медленным"""
+        below = [sample for sample in samples if sample.seconds < target]
+        above = [sample for sample in samples if sample.seconds >= target]
+        result = CalibrationResult(
+            parameter=parameter, size=1, target=target, reached=False, samples=samples
+        )
+        if not below:
+            return result
+        low = below[-1]
+        if not above:
+            result.size = low.size
+            return result
+
+        high = above[0]
+        size, exponent = _interpolate(
+            (low.size, low.seconds), (high.size, high.seconds), target
+        )
+        result.size = max(low.size, min(high.size, size))
+        result.exponent = exponent
+        result.reached = True
+        return result
+
+
+def _interpolate(
+    low: Tuple[int, float], high: Tuple[int, float], target: float
+) -> Tuple[int, Optional[float]]:
+    """Размер с временем target по модели time = c * size ** exponent"""
+    (low_size, low_time), (high_size, high_time) = low, high
+    if low_time > 0 and high_time > low_time:
+        exponent = math.log(high_time / low_time) / math.log(high_size / low_size)
+        size = low_size * (target / low_time) ** (1 / exponent)
+        # Погрешность степени не должна отнимать единицу у точного размера
+        return int(size + 1e-6), exponent
+    # Время меньшего размера не измеримо: линейная интерполяция
+    share = (target - low_time) / max(high_time - low_time, 1e-12)
+    return int(low_size + share * (high_size - low_size)), None
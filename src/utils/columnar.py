@@ -0,0 +1,379 @@
+"""
+Модуль колоночного экспорта наборов тестов (Apache Arrow и Parquet)
+
+Скалярные поля случая записываются отдельными колонками, целочисленные
+массивы входных данных и ожидаемых результатов - колонками list<int64>;
+буферные массивы (array('q'), NumPy) копируются в колонку байтами.
+Значения, не укладывающиеся в эти типы, сохраняются как JSON строки.
+Файлы пишутся по одной группе строк на фрагмент генерации, а файлы
+Arrow читаются через отображение в память без копирования.
+"""
+
+import functools
+import json
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.generators.base_generator import TestCase
+from src.generators.buffers import int64_view, is_buffer, to_plain
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - зависит от окружения
+    pa = None
+    pc = None
+    pq = None
+
+
+COLUMNAR_FORMATS = ["parquet", "arrow"]
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+# Вид значения в колонках *_kind
+ARRAY = "array"
+VALUE = "value"
+SEARCH = "search"
+JSON = "json"
+
+
+def available() -> bool:
+    """Установлен ли pyarrow"""
+    return pa is not None
+
+
+def _require() -> None:
+    if pa is None:
+        raise ValueError(
+            "Для форматов parquet и arrow требуется pyarrow (pip install pyarrow)"
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def schema() -> "pa.Schema":
+    """Схема колоночного набора тестов"""
+    _require()
+    int_list = pa.list_(pa.int64())
+    return pa.schema([
+        ("description", pa.string()),
+        ("is_edge_case", pa.bool_()),
+        ("weight", pa.float64()),
+        ("input_kind", pa.string()),
+        ("input_length", pa.int64()),
+        ("input_array", int_list),
+        ("input_value", pa.int64()),
+        ("input_json", pa.string()),
+        ("expected_kind", pa.string()),
+        ("expected_array", int_list),
+        ("expected_value", pa.int64()),
+        ("expected_json", pa.string()),
+    ])
+
+
+def _is_int64(value: Any) -> bool:
+    return type(value) is int and _INT64_MIN <= value <= _INT64_MAX
+
+
+def _is_int64_list(value: Any, strict: bool) -> bool:
+    if is_buffer(value):
+        return int64_view(value) is not None
+    if not isinstance(value, (list, tuple)):
+        return False
+    if not value:
+        return isinstance(value, list)
+    if not strict:
+        # Быстрая проверка по первому элементу; при ошибке конвертации
+        # фрагмент перестраивается со строгой проверкой
+        return type(value[0]) is int
+    return all(type(x) is int for x in value) and (
+        _INT64_MIN <= min(value) and max(value) <= _INT64_MAX
+    )
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(to_plain(value), ensure_ascii=False, separators=(",", ":"))
+
+
+def _split(
+    value: Any, strict: bool, search: bool = False
+) -> Tuple[str, Any, Any, Any]:
+    """Разложение значения по колонкам: (вид, массив, число, JSON)"""
+    if (
+        search
+        and isinstance(value, dict)
+        and len(value) == 2
+        and _is_int64_list(value.get("array"), strict)
+        and _is_int64(value.get("target"))
+    ):
+        return SEARCH, value["array"], value["target"], None
+    if _is_int64_list(value, strict):
+        return ARRAY, value, None, None
+    if _is_int64(value):
+        return VALUE, None, value, None
+    return JSON, None, None, _dumps(value)
+
+
+def _columns(test_cases: List[TestCase], strict: bool) -> Dict[str, List[Any]]:
+    columns: Dict[str, List[Any]] = {name: [] for name in schema().names}
+
+    for tc in test_cases:
+        kind, array, value, raw = _split(tc.input, strict, search=True)
+        columns["input_kind"].append(kind)
+        columns["input_length"].append(len(array) if array is not None else None)
+        columns["input_array"].append(array)
+        columns["input_value"].append(value)
+        columns["input_json"].append(raw)
+
+        kind, array, value, raw = _split(tc.expected, strict)
+        columns["expected_kind"].append(kind)
+        columns["expected_array"].append(array)
+        columns["expected_value"].append(value)
+        columns["expected_json"].append(raw)
+
+        columns["description"].append(tc.description)
+        columns["is_edge_case"].append(tc.is_edge_case)
+        columns["weight"].append(tc.weight)
+
+    for name in ("input_array", "expected_array"):
+        columns[name] = _int_list_column(columns[name])
+
+    return columns
+
+
+def _int_list_column(arrays: List[Any]) -> Any:
+    """
+    Колонка list<int64> из байтов массивов
+
+    Если в колонке нет буферных массивов, значения остаются списком и
+    преобразуются pyarrow. Иначе байты массивов склеиваются в один буфер
+    значений без создания объектов int (фрагмент из одного массива
+    ссылается на его память без копирования).
+    """
+    if not any(is_buffer(item) for item in arrays):
+        return arrays
+
+    offsets = [0]
+    nulls = []
+    views = []
+    for item in arrays:
+        nulls.append(item is None)
+        if item is not None:
+            view = int64_view(item)
+            views.append(view if view is not None else memoryview(array('q', item)))
+            offsets.append(offsets[-1] + len(views[-1]))
+        else:
+            offsets.append(offsets[-1])
+
+    data = pa.py_buffer(views[0] if len(views) == 1 else b"".join(views))
+    values = pa.Array.from_buffers(pa.int64(), offsets[-1], [None, data])
+    return pa.ListArray.from_arrays(
+        pa.array(offsets, pa.int32()),
+        values,
+        mask=pa.array(nulls) if any(nulls) else None,
+    )
+
+
+def to_record_batch(test_cases: List[TestCase]) -> "pa.RecordBatch":
+    """
+    Преобразование фрагмента случаев в пакет записей Arrow
+
+    Args:
+        test_cases: Список тестовых случаев
+
+    Returns:
+        Пакет записей со схемой schema()
+    """
+    _require()
+    try:
+        columns = _columns(test_cases, strict=False)
+        return pa.RecordBatch.from_pydict(columns, schema=schema())
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError, TypeError):
+        columns = _columns(test_cases, strict=True)
+        return pa.RecordBatch.from_pydict(columns, schema=schema())
+
+
+def _join(kind: str, array: Any, value: Any, raw: Optional[str]) -> Any:
+    if kind == SEARCH:
+        return {"array": array, "target": value}
+    if kind == ARRAY:
+        return array
+    if kind == VALUE:
+        return value
+    assert raw is not None
+    return json.loads(raw)
+
+
+def from_record_batch(batch: "pa.RecordBatch") -> List[TestCase]:
+    """Восстановление тестовых случаев из пакета записей"""
+    return [
+        TestCase(
+            input=_join(
+                row["input_kind"],
+                row["input_array"],
+                row["input_value"],
+                row["input_json"],
+            ),
+            expected=_join(
+                row["expected_kind"],
+                row["expected_array"],
+                row["expected_value"],
+                row["expected_json"],
+            ),
+            description=row["description"],
+            is_edge_case=row["is_edge_case"],
+            weight=row["weight"],
+        )
+        for row in batch.to_pylist()
+    ]
+
+
+class ColumnarWriter:
+    """Потоковая запись набора в Parquet или Arrow IPC файл"""
+
+    def __init__(self, filename: str, fmt: str = "parquet") -> None:
+        """
+        Открытие файла для записи
+
+        Args:
+            filename: Имя файла
+            fmt: Формат из COLUMNAR_FORMATS
+        """
+        _require()
+        if fmt not in COLUMNAR_FORMATS:
+            raise ValueError(f"Неизвестный колоночный формат: {fmt}")
+
+        self.fmt = fmt
+        self.rows = 0
+        if fmt == "parquet":
+            self._writer = pq.ParquetWriter(filename, schema())
+        else:
+            self._sink = pa.OSFile(filename, "wb")
+            self._writer = pa.ipc.new_file(self._sink, schema())
+
+    def write_batch(self, batch: "pa.RecordBatch") -> None:
+        """Запись пакета как отдельной группы строк"""
+        if self.fmt == "parquet":
+            self._writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+        self.rows += batch.num_rows
+
+    def write(self, test_cases: List[TestCase]) -> None:
+        """Запись фрагмента тестовых случаев"""
+        self.write_batch(to_record_batch(test_cases))
+
+    def close(self) -> None:
+        self._writer.close()
+        if self.fmt == "arrow":
+            self._sink.close()
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def write(test_cases: List[TestCase], filename: str, fmt: str = "parquet") -> None:
+    """Запись списка случаев в колоночный файл одной группой строк"""
+    with ColumnarWriter(filename, fmt) as writer:
+        writer.write(test_cases)
+
+
+def read_table(filename: str, fmt: str, columns: Optional[List[str]] = None) -> Any:
+    """
+    Чтение набора как таблицы Arrow
+
+    Файлы Arrow отображаются в память, поэтому колонки читаются без
+    копирования; из Parquet читаются только запрошенные колонки.
+
+    Args:
+        filename: Имя файла
+        fmt: Формат из COLUMNAR_FORMATS
+        columns: Список колонок (по умолчанию - все)
+
+    Returns:
+        Таблица pyarrow.Table
+    """
+    _require()
+    if fmt == "parquet":
+        return pq.read_table(filename, columns=columns, memory_map=True)
+
+    table = pa.ipc.open_file(pa.memory_map(filename, "r")).read_all()
+    return table.select(columns) if columns else table
+
+
+def iter_test_cases(filename: str, fmt: str) -> Iterator[TestCase]:
+    """Последовательное чтение тестовых случаев по группам строк"""
+    _require()
+    if fmt == "parquet":
+        for batch in pq.ParquetFile(filename).iter_batches():
+            yield from from_record_batch(batch)
+        return
+
+    reader = pa.ipc.open_file(pa.memory_map(filename, "r"))
+    for i in range(reader.num_record_batches):
+        yield from from_record_batch(reader.get_batch(i))
+
+
+def row_groups(filename: str, fmt: str) -> List[int]:
+    """Количество случаев в каждой группе строк (пакете записей) файла"""
+    _require()
+    if fmt == "parquet":
+        metadata = pq.ParquetFile(filename).metadata
+        return [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+
+    reader = pa.ipc.open_file(pa.memory_map(filename, "r"))
+    return [reader.get_batch(i).num_rows for i in range(reader.num_record_batches)]
+
+
+def read_row_group(filename: str, fmt: str, index: int) -> List[TestCase]:
+    """Тестовые случаи одной группы строк (для чтения файла по частям)"""
+    _require()
+    if fmt == "parquet":
+        return from_record_batch(pq.ParquetFile(filename).read_row_group(index))
+
+    reader = pa.ipc.open_file(pa.memory_map(filename, "r"))
+    return from_record_batch(reader.get_batch(index))
+
+
+def summarize(filename: str, fmt: str) -> Dict[str, Any]:
+    """
+    Агрегированная статистика набора без восстановления случаев
+
+    Ключи совпадают с Validator.calculate_coverage, дополнительно
+    возвращается статистика длины входных массивов.
+
+    Args:
+        filename: Имя файла
+        fmt: Формат из COLUMNAR_FORMATS
+
+    Returns:
+        Словарь метрик
+    """
+    table = read_table(filename, fmt, ["is_edge_case", "weight", "input_length"])
+    edge = table["is_edge_case"]
+    weight = table["weight"]
+    length = table["input_length"]
+
+    total = table.num_rows
+    edge_cases = pc.sum(pc.cast(edge, pa.int64())).as_py() or 0
+    total_weight = pc.sum(weight).as_py() or 0.0
+    edge_weight = pc.sum(pc.filter(weight, edge)).as_py() or 0.0
+    bounds = pc.min_max(length).as_py()
+
+    return {
+        "total_cases": total,
+        "normal_cases": total - edge_cases,
+        "edge_cases": edge_cases,
+        "total_weight": total_weight,
+        "normal_weight": total_weight - edge_weight,
+        "edge_weight": edge_weight,
+        "normal_percentage": (total - edge_cases) / total * 100 if total else 0,
+        "edge_percentage": edge_cases / total * 100 if total else 0,
+        "input_length_min": bounds["min"],
+        "input_length_max": bounds["max"],
+        "input_length_mean": pc.mean(length).as_py(),
+    }
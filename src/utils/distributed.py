@@ -0,0 +1,719 @@
+"""
+Модуль распределенной генерации наборов тестов
+
+Координатор делит задание (тип задачи, количество случаев, параметры) на
+фрагменты и помещает их в очередь. Исполнители на любых узлах забирают
+фрагменты, генерируют их счетчиковым генератором по (seed, номер случая),
+записывают части файла в каталог частей и отмечают фрагмент выполненным.
+Фрагмент, исполнитель которого не отчитался до истечения аренды,
+возвращается в очередь. Когда все фрагменты готовы, координатор склеивает
+части в итоговый файл. Так как случай k зависит только от (seed, k),
+результат не зависит от числа исполнителей, порядка выполнения и
+повторов и совпадает с файлом однопроцессного конвейера с тем же seed.
+
+Очередь подключаемая: реализации WorkQueue регистрируются в QUEUE_BACKENDS,
+эталонная реализация - SQLite файл (SQLiteWorkQueue), доступный всем
+исполнителям через общую файловую систему.
+"""
+
+import json
+import os
+import shutil
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, Field, field_validator
+
+from src.generators import GENERATORS
+from src.generators.base_generator import BaseGenerator
+from src.utils.append import SuiteManifest
+from src.utils.exporter import Exporter
+
+
+# Форматы, файл которых склеивается из независимо записанных частей
+DISTRIBUTED_FORMATS = Exporter.STREAMING_FORMATS + Exporter.DEFERRED_HEADER_FORMATS
+
+# Время, за которое исполнитель должен отчитаться о фрагменте, с
+DEFAULT_LEASE = 300.0
+
+# Состояния фрагмента
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class DistributedJob(BaseModel):
+    """Задание распределенной генерации"""
+
+    task_type: str = Field(description="Тип задачи (sorting, searching, math)")
+    output: str = Field(description="Путь к итоговому файлу")
+    seed: int = Field(description="Начальное значение счетчикового генератора")
+    normal_cases: int = Field(default=5, ge=0, description="Количество обычных случаев")
+    edge_cases: bool = Field(default=True, description="Включать ли крайние случаи")
+    chunk_size: int = Field(default=10000, ge=1, description="Случаев во фрагменте")
+    params: Dict[str, Any] = Field(
+        default_factory=dict, description="Параметры конструктора генератора"
+    )
+    format: str = Field(default="jsonl", description="Формат итогового файла")
+    compact: bool = Field(default=False, description="Компактная запись json/yaml")
+    shard_dir: Optional[str] = Field(
+        default=None, description="Каталог частей (по умолчанию <output>.shards)"
+    )
+    max_attempts: int = Field(
+        default=3, ge=1, description="Сколько раз выполнять фрагмент до отказа"
+    )
+
+    @field_validator("task_type")
+    @classmethod
+    def _check_task_type(cls, value: str) -> str:
+        if value not in GENERATORS:
+            raise ValueError(f"неизвестный тип задачи: {value}")
+        if not GENERATORS[value].supports_random_access():
+            raise ValueError(
+                f"тип задачи {value} не поддерживает счетчиковый генератор"
+            )
+        return value
+
+    @field_validator("format")
+    @classmethod
+    def _check_format(cls, value: str) -> str:
+        if value not in DISTRIBUTED_FORMATS:
+            raise ValueError(
+                f"формат {value} не поддерживает распределенную запись "
+                f"(допустимы: {', '.join(DISTRIBUTED_FORMATS)})"
+            )
+        return value
+
+    @property
+    def shards(self) -> str:
+        return self.shard_dir or self.output + ".shards"
+
+
+class Chunk(BaseModel):
+    """Фрагмент задания и его состояние в очереди"""
+
+    job_id: str
+    seq: int = Field(description="Порядковый номер фрагмента в файле")
+    start: int = Field(description="Номер первого случая фрагмента")
+    count: Optional[int] = Field(
+        default=None, description="Количество обычных случаев (None - крайние)"
+    )
+    state: str = PENDING
+    worker: Optional[str] = None
+    attempts: int = 0
+    cases: int = 0
+    edge_cases: int = 0
+    bytes: int = 0
+    error: Optional[str] = None
+
+    @property
+    def is_edge(self) -> bool:
+        return self.count is None
+
+
+class JobStatus(BaseModel):
+    """Сводка по фрагментам задания"""
+
+    job_id: str
+    chunks: int = 0
+    pending: int = 0
+    running: int = 0
+    done: int = 0
+    failed: int = 0
+    cases: int = 0
+    retries: int = Field(default=0, description="Повторные выполнения фрагментов")
+    errors: List[str] = Field(default_factory=list)
+
+    @property
+    def finished(self) -> bool:
+        return self.done == self.chunks
+
+
+class WorkerReport(BaseModel):
+    """Итоги работы исполнителя"""
+
+    worker: str
+    chunks: int = 0
+    cases: int = 0
+    bytes: int = 0
+    failures: int = 0
+    elapsed: float = 0.0
+
+
+class MergeReport(BaseModel):
+    """Итоги склейки частей"""
+
+    output: str
+    normal_cases: int = 0
+    edge_cases: int = 0
+    bytes: int = 0
+    chunks: int = 0
+    elapsed: float = 0.0
+
+
+def split_job(job_id: str, job: DistributedJob) -> List[Chunk]:
+    """
+    Разбиение задания на фрагменты
+
+    Args:
+        job_id: Идентификатор задания
+        job: Задание
+
+    Returns:
+        Фрагменты по chunk_size обычных случаев и, если нужно,
+        фрагмент с крайними случаями в конце
+    """
+    chunks = [
+        Chunk(
+            job_id=job_id,
+            seq=seq,
+            start=start,
+            count=min(job.chunk_size, job.normal_cases - start),
+        )
+        for seq, start in enumerate(range(0, job.normal_cases, job.chunk_size))
+    ]
+    if job.edge_cases:
+        chunks.append(Chunk(job_id=job_id, seq=len(chunks), start=job.normal_cases))
+    return chunks
+
+
+def shard_path(job: DistributedJob, seq: int) -> str:
+    """Путь к части файла с фрагментом seq"""
+    return os.path.join(job.shards, f"{seq:08d}.{job.format}.part")
+
+
+class WorkQueue(ABC):
+    """Очередь фрагментов, общая для координатора и исполнителей"""
+
+    @abstractmethod
+    def __init__(self, path: str) -> None:
+        """
+        Открытие очереди
+
+        Args:
+            path: Путь из адреса очереди (часть после <схема>://)
+        """
+
+    @abstractmethod
+    def submit(self, job_id: str, job: DistributedJob, chunks: List[Chunk]) -> None:
+        """Добавление задания и его фрагментов"""
+
+    @abstractmethod
+    def job(self, job_id: str) -> DistributedJob:
+        """Задание по идентификатору"""
+
+    @abstractmethod
+    def jobs(self) -> List[str]:
+        """Идентификаторы всех заданий в порядке добавления"""
+
+    @abstractmethod
+    def chunks(self, job_id: str) -> List[Chunk]:
+        """Фрагменты задания в порядке seq"""
+
+    @abstractmethod
+    def claim(self, worker: str, lease: float) -> Optional[Chunk]:
+        """
+        Захват свободного фрагмента
+
+        Фрагменты с истекшей арендой сначала возвращаются в очередь.
+
+        Args:
+            worker: Имя исполнителя
+            lease: Время, за которое исполнитель должен отчитаться, с
+
+        Returns:
+            Фрагмент или None, если свободных фрагментов нет
+        """
+
+    @abstractmethod
+    def complete(self, chunk: Chunk) -> None:
+        """Отметка о выполнении фрагмента (поля cases, edge_cases, bytes)"""
+
+    @abstractmethod
+    def fail(self, chunk: Chunk, error: str) -> None:
+        """Отметка об ошибке: фрагмент возвращается в очередь до max_attempts"""
+
+    def close(self) -> None:
+        """Освобождение ресурсов очереди"""
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """Очередь фрагментов в SQLite файле"""
+
+    def __init__(self, path: str) -> None:
+        """
+        Открытие (или создание) очереди
+
+        Args:
+            path: Путь к файлу базы
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        # Транзакции открываются явно (BEGIN IMMEDIATE), чтобы захват
+        # фрагмента был атомарным для всех процессов
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        # Журнал отката вместо WAL: индекс WAL - разделяемая память одного
+        # узла, и на сетевой файловой системе исполнители разных узлов
+        # видели бы несогласованное состояние очереди
+        self._connection.execute("PRAGMA journal_mode=DELETE")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                spec TEXT NOT NULL,
+                created REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS chunks (
+                job_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                start INTEGER NOT NULL,
+                count INTEGER,
+                state TEXT NOT NULL,
+                worker TEXT,
+                lease_until REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                cases INTEGER NOT NULL DEFAULT 0,
+                edge_cases INTEGER NOT NULL DEFAULT 0,
+                bytes INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                PRIMARY KEY (job_id, seq)
+            );
+            CREATE INDEX IF NOT EXISTS chunks_state ON chunks (state);
+            """
+        )
+
+    def _transaction(self, statements: List[Tuple[str, Tuple[Any, ...]]]) -> None:
+        """Выполнение изменений одной транзакцией"""
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, params in statements:
+                    self._connection.execute(sql, params)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def _query(self, sql: str, params: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def submit(self, job_id: str, job: DistributedJob, chunks: List[Chunk]) -> None:
+        statements: List[Tuple[str, Tuple[Any, ...]]] = [
+            (
+                "INSERT INTO jobs (id, spec, created) VALUES (?, ?, ?)",
+                (job_id, job.model_dump_json(), time.time()),
+            )
+        ]
+        statements.extend(
+            (
+                "INSERT INTO chunks (job_id, seq, start, count, state, max_attempts) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, c.seq, c.start, c.count, PENDING, job.max_attempts),
+            )
+            for c in chunks
+        )
+        self._transaction(statements)
+
+    def job(self, job_id: str) -> DistributedJob:
+        rows = self._query("SELECT spec FROM jobs WHERE id = ?", (job_id,))
+        if not rows:
+            raise ValueError(f"задание {job_id} не найдено в очереди {self.path}")
+        return DistributedJob(**json.loads(rows[0][0]))
+
+    def jobs(self) -> List[str]:
+        return [row[0] for row in self._query("SELECT id FROM jobs ORDER BY created")]
+
+    def chunks(self, job_id: str) -> List[Chunk]:
+        rows = self._query(
+            "SELECT job_id, seq, start, count, state, worker, attempts, cases, "
+            "edge_cases, bytes, error FROM chunks WHERE job_id = ? ORDER BY seq",
+            (job_id,),
+        )
+        return [self._chunk(row) for row in rows]
+
+    @staticmethod
+    def _chunk(row: Tuple[Any, ...]) -> Chunk:
+        fields = (
+            "job_id", "seq", "start", "count", "state", "worker", "attempts",
+            "cases", "edge_cases", "bytes", "error",
+        )
+        return Chunk(**dict(zip(fields, row)))
+
+    def claim(self, worker: str, lease: float) -> Optional[Chunk]:
+        now = time.time()
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                # Аренда истекла: исполнитель пропал, фрагмент выполняется заново
+                self._connection.execute(
+                    "UPDATE chunks SET state = CASE WHEN attempts >= max_attempts "
+                    "THEN ? ELSE ? END, error = 'аренда истекла (' || worker || ')', "
+                    "worker = NULL WHERE state = ? AND lease_until < ?",
+                    (FAILED, PENDING, RUNNING, now),
+                )
+                row = self._connection.execute(
+                    "SELECT c.job_id, c.seq FROM chunks c JOIN jobs j "
+                    "ON j.id = c.job_id WHERE c.state = ? "
+                    "ORDER BY j.created, c.seq LIMIT 1",
+                    (PENDING,),
+                ).fetchone()
+                chunk = None
+                if row is not None:
+                    self._connection.execute(
+                        "UPDATE chunks SET state = ?, worker = ?, lease_until = ?, "
+                        "attempts = attempts + 1 WHERE job_id = ? AND seq = ?",
+                        (RUNNING, worker, now + lease, row[0], row[1]),
+                    )
+                    chunk = self._chunk(
+                        self._connection.execute(
+                            "SELECT job_id, seq, start, count, state, worker, "
+                            "attempts, cases, edge_cases, bytes, error FROM chunks "
+                            "WHERE job_id = ? AND seq = ?",
+                            row,
+                        ).fetchone()
+                    )
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+        return chunk
+
+    def complete(self, chunk: Chunk) -> None:
+        # Опоздавший исполнитель с истекшей арендой записал ту же часть,
+        # поэтому его отчет тоже принимается
+        self._transaction(
+            [
+                (
+                    "UPDATE chunks SET state = ?, worker = ?, cases = ?, "
+                    "edge_cases = ?, bytes = ?, error = NULL "
+                    "WHERE job_id = ? AND seq = ? AND state != ?",
+                    (
+                        DONE,
+                        chunk.worker,
+                        chunk.cases,
+                        chunk.edge_cases,
+                        chunk.bytes,
+                        chunk.job_id,
+                        chunk.seq,
+                        DONE,
+                    ),
+                )
+            ]
+        )
+
+    def fail(self, chunk: Chunk, error: str) -> None:
+        self._transaction(
+            [
+                (
+                    "UPDATE chunks SET state = CASE WHEN attempts >= max_attempts "
+                    "THEN ? ELSE ? END, worker = NULL, error = ? "
+                    "WHERE job_id = ? AND seq = ? AND state = ? AND worker = ?",
+                    (
+                        FAILED,
+                        PENDING,
+                        error,
+                        chunk.job_id,
+                        chunk.seq,
+                        RUNNING,
+                        chunk.worker,
+                    ),
+                )
+            ]
+        )
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+# Реализации очереди по схеме адреса (sqlite:///path/queue.db)
+QUEUE_BACKENDS: Dict[str, Type[WorkQueue]] = {
+    "sqlite": SQLiteWorkQueue,
+}
+
+
+def open_queue(location: str) -> WorkQueue:
+    """
+    Открытие очереди по адресу
+
+    Args:
+        location: Адрес вида <схема>://<путь> из QUEUE_BACKENDS или путь к
+            SQLite файлу
+
+    Returns:
+        Очередь фрагментов
+    """
+    scheme, separator, path = location.partition("://")
+    if not separator:
+        return SQLiteWorkQueue(location)
+    if scheme not in QUEUE_BACKENDS:
+        raise ValueError(
+            f"неизвестная очередь {scheme} "
+            f"(допустимы: {', '.join(QUEUE_BACKENDS)})"
+        )
+    return QUEUE_BACKENDS[scheme](path)
+
+
+class Coordinator:
+    """Постановка заданий в очередь, ожидание и склейка результата"""
+
+    def __init__(self, work_queue: WorkQueue) -> None:
+        """
+        Инициализация координатора
+
+        Args:
+            work_queue: Очередь фрагментов
+        """
+        self.queue = work_queue
+
+    def submit(self, job: DistributedJob, job_id: Optional[str] = None) -> str:
+        """
+        Разбиение задания на фрагменты и постановка в очередь
+
+        Args:
+            job: Задание
+            job_id: Идентификатор (по умолчанию - случайный)
+
+        Returns:
+            Идентификатор задания
+        """
+        job_id = job_id or uuid.uuid4().hex[:12]
+        os.makedirs(job.shards, exist_ok=True)
+        self.queue.submit(job_id, job, split_job(job_id, job))
+        return job_id
+
+    def status(self, job_id: str) -> JobStatus:
+        """Сводка по фрагментам задания"""
+        status = JobStatus(job_id=job_id)
+        for chunk in self.queue.chunks(job_id):
+            status.chunks += 1
+            setattr(status, chunk.state, getattr(status, chunk.state) + 1)
+            status.retries += max(0, chunk.attempts - 1)
+            if chunk.state == DONE:
+                status.cases += chunk.cases
+            elif chunk.state == FAILED:
+                status.errors.append(f"фрагмент {chunk.seq}: {chunk.error}")
+        return status
+
+    def wait(
+        self,
+        job_id: str,
+        poll_interval: float = 1.0,
+        timeout: Optional[float] = None,
+    ) -> JobStatus:
+        """
+        Ожидание выполнения всех фрагментов
+
+        Args:
+            job_id: Идентификатор задания
+            poll_interval: Период опроса очереди, с
+            timeout: Предельное время ожидания, с
+
+        Returns:
+            Сводка по выполненному заданию
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            status = self.status(job_id)
+            if status.failed:
+                raise RuntimeError(
+                    f"задание {job_id} не выполнено: {'; '.join(status.errors)}"
+                )
+            if status.finished:
+                return status
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"задание {job_id}: готово {status.done} из {status.chunks} "
+                    "фрагментов"
+                )
+            time.sleep(poll_interval)
+
+    def merge(
+        self, job_id: str, output: Optional[str] = None, keep_shards: bool = False
+    ) -> MergeReport:
+        """
+        Склейка частей в итоговый файл
+
+        Части копируются в порядке фрагментов между заголовком и окончанием
+        формата; для jsonl рядом записывается манифест, допускающий дозапись.
+
+        Args:
+            job_id: Идентификатор задания
+            output: Итоговый файл (по умолчанию - из задания)
+            keep_shards: Не удалять части после склейки
+
+        Returns:
+            Итоги склейки
+        """
+        started = time.perf_counter()
+        job = self.queue.job(job_id)
+        chunks = self.queue.chunks(job_id)
+        missing = [chunk.seq for chunk in chunks if chunk.state != DONE]
+        if missing:
+            raise RuntimeError(
+                f"задание {job_id}: не выполнены фрагменты "
+                f"{', '.join(map(str, missing[:10]))}"
+            )
+
+        output = output or job.output
+        report = MergeReport(output=output, chunks=len(chunks))
+        report.normal_cases = sum(chunk.cases - chunk.edge_cases for chunk in chunks)
+        report.edge_cases = sum(chunk.edge_cases for chunk in chunks)
+        total = report.normal_cases + report.edge_cases
+
+        if job.format in Exporter.DEFERRED_HEADER_FORMATS:
+            header = Exporter.markdown_header(total, report.edge_cases)
+        else:
+            header = Exporter.header(job.format)
+
+        directory = os.path.dirname(output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(output, 'wb') as f:
+            f.write(header.encode('utf-8'))
+            for chunk in chunks:
+                with open(shard_path(job, chunk.seq), 'rb') as part:
+                    shutil.copyfileobj(part, f, 1024 * 1024)
+            f.write(Exporter.footer(job.format, total, job.compact).encode('utf-8'))
+            report.bytes = f.tell()
+
+        if job.format in Exporter.APPENDABLE_FORMATS:
+            SuiteManifest.record(
+                output,
+                report.normal_cases,
+                report.edge_cases,
+                task_type=job.task_type,
+                seed=job.seed,
+                counter_rng=True,
+            )
+
+        if not keep_shards:
+            shutil.rmtree(job.shards, ignore_errors=True)
+
+        report.elapsed = time.perf_counter() - started
+        return report
+
+
+class Worker:
+    """Исполнитель фрагментов из очереди"""
+
+    def __init__(
+        self,
+        work_queue: WorkQueue,
+        name: Optional[str] = None,
+        lease: float = DEFAULT_LEASE,
+    ) -> None:
+        """
+        Инициализация исполнителя
+
+        Args:
+            work_queue: Очередь фрагментов
+            name: Имя исполнителя (по умолчанию - узел и номер процесса)
+            lease: Время, за которое нужно отчитаться о фрагменте, с
+        """
+        self.queue = work_queue
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease = lease
+        self._jobs: Dict[str, DistributedJob] = {}
+        self._generators: Dict[str, BaseGenerator] = {}
+
+    def run(
+        self,
+        max_chunks: Optional[int] = None,
+        idle_timeout: float = 0.0,
+        poll_interval: float = 0.5,
+    ) -> WorkerReport:
+        """
+        Выполнение фрагментов, пока они есть в очереди
+
+        Args:
+            max_chunks: Предельное число фрагментов
+            idle_timeout: Сколько ждать новых фрагментов при пустой очереди, с
+            poll_interval: Период опроса пустой очереди, с
+
+        Returns:
+            Итоги работы
+        """
+        report = WorkerReport(worker=self.name)
+        started = time.perf_counter()
+        idle_since = time.monotonic()
+
+        while max_chunks is None or report.chunks < max_chunks:
+            chunk = self.queue.claim(self.name, self.lease)
+            if chunk is None:
+                if time.monotonic() - idle_since >= idle_timeout:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            try:
+                self.execute(chunk)
+            except Exception as e:
+                self.queue.fail(chunk, f"{type(e).__name__}: {e}")
+                report.failures += 1
+            else:
+                self.queue.complete(chunk)
+                report.chunks += 1
+                report.cases += chunk.cases
+                report.bytes += chunk.bytes
+            idle_since = time.monotonic()
+
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def execute(self, chunk: Chunk) -> None:
+        """
+        Генерация фрагмента и запись его части
+
+        Часть пишется во временный файл и переименовывается, поэтому
+        пропавший посреди записи исполнитель не оставляет неполной части.
+
+        Args:
+            chunk: Захваченный фрагмент; заполняются поля cases,
+                edge_cases и bytes
+        """
+        job = self._job(chunk.job_id)
+        generator = self._generator(chunk.job_id, job)
+
+        if chunk.is_edge:
+            cases = generator.shared_edge_cases()
+        else:
+            assert chunk.count is not None
+            cases = generator.generate_normal_cases(chunk.count, start=chunk.start)
+        payload = Exporter.dumps_chunk(cases, job.format, chunk.start, job.compact)
+        data = payload.encode('utf-8')
+
+        path = shard_path(job, chunk.seq)
+        os.makedirs(job.shards, exist_ok=True)
+        temporary = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(temporary, 'wb') as f:
+            f.write(data)
+        os.replace(temporary, path)
+
+        chunk.cases = len(cases)
+        chunk.edge_cases = sum(1 for tc in cases if tc.is_edge_case)
+        chunk.bytes = len(data)
+
+    def _job(self, job_id: str) -> DistributedJob:
+        job = self._jobs.get(job_id)
+        if job is None:
+            job = self._jobs[job_id] = self.queue.job(job_id)
+        return job
+
+    def _generator(self, job_id: str, job: DistributedJob) -> BaseGenerator:
+        """Генератор задания, общий для всех его фрагментов"""
+        generator = self._generators.get(job_id)
+        if generator is None:
+            params = {**job.params, "seed": job.seed}
+            generator = GENERATORS[job.task_type](**params)
+            self._generators[job_id] = generator
+        return generator
@@ -2,44 +2,332 @@
 Модуль для экспорта тестовых случаев в разные форматы
 """
 
-import json
-import yaml
+import os
+import textwrap
+from io import StringIO
 from pathlib import Path
-from typing import List, Any
+from typing import List, Any, Dict, Optional, Sequence
 
 from src.generators.base_generator import TestCase
+from src.generators.buffers import to_plain
+from src.generators.spill import SpilledArray
+from src.utils import columnar
+from src.utils.serializers import Serializer, get_json_serializer, get_yaml_serializer
 
 
 class Exporter:
     """Класс для экспорта тестовых случаев"""
 
+    FORMATS = ["json", "jsonl", "yaml", "python", "markdown"]
+    
+    # Форматы, которые можно записывать частями (заголовок, фрагменты, окончание)
+    STREAMING_FORMATS = ["json", "jsonl", "yaml", "python"]
+    
+    # Форматы, которые пишутся частями, но заголовок которых зависит от
+    # итогового количества случаев и записывается после всех фрагментов
+    DEFERRED_HEADER_FORMATS = ["markdown"]
+    
+    # Форматы, в конец которых можно дописывать новые случаи
+    APPENDABLE_FORMATS = ["jsonl"]
+    
+    # Двоичные колоночные форматы (требуют pyarrow), пишутся только в файл
+    COLUMNAR_FORMATS = columnar.COLUMNAR_FORMATS
+    
+    # Расширения файлов форматов (для записи в несколько форматов сразу)
+    EXTENSIONS = {
+        "json": ".json",
+        "jsonl": ".jsonl",
+        "yaml": ".yaml",
+        "python": ".py",
+        "markdown": ".md",
+        "parquet": ".parquet",
+        "arrow": ".arrow",
+    }
+    
+    # Сериализаторы выбираются при импорте: orjson/msgspec и libyaml, если
+    # установлены, иначе стандартные реализации
+    json_serializer: Serializer = get_json_serializer()
+    yaml_serializer: Serializer = get_yaml_serializer()
+    
     @staticmethod
-    def to_json(test_cases: List[TestCase], filename: str) -> None:
+    def use_json_backend(backend: Optional[str] = None) -> None:
         """
-        Экспорт тестовых случаев в JSON формате
+        Выбор реализации JSON
+        
+        Args:
+            backend: Имя реализации (orjson, msgspec, json), None - автовыбор
+        """
+        Exporter.json_serializer = get_json_serializer(backend)
+
+    @staticmethod
+    def dumps(test_cases: List[TestCase], fmt: str, compact: bool = False) -> str:
+        """
+        Сериализация тестовых случаев в строку заданного формата
+        
+        Args:
+            test_cases: Список тестовых случаев
+            fmt: Формат (json, jsonl, yaml, python, markdown)
+            compact: Компактная запись без отступов (для json и yaml)
+            
+        Returns:
+            Содержимое файла в виде строки
+        """
+        if fmt in Exporter.COLUMNAR_FORMATS:
+            raise ValueError(f"Формат {fmt} двоичный, используйте export()")
+        if fmt not in Exporter.FORMATS:
+            raise ValueError(f"Неизвестный формат экспорта: {fmt}")
+        
+        if fmt == "jsonl":
+            return Exporter.dumps_chunk(test_cases, fmt)
+        if fmt == "json":
+            data = Exporter._to_data(test_cases)
+            return Exporter.json_serializer.dumps(data, compact)
+        if fmt == "yaml":
+            data = Exporter._to_data(test_cases)
+            return Exporter.yaml_serializer.dumps(data, compact)
+        
+        buffer = StringIO()
+        getattr(Exporter, f"_write_{fmt}")(test_cases, buffer)
+        return buffer.getvalue()
+    
+    @staticmethod
+    def export(
+        test_cases: List[TestCase], filename: str, fmt: str, compact: bool = False
+    ) -> None:
+        """
+        Экспорт тестовых случаев в файл заданного формата
         
         Args:
             test_cases: Список тестовых случаев
             filename: Имя файла для сохранения
+            fmt: Формат (json, jsonl, yaml, python, markdown, parquet, arrow)
+            compact: Компактная запись без отступов (для json и yaml)
         """
-        data = [tc.dict() for tc in test_cases]
+        if fmt in Exporter.COLUMNAR_FORMATS:
+            columnar.write(test_cases, filename, fmt)
+            return
+        if fmt in ("json", "jsonl") and Exporter._has_spilled(test_cases):
+            with open(filename, 'w', encoding='utf-8') as f:
+                Exporter._write_spilled(test_cases, f, fmt)
+            return
+
+        content = Exporter.dumps(test_cases, fmt, compact)
         
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write(content)
+
+    @staticmethod
+    def header(fmt: str) -> str:
+        """
+        Начало файла потокового формата
+        
+        Args:
+            fmt: Формат из STREAMING_FORMATS
+            
+        Returns:
+            Текст, предшествующий первому фрагменту
+        """
+        if fmt == "json":
+            return "["
+        if fmt == "python":
+            return (
+                "import pytest\n\n"
+                "# Автоматически сгенерированные тестовые случаи\n"
+                "# Для использования импортируйте вашу функцию и раскомментируйте assert\n\n"
+            )
+        return ""
+    
+    @staticmethod
+    def dumps_chunk(
+        test_cases: List[TestCase], fmt: str, start: int = 0, compact: bool = False
+    ) -> str:
+        """
+        Сериализация фрагмента потокового файла
+        
+        Фрагменты, записанные подряд между header() и footer(), образуют
+        тот же документ, что и сериализация всего списка целиком.
+        
+        Args:
+            test_cases: Тестовые случаи фрагмента
+            fmt: Формат из STREAMING_FORMATS или DEFERRED_HEADER_FORMATS
+            start: Порядковый номер первого случая фрагмента в файле
+            compact: Компактная запись без отступов (для json и yaml)
+            
+        Returns:
+            Текст фрагмента
+        """
+        return Exporter.dumps_chunks(test_cases, [fmt], start, compact)[fmt]
+    
+    @staticmethod
+    def dumps_chunks(
+        test_cases: List[TestCase],
+        formats: Sequence[str],
+        start: int = 0,
+        compact: bool = False,
+    ) -> Dict[str, str]:
+        """
+        Сериализация фрагмента сразу в несколько форматов
+        
+        Словари случаев строятся один раз и используются всеми текстовыми
+        форматами данных (json, jsonl, yaml).
+        
+        Args:
+            test_cases: Тестовые случаи фрагмента
+            formats: Форматы из STREAMING_FORMATS или DEFERRED_HEADER_FORMATS
+            start: Порядковый номер первого случая фрагмента в файле
+            compact: Компактная запись без отступов (для json и yaml)
+            
+        Returns:
+            Словарь формат -> текст фрагмента
+        """
+        data = None
+        chunks = {}
+        for fmt in formats:
+            if test_cases and data is None and fmt in ("json", "jsonl", "yaml"):
+                data = Exporter._to_data(test_cases)
+            chunks[fmt] = Exporter._dumps_data(test_cases, data, fmt, start, compact)
+        return chunks
+    
+    @staticmethod
+    def _dumps_data(
+        test_cases: List[TestCase],
+        data: Optional[List[Dict[str, Any]]],
+        fmt: str,
+        start: int,
+        compact: bool,
+    ) -> str:
+        """Текст фрагмента формата fmt по случаям и их словарям"""
+        if fmt not in Exporter.STREAMING_FORMATS + Exporter.DEFERRED_HEADER_FORMATS:
+            raise ValueError(f"Формат {fmt} не поддерживает запись частями")
+        if not test_cases:
+            return ""
+        
+        if fmt in ("json", "jsonl", "yaml"):
+            if data is None:
+                data = Exporter._to_data(test_cases)
+            return Exporter._dumps_text(data, fmt, start, compact)
+        
+        buffer = StringIO()
+        getattr(Exporter, f"_write_{fmt}_cases")(test_cases, buffer, start)
+        return buffer.getvalue()
+    
+    @staticmethod
+    def _dumps_text(
+        data: List[Dict[str, Any]], fmt: str, start: int, compact: bool
+    ) -> str:
+        """Текст фрагмента формата данных (json, jsonl, yaml) по словарям"""
+        if fmt == "json":
+            dumps = Exporter.json_serializer.dumps
+            if compact:
+                items = ",".join(dumps(item, True) for item in data)
+                return items if start == 0 else "," + items
+            
+            items = ",\n".join(textwrap.indent(dumps(item), "  ") for item in data)
+            return ("\n" if start == 0 else ",\n") + items
+        
+        if fmt == "jsonl":
+            dumps = Exporter.json_serializer.dumps
+            return "".join(dumps(item, True) + "\n" for item in data)
+        
+        return Exporter.yaml_serializer.dumps(data, compact)
+    
+    @staticmethod
+    def footer(fmt: str, count: int, compact: bool = False) -> str:
+        """
+        Окончание файла потокового формата
+        
+        Args:
+            fmt: Формат из STREAMING_FORMATS
+            count: Общее количество записанных случаев
+            compact: Компактная запись без отступов (для json и yaml)
+            
+        Returns:
+            Текст, завершающий файл
+        """
+        if fmt == "json":
+            return "\n]" if count and not compact else "]"
+        if fmt == "yaml" and not count:
+            return "[]\n"
+        return ""
+
+    @staticmethod
+    def markdown_header(total: int, edge_count: int) -> str:
+        """
+        Заголовок Markdown файла со сводкой по набору
+        
+        Args:
+            total: Общее количество случаев
+            edge_count: Количество крайних случаев
+            
+        Returns:
+            Текст, предшествующий фрагментам dumps_chunk(..., "markdown")
+        """
+        return (
+            "# Тестовые случаи\n\n"
+            f"Всего случаев: {total}\n\n"
+            f"- Нормальных случаев: {total - edge_count}\n"
+            f"- Крайних случаев: {edge_count}\n\n"
+            "## Список тестовых случаев\n\n"
+        )
+
+    @staticmethod
+    def output_names(filename: str, formats: Sequence[str]) -> Dict[str, str]:
+        """
+        Имена файлов для записи набора в несколько форматов
+        
+        Для одного формата используется filename как есть, для нескольких -
+        filename с расширением каждого формата из EXTENSIONS.
+        
+        Args:
+            filename: Имя выходного файла
+            formats: Список форматов
+            
+        Returns:
+            Словарь формат -> имя файла
+        """
+        if len(formats) == 1:
+            return {formats[0]: filename}
+        stem = os.path.splitext(filename)[0]
+        return {fmt: stem + Exporter.EXTENSIONS[fmt] for fmt in formats}
+
+    @staticmethod
+    def to_json(
+        test_cases: List[TestCase], filename: str, compact: bool = False
+    ) -> None:
+        """
+        Экспорт тестовых случаев в JSON формате
+        
+        Args:
+            test_cases: Список тестовых случаев
+            filename: Имя файла для сохранения
+            compact: Компактная запись без отступов
+        """
+        Exporter.export(test_cases, filename, "json", compact)
     
     @staticmethod
-    def to_yaml(test_cases: List[TestCase], filename: str) -> None:
+    def to_yaml(
+        test_cases: List[TestCase], filename: str, compact: bool = False
+    ) -> None:
         """
         Экспорт тестовых случаев в YAML формате
         
         Args:
             test_cases: Список тестовых случаев
             filename: Имя файла для сохранения
+            compact: Списки чисел записываются в одну строку
         """
-        data = [tc.dict() for tc in test_cases]
+        Exporter.export(test_cases, filename, "yaml", compact)
+    
+    @staticmethod
+    def to_jsonl(test_cases: List[TestCase], filename: str) -> None:
+        """
+        Экспорт тестовых случаев в JSON Lines (один случай на строку)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, allow_unicode=True, default_flow_style=False)
+        Args:
+            test_cases: Список тестовых случаев
+            filename: Имя файла для сохранения
+        """
+        Exporter.export(test_cases, filename, "jsonl")
     
     @staticmethod
     def to_python(test_cases: List[TestCase], filename: str) -> None:
@@ -51,26 +339,7 @@ class Exporter:
             filename: Имя файла для сохранения
         """
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write("import pytest\n\n")
-            f.write("# Автоматически сгенерированные тестовые случаи\n")
-            f.write("# Для использования импортируйте вашу функцию и раскомментируйте assert\n\n")
-            
-            for i, tc in enumerate(test_cases):
-                f.write(f"def test_case_{i:03d}():\n")
-                f.write(f'    """{tc.description}"""\n')
-                f.write(f"    input_data = {repr(tc.input)}\n")
-                f.write(f"    expected = {repr(tc.expected)}\n")
-                f.write("    \n")
-                f.write("    # Раскомментируйте и замените на вашу функцию:\n")
-                f.write("    # result = your_function(input_data)\n")
-                f.write("    # assert result == expected\n")
-                
-                if tc.is_edge_case:
-                    f.write("    # Этот тест является крайним случаем\n")
-                
-                f.write("    \n")
-                f.write("    # Временно всегда проходит:\n")
-                f.write("    assert True\n\n")
+            Exporter._write_python(test_cases, f)
     
     @staticmethod
     def to_markdown(test_cases: List[TestCase], filename: str) -> None:
@@ -82,22 +351,107 @@ class Exporter:
             filename: Имя файла для сохранения
         """
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write("# Тестовые случаи\n\n")
-            f.write(f"Всего случаев: {len(test_cases)}\n\n")
-            
-            normal_count = sum(1 for tc in test_cases if not tc.is_edge_case)
-            edge_count = len(test_cases) - normal_count
-            
-            f.write(f"- Нормальных случаев: {normal_count}\n")
-            f.write(f"- Крайних случаев: {edge_count}\n\n")
+            Exporter._write_markdown(test_cases, f)
+    
+    @staticmethod
+    def _to_data(test_cases: List[TestCase]) -> List[Dict[str, Any]]:
+        """Преобразование тестовых случаев в словари для сериализации"""
+        data = [tc.model_dump() for tc in test_cases]
+        for item in data:
+            # Буферные массивы (array, NumPy) пишутся как списки
+            item["input"] = to_plain(item["input"])
+            item["expected"] = to_plain(item["expected"])
+        return data
+    
+    @staticmethod
+    def _has_spilled(test_cases: List[TestCase]) -> bool:
+        """Есть ли среди случаев массивы, выгруженные на диск"""
+        return any(
+            isinstance(tc.input, SpilledArray) or isinstance(tc.expected, SpilledArray)
+            for tc in test_cases
+        )
+
+    @staticmethod
+    def _write_spilled(test_cases: List[TestCase], f: Any, fmt: str) -> None:
+        """
+        Запись случаев с выгруженными массивами, по одному случаю на строку
+
+        Выгруженные массивы читаются и записываются фрагментами, поэтому
+        случай не собирается в памяти целиком.
+        """
+        if fmt == "json":
+            f.write("[\n")
+        for i, tc in enumerate(test_cases):
+            if fmt == "json" and i:
+                f.write(",\n")
+            for j, (name, value) in enumerate(tc.model_dump().items()):
+                f.write(("{" if j == 0 else ",") + f'"{name}":')
+                if isinstance(value, SpilledArray):
+                    Exporter._write_spilled_array(value, f)
+                else:
+                    f.write(
+                        Exporter.json_serializer.dumps(to_plain(value), compact=True)
+                    )
+            f.write("}\n")
+        if fmt == "json":
+            f.write("]")
+
+    @staticmethod
+    def _write_spilled_array(spilled: SpilledArray, f: Any) -> None:
+        """Запись выгруженного массива списком JSON, фрагмент за фрагментом"""
+        f.write("[")
+        first = True
+        for chunk in spilled.iter_chunks():
+            if chunk:
+                f.write(("" if first else ",") + ",".join(map(str, chunk)))
+                first = False
+        f.write("]")
+
+    @staticmethod
+    def _write_python(test_cases: List[TestCase], f: Any) -> None:
+        """Запись модуля pytest в открытый файл"""
+        f.write(Exporter.header("python"))
+        Exporter._write_python_cases(test_cases, f)
+    
+    @staticmethod
+    def _write_python_cases(test_cases: List[TestCase], f: Any, start: int = 0) -> None:
+        """Запись тестовых функций pytest, нумерация начинается со start"""
+        for i, tc in enumerate(test_cases, start):
+            f.write(f"def test_case_{i:03d}():\n")
+            f.write(f'    """{tc.description}"""\n')
+            f.write(f"    input_data = {repr(to_plain(tc.input))}\n")
+            f.write(f"    expected = {repr(to_plain(tc.expected))}\n")
+            f.write("    \n")
+            f.write("    # Раскомментируйте и замените на вашу функцию:\n")
+            f.write("    # result = your_function(input_data)\n")
+            f.write("    # assert result == expected\n")
             
-            f.write("## Список тестовых случаев\n\n")
+            if tc.is_edge_case:
+                f.write("    # Этот тест является крайним случаем\n")
             
-            for i, tc in enumerate(test_cases, 1):
-                case_type = "🚨 Крайний" if tc.is_edge_case else "✅ Нормальный"
-                f.write(f"### Тест {i}: {case_type}\n\n")
-                f.write(f"**Описание:** {tc.description}\n\n")
-                f.write(f"**Входные данные:**\n```python\n{tc.input}\n```\n\n")
-                f.write(f"**Ожидаемый результат:**\n```python\n{tc.expected}\n```\n\n")
-                f.write(f"**Вес:** {tc.weight}\n\n")
-                f.write("---\n\n")
\ No newline at end of file
+            f.write("    \n")
+            f.write("    # Временно всегда проходит:\n")
+            f.write("    assert True\n\n")
+    
+    @staticmethod
+    def _write_markdown(test_cases: List[TestCase], f: Any) -> None:
+        """Запись Markdown представления в открытый файл"""
+        edge_count = sum(1 for tc in test_cases if tc.is_edge_case)
+        f.write(Exporter.markdown_header(len(test_cases), edge_count))
+        Exporter._write_markdown_cases(test_cases, f)
+    
+    @staticmethod
+    def _write_markdown_cases(
+        test_cases: List[TestCase], f: Any, start: int = 0
+    ) -> None:
+        """Запись разделов Markdown по случаям, нумерация начинается со start"""
+        for i, tc in enumerate(test_cases, start + 1):
+            case_type = "🚨 Крайний" if tc.is_edge_case else "✅ Нормальный"
+            f.write(f"### Тест {i}: {case_type}\n\n")
+            f.write(f"**Описание:** {tc.description}\n\n")
+            input_data = to_plain(tc.input)
+            expected = to_plain(tc.expected)
+            f.write(f"**Входные данные:**\n```python\n{input_data}\n```\n\n")
+            f.write(f"**Ожидаемый результат:**\n```python\n{expected}\n```\n\n")
+            f.write(f"**Вес:** {tc.weight}\n\n")
+            f.write("---\n\n")
\ No newline at end of file
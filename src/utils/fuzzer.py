@@ -0,0 +1,580 @@
+"""
+Модуль дифференциального фаззинга: поиск входов, различающих решения
+
+Эталонное решение и решения-кандидаты (например, заведомо ошибочные
+варианты из KNOWN_BUGS) запускаются на мутациях входов из набора
+генератора. Вход, на котором ответ кандидата расходится с эталоном,
+сокращается до минимального и выдается крайним случаем. Каждый случай
+различает хотя бы одного нового кандидата, поэтому итоговый набор ловит
+все найденные ошибки наименьшим числом случаев.
+"""
+
+import bisect
+import copy
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field
+
+from src.generators.base_generator import BaseGenerator, TestCase
+from src.generators.buffers import to_plain
+from src.utils.runner import normalize
+
+
+# Наибольшее количество проверок при сокращении одного входа
+MAX_SHRINK_STEPS = 2000
+
+# Наибольший размер корпуса входов, из которых строятся мутации
+MAX_CORPUS_SIZE = 10000
+
+
+def _last_occurrence(data: Dict[str, Any]) -> int:
+    """Последнее вхождение вместо первого"""
+    arr, target = data["array"], data["target"]
+    i = bisect.bisect_right(arr, target) - 1
+    return i if i >= 0 and arr[i] == target else -1
+
+
+def _any_occurrence(data: Dict[str, Any]) -> int:
+    """Классический двоичный поиск: любое из равных вхождений"""
+    arr, target = data["array"], data["target"]
+    lo, hi = 0, len(arr) - 1
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if arr[mid] == target:
+            return mid
+        if arr[mid] < target:
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    return -1
+
+
+def _unchecked_lower_bound(data: Dict[str, Any]) -> int:
+    """Точка вставки без проверки, что элемент найден"""
+    arr, target = data["array"], data["target"]
+    i = bisect.bisect_left(arr, target)
+    return i if i < len(arr) else -1
+
+
+def _exclusive_high(data: Dict[str, Any]) -> int:
+    """Ошибка на единицу в правой границе: последний элемент не находится"""
+    arr, target = data["array"], data["target"]
+    lo, hi = 0, len(arr) - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if arr[mid] < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo if lo < len(arr) - 1 and arr[lo] == target else -1
+
+
+def _dedup_sort(arr: List[int]) -> List[int]:
+    """Сортировка, теряющая дубликаты"""
+    return sorted(set(arr))
+
+
+def _abs_sort(arr: List[int]) -> List[int]:
+    """Сортировка по модулю"""
+    return sorted(arr, key=abs)
+
+
+def _skip_last_sort(arr: List[int]) -> List[int]:
+    """Сортировка без последнего элемента"""
+    return sorted(arr[:-1]) + arr[-1:]
+
+
+def _factorial_without_n(n: int) -> int:
+    """Произведение 1..n-1 вместо 1..n"""
+    return math.prod(range(1, n))
+
+
+def _fibonacci_one_based(n: int) -> int:
+    """Последовательность, начинающаяся с F(0) = 1"""
+    a, b = 1, 1
+    for _ in range(n - 1):
+        a, b = b, a + b
+    return a
+
+
+def _gcd_without_zero(pair: Tuple[int, int]) -> int:
+    """Алгоритм Евклида без обработки нулевого аргумента"""
+    a, b = pair
+    while a % b:
+        a, b = b, a % b
+    return b
+
+
+# Заведомо ошибочные решения по имени оракула генератора
+KNOWN_BUGS: Dict[str, Dict[str, Callable[[Any], Any]]] = {
+    "searching": {
+        "last_occurrence": _last_occurrence,
+        "any_occurrence": _any_occurrence,
+        "unchecked_lower_bound": _unchecked_lower_bound,
+        "exclusive_high": _exclusive_high,
+    },
+    "sorting": {
+        "dedup": _dedup_sort,
+        "abs_key": _abs_sort,
+        "skip_last": _skip_last_sort,
+    },
+    "factorial": {"without_n": _factorial_without_n},
+    "fibonacci": {"one_based": _fibonacci_one_based},
+    "gcd": {"without_zero": _gcd_without_zero},
+}
+
+
+def outcome(solve: Callable[[Any], Any], value: Any) -> Any:
+    """
+    Ответ решения в виде, пригодном для сравнения
+
+    Решение получает копию входа (и может ее менять); ответ приводится
+    к виду после записи в JSON, исключение - к кортежу ("error", тип).
+    """
+    try:
+        return normalize(solve(copy.deepcopy(value)))
+    except Exception as e:
+        return ("error", type(e).__name__)
+
+
+def _is_error(result: Any) -> bool:
+    return isinstance(result, tuple)
+
+
+def differing(
+    reference: Callable[[Any], Any],
+    candidates: Dict[str, Callable[[Any], Any]],
+    value: Any,
+) -> Optional[List[str]]:
+    """
+    Кандидаты, ответ которых на value расходится с эталоном
+
+    Returns:
+        Имена кандидатов или None, если эталон не принимает вход
+    """
+    expected = outcome(reference, value)
+    if _is_error(expected):
+        return None
+    return [
+        name for name, solve in candidates.items() if outcome(solve, value) != expected
+    ]
+
+
+def _evaluate(
+    reference: Callable[[Any], Any],
+    candidates: Dict[str, Callable[[Any], Any]],
+    inputs: List[Any],
+) -> List[Optional[List[str]]]:
+    """Проверка пакета входов (выполняется в пуле процессов)"""
+    return [differing(reference, candidates, value) for value in inputs]
+
+
+def _is_int_list(value: Any) -> bool:
+    return isinstance(value, list) and all(type(item) is int for item in value)
+
+
+def _is_sorted(value: List[int]) -> bool:
+    return all(a <= b for a, b in zip(value, value[1:]))
+
+
+def _ints(value: Any) -> Iterator[int]:
+    """Все целые числа значения (для выбора «интересных» соседних значений)"""
+    if type(value) is int:
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _ints(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _ints(item)
+
+
+class Mutator:
+    """Случайные мутации входов: целых чисел, массивов, кортежей и словарей"""
+
+    def __init__(self, seeds: Sequence[Any], rng: random.Random) -> None:
+        """
+        Инициализация
+
+        Args:
+            seeds: Исходные входы; по ним выбираются границы значений и длин
+            rng: Генератор случайных чисел
+        """
+        self.rng = rng
+        values = [abs(x) for seed in seeds for x in _ints(seed)]
+        lengths = [len(seed) for seed in seeds if isinstance(seed, list)] + [
+            len(item)
+            for seed in seeds
+            if isinstance(seed, dict)
+            for item in seed.values()
+            if isinstance(item, list)
+        ]
+        self.bound = max([1000] + [2 * x for x in values])
+        self.max_len = max([16] + [2 * n for n in lengths])
+
+    def mutate(self, value: Any, rounds: int = 1) -> Any:
+        """Вход после rounds случайных мутаций (исходное значение не меняется)"""
+        for _ in range(rounds):
+            value = self._mutate(value, [])
+        return value
+
+    def _mutate(self, value: Any, pool: List[int]) -> Any:
+        if type(value) is int:
+            return self._mutate_int(value, pool)
+        if _is_int_list(value):
+            return self._mutate_list(value, pool)
+        if isinstance(value, tuple) and value:
+            i = self.rng.randrange(len(value))
+            return value[:i] + (self._mutate(value[i], pool),) + value[i + 1:]
+        if isinstance(value, dict) and value:
+            key = self.rng.choice(sorted(value))
+            # Соседние значения других полей помогают попасть в границы
+            # (например, target рядом с элементами array)
+            others = [x for k, item in value.items() if k != key for x in _ints(item)]
+            mutated = self._mutate(value[key], others)
+            if _is_int_list(value[key]) and _is_sorted(value[key]):
+                mutated = sorted(mutated)
+            return {**value, key: mutated}
+        return value
+
+    def _mutate_int(self, x: int, pool: List[int]) -> int:
+        rng = self.rng
+        options = [x + 1, x - 1, -x, x // 2, 0, 1, rng.randint(-self.bound, self.bound)]
+        if pool:
+            options += [rng.choice(pool) + rng.choice((-1, 0, 1))] * 3
+        return max(-self.bound, min(self.bound, rng.choice(options)))
+
+    def _mutate_list(self, arr: List[int], pool: List[int]) -> List[int]:
+        rng = self.rng
+        arr = list(arr)
+        op = rng.randrange(9) if arr else 0
+
+        if op == 0 and len(arr) < self.max_len:
+            # Вставка: значение рядом с имеющимся или случайное
+            value = self._mutate_int(rng.choice(arr) if arr else 0, pool)
+            arr.insert(rng.randint(0, len(arr)), value)
+        elif op == 1 and len(arr) < self.max_len:
+            # Повтор элемента рядом с ним (дубликаты)
+            i = rng.randrange(len(arr))
+            arr.insert(i, arr[i])
+        elif op == 2:
+            del arr[rng.randrange(len(arr))]
+        elif op == 3:
+            i = rng.randrange(len(arr))
+            arr[i] = self._mutate_int(arr[i], pool)
+        elif op == 4:
+            i, j = rng.randrange(len(arr)), rng.randrange(len(arr))
+            arr[i], arr[j] = arr[j], arr[i]
+        elif op == 5:
+            # Серия равных значений
+            i = rng.randrange(len(arr))
+            j = rng.randint(i, len(arr))
+            arr[i:j] = [arr[i]] * (j - i)
+        elif op == 6:
+            arr = arr[: rng.randint(0, len(arr))]
+        elif op == 7:
+            arr.sort(reverse=rng.random() < 0.5)
+        else:
+            value = rng.choice((min(arr) - 1, max(arr) + 1))
+            if len(arr) < self.max_len:
+                arr.append(max(-self.bound, min(self.bound, value)))
+        return arr
+
+
+def _shrink_int(x: int) -> Iterator[int]:
+    if x == 0:
+        return
+    yield 0
+    if abs(x) > 1:
+        yield x // 2 if x > 0 else -(-x // 2)
+    yield x - 1 if x > 0 else x + 1
+    if x < 0:
+        yield -x
+
+
+def _shrink_list(arr: List[Any]) -> Iterator[List[Any]]:
+    # Удаление частей: половины, четверти, ..., отдельные элементы
+    size = len(arr) // 2
+    while size >= 1:
+        for start in range(0, len(arr), size):
+            yield arr[:start] + arr[start + size:]
+        size //= 2
+    yield from _shrink_equal(arr)
+    for i, item in enumerate(arr):
+        for smaller in shrink_candidates(item):
+            yield arr[:i] + [smaller] + arr[i + 1:]
+
+
+def _substitute(value: Any, old: int, new: int) -> Any:
+    """Замена всех вхождений числа old (в том числе внутри массивов)"""
+    if type(value) is int:
+        return new if value == old else value
+    if isinstance(value, list):
+        return [_substitute(item, old, new) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_substitute(item, old, new) for item in value)
+    if isinstance(value, dict):
+        return {key: _substitute(item, old, new) for key, item in value.items()}
+    return value
+
+
+def _shrink_equal(value: Any) -> Iterator[Any]:
+    # Одновременное уменьшение равных чисел сохраняет связи между ними
+    # (дубликаты в массиве, target, равный элементу array)
+    for old in sorted(set(_ints(value)), key=abs, reverse=True):
+        for new in _shrink_int(old):
+            yield _substitute(value, old, new)
+
+
+def shrink_candidates(value: Any) -> Iterator[Any]:
+    """Меньшие варианты значения, от самых сильных сокращений к слабым"""
+    if isinstance(value, (tuple, dict)):
+        yield from _shrink_equal(value)
+
+    if type(value) is int:
+        yield from _shrink_int(value)
+    elif isinstance(value, list):
+        yield from _shrink_list(value)
+    elif isinstance(value, tuple):
+        for i, item in enumerate(value):
+            for smaller in shrink_candidates(item):
+                yield value[:i] + (smaller,) + value[i + 1:]
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            keep_sorted = _is_int_list(item) and _is_sorted(item)
+            for smaller in shrink_candidates(item):
+                if keep_sorted:
+                    smaller = sorted(smaller)
+                yield {**value, key: smaller}
+
+
+def shrink(
+    value: Any,
+    predicate: Callable[[Any], bool],
+    max_steps: int = MAX_SHRINK_STEPS,
+) -> Any:
+    """
+    Сокращение входа с сохранением свойства predicate
+
+    Жадно применяется первое сокращение из shrink_candidates, для которого
+    predicate выполняется, пока такие находятся.
+
+    Args:
+        value: Вход, для которого predicate выполняется
+        predicate: Проверяемое свойство (например, кандидат ошибается)
+        max_steps: Наибольшее количество вызовов predicate
+
+    Returns:
+        Сокращенный вход
+    """
+    steps = 0
+    improved = True
+    while improved and steps < max_steps:
+        improved = False
+        for smaller in shrink_candidates(value):
+            steps += 1
+            if predicate(smaller):
+                value = smaller
+                improved = True
+                break
+            if steps >= max_steps:
+                break
+    return value
+
+
+def seed_inputs(generator: BaseGenerator, oracle: str, count: int) -> List[Any]:
+    """
+    Исходные входы для фаззинга эталона oracle
+
+    Если у генератора есть метод отдельной задачи (_generate_<oracle>,
+    как у MathGenerator), входы берутся из него, иначе - из обычных
+    случаев.
+
+    Args:
+        generator: Генератор тестовых случаев
+        oracle: Имя оракула из ORACLES генератора
+        count: Количество входов
+
+    Returns:
+        Входные данные случаев
+    """
+    method = getattr(generator, f"_generate_{oracle}", None)
+    if method is not None:
+        return [method(normal_case=True).input for _ in range(count)]
+    return [tc.input for tc in generator.generate_normal_cases(count)]
+
+
+class FuzzReport(BaseModel):
+    """Результат фаззинга"""
+
+    cases: List[TestCase] = Field(default_factory=list)
+    killed: Dict[str, int] = Field(
+        default_factory=dict, description="Кандидат -> номер различающего случая"
+    )
+    survivors: List[str] = Field(
+        default_factory=list, description="Кандидаты, не отличенные от эталона"
+    )
+    executed: int = 0
+    discriminating: int = 0
+    invalid: int = Field(default=0, description="Входы, не принятые эталоном")
+    elapsed: float = 0.0
+
+
+class DifferentialFuzzer:
+    """Поиск минимальных входов, на которых кандидаты расходятся с эталоном"""
+
+    def __init__(
+        self,
+        reference: Callable[[Any], Any],
+        candidates: Dict[str, Callable[[Any], Any]],
+        batch_size: int = 256,
+        workers: int = 1,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Инициализация
+
+        Args:
+            reference: Эталонное решение
+            candidates: Проверяемые решения по имени
+            batch_size: Количество входов в пакете проверки
+            workers: Количество процессов проверки (при workers > 1 решения
+                должны быть функциями уровня модуля)
+            seed: Начальное значение генератора мутаций
+        """
+        if not candidates:
+            raise ValueError("Не заданы решения-кандидаты")
+
+        self.reference = reference
+        self.candidates = candidates
+        self.batch_size = max(1, batch_size)
+        self.workers = max(1, workers)
+        self.rng = random.Random(seed)
+        # Различаемые кандидаты по номеру случая отчета
+        self._names: List[List[str]] = []
+
+    def run(
+        self,
+        seeds: Sequence[Any],
+        max_inputs: int = 100000,
+        time_budget: Optional[float] = None,
+    ) -> FuzzReport:
+        """
+        Фаззинг от исходных входов до различения всех кандидатов или
+        исчерпания бюджета
+
+        Args:
+            seeds: Исходные входы (например, input случаев генератора)
+            max_inputs: Наибольшее количество проверенных входов
+            time_budget: Ограничение времени, секунды
+
+        Returns:
+            Отчет с минимальными различающими случаями
+        """
+        started = time.perf_counter()
+        corpus = [to_plain(seed) for seed in seeds]
+        if not corpus:
+            raise ValueError("Нет исходных входов для мутаций")
+
+        mutator = Mutator(corpus, self.rng)
+        report = FuzzReport()
+        self._names = []
+        pending: List[Any] = list(corpus)
+
+        pool = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+        try:
+            while report.executed < max_inputs and len(report.killed) < len(
+                self.candidates
+            ):
+                if time_budget is not None:
+                    if time.perf_counter() - started >= time_budget:
+                        break
+
+                count = min(
+                    self.batch_size * self.workers, max_inputs - report.executed
+                )
+                batch = pending[:count]
+                pending = pending[count:]
+                while len(batch) < count:
+                    parent = self.rng.choice(corpus)
+                    batch.append(mutator.mutate(parent, self.rng.randint(1, 3)))
+
+                for value, names in zip(batch, self._evaluate(batch, pool)):
+                    report.executed += 1
+                    if names is None:
+                        report.invalid += 1
+                        continue
+                    if not names:
+                        continue
+
+                    report.discriminating += 1
+                    if len(corpus) < MAX_CORPUS_SIZE:
+                        corpus.append(value)
+                    new = [name for name in names if name not in report.killed]
+                    if new:
+                        self._keep(value, new[0], report)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        self._minimize(report)
+        report.survivors = [
+            name for name in self.candidates if name not in report.killed
+        ]
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _minimize(self, report: FuzzReport) -> None:
+        """Удаление случаев, все кандидаты которых различены другими"""
+        keep = list(range(len(report.cases)))
+        for i in range(len(report.cases)):
+            others = {name for j in keep if j != i for name in self._names[j]}
+            if others.issuperset(self._names[i]):
+                keep.remove(i)
+
+        report.cases = [report.cases[i] for i in keep]
+        report.killed = {}
+        for index, i in enumerate(keep):
+            for name in self._names[i]:
+                report.killed.setdefault(name, index)
+
+    def _evaluate(
+        self, batch: List[Any], pool: Optional[ProcessPoolExecutor]
+    ) -> List[Optional[List[str]]]:
+        if pool is None:
+            return _evaluate(self.reference, self.candidates, batch)
+
+        size = (len(batch) + self.workers - 1) // self.workers
+        futures = [
+            pool.submit(_evaluate, self.reference, self.candidates, batch[i:i + size])
+            for i in range(0, len(batch), size)
+        ]
+        return [names for future in futures for names in future.result()]
+
+    def _keep(self, value: Any, name: str, report: FuzzReport) -> None:
+        """Сокращение входа, различающего кандидата name, и запись случая"""
+        solve = self.candidates[name]
+
+        def still_differs(smaller: Any) -> bool:
+            expected = outcome(self.reference, smaller)
+            return not _is_error(expected) and outcome(solve, smaller) != expected
+
+        smaller = shrink(value, still_differs)
+        names = differing(self.reference, self.candidates, smaller) or [name]
+        for killed in names:
+            report.killed.setdefault(killed, len(report.cases))
+
+        self._names.append(names)
+        report.cases.append(
+            TestCase(
+                input=smaller,
+                expected=self.reference(copy.deepcopy(smaller)),
+                description=f"Различающий случай: {', '.join(names)}",
+                is_edge_case=True,
+                weight=2.0,
+            )
+        )
@@ -0,0 +1,418 @@
+"""
+Модуль прогона решения в пуле заранее прогретых процессов
+
+Процесс-зигота один раз импортирует решение (и модули из preload) и
+порождает процессы-исполнители через fork: каждый исполнитель получает уже
+загруженный модуль без запуска интерпретатора и повторного импорта. Зигота
+однопоточна, поэтому fork из нее безопасен, в отличие от fork из
+многопоточного родителя, где работают потоки раздачи случаев.
+
+Исполнитель получает случаи пакетами по каналу (socketpair, переданный из
+зиготы родителю через SCM_RIGHTS), сам сравнивает ответ с ожидаемым и
+возвращает время каждого вызова; ответ передается обратно только для
+упавших случаев. Исполнитель заменяется новым после max_cases случаев,
+роста пиковой памяти больше max_memory или прерванного по таймауту случая
+(таймер SIGALRM в исполнителе). Если исполнитель упал или не вернул пакет
+за отведенное время (решение зависло внутри C-кода, где сигнал не
+обрабатывается), процесс уничтожается, а случаи пакета проверяются по
+одному в новых исполнителях, чтобы найти виновный случай.
+"""
+
+import gc
+import os
+import pickle
+import signal
+import socket
+import threading
+import time
+from functools import partial
+from itertools import islice
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from multiprocessing.reduction import recv_handle, send_handle
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pydantic import Field
+
+from src.generators.base_generator import TestCase
+from src.utils.loader import import_callable
+from src.utils.runner import (
+    CaseFailure,
+    FailureHistory,
+    RunReport,
+    SuiteRunner,
+    case_failure,
+    normalize,
+)
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+
+# Результат случая в исполнителе: (номер, время, ответ или None, ошибка)
+_Result = Tuple[int, float, Any, Optional[str]]
+
+# Итог случая в родителе: (время или None, описание падения или None)
+_Graded = Tuple[Optional[float], Optional[CaseFailure]]
+
+
+def _peak_memory() -> int:
+    """Пиковая память процесса, байты (0, если неизвестна)"""
+    if resource is None:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _load(solution: Union[str, Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    return import_callable(solution) if isinstance(solution, str) else solution
+
+
+def _call(solution: Union[str, Callable[[Any], Any]], data: Any) -> Any:
+    """Вызов решения с импортом по требованию"""
+    return _load(solution)(data)
+
+
+class _CaseTimeout(BaseException):
+    """Превышение времени случая (не перехватывается except Exception решения)"""
+
+
+def _alarm(signum: int, frame: Any) -> None:
+    raise _CaseTimeout()
+
+
+def _serve(
+    solution: Callable[[Any], Any], conn: Connection, timeout: Optional[float]
+) -> None:
+    """Цикл исполнителя: пакет (номер, вход, ожидаемое) -> результаты"""
+    baseline = _peak_memory()
+    timer = timeout is not None and hasattr(signal, "setitimer")
+    if timer:
+        signal.signal(signal.SIGALRM, _alarm)
+
+    while True:
+        try:
+            batch = conn.recv()
+        except EOFError:
+            return
+        if batch is None:
+            return
+
+        results: List[_Result] = []
+        interrupted = False
+        for index, data, expected in batch:
+            actual, error = None, None
+            started = time.perf_counter()
+            try:
+                if timer and timeout is not None:
+                    signal.setitimer(signal.ITIMER_REAL, timeout)
+                try:
+                    answer = solution(data)
+                finally:
+                    if timer:
+                        signal.setitimer(signal.ITIMER_REAL, 0)
+            except _CaseTimeout:
+                error = f"TimeoutError: превышено время {timeout} с на случай"
+                interrupted = True
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            elapsed = time.perf_counter() - started
+            if error is None and normalize(answer) != normalize(expected):
+                actual = normalize(answer)
+                error = ""
+            results.append((index, elapsed, actual, error))
+
+        growth = _peak_memory() - baseline
+        try:
+            data = pickle.dumps((results, growth, interrupted))
+        except Exception:
+            # Ответ, который нельзя передать, заменяется его repr
+            results = [
+                (index, elapsed, repr(actual) if error == "" else None, error)
+                for index, elapsed, actual, error in results
+            ]
+            data = pickle.dumps((results, growth, interrupted))
+        conn.send_bytes(data)
+
+
+def _zygote(
+    solution: Union[str, Callable[[Any], Any]],
+    preload: List[str],
+    timeout: Optional[float],
+    control: Connection,
+) -> None:
+    """Процесс-зигота: импорт решения и fork исполнителей по запросу"""
+    # Исполнители не ждутся зиготой: ядро удаляет их записи само
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    try:
+        for module in preload:
+            __import__(module)
+        function = _load(solution)
+    except Exception as e:
+        control.send(f"{type(e).__name__}: {e}")
+        return
+    # Объекты импорта не трогает сборщик мусора исполнителей: страницы
+    # памяти остаются общими с зиготой
+    gc.freeze()
+    control.send(None)
+
+    while True:
+        try:
+            request = control.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+
+        ours, theirs = socket.socketpair()
+        pid = os.fork()
+        if pid == 0:
+            control.close()
+            ours.close()
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            try:
+                _serve(function, Connection(theirs.detach()), timeout)
+            finally:
+                os._exit(0)
+
+        theirs.close()
+        control.send(pid)
+        send_handle(control, ours.fileno(), os.getppid())
+        ours.close()
+
+
+class _Worker:
+    """Исполнитель, порожденный зиготой"""
+
+    def __init__(self, pid: int, conn: Connection) -> None:
+        self.pid = pid
+        self.conn = conn
+        self.cases = 0
+
+    def kill(self) -> None:
+        try:
+            os.kill(self.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.conn.close()
+
+
+class _WorkerLost(Exception):
+    """Исполнитель не вернул результат пакета"""
+
+
+class GradingReport(RunReport):
+    """Результат прогона в пуле исполнителей"""
+
+    workers_started: int = 0
+    recycled: int = Field(default=0, description="Замен по max_cases и памяти")
+    lost: int = Field(default=0, description="Исполнителей, убитых или упавших")
+
+
+class GradingRunner(SuiteRunner):
+    """
+    Прогон решения в пуле исполнителей, порожденных прогретой зиготой
+
+    Требует os.fork (Linux, macOS).
+    """
+
+    def __init__(
+        self,
+        solution: Union[str, Callable[[Any], Any]],
+        workers: int = 1,
+        batch_size: int = 64,
+        max_cases: int = 1000,
+        max_memory: Optional[int] = None,
+        timeout: Optional[float] = None,
+        preload: Optional[List[str]] = None,
+        ordering: str = "file",
+        fail_fast: bool = False,
+        history: Optional[FailureHistory] = None,
+    ) -> None:
+        """
+        Инициализация
+
+        Args:
+            solution: Решение module:function (импортируется в зиготе) или
+                функция, наследуемая зиготой через fork
+            workers: Количество исполнителей
+            batch_size: Количество случаев в пакете
+            max_cases: Замена исполнителя после стольких случаев
+            max_memory: Замена исполнителя при росте пиковой памяти больше
+                стольких байт (None - без ограничения)
+            timeout: Предельное время одного случая, секунды
+            preload: Модули, импортируемые в зиготе до решения
+            ordering: Стратегия порядка из ORDERINGS
+            fail_fast: Остановиться на первом упавшем случае
+            history: История падений; обновляется по итогам прогона
+        """
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Пул исполнителей требует os.fork")
+        # Родитель решение не импортирует: описание уходит в зиготу как есть
+        super().__init__(partial(_call, solution), ordering, fail_fast, history)
+        self.target = solution
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.max_cases = max(1, max_cases)
+        self.max_memory = max_memory
+        self.timeout = timeout
+        self.preload = list(preload or [])
+
+    def _execute(self, cases: Iterable[Any], report: RunReport) -> GradingReport:
+        report = GradingReport(**report.model_dump())
+        started = time.perf_counter()
+        latencies: List[float] = []
+        pending: Iterator[Tuple[int, TestCase]] = iter(cases)
+        lock = threading.Lock()
+        stop = threading.Event()
+        errors: List[BaseException] = []
+
+        zygote, control = self._start_zygote()
+        control_lock = threading.Lock()
+
+        def spawn() -> _Worker:
+            with control_lock:
+                control.send("fork")
+                pid = control.recv()
+                conn = Connection(recv_handle(control))
+            with lock:
+                report.workers_started += 1
+            return _Worker(pid, conn)
+
+        def serve() -> None:
+            worker: Optional[_Worker] = None
+            try:
+                while not stop.is_set():
+                    with lock:
+                        batch = list(islice(pending, self.batch_size))
+                    if not batch:
+                        break
+                    results, worker = self._grade(batch, worker, spawn, report, lock)
+                    with lock:
+                        for (index, tc), (elapsed, failure) in zip(batch, results):
+                            if elapsed is not None:
+                                latencies.append(elapsed)
+                            # Пакеты, уже отправленные исполнителям, учитываются
+                            # и после остановки: более раннее падение не теряется
+                            if self._record(report, tc, failure):
+                                stop.set()
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                if worker is not None:
+                    worker.stop()
+
+        threads = [threading.Thread(target=serve) for _ in range(self.workers)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            control.send(None)
+            control.close()
+            zygote.join()
+
+        if errors:
+            raise errors[0]
+        report.failures.sort(key=lambda failure: failure.index)
+        return self._finish(report, started, latencies)
+
+    def _start_zygote(self) -> Tuple[Any, Connection]:
+        """Запуск зиготы и ожидание импорта решения"""
+        control, remote = get_context("fork").Pipe()
+        zygote = get_context("fork").Process(
+            target=_zygote,
+            args=(self.target, self.preload, self.timeout, remote),
+            daemon=True,
+        )
+        zygote.start()
+        remote.close()
+        error = control.recv()
+        if error is not None:
+            zygote.join()
+            raise RuntimeError(f"не удалось загрузить решение: {error}")
+        return zygote, control
+
+    def _grade(
+        self,
+        batch: List[Tuple[int, TestCase]],
+        worker: Optional[_Worker],
+        spawn: Callable[[], _Worker],
+        report: GradingReport,
+        lock: threading.Lock,
+    ) -> Tuple[List[_Graded], Optional[_Worker]]:
+        """
+        Проверка пакета; при потере исполнителя - по одному случаю
+
+        Returns:
+            Кортеж (время и описание падения для каждого случая, исполнитель
+            для следующего пакета); время случая, на котором исполнитель
+            потерян, - None
+        """
+        if worker is None:
+            worker = spawn()
+        try:
+            results, growth, interrupted = self._send(worker, batch)
+        except _WorkerLost as e:
+            worker.kill()
+            with lock:
+                report.lost += 1
+            if len(batch) == 1:
+                index, tc = batch[0]
+                return [(None, case_failure(index, tc, error=str(e)))], None
+            graded: List[_Graded] = []
+            worker = None
+            for case in batch:
+                single, worker = self._grade([case], worker, spawn, report, lock)
+                graded.extend(single)
+            return graded, worker
+
+        graded = []
+        for (index, tc), (_, elapsed, actual, error) in zip(batch, results):
+            failure = None
+            if error == "":
+                failure = case_failure(index, tc, actual=actual)
+            elif error is not None:
+                failure = case_failure(index, tc, error=error)
+            graded.append((elapsed, failure))
+
+        worker.cases += len(batch)
+        memory_exceeded = self.max_memory is not None and growth > self.max_memory
+        # Прерванное по таймауту решение могло оставить испорченное состояние
+        if worker.cases >= self.max_cases or memory_exceeded or interrupted:
+            worker.stop()
+            worker = None
+            with lock:
+                report.recycled += 1
+        return graded, worker
+
+    def _send(
+        self, worker: _Worker, batch: List[Tuple[int, TestCase]]
+    ) -> Tuple[List[_Result], int, bool]:
+        """Отправка пакета исполнителю и ожидание результатов"""
+        # Запас на случай, если таймер исполнителя не сработал вовремя
+        timeout = None if self.timeout is None else self.timeout * (len(batch) + 1)
+        try:
+            worker.conn.send([(index, tc.input, tc.expected) for index, tc in batch])
+            if not worker.conn.poll(timeout):
+                raise _WorkerLost(
+                    f"TimeoutError: превышено время {self.timeout} с на случай"
+                )
+            results: Tuple[List[_Result], int, bool] = pickle.loads(
+                worker.conn.recv_bytes()
+            )
+            return results
+        except (EOFError, OSError) as e:
+            raise _WorkerLost(
+                f"процесс решения завершился аварийно ({type(e).__name__})"
+            ) from e
@@ -0,0 +1,116 @@
+"""
+Модуль загрузки наборов тестов, записанных Exporter
+"""
+
+import importlib
+import json
+import os
+from typing import Any, Callable, Iterator, List, Optional
+
+import yaml
+
+from src.generators.base_generator import TestCase
+from src.utils import columnar
+
+
+# Форматы, которые можно прочитать обратно
+LOADABLE_FORMATS = ["json", "jsonl", "yaml"] + columnar.COLUMNAR_FORMATS
+
+_EXTENSIONS = {
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+}
+
+
+def detect_format(filename: str) -> str:
+    """
+    Определение формата набора по расширению файла
+
+    Args:
+        filename: Имя файла
+
+    Returns:
+        Формат из LOADABLE_FORMATS
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension not in _EXTENSIONS:
+        raise ValueError(f"Не удалось определить формат файла {filename}")
+    return _EXTENSIONS[extension]
+
+
+def iter_test_cases(filename: str, fmt: Optional[str] = None) -> Iterator[TestCase]:
+    """
+    Последовательное чтение тестовых случаев из файла
+
+    Формат jsonl читается построчно, parquet и arrow - по группам строк,
+    без загрузки всего файла.
+
+    Args:
+        filename: Имя файла набора
+        fmt: Формат из LOADABLE_FORMATS (по умолчанию - по расширению)
+
+    Yields:
+        Тестовые случаи в порядке записи
+    """
+    fmt = fmt or detect_format(filename)
+    if fmt not in LOADABLE_FORMATS:
+        raise ValueError(f"Формат {fmt} не поддерживает чтение")
+
+    if fmt in columnar.COLUMNAR_FORMATS:
+        yield from columnar.iter_test_cases(filename, fmt)
+        return
+
+    with open(filename, 'r', encoding='utf-8') as f:
+        if fmt == "jsonl":
+            for line in f:
+                if line.strip():
+                    yield TestCase(**json.loads(line))
+            return
+
+        data = json.load(f) if fmt == "json" else yaml.safe_load(f)
+
+    for item in data or []:
+        yield TestCase(**item)
+
+
+def load_test_cases(filename: str, fmt: Optional[str] = None) -> List[TestCase]:
+    """
+    Загрузка всех тестовых случаев из файла
+
+    Args:
+        filename: Имя файла набора
+        fmt: Формат из LOADABLE_FORMATS (по умолчанию - по расширению)
+
+    Returns:
+        Список тестовых случаев
+    """
+    return list(iter_test_cases(filename, fmt))
+
+
+def import_callable(path: str) -> Callable[..., Any]:
+    """
+    Импорт функции по строке вида ``module.submodule:function``
+
+    Args:
+        path: Путь к функции
+
+    Returns:
+        Импортированная функция
+    """
+    module_name, sep, attribute = path.partition(":")
+    if not sep or not module_name or not attribute:
+        raise ValueError(f"Ожидается путь вида module:function, получено {path}")
+
+    target: Any = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        target = getattr(target, name)
+
+    if not callable(target):
+        raise ValueError(f"{path} не является функцией")
+    function: Callable[..., Any] = target
+    return function
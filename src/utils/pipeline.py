@@ -0,0 +1,544 @@
+"""
+Модуль конвейерной генерации: генерация, сериализация и запись
+выполняются параллельно и связаны ограниченными очередями
+"""
+
+import os
+import queue
+import random
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+from src.generators.base_generator import BaseGenerator, TestCase
+from src.utils import columnar
+from src.utils.exporter import Exporter
+from src.utils.profiling import Profiler
+from src.utils.shared import SharedBlock, share_cases
+from src.utils.validator import Validator
+
+
+# Маркер завершения потока данных в очереди
+_STOP = object()
+
+# Генератор процесса-исполнителя (см. _init_process)
+_PROCESS_GENERATOR: Optional[BaseGenerator] = None
+
+
+def _init_process(generator: BaseGenerator) -> None:
+    """Инициализация процесса генерации"""
+    global _PROCESS_GENERATOR
+    _PROCESS_GENERATOR = generator
+    if generator.seed is None:
+        # Процессы, порожденные fork, иначе повторяли бы случаи друг друга
+        random.seed()
+
+
+def _generate_shared(
+    offset: int, count: Optional[int]
+) -> Tuple[Optional[str], List[TestCase]]:
+    """
+    Генерация фрагмента в процессе с передачей массивов через общую память
+
+    Args:
+        offset: Номер первого случая
+        count: Количество обычных случаев (None - крайние случаи)
+
+    Returns:
+        Результат share_cases
+    """
+    generator = _PROCESS_GENERATOR
+    assert generator is not None
+    if count is None:
+        cases = generator.shared_edge_cases()
+    else:
+        cases = generator.generate_normal_cases(count, start=offset)
+    return share_cases(cases)
+
+
+class StageStats(BaseModel):
+    """Статистика одной стадии конвейера"""
+
+    name: str
+    workers: int = 1
+    chunks: int = 0
+    cases: int = 0
+    busy_time: float = Field(default=0.0, description="Суммарное время работы, с")
+    wait_time: float = Field(default=0.0, description="Суммарное время ожидания, с")
+
+
+class PipelineStats(BaseModel):
+    """Итоговая статистика конвейера"""
+
+    stages: List[StageStats] = Field(default_factory=list)
+    normal_cases: int = 0
+    edge_cases: int = 0
+    bytes_written: int = 0
+    files: Dict[str, int] = Field(
+        default_factory=dict, description="Байт записано в каждый файл"
+    )
+    elapsed: float = 0.0
+    validation_errors: List[str] = Field(default_factory=list)
+
+    @property
+    def total_cases(self) -> int:
+        return self.normal_cases + self.edge_cases
+
+
+class _Aborted(Exception):
+    """Конвейер остановлен из-за ошибки в другой стадии"""
+
+
+class Pipeline:
+    """
+    Конвейер генерации тестовых случаев
+
+    Потоки-генераторы создают фрагменты по chunk_size случаев, потоки-сериализаторы
+    превращают их в текст, поток-писатель записывает фрагменты в файл в
+    исходном порядке. Генерация на чистом Python удерживает GIL, поэтому
+    несколько потоков генерации ускоряют ее, только если она ждет ввода-вывода
+    (кэш ответов, внешняя эталонная программа); чтобы генерация шла
+    параллельно с сериализацией на других ядрах, ее выносят в процессы
+    (generator_processes): длинные массивы случаев возвращаются из них
+    через общую память (см. src.utils.shared), а не через pickle. При
+    записи в несколько форматов каждый фрагмент генерируется один раз,
+    сериализуется во все форматы и раздается писателям, по одному потоку
+    на файл. Очереди между стадиями ограничены
+    queue_size, поэтому быстрая стадия ждет медленную и память не растет.
+    """
+
+    def __init__(
+        self,
+        generator: BaseGenerator,
+        fmt: Union[str, Sequence[str]] = "json",
+        chunk_size: int = 1000,
+        generator_workers: int = 1,
+        serializer_workers: int = 1,
+        queue_size: int = 8,
+        generator_processes: int = 0,
+        compact: bool = False,
+        validate: bool = False,
+        profiler: Optional[Profiler] = None,
+    ) -> None:
+        """
+        Инициализация конвейера
+
+        Args:
+            generator: Генератор тестовых случаев
+            fmt: Формат из Exporter.STREAMING_FORMATS,
+                Exporter.DEFERRED_HEADER_FORMATS или Exporter.COLUMNAR_FORMATS,
+                либо список таких форматов
+            chunk_size: Количество случаев во фрагменте
+            generator_workers: Количество потоков генерации (из-за GIL
+                ускоряют только генерацию, ожидающую ввода-вывода)
+            serializer_workers: Количество потоков сериализации
+            queue_size: Максимальное число фрагментов в каждой очереди
+            generator_processes: Количество процессов генерации (0 - генерация
+                в потоках текущего процесса)
+            compact: Компактная запись без отступов (для json и yaml)
+            validate: Проверять фрагменты Validator перед сериализацией
+            profiler: Профилировщик для таймеров стадий и счетчиков
+        """
+        formats = [fmt] if isinstance(fmt, str) else list(fmt)
+        if not formats:
+            raise ValueError("Не задан формат записи")
+        if len(set(formats)) != len(formats):
+            raise ValueError("Форматы записи повторяются")
+
+        streaming = (
+            Exporter.STREAMING_FORMATS
+            + Exporter.DEFERRED_HEADER_FORMATS
+            + Exporter.COLUMNAR_FORMATS
+        )
+        for name in formats:
+            if name not in streaming:
+                raise ValueError(f"Формат {name} не поддерживает конвейерную запись")
+
+        if generator_processes > 0:
+            if profiler is not None:
+                raise ValueError("Профилирование недоступно при генерации в процессах")
+            if generator.oracle_cache is not None:
+                raise ValueError(
+                    "Кэш ожидаемых результатов недоступен при генерации в процессах"
+                )
+
+        self.generator = generator
+        self.formats = formats
+        self.fmt = formats[0]
+        self.chunk_size = max(1, chunk_size)
+        self.generator_workers = max(1, generator_workers)
+        self.serializer_workers = max(1, serializer_workers)
+        self.queue_size = max(1, queue_size)
+        self.generator_processes = max(0, generator_processes)
+        self.compact = compact
+        self.validate = validate
+        self.profiler = profiler
+
+        self._abort = threading.Event()
+        self._errors: List[BaseException] = []
+        self._lock = threading.Lock()
+        # Блоки общей памяти фрагментов: номер -> [блок, писателей осталось]
+        self._blocks: Dict[int, List[Any]] = {}
+        self._released: List[SharedBlock] = []
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._on_chunk: Optional[Callable[[int, List[TestCase]], None]] = None
+
+    def run(
+        self,
+        n_normal: int,
+        filename: Union[str, Dict[str, str]],
+        include_edge_cases: bool = True,
+        on_chunk: Optional[Callable[[int, List[TestCase]], None]] = None,
+    ) -> PipelineStats:
+        """
+        Генерация и запись набора тестов
+
+        Args:
+            n_normal: Количество обычных случаев
+            filename: Имя выходного файла (для нескольких форматов - общее
+                имя, расширения подставляются Exporter.output_names) или
+                словарь формат -> имя файла
+            include_edge_cases: Добавлять ли крайние случаи в конец файла
+            on_chunk: Вызывается для каждого сгенерированного фрагмента
+                (номер первого случая, случаи) под блокировкой конвейера;
+                массивы из общей памяти действительны только во время вызова
+
+        Returns:
+            Статистика по стадиям
+        """
+        if isinstance(filename, str):
+            filenames = Exporter.output_names(filename, self.formats)
+        else:
+            filenames = {fmt: filename[fmt] for fmt in self.formats}
+
+        start_time = time.perf_counter()
+        # Состояние предыдущего запуска
+        self._abort.clear()
+        self._errors.clear()
+        self._blocks.clear()
+        self._released.clear()
+        self._pool = None
+        self._on_chunk = on_chunk
+        if self.generator_processes:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.generator_processes,
+                initializer=_init_process,
+                initargs=(self.generator,),
+            )
+
+        # Задания генерации: (номер фрагмента, первый индекс, количество);
+        # количество None означает фрагмент с крайними случаями
+        tasks: "queue.Queue[Any]" = queue.Queue()
+        seq = 0
+        for offset in range(0, n_normal, self.chunk_size):
+            tasks.put((seq, offset, min(self.chunk_size, n_normal - offset)))
+            seq += 1
+        if include_edge_cases:
+            tasks.put((seq, n_normal, None))
+            seq += 1
+        total_chunks = seq
+
+        generated: "queue.Queue[Any]" = queue.Queue(self.queue_size)
+        serialized: Dict[str, "queue.Queue[Any]"] = {
+            fmt: queue.Queue(self.queue_size) for fmt in self.formats
+        }
+
+        stats = PipelineStats()
+        # Потоки генерации при процессах лишь ждут результатов, поэтому
+        # их не меньше, чем процессов
+        generator_threads = max(self.generator_workers, self.generator_processes)
+        gen_stats = StageStats(name="generation", workers=generator_threads)
+        ser_stats = StageStats(name="serialization", workers=self.serializer_workers)
+        write_stats = {
+            fmt: StageStats(name="write" if len(self.formats) == 1 else f"write.{fmt}")
+            for fmt in self.formats
+        }
+        stats.stages = [gen_stats, ser_stats, *write_stats.values()]
+        if self.validate:
+            val_stats = StageStats(name="validation", workers=self.serializer_workers)
+            stats.stages.insert(1, val_stats)
+
+        generators = [
+            self._spawn(self._generate_worker, tasks, generated, gen_stats, stats)
+            for _ in range(generator_threads)
+        ]
+        serializers = [
+            self._spawn(self._serialize_worker, generated, serialized, ser_stats, stats)
+            for _ in range(self.serializer_workers)
+        ]
+        writers = [
+            self._spawn(
+                self._write_worker,
+                fmt,
+                serialized[fmt],
+                filenames[fmt],
+                total_chunks,
+                write_stats[fmt],
+                stats,
+            )
+            for fmt in self.formats
+        ]
+
+        for thread in generators:
+            thread.join()
+        self._put_stops(generated, self.serializer_workers)
+        for thread in serializers:
+            thread.join()
+        for q in serialized.values():
+            self._put_stops(q, 1)
+        for thread in writers:
+            thread.join()
+
+        if self._pool is not None:
+            self._pool.shutdown()
+        for block, _ in self._blocks.values():
+            block.release()
+        for block in self._released:
+            block.release()
+
+        if self._errors:
+            raise self._errors[0]
+
+        stats.elapsed = time.perf_counter() - start_time
+
+        if self.profiler is not None:
+            self.profiler.count("cases.normal", stats.normal_cases)
+            self.profiler.count("cases.edge", stats.edge_cases)
+            self.profiler.count("bytes.written", stats.bytes_written)
+            self.profiler.collect(self.generator)
+
+        return stats
+
+    def _spawn(self, target: Callable[..., None], *args: Any) -> threading.Thread:
+        """Запуск потока стадии с перехватом ошибок"""
+
+        def runner() -> None:
+            try:
+                target(*args)
+            except _Aborted:
+                pass
+            except BaseException as e:  # noqa: B902 - ошибка передается в run()
+                with self._lock:
+                    self._errors.append(e)
+                self._abort.set()
+
+        thread = threading.Thread(target=runner, daemon=True)
+        thread.start()
+        return thread
+
+    def _put(self, q: "queue.Queue[Any]", item: Any, stage: StageStats) -> None:
+        """Помещение в очередь с учетом времени ожидания и остановки конвейера"""
+        waited = time.perf_counter()
+        while True:
+            if self._abort.is_set():
+                raise _Aborted()
+            try:
+                q.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        with self._lock:
+            stage.wait_time += time.perf_counter() - waited
+
+    def _get(self, q: "queue.Queue[Any]", stage: StageStats) -> Any:
+        """Извлечение из очереди с учетом времени ожидания и остановки конвейера"""
+        waited = time.perf_counter()
+        while True:
+            if self._abort.is_set():
+                raise _Aborted()
+            try:
+                item = q.get(timeout=0.1)
+                break
+            except queue.Empty:
+                continue
+        with self._lock:
+            stage.wait_time += time.perf_counter() - waited
+        return item
+
+    def _put_stops(self, q: "queue.Queue[Any]", count: int) -> None:
+        """Отправка маркеров завершения следующей стадии"""
+        for _ in range(count):
+            while not self._abort.is_set():
+                try:
+                    q.put(_STOP, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    def _record(self, stage: StageStats, started: float, cases: int) -> None:
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            stage.busy_time += elapsed
+            stage.chunks += 1
+            stage.cases += cases
+        if self.profiler is not None:
+            self.profiler.add_time(f"stage.{stage.name}", elapsed)
+
+    def _release(self, seq: int) -> None:
+        """Освобождение блока общей памяти фрагмента после последнего писателя"""
+        with self._lock:
+            entry = self._blocks.get(seq)
+            if entry is not None:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._blocks[seq]
+                    self._released.append(entry[0])
+
+            # Блок, массивы которого еще держит пакет pyarrow сериализатора,
+            # освобождается при следующей попытке
+            pending = []
+            for block in self._released:
+                try:
+                    block.release()
+                except BufferError:
+                    pending.append(block)
+            self._released = pending
+
+    def _generate_worker(
+        self,
+        tasks: "queue.Queue[Any]",
+        out: "queue.Queue[Any]",
+        stage: StageStats,
+        stats: PipelineStats,
+    ) -> None:
+        while not self._abort.is_set():
+            try:
+                seq, offset, count = tasks.get_nowait()
+            except queue.Empty:
+                return
+
+            started = time.perf_counter()
+            if self._pool is not None:
+                future = self._pool.submit(_generate_shared, offset, count)
+                name, cases = future.result()
+                block, cases = SharedBlock.attach(name, cases)
+                if block is not None:
+                    with self._lock:
+                        self._blocks[seq] = [block, len(self.formats)]
+            elif count is None:
+                cases = self.generator.shared_edge_cases()
+            else:
+                cases = self.generator.generate_normal_cases(count, start=offset)
+            with self._lock:
+                if count is None:
+                    stats.edge_cases += len(cases)
+                else:
+                    stats.normal_cases += len(cases)
+                if self._on_chunk is not None:
+                    self._on_chunk(offset, cases)
+            self._record(stage, started, len(cases))
+
+            self._put(out, (seq, offset, cases), stage)
+
+    def _serialize_worker(
+        self,
+        inp: "queue.Queue[Any]",
+        out: Dict[str, "queue.Queue[Any]"],
+        stage: StageStats,
+        stats: PipelineStats,
+    ) -> None:
+        while True:
+            item = self._get(inp, stage)
+            if item is _STOP:
+                return
+            seq, offset, cases = item
+
+            if self.validate and cases:
+                started = time.perf_counter()
+                _, errors = Validator.validate_test_cases(cases, start=offset)
+                self._record(stats.stages[1], started, len(cases))
+                if errors:
+                    with self._lock:
+                        stats.validation_errors.extend(errors)
+
+            started = time.perf_counter()
+            text_formats = [
+                fmt for fmt in self.formats if fmt not in Exporter.COLUMNAR_FORMATS
+            ]
+            payloads: Dict[str, Any] = Exporter.dumps_chunks(
+                cases, text_formats, offset, self.compact
+            )
+            for fmt in self.formats:
+                if fmt in Exporter.COLUMNAR_FORMATS:
+                    payloads[fmt] = columnar.to_record_batch(cases)
+            edge_count = sum(1 for tc in cases if tc.is_edge_case)
+            self._record(stage, started, len(cases))
+
+            for fmt in self.formats:
+                self._put(out[fmt], (seq, len(cases), edge_count, payloads[fmt]), stage)
+
+    def _write_worker(
+        self,
+        fmt: str,
+        inp: "queue.Queue[Any]",
+        filename: str,
+        total_chunks: int,
+        stage: StageStats,
+        stats: PipelineStats,
+    ) -> None:
+        # Фрагменты приходят в произвольном порядке, поэтому
+        # опередившие очередь фрагменты ждут в pending
+        pending: Dict[int, Tuple[int, int, Any]] = {}
+        next_seq = 0
+        written_cases = 0
+        written_edge = 0
+        written_bytes = 0
+        deferred = fmt in Exporter.DEFERRED_HEADER_FORMATS
+
+        if fmt in Exporter.COLUMNAR_FORMATS:
+            sink: Any = columnar.ColumnarWriter(filename, fmt)
+            write = sink.write_batch
+        else:
+            # Фрагменты формата с отложенным заголовком копятся во временном
+            # файле и переписываются в итоговый после заголовка
+            sink = tempfile.TemporaryFile() if deferred else open(filename, 'wb')
+
+            def write(text: str) -> int:
+                written: int = sink.write(text.encode('utf-8'))
+                return written
+
+            if not deferred:
+                written_bytes += write(Exporter.header(fmt))
+
+        try:
+            while next_seq < total_chunks:
+                item = self._get(inp, stage)
+                if item is _STOP:
+                    break
+                seq, count, edge_count, payload = item
+                pending[seq] = (count, edge_count, payload)
+
+                while next_seq in pending:
+                    count, edge_count, payload = pending.pop(next_seq)
+                    started = time.perf_counter()
+                    written = write(payload)
+                    self._record(stage, started, count)
+                    del payload
+                    self._release(next_seq)
+                    written_bytes += written or 0
+                    written_cases += count
+                    written_edge += edge_count
+                    next_seq += 1
+
+            if deferred:
+                header = Exporter.markdown_header(written_cases, written_edge)
+                sink.seek(0)
+                with open(filename, 'wb') as f:
+                    written_bytes += f.write(header.encode('utf-8'))
+                    shutil.copyfileobj(sink, f)
+            elif fmt not in Exporter.COLUMNAR_FORMATS:
+                footer = Exporter.footer(fmt, written_cases, self.compact)
+                written_bytes += write(footer)
+        finally:
+            sink.close()
+
+        if fmt in Exporter.COLUMNAR_FORMATS:
+            written_bytes = os.path.getsize(filename)
+        with self._lock:
+            stats.files[filename] = written_bytes
+            stats.bytes_written += written_bytes
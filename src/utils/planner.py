@@ -0,0 +1,230 @@
+"""
+Модуль планирования набора тестов в пределах бюджета времени проверки
+"""
+
+import time
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field
+
+from src.generators.base_generator import TestCase
+from src.generators.buffers import is_buffer
+
+
+def input_size(value: Any) -> int:
+    """
+    Размер входных данных: количество скалярных значений (не меньше 1)
+
+    Args:
+        value: Входные данные тестового случая
+
+    Returns:
+        Размер
+    """
+    if isinstance(value, dict):
+        return max(1, sum(input_size(item) for item in value.values()))
+    if is_buffer(value):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        if value and not isinstance(value[0], (list, tuple, dict)):
+            return len(value)
+        return max(1, sum(input_size(item) for item in value))
+    return 1
+
+
+class CostModel(BaseModel):
+    """
+    Оценка времени проверки случая: overhead + per_unit * size ** exponent
+    """
+
+    overhead: float = Field(default=1e-3, ge=0, description="Секунд на случай")
+    per_unit: float = Field(default=1e-7, ge=0, description="Секунд на единицу")
+    exponent: float = Field(default=1.0, gt=0, description="Степень размера")
+
+    def estimate(self, test_case: TestCase) -> float:
+        """Оценка времени проверки случая в секундах"""
+        size = input_size(test_case.input)
+        seconds: float = self.overhead + self.per_unit * size ** self.exponent
+        return seconds
+
+    @classmethod
+    def fit(
+        cls, samples: Sequence[Tuple[int, float]], exponent: float = 1.0
+    ) -> "CostModel":
+        """
+        Подбор коэффициентов методом наименьших квадратов
+
+        Args:
+            samples: Пары (размер входных данных, время в секундах)
+            exponent: Степень размера в модели
+
+        Returns:
+            Модель с неотрицательными коэффициентами
+        """
+        if not samples:
+            raise ValueError("Нет измерений для подбора модели")
+
+        xs = [size ** exponent for size, _ in samples]
+        ys = [elapsed for _, elapsed in samples]
+        n = len(xs)
+        mean_x = sum(xs) / n
+        mean_y = sum(ys) / n
+        variance = sum((x - mean_x) ** 2 for x in xs)
+
+        if variance == 0:
+            return cls(overhead=mean_y, per_unit=0.0, exponent=exponent)
+
+        covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+        per_unit = max(0.0, covariance / variance)
+        overhead = max(0.0, mean_y - per_unit * mean_x)
+        return cls(overhead=overhead, per_unit=per_unit, exponent=exponent)
+
+    @classmethod
+    def calibrate(
+        cls,
+        test_cases: List[TestCase],
+        solution: Callable[[Any], Any],
+        sample: int = 20,
+        repeats: int = 3,
+        exponent: float = 1.0,
+    ) -> "CostModel":
+        """
+        Подбор модели по времени работы эталонного решения
+
+        Решение запускается на случаях, равномерно выбранных по размеру
+        входных данных; для каждого берется минимальное из repeats измерений.
+
+        Args:
+            test_cases: Набор тестов
+            solution: Эталонное решение, принимающее input случая
+            sample: Количество измеряемых случаев
+            repeats: Количество повторов каждого измерения
+            exponent: Степень размера в модели
+
+        Returns:
+            Подобранная модель
+        """
+        if not test_cases:
+            raise ValueError("Нет тестовых случаев для калибровки")
+
+        by_size = sorted(test_cases, key=lambda tc: input_size(tc.input))
+        step = max(1, len(by_size) // max(1, sample))
+        samples = []
+
+        for tc in by_size[::step]:
+            best = float("inf")
+            for _ in range(max(1, repeats)):
+                started = time.perf_counter()
+                solution(tc.input)
+                best = min(best, time.perf_counter() - started)
+            samples.append((input_size(tc.input), best))
+
+        return cls.fit(samples, exponent=exponent)
+
+
+class SuitePlan(BaseModel):
+    """Результат планирования: отобранные случаи в порядке проверки"""
+
+    cases: List[TestCase] = Field(default_factory=list)
+    indices: List[int] = Field(default_factory=list, description="Номера в наборе")
+    costs: List[float] = Field(default_factory=list)
+    budget: float = 0.0
+    total_cost: float = 0.0
+    total_weight: float = 0.0
+    available_weight: float = 0.0
+    skipped: int = 0
+
+    @property
+    def coverage(self) -> float:
+        """Доля суммарного веса набора, попавшая в план"""
+        if self.available_weight <= 0:
+            return 0.0
+        return self.total_weight / self.available_weight
+
+
+class SuitePlanner:
+    """
+    Отбор и упорядочивание случаев по весу в пределах бюджета времени
+
+    Отбор - жадное решение задачи о рюкзаке по отношению ценности к
+    стоимости (с проверкой единственного самого ценного случая). Ценность
+    крайнего случая умножается на edge_bonus, так как такие случаи чаще
+    отсеивают неверные решения. В плане сначала идут крайние случаи, затем
+    обычные, внутри групп - по убыванию ценности на секунду, чтобы
+    неверное решение падало как можно раньше.
+    """
+
+    def __init__(
+        self,
+        budget: float,
+        cost_model: Optional[CostModel] = None,
+        edge_bonus: float = 2.0,
+    ) -> None:
+        """
+        Инициализация планировщика
+
+        Args:
+            budget: Бюджет времени на проверку одного решения, секунды
+            cost_model: Модель стоимости случая
+            edge_bonus: Множитель ценности крайних случаев
+        """
+        if budget <= 0:
+            raise ValueError("Бюджет времени должен быть положительным")
+
+        self.budget = budget
+        self.cost_model = cost_model or CostModel()
+        self.edge_bonus = edge_bonus
+
+    def value(self, test_case: TestCase) -> float:
+        """Ценность случая для плана"""
+        bonus = self.edge_bonus if test_case.is_edge_case else 1.0
+        return test_case.weight * bonus
+
+    def plan(self, test_cases: List[TestCase]) -> SuitePlan:
+        """
+        Составление плана проверки
+
+        Args:
+            test_cases: Набор тестов
+
+        Returns:
+            План с отобранными случаями
+        """
+        costs = [self.cost_model.estimate(tc) for tc in test_cases]
+        values = [self.value(tc) for tc in test_cases]
+
+        def density(i: int) -> float:
+            return values[i] / costs[i] if costs[i] > 0 else float("inf")
+
+        candidates = sorted(
+            range(len(test_cases)), key=lambda i: (-density(i), costs[i])
+        )
+
+        selected: List[int] = []
+        spent = 0.0
+        for i in candidates:
+            if spent + costs[i] <= self.budget:
+                selected.append(i)
+                spent += costs[i]
+
+        # Жадный отбор может проиграть одному дорогому, но ценному случаю
+        affordable = [i for i in candidates if costs[i] <= self.budget]
+        if affordable:
+            best = max(affordable, key=lambda i: values[i])
+            if values[best] > sum(values[i] for i in selected):
+                selected = [best]
+
+        selected.sort(
+            key=lambda i: (not test_cases[i].is_edge_case, -density(i), costs[i])
+        )
+
+        return SuitePlan(
+            cases=[test_cases[i] for i in selected],
+            indices=selected,
+            costs=[costs[i] for i in selected],
+            budget=self.budget,
+            total_cost=sum(costs[i] for i in selected),
+            total_weight=sum(test_cases[i].weight for i in selected),
+            available_weight=sum(tc.weight for tc in test_cases),
+            skipped=len(test_cases) - len(selected),
+        )
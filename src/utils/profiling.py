@@ -0,0 +1,247 @@
+"""
+Модуль профилирования: таймеры стадий, счетчики и снимки cProfile/tracemalloc
+"""
+
+import cProfile
+import functools
+import json
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from pydantic import BaseModel
+
+from src.generators.base_generator import BaseGenerator
+
+
+class TimerStats(BaseModel):
+    """Накопленная статистика одного таймера"""
+
+    calls: int = 0
+    total: float = 0.0
+    min: float = 0.0
+    max: float = 0.0
+
+    def add(self, elapsed: float) -> None:
+        if self.calls == 0 or elapsed < self.min:
+            self.min = elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        self.calls += 1
+        self.total += elapsed
+
+
+class Profiler:
+    """
+    Сборщик метрик производительности
+
+    Таймеры и счетчики потокобезопасны, поэтому один профилировщик
+    можно передать во все стадии конвейера.
+    """
+
+    def __init__(self, cprofile: bool = False, trace_memory: bool = False) -> None:
+        """
+        Инициализация профилировщика
+
+        Args:
+            cprofile: Собирать профиль cProfile (во всех потоках)
+            trace_memory: Отслеживать выделения памяти через tracemalloc
+        """
+        self.cprofile = cprofile
+        self.trace_memory = trace_memory
+        self.timers: Dict[str, TimerStats] = {}
+        self.counters: Dict[str, int] = {}
+        self.top_allocations: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._profiles: List[cProfile.Profile] = []
+        self._started: Optional[float] = None
+
+    def add_time(self, name: str, elapsed: float) -> None:
+        """Добавление измерения к таймеру name"""
+        with self._lock:
+            timer = self.timers.get(name)
+            if timer is None:
+                timer = self.timers[name] = TimerStats()
+            timer.add(elapsed)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Контекстный менеджер, измеряющий время выполнения блока"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Увеличение счетчика name"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def instrument(self, generator: BaseGenerator, prefix: str = "generator") -> None:
+        """
+        Оборачивание методов генерации таймерами
+
+        Таймер создается для каждого метода generate_* и _generate_*
+        экземпляра (например, generator._generate_fibonacci), кроме
+        _generate_case: время обычных случаев учитывает таймер
+        generate_normal_cases.
+
+        Args:
+            generator: Экземпляр генератора
+            prefix: Префикс имен таймеров
+        """
+        wrapped: Dict[str, Callable[..., Any]] = {}
+
+        for name in dir(generator):
+            if not (name.startswith("generate_") or name.startswith("_generate_")):
+                continue
+            if name == "_generate_case":
+                continue
+            method = getattr(generator, name)
+            if callable(method):
+                wrapped[name] = self._wrap(method, f"{prefix}.{name}")
+                setattr(generator, name, wrapped[name])
+
+        # MathGenerator хранит связанные методы в списке task_types
+        task_types = getattr(generator, "task_types", None)
+        if isinstance(task_types, list):
+            setattr(generator, "task_types", [
+                wrapped.get(getattr(task, "__name__", ""), task) for task in task_types
+            ])
+
+    def _wrap(self, method: Callable[..., Any], name: str) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.add_time(name, time.perf_counter() - started)
+
+        return timed
+
+    def collect(self, generator: BaseGenerator, prefix: str = "generator") -> None:
+        """Перенос счетчиков генератора (например, повторов выборки)"""
+        for name, value in generator.counters.items():
+            self.count(f"{prefix}.{name}", value)
+
+    def start(self) -> None:
+        """Запуск сбора профиля и трассировки памяти"""
+        self._started = time.perf_counter()
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        if self.cprofile:
+            main = cProfile.Profile()
+            self._profiles.append(main)
+            # Потоки, запущенные после start(), получают собственный профиль
+            threading.setprofile(self._profile_thread)
+            main.enable()
+
+    def _profile_thread(self, frame: Any, event: str, arg: Any) -> None:
+        sys.setprofile(None)
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()
+
+    def stop(self) -> None:
+        """Остановка сбора и фиксация итоговых метрик"""
+        if self._started is not None:
+            self.add_time("total", time.perf_counter() - self._started)
+            self._started = None
+
+        if self.cprofile:
+            threading.setprofile(None)  # type: ignore[arg-type]
+            for profile in self._profiles:
+                profile.disable()
+
+        if self.trace_memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+            self.counters["memory.current_bytes"] = current
+            self.counters["memory.peak_bytes"] = peak
+            self.top_allocations = [
+                {
+                    "location": str(stat.traceback),
+                    "size": stat.size,
+                    "count": stat.count,
+                }
+                for stat in snapshot.statistics("lineno")[:20]
+            ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Метрики в виде словаря"""
+        return {
+            "timers": {
+                name: timer.model_dump() for name, timer in sorted(self.timers.items())
+            },
+            "counters": dict(sorted(self.counters.items())),
+            "top_allocations": self.top_allocations,
+        }
+
+    def to_json(self) -> str:
+        """Метрики в формате JSON"""
+        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+
+    def to_prometheus(self, namespace: str = "testgen") -> str:
+        """Метрики в текстовом формате Prometheus"""
+        lines = [
+            f"# HELP {namespace}_timer_seconds_total Суммарное время по таймеру",
+            f"# TYPE {namespace}_timer_seconds_total counter",
+        ]
+        for name, t in sorted(self.timers.items()):
+            lines.append(
+                f'{namespace}_timer_seconds_total{{name="{name}"}} {t.total:.9f}'
+            )
+
+        lines += [
+            f"# HELP {namespace}_timer_calls_total Количество измерений по таймеру",
+            f"# TYPE {namespace}_timer_calls_total counter",
+        ]
+        for name, t in sorted(self.timers.items()):
+            lines.append(f'{namespace}_timer_calls_total{{name="{name}"}} {t.calls}')
+
+        lines += [
+            f"# HELP {namespace}_counter_total Значения счетчиков",
+            f"# TYPE {namespace}_counter_total counter",
+        ]
+        for name, value in sorted(self.counters.items()):
+            lines.append(f'{namespace}_counter_total{{name="{name}"}} {value}')
+
+        return "\n".join(lines) + "\n"
+
+    def dump(self, filename: str, fmt: Optional[str] = None) -> None:
+        """
+        Сохранение метрик в файл
+
+        Профиль cProfile (если собирался) сохраняется рядом в файл
+        с расширением .pstats.
+
+        Args:
+            filename: Имя файла
+            fmt: json или prometheus; по умолчанию определяется по расширению
+                (.prom и .txt - Prometheus, иначе JSON)
+        """
+        if fmt is None:
+            fmt = "prometheus" if filename.endswith((".prom", ".txt")) else "json"
+        if fmt not in ("json", "prometheus"):
+            raise ValueError(f"Неизвестный формат профиля: {fmt}")
+
+        content = self.to_prometheus() if fmt == "prometheus" else self.to_json()
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+        if self._profiles:
+            stats = pstats.Stats(self._profiles[0])
+            for profile in self._profiles[1:]:
+                stats.add(profile)
+            stats.dump_stats(f"{filename}.pstats")
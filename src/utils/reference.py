@@ -0,0 +1,432 @@
+"""
+Эталонные решения во внешних программах
+
+ReferencePool держит несколько долгоживущих процессов эталонной программы
+(например, скомпилированного решения задачи) и передает им входы пакетами
+через stdin/stdout, поэтому стоимость запуска процесса делится на все
+входы набора.
+
+Протокол пакета повторяет формат задач с несколькими тестами: первая
+строка - количество входов T, затем T входов в кодировке encoding;
+программа печатает ровно T строк ответов и строку BATCH_END, сбрасывает
+вывод и ждет следующий пакет до конца ввода. По строке BATCH_END ответы
+делятся на пакеты: лишняя или недостающая строка (например, отладочный
+вывод) - ошибка пакета, а не сдвиг всех следующих ответов. В каждый
+процесс заранее отправляется до depth пакетов, так что он не простаивает,
+пока разбираются ответы предыдущего. Программу, которая обрабатывает один
+ввод и завершается, можно использовать с persistent=False: каждый пакет
+запускает новый процесс, а BATCH_END в конце вывода необязателен.
+"""
+
+import json
+import os
+import queue
+import shlex
+import subprocess
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+from src.generators.buffers import is_buffer, json_default
+
+
+# Кодировки входов
+ENCODINGS = ["json", "tokens"]
+
+# Разбор строки ответа
+ANSWER_FORMATS: Dict[str, Callable[[str], Any]] = {
+    "json": json.loads,
+    "int": int,
+    "ints": lambda line: list(map(int, line.split())),
+}
+
+# Формат ответа эталонных задач генераторов в кодировке tokens
+TOKEN_ANSWERS = {"sorting": "ints", "searching_many": "ints"}
+
+# Строка, которой программа завершает ответы каждого пакета
+BATCH_END = "#end"
+
+# Сколько последних байт stderr программы показывать в сообщении об ошибке
+STDERR_TAIL = 2000
+
+# Маркер конца вывода процесса
+_EOF = None
+
+_BATCH_END = BATCH_END.encode('ascii')
+
+
+def encode_tokens(value: Any) -> str:
+    """
+    Вход в формате олимпиадных задач
+
+    Число - одно число; массив - строка с длиной и строка с элементами;
+    кортеж - числа через пробел; словарь - его значения по строкам.
+
+    Args:
+        value: Входные данные случая
+
+    Returns:
+        Текст без завершающего перевода строки
+    """
+    if isinstance(value, dict):
+        return "\n".join(encode_tokens(item) for item in value.values())
+    if isinstance(value, tuple):
+        return " ".join(map(str, value))
+    if isinstance(value, list) or is_buffer(value):
+        items = value.tolist() if is_buffer(value) else value
+        return f"{len(items)}\n{' '.join(map(str, items))}"
+    return str(value)
+
+
+def encode_json(value: Any) -> str:
+    """Вход одной строкой JSON"""
+    return json.dumps(value, separators=(",", ":"), default=json_default)
+
+
+_ENCODERS: Dict[str, Callable[[Any], str]] = {
+    "json": encode_json,
+    "tokens": encode_tokens,
+}
+
+
+class _Process:
+    """Долгоживущий процесс эталонной программы"""
+
+    def __init__(self, command: List[str]) -> None:
+        self.stderr = tempfile.TemporaryFile()
+        self.popen = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self.stderr,
+        )
+        assert self.popen.stdin is not None and self.popen.stdout is not None
+        self._stdin = self.popen.stdin
+        self._stdout = self.popen.stdout
+        # Запись и чтение идут в отдельных потоках: иначе большой пакет
+        # и большой вывод программы заблокировали бы друг друга
+        self._inbox: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._lines: "queue.Queue[Optional[List[bytes]]]" = queue.Queue()
+        self._received: Deque[bytes] = deque()
+        self.pending: Deque[Tuple[int, int]] = deque()
+        threading.Thread(target=self._write, daemon=True).start()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _write(self) -> None:
+        stdin = self._stdin
+        while True:
+            payload = self._inbox.get()
+            try:
+                if payload is None:
+                    stdin.close()
+                    return
+                stdin.write(payload)
+                stdin.flush()
+            except (BrokenPipeError, OSError, ValueError):
+                # Процесс завершился; об этом сообщит чтение
+                return
+
+    def _read(self) -> None:
+        fd = self._stdout.fileno()
+        rest = b""
+        while True:
+            data = os.read(fd, 1 << 16)
+            if not data:
+                if rest:
+                    self._lines.put([rest])
+                self._lines.put(_EOF)
+                return
+            lines = (rest + data).split(b"\n")
+            rest = lines.pop()
+            if lines:
+                self._lines.put(lines)
+
+    def send(self, seq: int, count: int, payload: bytes) -> None:
+        """Отправка пакета seq из count входов"""
+        self.pending.append((seq, count))
+        self._inbox.put(payload)
+
+    def receive(self, count: int, timeout: Optional[float]) -> List[bytes]:
+        """
+        Чтение строк ответов пакета из count входов до строки BATCH_END
+
+        Raises:
+            TimeoutError: Ответы не получены за timeout секунд
+            RuntimeError: Процесс завершился раньше или вывел в пакете
+                не count ответов
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        answers: List[bytes] = []
+        while True:
+            while self._received:
+                line = self._received.popleft()
+                if line.strip() != _BATCH_END:
+                    answers.append(line)
+                    continue
+                if len(answers) != count:
+                    raise RuntimeError(
+                        f"эталонная программа вывела {len(answers)} ответов "
+                        f"вместо {count} до строки {BATCH_END}"
+                    )
+                return answers
+
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"эталонная программа не ответила за {timeout} с "
+                        f"(получено {len(answers)} из {count} ответов)"
+                    )
+            try:
+                lines = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if lines is _EOF:
+                self._lines.put(_EOF)
+                raise RuntimeError(
+                    f"эталонная программа завершилась с кодом {self.popen.wait()}, "
+                    f"получено {len(answers)} из {count} ответов"
+                    f"{self.stderr_tail()}"
+                )
+            self._received.extend(lines)
+
+    def stderr_tail(self) -> str:
+        """Конец stderr программы для сообщения об ошибке"""
+        self.stderr.seek(0, os.SEEK_END)
+        size = self.stderr.tell()
+        self.stderr.seek(max(0, size - STDERR_TAIL))
+        text = self.stderr.read().decode('utf-8', errors='replace').strip()
+        return f": {text}" if text else ""
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Закрытие stdin и ожидание завершения (или принудительная остановка)"""
+        self._inbox.put(None)
+        try:
+            self.popen.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.kill()
+        self.stderr.close()
+
+    def kill(self) -> None:
+        self.popen.kill()
+        self.popen.wait()
+        self.stderr.close()
+
+
+class ReferencePool:
+    """Пул процессов внешней эталонной программы"""
+
+    def __init__(
+        self,
+        command: Union[str, Sequence[str]],
+        processes: Optional[int] = None,
+        batch_size: int = 1000,
+        timeout: Optional[float] = 10.0,
+        encoding: str = "json",
+        answer: str = "json",
+        persistent: bool = True,
+        depth: int = 2,
+    ) -> None:
+        """
+        Инициализация пула (процессы запускаются при первом обращении)
+
+        Args:
+            command: Команда запуска программы (строка разбирается shlex)
+            processes: Количество процессов (по умолчанию - число ядер)
+            batch_size: Количество входов в пакете
+            timeout: Предельное время ответа на один пакет, с
+            encoding: Кодировка входов из ENCODINGS
+            answer: Формат строки ответа из ANSWER_FORMATS
+            persistent: Отправлять пакеты одним долгоживущим процессам;
+                False - новый процесс на каждый пакет
+            depth: Сколько пакетов держать отправленными в каждый процесс
+        """
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Неизвестная кодировка входов: {encoding}")
+        if answer not in ANSWER_FORMATS:
+            raise ValueError(f"Неизвестный формат ответа: {answer}")
+
+        if isinstance(command, str):
+            command = shlex.split(command)
+        self.command = list(command)
+        if not self.command:
+            raise ValueError("Не задана команда эталонной программы")
+        self.processes = max(1, processes or os.cpu_count() or 1)
+        self.batch_size = max(1, batch_size)
+        self.timeout = timeout
+        self.encoding = encoding
+        self.answer = answer
+        self.persistent = persistent
+        self.depth = max(1, depth)
+        self._init_state()
+
+    def _init_state(self) -> None:
+        self._encode = _ENCODERS[self.encoding]
+        self._decode = ANSWER_FORMATS[self.answer]
+        self._lock = threading.Lock()
+        self._idle: "queue.Queue[_Process]" = queue.Queue()
+        self._all: List[_Process] = []
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Процессы не передаются: копия в другом процессе запускает свои
+        state = self.__dict__.copy()
+        for name in ("_encode", "_decode", "_lock", "_idle", "_all"):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_state()
+
+    def solve(self, data: Any) -> Any:
+        """Ответ для одного входа"""
+        return self.solve_many([data])[0]
+
+    def solve_many(self, inputs: List[Any]) -> List[Any]:
+        """
+        Ответы для списка входов
+
+        Args:
+            inputs: Входные данные
+
+        Returns:
+            Ответы в порядке inputs
+
+        Raises:
+            TimeoutError: Пакет не обработан за timeout секунд
+            RuntimeError: Программа завершилась с ошибкой или вывела
+                не то количество ответов
+        """
+        batches = [
+            inputs[i:i + self.batch_size]
+            for i in range(0, len(inputs), self.batch_size)
+        ]
+        if not batches:
+            return []
+
+        if self.persistent:
+            answers = self._solve_persistent(batches)
+        else:
+            workers = min(self.processes, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                answers = list(pool.map(self._solve_oneshot, batches))
+
+        return [value for batch in answers for value in batch]
+
+    def _payload(self, batch: List[Any]) -> bytes:
+        """Текст пакета: количество входов и входы по строкам"""
+        lines = [str(len(batch))]
+        lines.extend(self._encode(data) for data in batch)
+        lines.append("")
+        return "\n".join(lines).encode('utf-8')
+
+    def _parse(self, lines: List[bytes]) -> List[Any]:
+        try:
+            return [self._decode(line.decode('utf-8').strip()) for line in lines]
+        except ValueError as e:
+            raise RuntimeError(f"некорректный ответ эталонной программы: {e}")
+
+    def _solve_oneshot(self, batch: List[Any]) -> List[Any]:
+        """Пакет в новом процессе"""
+        try:
+            result = subprocess.run(
+                self.command,
+                input=self._payload(batch),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=self.timeout,
+            )
+        except subprocess.TimeoutExpired:
+            raise TimeoutError(f"эталонная программа не ответила за {self.timeout} с")
+
+        stderr = result.stderr[-STDERR_TAIL:].decode('utf-8', errors='replace').strip()
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"эталонная программа завершилась с кодом {result.returncode}"
+                + (f": {stderr}" if stderr else "")
+            )
+        lines = result.stdout.splitlines()
+        if lines and lines[-1].strip() == _BATCH_END:
+            lines.pop()
+        if len(lines) != len(batch):
+            raise RuntimeError(
+                f"эталонная программа вывела {len(lines)} ответов "
+                f"вместо {len(batch)}"
+            )
+        return self._parse(lines)
+
+    def _acquire(self, wanted: int) -> List[_Process]:
+        """Свободные процессы: хотя бы один и не больше wanted"""
+        taken: List[_Process] = []
+        while len(taken) < wanted:
+            try:
+                taken.append(self._idle.get_nowait())
+                continue
+            except queue.Empty:
+                pass
+            with self._lock:
+                if len(self._all) < self.processes:
+                    process = _Process(self.command)
+                    self._all.append(process)
+                    taken.append(process)
+                    continue
+            if taken:
+                break
+            taken.append(self._idle.get())
+        return taken
+
+    def _solve_persistent(self, batches: List[List[Any]]) -> List[List[Any]]:
+        """Пакеты в долгоживущих процессах с опережающей отправкой"""
+        processes = self._acquire(min(self.processes, len(batches)))
+        answers: List[List[Any]] = [[] for _ in batches]
+        next_batch = 0
+
+        def feed(process: _Process) -> None:
+            nonlocal next_batch
+            batch = batches[next_batch]
+            process.send(next_batch, len(batch), self._payload(batch))
+            next_batch += 1
+
+        try:
+            for process in processes:
+                while next_batch < len(batches) and len(process.pending) < self.depth:
+                    feed(process)
+
+            while any(process.pending for process in processes):
+                for process in processes:
+                    if not process.pending:
+                        continue
+                    seq, count = process.pending.popleft()
+                    answers[seq] = self._parse(process.receive(count, self.timeout))
+                    if next_batch < len(batches):
+                        feed(process)
+        except BaseException:
+            # Непрочитанные ответы остались в процессах: они больше не
+            # согласованы с очередью пакетов и заменяются новыми
+            with self._lock:
+                for process in processes:
+                    process.kill()
+                    self._all.remove(process)
+            raise
+
+        for process in processes:
+            self._idle.put(process)
+        return answers
+
+    def close(self) -> None:
+        """Завершение всех процессов"""
+        with self._lock:
+            processes, self._all = self._all, []
+        for process in processes:
+            process.close()
+        self._idle = queue.Queue()
+
+    def __enter__(self) -> "ReferencePool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
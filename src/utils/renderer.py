@@ -0,0 +1,233 @@
+"""
+Модуль формирования условий задач по шаблонам Markdown
+
+Шаблон - Markdown файл с подстановками вида ``{{ samples }}``. Разобранные
+шаблоны кэшируются в процессе (до изменения файла), раздел примеров
+строится по тестовым случаям, а большие входные данные сокращаются.
+"""
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.generators.base_generator import BaseGenerator, TestCase
+from src.generators.buffers import is_buffer
+from src.generators.spec_generator import SpecGenerator
+from src.utils.planner import input_size
+
+
+# Каталог шаблонов задач (<тип задачи>_template.md)
+TEMPLATES_DIR = Path(__file__).resolve().parents[2] / "templates"
+
+_PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+# Кэш разобранных шаблонов процесса: путь -> (время изменения, шаблон)
+_TEMPLATE_CACHE: Dict[str, Tuple[float, "Template"]] = {}
+_TEMPLATE_CACHE_LOCK = threading.Lock()
+
+
+class Template:
+    """Разобранный шаблон: чередование текста и имен подстановок"""
+
+    def __init__(self, text: str) -> None:
+        """
+        Разбор текста шаблона
+
+        Args:
+            text: Текст с подстановками ``{{ имя }}``
+        """
+        # Четные элементы - текст, нечетные - имена подстановок
+        self.parts: List[str] = _PLACEHOLDER.split(text)
+        self.fields = set(self.parts[1::2])
+
+    def render(self, context: Dict[str, Any]) -> str:
+        """
+        Подстановка значений
+
+        Args:
+            context: Значения подстановок по имени
+
+        Returns:
+            Текст условия
+        """
+        missing = sorted(self.fields - context.keys())
+        if missing:
+            raise ValueError(f"Не заданы подстановки шаблона: {', '.join(missing)}")
+
+        parts = list(self.parts)
+        for i in range(1, len(parts), 2):
+            parts[i] = str(context[parts[i]])
+        return "".join(parts)
+
+
+def load_template(path: str) -> Template:
+    """
+    Загрузка шаблона с кэшированием до изменения файла
+
+    Args:
+        path: Путь к файлу шаблона
+
+    Returns:
+        Разобранный шаблон
+    """
+    key = os.path.abspath(path)
+    mtime = os.path.getmtime(key)
+    with _TEMPLATE_CACHE_LOCK:
+        cached = _TEMPLATE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(key, 'r', encoding='utf-8') as f:
+        template = Template(f.read())
+    with _TEMPLATE_CACHE_LOCK:
+        _TEMPLATE_CACHE[key] = (mtime, template)
+    return template
+
+
+def default_template(task_type: str) -> str:
+    """Путь к шаблону задачи из TEMPLATES_DIR"""
+    return str(TEMPLATES_DIR / f"{task_type}_template.md")
+
+
+def statement_context(generator: BaseGenerator) -> Dict[str, Any]:
+    """
+    Подстановки условия, которые задает генератор
+
+    Для SpecGenerator - name и description из спецификации (их использует
+    шаблон spec), для остальных генераторов - пустой словарь.
+    """
+    if isinstance(generator, SpecGenerator):
+        spec = generator.spec
+        return {"name": spec.name, "description": spec.description or spec.name}
+    return {}
+
+
+def format_value(value: Any, max_items: int = 20, max_chars: int = 200) -> str:
+    """
+    Запись значения для раздела примеров
+
+    Массивы длиннее max_items сокращаются до начала и последнего элемента
+    с указанием длины, длинные числа и строки - до max_chars символов.
+
+    Args:
+        value: Значение (в том числе буферный массив)
+        max_items: Наибольшее количество выводимых элементов массива
+        max_chars: Наибольшая длина записи скалярного значения
+
+    Returns:
+        Текст значения
+    """
+    if isinstance(value, dict):
+        return ", ".join(
+            f"{key} = {format_value(item, max_items, max_chars)}"
+            for key, item in value.items()
+        )
+
+    if isinstance(value, (list, tuple)) or is_buffer(value):
+        length = len(value)
+        shown = value if length <= max_items else value[: max(1, max_items - 1)]
+        items = [format_value(item, max_items, max_chars) for item in shown]
+        if length > max_items:
+            last = format_value(value[length - 1], max_items, max_chars)
+            items += ["...", last]
+        if isinstance(value, tuple):
+            return "(" + ", ".join(items) + ")"
+        text = "[" + ", ".join(items) + "]"
+        return text if length <= max_items else f"{text} ({length} элементов)"
+
+    text = repr(value) if isinstance(value, str) else str(value)
+    if len(text) > max_chars:
+        return f"{text[:max_chars]}... ({len(text)} символов)"
+    return text
+
+
+def select_samples(test_cases: List[TestCase], count: int = 3) -> List[TestCase]:
+    """
+    Выбор случаев для раздела примеров
+
+    Берется наименьший обычный случай и наименьшие крайние случаи; если
+    крайних не хватает, добавляются следующие по размеру обычные.
+
+    Args:
+        test_cases: Набор тестов
+        count: Количество примеров
+
+    Returns:
+        Случаи для примеров
+    """
+    def by_size(cases: List[TestCase]) -> List[TestCase]:
+        return sorted(cases, key=lambda tc: input_size(tc.input))
+
+    normal = by_size([tc for tc in test_cases if not tc.is_edge_case])
+    edge = by_size([tc for tc in test_cases if tc.is_edge_case])
+
+    samples = normal[:1] + edge[: max(0, count - 1)]
+    samples += normal[1 : 1 + count - len(samples)]
+    return samples[:count]
+
+
+def render_samples(
+    test_cases: List[TestCase],
+    count: int = 3,
+    max_items: int = 20,
+    max_chars: int = 200,
+) -> str:
+    """
+    Раздел примеров в виде блока кода
+
+    Args:
+        test_cases: Набор тестов
+        count: Количество примеров
+        max_items: Наибольшее количество выводимых элементов массива
+        max_chars: Наибольшая длина записи скалярного значения
+
+    Returns:
+        Markdown блок с примерами
+    """
+    blocks = []
+    for i, tc in enumerate(select_samples(test_cases, count), 1):
+        blocks.append(
+            f"# Пример {i}: {tc.description}\n"
+            f"вход: {format_value(tc.input, max_items, max_chars)}\n"
+            f"выход: {format_value(tc.expected, max_items, max_chars)}\n"
+        )
+    return "```python\n" + "\n".join(blocks) + "```"
+
+
+def render_statement(
+    template: str,
+    test_cases: List[TestCase],
+    samples: int = 3,
+    max_items: int = 20,
+    max_chars: int = 200,
+    context: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Условие задачи по шаблону и набору тестов
+
+    Доступные подстановки: samples (раздел примеров), total_cases,
+    normal_cases, edge_cases, max_input_size, а также значения context.
+
+    Args:
+        template: Путь к файлу шаблона
+        test_cases: Набор тестов
+        samples: Количество примеров
+        max_items: Наибольшее количество выводимых элементов массива
+        max_chars: Наибольшая длина записи скалярного значения
+        context: Дополнительные подстановки
+
+    Returns:
+        Текст условия
+    """
+    edge_cases = sum(1 for tc in test_cases if tc.is_edge_case)
+    values: Dict[str, Any] = {
+        "samples": render_samples(test_cases, samples, max_items, max_chars),
+        "total_cases": len(test_cases),
+        "normal_cases": len(test_cases) - edge_cases,
+        "edge_cases": edge_cases,
+        "max_input_size": max((input_size(tc.input) for tc in test_cases), default=0),
+    }
+    values.update(context or {})
+    return load_template(template).render(values)
@@ -0,0 +1,324 @@
+"""
+Модуль прогона решения на наборе тестов с упорядочиванием и ранней остановкой
+"""
+
+import json
+import math
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+from src.generators.base_generator import TestCase
+from src.generators.buffers import is_buffer
+from src.utils.append import fingerprint
+from src.utils.loader import iter_test_cases
+from src.utils.planner import input_size
+
+
+# Стратегии порядка прогона случаев
+ORDERINGS = ["file", "edge_first", "failure_rate", "size_ascending"]
+
+# Тип отчета: подклассы прогона дополняют RunReport своими счетчиками
+ReportT = TypeVar("ReportT", bound="RunReport")
+
+
+def case_key(test_case: TestCase) -> str:
+    """Ключ случая в истории падений (отпечаток входа и ответа)"""
+    return fingerprint(test_case.model_dump()).hex()
+
+
+class CaseHistory(BaseModel):
+    """Статистика прогонов одного случая"""
+
+    runs: int = 0
+    failures: int = 0
+
+    @property
+    def failure_rate(self) -> float:
+        # Сглаживание Лапласа: новые случаи получают оценку 0.5
+        return (self.failures + 1) / (self.runs + 2)
+
+
+class FailureHistory:
+    """История падений случаев одной задачи, хранимая в JSON файле"""
+
+    def __init__(self, filename: Optional[str] = None) -> None:
+        """
+        Инициализация истории
+
+        Args:
+            filename: Файл истории (None - история только в памяти)
+        """
+        self.filename = filename
+        self.cases: Dict[str, CaseHistory] = {}
+
+        if filename and os.path.exists(filename):
+            with open(filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.cases = {key: CaseHistory(**value) for key, value in data.items()}
+
+    def failure_rate(self, test_case: TestCase) -> float:
+        """Оценка вероятности падения случая"""
+        history = self.cases.get(case_key(test_case))
+        return history.failure_rate if history else CaseHistory().failure_rate
+
+    def record(self, test_case: TestCase, failed: bool) -> None:
+        """Учет результата прогона случая"""
+        history = self.cases.setdefault(case_key(test_case), CaseHistory())
+        history.runs += 1
+        history.failures += int(failed)
+
+    def save(self) -> None:
+        """Сохранение истории в файл"""
+        if not self.filename:
+            return
+        data = {key: value.model_dump() for key, value in self.cases.items()}
+        with open(self.filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+
+def order_indices(
+    test_cases: List[TestCase],
+    ordering: str,
+    history: Optional[FailureHistory] = None,
+) -> List[int]:
+    """
+    Порядок прогона случаев
+
+    Args:
+        test_cases: Набор тестов
+        ordering: Стратегия из ORDERINGS
+        history: История падений (для failure_rate)
+
+    Returns:
+        Номера случаев в порядке прогона (сортировка устойчива)
+    """
+    if ordering not in ORDERINGS:
+        raise ValueError(f"Неизвестный порядок прогона: {ordering}")
+
+    indices = list(range(len(test_cases)))
+    if ordering == "edge_first":
+        indices.sort(key=lambda i: not test_cases[i].is_edge_case)
+    elif ordering == "size_ascending":
+        indices.sort(key=lambda i: input_size(test_cases[i].input))
+    elif ordering == "failure_rate":
+        history = history or FailureHistory()
+        indices.sort(
+            key=lambda i: (
+                -history.failure_rate(test_cases[i]),
+                not test_cases[i].is_edge_case,
+                input_size(test_cases[i].input),
+            )
+        )
+    return indices
+
+
+def order_cases(
+    test_cases: List[TestCase],
+    ordering: str,
+    history: Optional[FailureHistory] = None,
+) -> List[TestCase]:
+    """Случаи в порядке прогона (см. order_indices)"""
+    return [test_cases[i] for i in order_indices(test_cases, ordering, history)]
+
+
+def normalize(value: Any) -> Any:
+    """Кортежи и буферные массивы приводятся к спискам, как после записи в JSON"""
+    if is_buffer(value):
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [normalize(item) for item in value]
+    if isinstance(value, dict):
+        return {key: normalize(item) for key, item in value.items()}
+    return value
+
+
+class CaseFailure(BaseModel):
+    """Описание упавшего случая"""
+
+    index: int = Field(description="Номер случая в наборе")
+    description: str
+    expected: Any = None
+    actual: Any = None
+    error: Optional[str] = None
+
+
+def case_failure(
+    index: int, tc: TestCase, actual: Any = None, error: Optional[str] = None
+) -> CaseFailure:
+    """Описание упавшего случая"""
+    return CaseFailure(
+        index=index,
+        description=tc.description,
+        expected=tc.expected,
+        actual=actual,
+        error=error,
+    )
+
+
+class LatencyStats(BaseModel):
+    """Распределение времени работы решения на одном случае, секунды"""
+
+    count: int = 0
+    mean: float = 0.0
+    p50: float = 0.0
+    p90: float = 0.0
+    p99: float = 0.0
+    max: float = 0.0
+
+    @classmethod
+    def from_samples(cls, samples: List[float]) -> "LatencyStats":
+        """Статистика по измерениям (перцентили - по ближайшему рангу)"""
+        if not samples:
+            return cls()
+        ordered = sorted(samples)
+
+        def percentile(share: float) -> float:
+            rank = max(1, math.ceil(share * len(ordered)))
+            return ordered[rank - 1]
+
+        return cls(
+            count=len(ordered),
+            mean=sum(ordered) / len(ordered),
+            p50=percentile(0.5),
+            p90=percentile(0.9),
+            p99=percentile(0.99),
+            max=ordered[-1],
+        )
+
+
+class RunReport(BaseModel):
+    """Результат прогона решения на наборе"""
+
+    total: int = Field(default=0, description="0, если набор не дочитан")
+    executed: int = 0
+    passed: int = 0
+    failures: List[CaseFailure] = Field(default_factory=list)
+    aborted: bool = False
+    elapsed: float = 0.0
+    latency: LatencyStats = Field(default_factory=LatencyStats)
+
+    @property
+    def failed(self) -> int:
+        return len(self.failures)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+
+class SuiteRunner:
+    """Прогон решения на наборе тестов"""
+
+    def __init__(
+        self,
+        solution: Callable[[Any], Any],
+        ordering: str = "file",
+        fail_fast: bool = False,
+        history: Optional[FailureHistory] = None,
+    ) -> None:
+        """
+        Инициализация
+
+        Args:
+            solution: Проверяемое решение, принимающее input случая
+            ordering: Стратегия порядка из ORDERINGS
+            fail_fast: Остановиться на первом упавшем случае
+            history: История падений; обновляется по итогам прогона
+        """
+        if ordering not in ORDERINGS:
+            raise ValueError(f"Неизвестный порядок прогона: {ordering}")
+
+        self.solution = solution
+        self.ordering = ordering
+        self.fail_fast = fail_fast
+        self.history = history
+
+    def run(self, test_cases: List[TestCase]) -> RunReport:
+        """
+        Прогон решения на списке случаев
+
+        Args:
+            test_cases: Набор тестов
+
+        Returns:
+            Отчет о прогоне
+        """
+        ordered = order_indices(test_cases, self.ordering, self.history)
+        report = RunReport(total=len(test_cases))
+        return self._execute(((i, test_cases[i]) for i in ordered), report)
+
+    def run_file(self, filename: str, fmt: Optional[str] = None) -> RunReport:
+        """
+        Прогон решения на наборе из файла, записанного Exporter
+
+        При порядке file случаи читаются потоково, и с fail_fast файл
+        дочитывается только до первого упавшего случая.
+
+        Args:
+            filename: Файл набора
+            fmt: Формат файла (по умолчанию - по расширению)
+
+        Returns:
+            Отчет о прогоне
+        """
+        if self.ordering != "file":
+            return self.run(list(iter_test_cases(filename, fmt)))
+
+        report = self._execute(enumerate(iter_test_cases(filename, fmt)), RunReport())
+        if not report.aborted:
+            report.total = report.executed
+        return report
+
+    def _execute(self, cases: Iterable[Any], report: RunReport) -> RunReport:
+        started = time.perf_counter()
+        latencies: List[float] = []
+
+        for index, tc in cases:
+            call_started = time.perf_counter()
+            failure = self._check(index, tc)
+            latencies.append(time.perf_counter() - call_started)
+            if self._record(report, tc, failure):
+                break
+
+        return self._finish(report, started, latencies)
+
+    def _record(
+        self, report: RunReport, tc: TestCase, failure: Optional[CaseFailure]
+    ) -> bool:
+        """Учет результата случая; True, если прогон нужно остановить"""
+        report.executed += 1
+        if self.history is not None:
+            self.history.record(tc, failure is not None)
+
+        if failure is None:
+            report.passed += 1
+            return False
+
+        report.failures.append(failure)
+        if self.fail_fast:
+            report.aborted = True
+        return self.fail_fast
+
+    def _finish(
+        self, report: ReportT, started: float, latencies: List[float]
+    ) -> ReportT:
+        """Завершение отчета и сохранение истории"""
+        report.elapsed = time.perf_counter() - started
+        report.latency = LatencyStats.from_samples(latencies)
+        if self.history is not None:
+            self.history.save()
+        return report
+
+    def _check(self, index: int, tc: TestCase) -> Optional[CaseFailure]:
+        """Проверка одного случая; None, если решение верно"""
+        try:
+            actual = self.solution(tc.input)
+        except Exception as e:
+            return case_failure(index, tc, error=f"{type(e).__name__}: {e}")
+
+        if normalize(actual) == normalize(tc.expected):
+            return None
+        return case_failure(index, tc, actual=actual)
@@ -0,0 +1,177 @@
+"""
+Модуль сериализаторов JSON и YAML с выбором самой быстрой доступной реализации
+"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Type
+
+import yaml
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - зависит от окружения
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - зависит от окружения
+    msgspec = None  # type: ignore[assignment]
+
+
+class Serializer(ABC):
+    """Абстрактный сериализатор структур данных в текст"""
+
+    name: str = ""
+
+    @classmethod
+    def available(cls) -> bool:
+        """Доступна ли реализация в текущем окружении"""
+        return True
+
+    @abstractmethod
+    def dumps(self, data: Any, compact: bool = False) -> str:
+        """
+        Сериализация данных
+
+        Args:
+            data: Данные из словарей, списков, кортежей и скаляров
+            compact: Без отступов и переводов строк
+
+        Returns:
+            Текстовое представление
+        """
+        pass
+
+
+class StdlibJsonSerializer(Serializer):
+    """JSON через стандартный модуль json"""
+
+    name = "json"
+
+    def dumps(self, data: Any, compact: bool = False) -> str:
+        if compact:
+            return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+class OrjsonSerializer(Serializer):
+    """JSON через orjson"""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        self._fallback = StdlibJsonSerializer()
+
+    @classmethod
+    def available(cls) -> bool:
+        return orjson is not None
+
+    def dumps(self, data: Any, compact: bool = False) -> str:
+        try:
+            option = 0 if compact else orjson.OPT_INDENT_2
+            return orjson.dumps(data, option=option).decode('utf-8')
+        except TypeError:
+            # orjson не поддерживает целые больше 64 бит
+            return self._fallback.dumps(data, compact)
+
+
+class MsgspecSerializer(Serializer):
+    """JSON через msgspec"""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        self._fallback = StdlibJsonSerializer()
+        self._encoder = msgspec.json.Encoder() if msgspec is not None else None
+
+    @classmethod
+    def available(cls) -> bool:
+        return msgspec is not None
+
+    def dumps(self, data: Any, compact: bool = False) -> str:
+        assert self._encoder is not None
+        try:
+            encoded: bytes = self._encoder.encode(data)
+        except (TypeError, OverflowError):
+            return self._fallback.dumps(data, compact)
+        if not compact:
+            encoded = msgspec.json.format(encoded, indent=2)
+        return encoded.decode('utf-8')
+
+
+def _make_yaml_dumper(base: Type[Any]) -> Type[Any]:
+    """Безопасный дампер, записывающий кортежи как обычные списки"""
+    dumper: Type[Any] = type(f"TestCase{base.__name__}", (base,), {})
+    dumper.add_representer(tuple, yaml.representer.SafeRepresenter.represent_list)
+    return dumper
+
+
+class YamlSerializer(Serializer):
+    """YAML через libyaml (CSafeDumper), если доступен, иначе на чистом Python"""
+
+    name = "yaml"
+
+    def __init__(self, use_libyaml: Optional[bool] = None) -> None:
+        """
+        Args:
+            use_libyaml: Использовать C-реализацию (по умолчанию - если доступна)
+        """
+        if use_libyaml is None:
+            use_libyaml = hasattr(yaml, "CSafeDumper")
+        base = yaml.CSafeDumper if use_libyaml else yaml.SafeDumper
+        self.dumper = _make_yaml_dumper(base)
+        self.libyaml = use_libyaml
+
+    def dumps(self, data: Any, compact: bool = False) -> str:
+        # В компактном режиме списки скаляров записываются в одну строку
+        text: str = yaml.dump(
+            data,
+            Dumper=self.dumper,
+            allow_unicode=True,
+            default_flow_style=None if compact else False,
+            sort_keys=True,
+        )
+        return text
+
+
+# Реализации JSON в порядке предпочтения
+JSON_SERIALIZERS: Dict[str, Type[Serializer]] = {
+    "orjson": OrjsonSerializer,
+    "msgspec": MsgspecSerializer,
+    "json": StdlibJsonSerializer,
+}
+
+
+def available_json_backends() -> List[str]:
+    """Список доступных реализаций JSON в порядке предпочтения"""
+    return [name for name, cls in JSON_SERIALIZERS.items() if cls.available()]
+
+
+def get_json_serializer(backend: Optional[str] = None) -> Serializer:
+    """
+    Получение сериализатора JSON
+
+    Args:
+        backend: Имя реализации (orjson, msgspec, json); по умолчанию
+            выбирается самая быстрая доступная
+
+    Returns:
+        Экземпляр сериализатора
+    """
+    if backend is None or backend == "auto":
+        backend = available_json_backends()[0]
+
+    if backend not in JSON_SERIALIZERS:
+        raise ValueError(f"Неизвестная реализация JSON: {backend}")
+
+    serializer_class = JSON_SERIALIZERS[backend]
+    if not serializer_class.available():
+        raise ValueError(f"Реализация JSON {backend} не установлена")
+
+    return serializer_class()
+
+
+def get_yaml_serializer() -> Serializer:
+    """Получение сериализатора YAML (libyaml при наличии)"""
+    return YamlSerializer()
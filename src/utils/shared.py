@@ -0,0 +1,217 @@
+"""
+Передача массивов из процессов-генераторов через общую память
+
+Процесс-генератор копирует длинные массивы целых из входных данных и
+ожидаемых результатов фрагмента в один блок multiprocessing.shared_memory
+(по 8 байт на элемент) и возвращает случаи, в которых массивы заменены
+описателями SharedSlice (смещение и длина). Родительский процесс
+подключает блок и подставляет вместо описателей memoryview формата 'q',
+указывающие прямо в блок: массивы не проходят через pickle, а Exporter
+сериализует их из общей памяти без промежуточных копий.
+
+Между share_cases и SharedBlock.attach блок не принадлежит ни одному
+трекеру ресурсов: если родительский процесс завершится раньше, чем
+подключит блок, блок останется в системе (на Linux - файл в /dev/shm)
+до перезагрузки или ручного удаления.
+"""
+
+import os
+import sys
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, List, Optional, Tuple
+
+from src.generators.base_generator import TestCase
+from src.generators.buffers import ITEM_SIZE, int64_view, is_buffer
+
+
+# Массивы короче этого передаются через pickle: для них создание
+# блока дороже копирования
+SHARED_MIN_ITEMS = 1024
+
+
+class SharedSlice:
+    """Описатель массива в блоке общей памяти"""
+
+    __slots__ = ("offset", "length")
+
+    def __init__(self, offset: int, length: int) -> None:
+        """
+        Args:
+            offset: Номер первого элемента в блоке
+            length: Количество элементов
+        """
+        self.offset = offset
+        self.length = length
+
+    def __getstate__(self) -> Tuple[int, int]:
+        return self.offset, self.length
+
+    def __setstate__(self, state: Tuple[int, int]) -> None:
+        self.offset, self.length = state
+
+
+def _int64_buffer(value: Any, min_items: int) -> Optional[memoryview]:
+    """Байты массива целых, если его стоит передать через общую память"""
+    if isinstance(value, list):
+        if not value or len(value) < min_items:
+            return None
+        try:
+            return memoryview(array('q', value))
+        except (TypeError, OverflowError):
+            return None
+    if is_buffer(value) and 0 < len(value) >= min_items:
+        return int64_view(value)
+    return None
+
+
+def _create_block(size: int) -> shared_memory.SharedMemory:
+    """Новый блок, который не удалит трекер ресурсов процесса-генератора"""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(create=True, size=size, track=False)
+    return shared_memory.SharedMemory(create=True, size=size)
+
+
+def _untrack(block: shared_memory.SharedMemory) -> None:
+    """Снятие блока с учета трекера ресурсов (до Python 3.13)"""
+    if sys.version_info < (3, 13) and os.name == "posix":
+        # Трекер знает блок под именем с ведущей косой чертой, которое
+        # SharedMemory.name отбрасывает
+        resource_tracker.unregister(f"/{block.name}", "shared_memory")
+
+
+def share_cases(
+    test_cases: List[TestCase], min_items: int = SHARED_MIN_ITEMS
+) -> Tuple[Optional[str], List[TestCase]]:
+    """
+    Перенос массивов фрагмента в новый блок общей памяти
+
+    Вызывается в процессе-генераторе. Блок остается в системе после
+    возврата; его подключает и удаляет SharedBlock.attach.
+
+    Args:
+        test_cases: Случаи фрагмента
+        min_items: Наименьшая длина массива для переноса
+
+    Returns:
+        Кортеж (имя блока или None, если переносить нечего; случаи с
+        описателями SharedSlice вместо массивов)
+    """
+    buffers: List[memoryview] = []
+    total = 0
+
+    def collect(value: Any) -> Any:
+        nonlocal total
+        if isinstance(value, dict):
+            return {key: collect(item) for key, item in value.items()}
+        view = _int64_buffer(value, min_items)
+        if view is None:
+            return value
+        buffers.append(view)
+        total += len(view)
+        return SharedSlice(total - len(view), len(view))
+
+    shared = [
+        case.model_copy(
+            update={"input": collect(case.input), "expected": collect(case.expected)}
+        )
+        for case in test_cases
+    ]
+    if not buffers:
+        return None, test_cases
+
+    block = _create_block(total * ITEM_SIZE)
+    try:
+        assert block.buf is not None
+        target = block.buf.cast("q")
+        offset = 0
+        for buffer in buffers:
+            target[offset:offset + len(buffer)] = buffer
+            offset += len(buffer)
+        target.release()
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    block.close()
+    # Блок теперь принадлежит родительскому процессу: трекер ресурсов
+    # процесса-генератора не должен удалять его при завершении
+    _untrack(block)
+    return block.name, shared
+
+
+class SharedBlock:
+    """Блок общей памяти, подключенный в родительском процессе"""
+
+    def __init__(self, name: str) -> None:
+        """
+        Подключение блока
+
+        Имя блока удаляется сразу: память освобождается при release(),
+        даже если процесс завершится аварийно.
+
+        Args:
+            name: Имя блока из share_cases
+        """
+        self.name = name
+        self._block = shared_memory.SharedMemory(name=name)
+        self._block.unlink()
+        self._views: List[memoryview] = []
+
+    @classmethod
+    def attach(
+        cls, name: Optional[str], test_cases: List[TestCase]
+    ) -> Tuple[Optional["SharedBlock"], List[TestCase]]:
+        """
+        Замена описателей массивами из блока
+
+        Args:
+            name: Имя блока (None - случаи без описателей)
+            test_cases: Случаи из share_cases
+
+        Returns:
+            Кортеж (блок или None, случаи с memoryview формата 'q' вместо
+            описателей)
+        """
+        if name is None:
+            return None, test_cases
+
+        block = cls(name)
+
+        def restore(value: Any) -> Any:
+            if isinstance(value, dict):
+                return {key: restore(item) for key, item in value.items()}
+            if isinstance(value, SharedSlice):
+                return block.view(value.offset, value.length)
+            return value
+
+        restored = [
+            case.model_copy(
+                update={
+                    "input": restore(case.input),
+                    "expected": restore(case.expected),
+                }
+            )
+            for case in test_cases
+        ]
+        return block, restored
+
+    def view(self, offset: int, length: int) -> memoryview:
+        """Массив из length элементов, начиная с элемента offset"""
+        assert self._block.buf is not None
+        start = offset * ITEM_SIZE
+        view = self._block.buf[start:start + length * ITEM_SIZE].cast("q")
+        self._views.append(view)
+        return view
+
+    def release(self) -> None:
+        """
+        Освобождение блока
+
+        Массивы из блока после этого недоступны; их потребители (например,
+        пакеты pyarrow) к этому моменту должны быть удалены.
+        """
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        self._block.close()
@@ -4,18 +4,23 @@
 
 from typing import List, Tuple, Optional
 from src.generators.base_generator import TestCase
+from src.generators.buffers import first_indices, is_buffer, is_sorted, to_plain
+from src.generators.spill import SpilledArray
 
 
 class Validator:
     """Класс для валидации тестовых случаев"""
 
     @staticmethod
-    def validate_test_cases(test_cases: List[TestCase]) -> Tuple[bool, List[str]]:
+    def validate_test_cases(
+        test_cases: List[TestCase], start: int = 0
+    ) -> Tuple[bool, List[str]]:
         """
         Валидация списка тестовых случаев
         
         Args:
             test_cases: Список тестовых случаев для валидации
+            start: Номер первого случая в сообщениях об ошибках
             
         Returns:
             Кортеж (валидны ли все случаи, список ошибок)
@@ -26,7 +31,7 @@ class Validator:
             errors.append("Список тестовых случаев пуст")
             return False, errors
         
-        for i, tc in enumerate(test_cases):
+        for i, tc in enumerate(test_cases, start):
             # Проверяем обязательные поля
             if tc.input is None:
                 errors.append(f"Тест {i}: отсутствуют входные данные")
@@ -48,10 +53,20 @@ class Validator:
     def _validate_specific_types(tc: TestCase, index: int) -> Optional[str]:
         """Валидация специфичных типов данных"""
         
-        # Проверка для задач сортировки
-        if isinstance(tc.input, list):
-            # Проверяем, что ожидаемый результат тоже список
-            if not isinstance(tc.expected, list):
+        # Проверка для массивов, выгруженных на диск (чтение фрагментами)
+        if isinstance(tc.input, SpilledArray):
+            if not isinstance(tc.expected, SpilledArray):
+                return f"Тест {index}: для массива на диске ожидается массив на диске"
+            if len(tc.input) != len(tc.expected):
+                return f"Тест {index}: длина входного массива ({len(tc.input)}) " \
+                       f"не совпадает с длиной ожидаемого ({len(tc.expected)})"
+            if not tc.expected.is_sorted():
+                return f"Тест {index}: ожидаемый результат не отсортирован"
+
+        # Проверка для задач сортировки (список или буферный массив)
+        elif isinstance(tc.input, list) or is_buffer(tc.input):
+            # Проверяем, что ожидаемый результат тоже массив
+            if not (isinstance(tc.expected, list) or is_buffer(tc.expected)):
                 return f"Тест {index}: для списка на входе ожидается список на выходе"
             
             # Проверяем, что длины совпадают
@@ -60,15 +75,43 @@ class Validator:
                        f"не совпадает с длиной ожидаемого ({len(tc.expected)})"
             
             # Проверяем, что ожидаемый результат отсортирован
-            if tc.expected != sorted(tc.expected):
+            if not is_sorted(tc.expected):
                 return f"Тест {index}: ожидаемый результат не отсортирован"
         
+        # Проверка для задач поиска с несколькими запросами
+        elif isinstance(tc.input, dict) and {"array", "targets"} <= tc.input.keys():
+            arr = tc.input["array"]
+            targets = tc.input["targets"]
+
+            if not (isinstance(arr, list) or is_buffer(arr)):
+                return f"Тест {index}: поле 'array' должно быть списком"
+
+            if not (isinstance(tc.expected, list) or is_buffer(tc.expected)):
+                return f"Тест {index}: для нескольких запросов " \
+                       f"ожидается список индексов"
+
+            if len(tc.expected) != len(targets):
+                return f"Тест {index}: количество ответов ({len(tc.expected)}) " \
+                       f"не совпадает с количеством запросов ({len(targets)})"
+
+            if not is_sorted(arr):
+                return f"Тест {index}: массив для двоичного поиска не отсортирован"
+
+            # Ответы сверяются с первыми вхождениями, найденными двоичным поиском
+            answers = to_plain(first_indices(arr, targets))
+            expected = to_plain(tc.expected)
+            if expected != answers:
+                j = next(j for j, pair in enumerate(zip(expected, answers))
+                         if pair[0] != pair[1])
+                return f"Тест {index}: ответ на запрос {j} ({targets[j]}) - " \
+                       f"{expected[j]}, а первое вхождение - {answers[j]}"
+
         # Проверка для задач поиска
         elif isinstance(tc.input, dict) and "array" in tc.input and "target" in tc.input:
             arr = tc.input["array"]
             target = tc.input["target"]
             
-            if not isinstance(arr, list):
+            if not (isinstance(arr, list) or is_buffer(arr)):
                 return f"Тест {index}: поле 'array' должно быть списком"
             
             if not isinstance(tc.expected, int):
@@ -104,7 +147,8 @@ class Validator:
         
         for i, tc in enumerate(test_cases):
             # Создаем ключ на основе входных данных и ожидаемого результата
-            key = (str(tc.input), str(tc.expected))
+            # (str массива NumPy сокращает длинные массивы многоточием)
+            key = (str(to_plain(tc.input)), str(to_plain(tc.expected)))
             
             if key in seen:
                 duplicates.append((seen[key], i))
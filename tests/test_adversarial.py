@@ -0,0 +1,123 @@
+"""
+Тесты для состязательных входных данных
+"""
+
+import pytest
+
+from src.generators import adversarial
+from src.generators.searching_generator import SearchingGenerator
+from src.generators.sorting_generator import SortingGenerator
+
+
+def median_of_three_quicksort_steps(arr):
+    """Число сравнений быстрой сортировки с медианой первого, среднего и
+    последнего элементов (разбиение Хоара, как в SGI STL)"""
+    a = list(arr)
+    steps = 0
+
+    def median(x, y, z):
+        return sorted((x, y, z))[1]
+
+    stack = [(0, len(a))]
+    while stack:
+        first, last = stack.pop()
+        if last - first <= 16:
+            continue
+        pivot = median(a[first], a[first + (last - first) // 2], a[last - 1])
+        lo, hi = first, last
+        while True:
+            while a[lo] < pivot:
+                lo += 1
+                steps += 1
+            hi -= 1
+            while pivot < a[hi]:
+                hi -= 1
+                steps += 1
+            if lo >= hi:
+                break
+            a[lo], a[hi] = a[hi], a[lo]
+            lo += 1
+        stack.append((first, lo))
+        stack.append((lo, last))
+
+    return steps
+
+
+class TestAdversarialFamilies:
+    """Тесты для функций модуля adversarial"""
+
+    @pytest.mark.parametrize("n", [0, 1, 5, 8, 1001])
+    def test_killer_is_permutation(self, n):
+        """Последовательность Мюссера - перестановка чисел 1..n"""
+        assert sorted(adversarial.median_of_three_killer(n)) == list(range(1, n + 1))
+
+    def test_killer_is_quadratic(self):
+        """Медиана из трех деградирует на последовательности Мюссера"""
+        n = 2000
+        killer = median_of_three_quicksort_steps(
+            adversarial.median_of_three_killer(n)
+        )
+        regular = median_of_three_quicksort_steps(list(range(n, 0, -1)))
+        assert killer > 20 * regular
+
+    @pytest.mark.parametrize("n", [0, 1, 7, 100])
+    def test_shapes(self, n):
+        """Длины и диапазоны значений семейств"""
+        assert len(adversarial.sawtooth(n, 4)) == n
+        assert set(adversarial.sawtooth(n, 4)) <= {0, 1, 2, 3}
+        assert set(adversarial.many_equal(n, 3)) <= {0, 1, 2}
+        pipe = adversarial.organ_pipe(n)
+        assert len(pipe) == n
+        assert pipe == pipe[::-1]
+
+    def test_hash_collisions(self):
+        """Все ключи различны и совпадают по модулю"""
+        keys = adversarial.hash_collision_keys(100, 1 << 20)
+        assert len(set(keys)) == 100
+        assert all(k % (1 << 20) == 0 for k in keys)
+
+    def test_hash_collisions_in_cpython(self):
+        """С модулем по умолчанию у всех ключей совпадает hash()"""
+        keys = adversarial.hash_collision_keys(1000)
+        assert len(set(keys)) == 1000
+        assert len({hash(k) for k in keys}) == 1
+
+    def test_counting_sorted(self):
+        """Сортировка подсчетом совпадает со встроенной"""
+        arr = adversarial.many_equal(1000, 5)
+        assert adversarial.counting_sorted(arr, 0, 4) == sorted(arr)
+
+
+class TestAdversarialCases:
+    """Тесты для состязательных случаев генераторов"""
+
+    def test_sorting_cases(self):
+        """Ожидаемые результаты сортировки корректны"""
+        cases = SortingGenerator().generate_adversarial_cases(1000)
+        assert len(cases) == 5
+        for case in cases:
+            assert len(case.input) == 1000
+            assert case.expected == sorted(case.input)
+            assert case.is_edge_case
+
+    def test_searching_cases(self):
+        """Ожидаемые индексы - первое вхождение цели или -1"""
+        for case in SearchingGenerator().generate_adversarial_cases(1000):
+            arr, target = case.input["array"], case.input["target"]
+            assert arr == sorted(arr)
+            assert case.expected == (arr.index(target) if target in arr else -1)
+
+    def test_searching_compact_arrays(self):
+        """Ключи с коллизиями, не помещающиеся в int64, отклоняются"""
+        with pytest.raises(ValueError, match="int64"):
+            SearchingGenerator(array_type="array").generate_adversarial_cases(10)
+        cases = SearchingGenerator(
+            array_type="array", hash_modulus=1 << 32
+        ).generate_adversarial_cases(10)
+        assert cases[0].input["array"][-1] == 9 << 32
+
+    def test_included_in_edge_cases(self):
+        """adversarial_size добавляет случаи к крайним"""
+        plain = SortingGenerator().generate_edge_cases()
+        extended = SortingGenerator(adversarial_size=50).generate_edge_cases()
+        assert len(extended) == len(plain) + 5
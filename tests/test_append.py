@@ -0,0 +1,125 @@
+"""
+Тесты для дозаписи в существующий набор
+"""
+
+import json
+import os
+
+import pytest
+
+from src.generators.base_generator import TestCase
+from src.generators.math_generator import MathGenerator
+from src.generators.sorting_generator import SortingGenerator
+from src.utils.append import (
+    FINGERPRINT_SIZE,
+    FINGERPRINTS_SUFFIX,
+    SuiteAppender,
+    SuiteManifest,
+    fingerprint,
+)
+from src.utils.exporter import Exporter
+
+
+def read_jsonl(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def suite(tmp_path):
+    """Набор из 10 обычных и крайних случаев сортировки с манифестом"""
+    path = str(tmp_path / "suite.jsonl")
+    generator = SortingGenerator(min_len=1, max_len=10)
+    cases = generator.generate_all(n_normal=10)
+    Exporter.to_jsonl(cases, path)
+    SuiteManifest.record(path, 10, len(cases) - 10, task_type="sorting")
+    return path
+
+
+class TestSuiteAppender:
+    """Тесты для SuiteAppender"""
+
+    def test_append_delta(self, suite):
+        """Тест дозаписи только недостающих случаев"""
+        before = read_jsonl(suite)
+        appender = SuiteAppender(SortingGenerator(), suite, task_type="sorting")
+        result = appender.append(25)
+
+        after = read_jsonl(suite)
+        assert result.added == 15
+        assert result.normal_cases == 25
+        assert len(after) == len(before) + 15
+        assert after[: len(before)] == before
+        assert after[-1]["description"].startswith("Нормальный случай 25:")
+
+        manifest = SuiteManifest.load(suite)
+        assert manifest.normal_cases == 25
+        assert manifest.size == os.path.getsize(suite)
+
+    def test_nothing_to_append(self, suite):
+        """Тест что при достаточном количестве файл не меняется"""
+        size = os.path.getsize(suite)
+        result = SuiteAppender(SortingGenerator(), suite).append(5)
+
+        assert result.added == 0
+        assert os.path.getsize(suite) == size
+
+    def test_missing_manifest_is_rebuilt(self, suite):
+        """Тест восстановления манифеста чтением файла"""
+        os.remove(SuiteManifest.path_for(suite))
+
+        manifest = SuiteAppender(SortingGenerator(), suite).load_manifest()
+        assert manifest.normal_cases == 10
+        assert manifest.edge_cases >= 5
+
+    def test_dedup(self, tmp_path):
+        """Тест исключения дубликатов по отпечаткам"""
+        path = str(tmp_path / "math.jsonl")
+        Exporter.to_jsonl(MathGenerator().generate_edge_cases(), path)
+
+        existing = {fingerprint(data) for data in read_jsonl(path)}
+
+        result = SuiteAppender(MathGenerator(), path).append(60, dedup=True)
+
+        appended = [fingerprint(data) for data in read_jsonl(path)][-60:]
+        assert len(appended) == len(set(appended))
+        assert not existing & set(appended)
+        assert os.path.getsize(path + FINGERPRINTS_SUFFIX) == (
+            result.total_cases * FINGERPRINT_SIZE
+        )
+
+    def test_task_type_mismatch(self, suite):
+        """Тест дозаписи случаев другой задачи"""
+        with pytest.raises(ValueError):
+            SuiteAppender(MathGenerator(), suite, task_type="math").append(20)
+
+    def test_stale_manifest_keeps_task_type(self, suite):
+        """Устаревший манифест пересчитывается, но тип задачи сохраняется"""
+        with open(suite, "a", encoding="utf-8") as f:
+            f.write(TestCase(input=[2, 1], expected=[1, 2]).model_dump_json() + "\n")
+
+        with pytest.raises(ValueError, match="sorting"):
+            SuiteAppender(MathGenerator(), suite, task_type="math").append(20)
+
+        appender = SuiteAppender(SortingGenerator(), suite, task_type="sorting")
+        manifest = appender.load_manifest()
+        assert manifest.task_type == "sorting" and manifest.normal_cases == 11
+
+    def test_unknown_task_type(self, suite):
+        """Без манифеста тип задачи неизвестен и дозапись с task_type отклоняется"""
+        os.remove(SuiteManifest.path_for(suite))
+        with pytest.raises(ValueError, match="неизвестен"):
+            SuiteAppender(MathGenerator(), suite, task_type="math").append(20)
+
+    def test_truncated_file(self, suite):
+        """Тест обнаружения оборванной последней строки"""
+        with open(suite, "a", encoding="utf-8") as f:
+            f.write('{"input": [1')
+
+        with pytest.raises(ValueError):
+            SuiteAppender(SortingGenerator(), suite).append(20)
+
+    def test_unsupported_format(self, tmp_path):
+        """Тест формата без поддержки дозаписи"""
+        with pytest.raises(ValueError):
+            SuiteAppender(SortingGenerator(), str(tmp_path / "a.json"), fmt="json")
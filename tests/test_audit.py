@@ -0,0 +1,117 @@
+"""
+Тесты для проверки и статистики наборов тестов из файла
+"""
+
+import json
+
+import pytest
+
+from src.generators.base_generator import TestCase
+from src.generators.sorting_generator import SortingGenerator
+from src.utils import audit, columnar
+from src.utils.audit import SuiteAuditor
+from src.utils.exporter import Exporter
+from src.utils.validator import Validator
+
+
+@pytest.fixture
+def cases():
+    """Набор с дубликатами и некорректными случаями"""
+    cases = SortingGenerator(seed=3).generate_all(60)
+    cases.append(cases[2].model_copy())
+    cases.append(cases[10].model_copy())
+    cases[5] = cases[5].model_copy(update={"expected": [3, 1, 2]})
+    return cases
+
+
+def assert_matches_validator(report, cases):
+    """Отчет совпадает с проверкой набора в памяти"""
+    _, errors = Validator.validate_test_cases(cases)
+    assert report.cases == len(cases)
+    assert report.errors == errors and report.error_count == len(errors)
+
+    duplicates = Validator.find_duplicates(cases)
+    assert report.duplicate_count == len(duplicates)
+    assert sorted(report.duplicates) == sorted(duplicates)
+
+    coverage = Validator.calculate_coverage(cases)
+    for key, value in coverage.items():
+        assert report.coverage[key] == pytest.approx(value), key
+
+
+class TestSuiteAuditor:
+    """Тесты для SuiteAuditor"""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_jsonl(self, cases, tmp_path, workers):
+        """Проверка jsonl по частям совпадает с Validator"""
+        suite = str(tmp_path / "suite.jsonl")
+        Exporter.to_jsonl(cases, suite)
+
+        report = SuiteAuditor(workers=workers, chunk_size=7).audit(suite)
+        assert_matches_validator(report, cases)
+        assert not report.ok
+        assert report.workers == workers and report.bytes > 0
+        assert report.coverage["input_size_max"] >= report.coverage["input_size_min"]
+
+    def test_json(self, cases, tmp_path):
+        """Формат json загружается целиком и проверяется так же"""
+        suite = str(tmp_path / "suite.json")
+        Exporter.to_json(cases, suite)
+        report = SuiteAuditor(workers=1, chunk_size=10).audit(suite)
+        assert_matches_validator(report, cases)
+
+    @pytest.mark.skipif(not columnar.available(), reason="pyarrow не установлен")
+    @pytest.mark.parametrize("fmt", columnar.COLUMNAR_FORMATS)
+    def test_row_groups(self, cases, tmp_path, fmt):
+        """Колоночные файлы проверяются по группам строк"""
+        suite = str(tmp_path / f"suite.{fmt}")
+        with columnar.ColumnarWriter(suite, fmt) as writer:
+            for offset in range(0, len(cases), 25):
+                writer.write(cases[offset:offset + 25])
+        groups = columnar.row_groups(suite, fmt)
+        assert len(groups) == 3 and sum(groups) == len(cases)
+
+        report = SuiteAuditor(workers=2).audit(suite)
+        assert_matches_validator(report, cases)
+
+    def test_unparsable_lines(self, tmp_path):
+        """Неразобранные строки - ошибки со своими номерами, дубликаты не сдвигаются"""
+        case = TestCase(input=[2, 1], expected=[1, 2], description="пара")
+        line = case.model_dump_json()
+        suite = tmp_path / "suite.jsonl"
+        suite.write_text(
+            "\n".join([line, "{не json", json.dumps({"input": 1}), line, ""]),
+            encoding="utf-8",
+        )
+
+        report = SuiteAuditor(workers=1, max_errors=1).audit(str(suite))
+        assert report.cases == 4 and report.error_count == 2
+        assert len(report.errors) == 1
+        assert report.errors[0].startswith("Тест 1: не удалось разобрать строку")
+        assert report.duplicates == [(0, 3)]
+
+    def test_empty(self, tmp_path):
+        """Пустой набор - ошибка, как у Validator"""
+        suite = tmp_path / "suite.jsonl"
+        suite.write_text("\n", encoding="utf-8")
+        report = SuiteAuditor(workers=1).audit(str(suite))
+        assert not report.ok
+        assert report.errors == Validator.validate_test_cases([])[1]
+        assert report.coverage["input_size_mean"] is None
+
+    def test_duplicates_without_numpy(self, cases, tmp_path, monkeypatch):
+        """Поиск дубликатов без NumPy дает те же пары"""
+        suite = tmp_path / "suite.jsonl"
+        Exporter.to_jsonl(cases, str(suite))
+        with open(suite, "a", encoding="utf-8") as f:
+            f.write("{не json\n" + cases[0].model_dump_json() + "\n")
+
+        expected = SuiteAuditor(workers=1, chunk_size=9, max_errors=2).audit(str(suite))
+        monkeypatch.setattr(audit, "np", None)
+        report = SuiteAuditor(workers=1, chunk_size=9, max_errors=2).audit(str(suite))
+        duplicates = Validator.find_duplicates(cases)
+        assert report.duplicate_count == expected.duplicate_count
+        assert report.duplicate_count == len(duplicates) + 1
+        assert report.duplicates == expected.duplicates
+        assert report.duplicates == sorted(duplicates, key=lambda p: p[1])[:2]
@@ -0,0 +1,148 @@
+"""
+Тесты для пакетной генерации
+"""
+
+import json
+
+import pytest
+import yaml
+from pydantic import ValidationError
+
+from src.generators.oracle import OracleCache
+from src.generators.sorting_generator import SortingGenerator
+from src.utils import batch
+from src.utils.batch import BatchJob, BatchRunner
+from src.utils.exporter import Exporter
+from src.utils.renderer import render_statement
+
+
+class TestBatchRunner:
+    """Тесты для BatchRunner"""
+
+    def test_from_yaml_and_run(self, tmp_path):
+        """Тест выполнения манифеста с несколькими заданиями"""
+        manifest = {
+            "workers": 2,
+            "jobs": [
+                {
+                    "task_type": "sorting",
+                    "normal_cases": 3,
+                    "params": {"min_len": 1, "max_len": 10},
+                    "output": str(tmp_path / "sorting.json"),
+                },
+                {
+                    "task_type": "searching",
+                    "normal_cases": 2,
+                    "edge_cases": False,
+                    "format": "yaml",
+                    "output": str(tmp_path / "nested" / "searching.yaml"),
+                },
+            ],
+        }
+        manifest_path = tmp_path / "jobs.yaml"
+        manifest_path.write_text(yaml.safe_dump(manifest), encoding="utf-8")
+
+        runner = BatchRunner.from_yaml(str(manifest_path))
+        report = runner.run()
+
+        assert runner.workers == 2
+        assert len(report.results) == 2
+
+        sorting = json.loads((tmp_path / "sorting.json").read_text(encoding="utf-8"))
+        assert sum(1 for c in sorting if not c["is_edge_case"]) == 3
+
+        searching = yaml.safe_load(
+            (tmp_path / "nested" / "searching.yaml").read_text(encoding="utf-8")
+        )
+        assert len(searching) == 2
+
+        assert report.total_cases == len(sorting) + 2
+        assert report.total_bytes > 0
+
+    def test_inline_run(self, tmp_path):
+        """Тест выполнения в текущем процессе"""
+        jobs = [
+            BatchJob(task_type="math", normal_cases=4, output=str(tmp_path / "m.json")),
+        ]
+        report = BatchRunner(jobs, workers=1).run()
+
+        assert report.results[0].cases >= 4
+        assert (tmp_path / "m.json").exists()
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_streamed_by_chunks(self, tmp_path, workers):
+        """Задание пишется конвейером по фрагментам, как Exporter целиком"""
+        template = tmp_path / "t.md"
+        template.write_text(
+            "{{ total_cases }} {{ edge_cases }} {{ max_input_size }}\n{{ samples }}",
+            encoding="utf-8",
+        )
+        job = BatchJob(
+            task_type="sorting",
+            normal_cases=30,
+            params={"seed": 4, "max_len": 40},
+            chunk_size=7,
+            output=str(tmp_path / "sorting.json"),
+            statement=str(tmp_path / "statement.md"),
+            template=str(template),
+            samples=3,
+        )
+        report = BatchRunner([job], workers=workers).run()
+
+        generator = SortingGenerator(seed=4, max_len=40)
+        cases = generator.generate_normal_cases(30) + generator.generate_edge_cases()
+        text = (tmp_path / "sorting.json").read_text(encoding="utf-8")
+        assert text == Exporter.dumps(cases, "json")
+        assert report.results[0].cases == len(cases)
+
+        statement = (tmp_path / "statement.md").read_text(encoding="utf-8")
+        assert statement == render_statement(str(template), cases, samples=3)
+
+    def test_oracle_cache_per_path(self, tmp_path, monkeypatch):
+        """Задания с одним файлом кэша делят подключение, с разными - нет"""
+        opened = []
+
+        class TrackedCache(OracleCache):
+            def __init__(self, path):
+                super().__init__(path)
+                self.closed = False
+                opened.append(self)
+
+            def close(self):
+                super().close()
+                self.closed = True
+
+        monkeypatch.setattr(batch, "OracleCache", TrackedCache)
+        jobs = [
+            BatchJob(
+                task_type="math",
+                normal_cases=5,
+                oracle_cache=str(tmp_path / cache),
+                output=str(tmp_path / f"math_{i}.json"),
+            )
+            for i, cache in enumerate(["a.db", "b.db", "a.db"])
+        ]
+        BatchRunner(jobs, workers=1).run()
+
+        assert [cache.path for cache in opened] == [
+            str(tmp_path / "a.db"),
+            str(tmp_path / "b.db"),
+        ]
+        assert all(cache.closed for cache in opened)
+        assert len(OracleCache(str(tmp_path / "b.db"))) > 0
+
+    def test_invalid_job(self):
+        """Тест валидации заданий"""
+        with pytest.raises(ValidationError):
+            BatchJob(task_type="unknown", output="x.json")
+
+        with pytest.raises(ValidationError):
+            BatchJob(task_type="sorting", output="x.json", format="xml")
+
+    def test_empty_manifest(self, tmp_path):
+        """Тест пустого манифеста"""
+        manifest_path = tmp_path / "jobs.yaml"
+        manifest_path.write_text("jobs: []\n", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            BatchRunner.from_yaml(str(manifest_path))
@@ -0,0 +1,159 @@
+"""
+Тесты для буферных массивов (array('q'), NumPy, memoryview)
+"""
+
+import json
+import random
+from array import array
+
+import pytest
+
+from src.generators import buffers
+from src.generators.base_generator import TestCase
+from src.generators.searching_generator import SearchingGenerator
+from src.generators.sorting_generator import SortingGenerator
+from src.utils.exporter import Exporter
+from src.utils.validator import Validator
+
+
+class TestBuffers:
+    """Тесты для вспомогательных функций модуля buffers"""
+
+    def test_pack_array(self):
+        """Упаковка в array('q') и обратно в список"""
+        packed = buffers.pack([3, -1, 2], "array")
+
+        assert isinstance(packed, array) and packed.typecode == 'q'
+        assert buffers.is_buffer(packed)
+        assert buffers.to_plain({"array": packed, "target": 2}) == {
+            "array": [3, -1, 2],
+            "target": 2,
+        }
+
+    def test_unknown_array_type(self):
+        """Неизвестное представление отклоняется"""
+        with pytest.raises(ValueError):
+            buffers.check_array_type("tuple")
+        with pytest.raises(ValueError):
+            SortingGenerator(array_type="tuple")
+
+    def test_int64_view(self):
+        """Байты int64 отдаются без копирования, прочие буферы - нет"""
+        values = array('q', [1, 2, 3])
+        view = buffers.int64_view(values)
+
+        assert view.format == 'q' and view.obj is values
+        assert buffers.int64_view(array('i', [1])) is None
+        assert buffers.int64_view([1, 2]) is None
+
+    def test_index_and_sorted(self):
+        """Поиск первого вхождения и проверка упорядоченности"""
+        values = array('q', [1, 2, 2, 5])
+
+        assert buffers.index_of(values, 2) == 1
+        assert buffers.index_of(memoryview(values), 5) == 3
+        assert buffers.index_of(values, 7) == -1
+        assert buffers.is_sorted(values)
+        assert not buffers.is_sorted(array('q', [2, 1]))
+
+    def test_numpy(self):
+        """Массивы NumPy int64 поддерживаются наравне с array('q')"""
+        np = pytest.importorskip("numpy")
+        packed = buffers.pack(range(5), "numpy")
+
+        assert packed.dtype == np.int64
+        assert buffers.int64_view(packed).tolist() == [0, 1, 2, 3, 4]
+        assert buffers.int64_view(packed[::2]) is None
+        assert buffers.index_of(packed, 3) == 3
+        assert buffers.is_sorted(packed)
+        assert json.dumps(packed, default=buffers.json_default) == "[0, 1, 2, 3, 4]"
+
+
+class TestBufferCases:
+    """Тесты сквозной обработки случаев с буферными массивами"""
+
+    @pytest.mark.parametrize("array_type", ["array", "numpy"])
+    def test_same_suite_as_lists(self, array_type):
+        """При одном seed набор совпадает с набором из списков"""
+        if array_type == "numpy":
+            pytest.importorskip("numpy")
+
+        suites = {}
+        for name in ("list", array_type):
+            random.seed(7)
+            generator = SortingGenerator(adversarial_size=32, array_type=name)
+            suites[name] = generator.generate_all(5)
+
+        packed = suites[array_type]
+        assert buffers.is_buffer(packed[0].input)
+        assert Exporter.dumps(packed, "json") == Exporter.dumps(suites["list"], "json")
+        assert Exporter.dumps(packed, "python") == Exporter.dumps(
+            suites["list"], "python"
+        )
+
+    def test_validator(self):
+        """Validator проверяет буферные массивы сортировки и поиска"""
+        random.seed(3)
+        cases = SortingGenerator(array_type="array").generate_normal_cases(5)
+        cases += SearchingGenerator(array_type="array").generate_normal_cases(5)
+
+        ok, errors = Validator.validate_test_cases(cases)
+        assert ok, errors
+
+        broken = TestCase(
+            input=array('q', [2, 1]),
+            expected=array('q', [2, 1]),
+            description="Не отсортирован",
+        )
+        ok, errors = Validator.validate_test_cases([broken])
+        assert not ok and "не отсортирован" in errors[0]
+
+    def test_searching_adversarial_shares_keys(self):
+        """Случаи с коллизиями ссылаются на один массив ключей"""
+        generator = SearchingGenerator(array_type="array", hash_modulus=1 << 32)
+        cases = generator.generate_adversarial_cases(64)
+
+        assert cases[0].input["array"] is cases[1].input["array"]
+        assert cases[0].expected == 63
+        assert isinstance(cases[0].input["target"], int)
+
+    def test_columnar_round_trip(self, tmp_path):
+        """Буферные массивы пишутся в колонки list<int64> и читаются списками"""
+        pytest.importorskip("pyarrow")
+        np = pytest.importorskip("numpy")
+        from src.utils import columnar
+
+        cases = [
+            TestCase(
+                input=np.array([3, 1, 2]),
+                expected=array('q', [1, 2, 3]),
+                description="Сортировка",
+            ),
+            TestCase(
+                input={"array": np.arange(4), "target": 2},
+                expected=2,
+                description="Поиск",
+            ),
+            TestCase(input=[5, 4], expected=[4, 5], description="Списки"),
+        ]
+        filename = str(tmp_path / "suite.arrow")
+        columnar.write(cases, filename, "arrow")
+
+        loaded = list(columnar.iter_test_cases(filename, "arrow"))
+        assert [tc.input for tc in loaded] == [
+            [3, 1, 2],
+            {"array": [0, 1, 2, 3], "target": 2},
+            [5, 4],
+        ]
+        assert loaded[0].expected == [1, 2, 3]
+
+    def test_first_indices(self):
+        """Первые вхождения для нескольких запросов к отсортированному массиву"""
+        values = [1, 2, 2, 2, 3, 5, 5, 8]
+        targets = [0, 1, 2, 3, 4, 5, 8, 9]
+        expected = [-1, 0, 1, 4, -1, 5, 7, -1]
+
+        assert buffers.first_indices(values, targets) == expected
+        assert buffers.first_indices(array('q', values), targets) == expected
+        assert buffers.first_indices(memoryview(array('q', values)), []) == []
+        assert buffers.first_indices([], [1]) == [-1]
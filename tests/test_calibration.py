@@ -0,0 +1,134 @@
+"""
+Тесты для калибровки размеров входных данных
+"""
+
+import pytest
+
+from src.generators.math_generator import MathGenerator
+from src.utils.calibration import (
+    CalibrationProfiles,
+    Calibrator,
+    CalibrationResult,
+    size_parameter,
+)
+
+
+class FakeClock:
+    """Часы, которые двигает решение"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCalibrator:
+    """Тесты для Calibrator"""
+
+    def test_power_law(self):
+        """Размер находится интерполяцией по степенному закону"""
+        clock = FakeClock()
+
+        def solution(n):
+            clock.now += 1e-9 * n ** 2
+
+        result = Calibrator(solution, timer=clock).calibrate(
+            "math", "max_factorial", 0.01
+        )
+        assert result.reached
+        assert abs(result.size - 3162) <= 1
+        assert result.exponent == pytest.approx(2.0)
+        assert [sample.size for sample in result.samples][:3] == [16, 32, 64]
+
+    def test_shrinks_from_start(self):
+        """Слишком большой первый размер уменьшается до границы цели"""
+        clock = FakeClock()
+
+        def solution(n):
+            clock.now += 1e-3 * n
+
+        result = Calibrator(solution, timer=clock).calibrate(
+            "math", "max_fibonacci", 0.1, start=1000
+        )
+        assert result.reached
+        assert result.size == 100
+
+        def slow(n):
+            clock.now += 1.0
+
+        result = Calibrator(slow, timer=clock).calibrate("math", "max_fibonacci", 0.1)
+        assert result.size == 1 and not result.reached
+        assert [sample.size for sample in result.samples] == [1, 2, 4, 8, 16]
+
+        result = Calibrator(lambda n: None, timer=clock).calibrate(
+            "math", "max_fibonacci", 0.1, max_size=100
+        )
+        assert result.size == 100 and not result.reached
+
+    def test_limit_and_fresh_inputs(self):
+        """Поиск останавливается на границе параметра, вход не портится"""
+        seen = []
+
+        def solution(data):
+            seen.append(data["array"] == sorted(set(data["array"])))
+            data["array"].reverse()
+
+        result = Calibrator(solution, repeats=2).calibrate(
+            "searching", "max_len", 10.0, start=500
+        )
+        assert not result.reached
+        assert [sample.size for sample in result.samples] == [500, 1000]
+        assert result.size == 1000
+        assert all(seen)
+
+    def test_invalid(self):
+        """Неподдерживаемые задачи и параметры отклоняются"""
+        with pytest.raises(ValueError, match="spec"):
+            size_parameter("spec")
+        with pytest.raises(ValueError, match="max_len"):
+            size_parameter("sorting", "min_len")
+        assert size_parameter("searching", "max_len").oracle({"queries": 5}) == (
+            "searching_many"
+        )
+
+
+class TestCalibrationProfiles:
+    """Тесты для CalibrationProfiles"""
+
+    def test_round_trip(self, tmp_path):
+        """Параметры задачи накапливаются, сохраняются и попадают в генератор"""
+        filename = str(tmp_path / "calibration.json")
+        profiles = CalibrationProfiles(filename)
+        for parameter, size in [("max_factorial", 500), ("max_fibonacci", 900)]:
+            result = CalibrationResult(
+                parameter=parameter, size=size, target=0.5, reached=True
+            )
+            profiles.record("big-math", "math", result, 1.0, 0.5)
+        profiles.save()
+
+        profile = CalibrationProfiles(filename).get("big-math")
+        assert profile.generator_params() == {
+            "max_factorial": 500,
+            "max_fibonacci": 900,
+        }
+        assert profile.machine
+
+        generator = MathGenerator(seed=1, **profile.generator_params())
+        assert generator.max_factorial == 500 and generator.max_fibonacci == 900
+
+        with pytest.raises(ValueError, match="не откалибрована"):
+            CalibrationProfiles(filename).get("other")
+
+    def test_changed_limit_resets(self):
+        """Новое ограничение времени заменяет профиль целиком"""
+        profiles = CalibrationProfiles()
+        result = CalibrationResult(
+            parameter="max_len", size=10, target=0.5, reached=True
+        )
+        profiles.record("p", "searching", result, 1.0, 0.5)
+        result = CalibrationResult(
+            parameter="queries", size=20, target=1.0, reached=True
+        )
+        profile = profiles.record("p", "searching", result, 2.0, 0.5)
+        assert profile.params == {"queries": 20}
@@ -0,0 +1,75 @@
+"""
+Тесты для колоночного экспорта (Arrow и Parquet)
+"""
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.generators.base_generator import TestCase
+from src.generators.math_generator import MathGenerator
+from src.generators.searching_generator import SearchingGenerator
+from src.generators.sorting_generator import SortingGenerator
+from src.utils import columnar
+from src.utils.exporter import Exporter
+from src.utils.loader import load_test_cases
+from src.utils.pipeline import Pipeline
+from src.utils.validator import Validator
+
+
+def dump_all(cases):
+    return [tc.model_dump() for tc in cases]
+
+
+@pytest.mark.parametrize("fmt", columnar.COLUMNAR_FORMATS)
+class TestColumnar:
+    """Тесты для колоночных форматов"""
+
+    def test_round_trip(self, tmp_path, fmt):
+        """Случаи всех генераторов восстанавливаются без потерь"""
+        for generator in (SortingGenerator(), SearchingGenerator()):
+            cases = generator.generate_all(n_normal=20)
+            path = str(tmp_path / f"suite.{fmt}")
+            Exporter.export(cases, path, fmt)
+            assert dump_all(load_test_cases(path)) == dump_all(cases)
+
+    def test_math_tuples_become_lists(self, tmp_path, fmt):
+        """Кортежи записываются как массивы, как и в JSON"""
+        cases = MathGenerator().generate_edge_cases()
+        path = str(tmp_path / f"math.{fmt}")
+        Exporter.export(cases, path, fmt)
+
+        loaded = load_test_cases(path)
+        assert [tc.expected for tc in loaded] == [tc.expected for tc in cases]
+        assert loaded[-1].input == list(cases[-1].input)
+
+    def test_fallback_to_json(self, tmp_path, fmt):
+        """Значения вне int64 и булевы значения сохраняются как JSON"""
+        cases = [
+            TestCase(input=[1, 2 ** 70], expected=True, description="большие"),
+            TestCase(input={"a": 1}, expected=[1.5], description="словарь"),
+        ]
+        path = str(tmp_path / f"mixed.{fmt}")
+        Exporter.export(cases, path, fmt)
+        assert dump_all(load_test_cases(path)) == dump_all(cases)
+
+    def test_pipeline_row_groups(self, tmp_path, fmt):
+        """Конвейер пишет набор фрагментами и считает размер файла"""
+        path = str(tmp_path / f"pipeline.{fmt}")
+        pipeline = Pipeline(SortingGenerator(max_len=20), fmt=fmt, chunk_size=10)
+        stats = pipeline.run(35, path)
+
+        assert stats.bytes_written > 0
+        assert len(load_test_cases(path)) == stats.total_cases
+
+    def test_summarize_matches_coverage(self, tmp_path, fmt):
+        """Агрегаты совпадают с Validator.calculate_coverage"""
+        cases = SortingGenerator().generate_all(n_normal=30)
+        path = str(tmp_path / f"suite.{fmt}")
+        Exporter.export(cases, path, fmt)
+
+        summary = columnar.summarize(path, fmt)
+        coverage = Validator.calculate_coverage(cases)
+        for key, value in coverage.items():
+            assert summary[key] == pytest.approx(value)
+        assert summary["input_length_max"] == max(len(tc.input) for tc in cases)
@@ -0,0 +1,163 @@
+"""
+Тесты для распределенной генерации через очередь фрагментов
+"""
+
+from multiprocessing import get_context
+
+import pytest
+from pydantic import ValidationError
+
+from src.generators import GENERATORS
+from src.utils.append import SuiteManifest
+from src.utils.distributed import (
+    DONE,
+    FAILED,
+    Coordinator,
+    DistributedJob,
+    Worker,
+    open_queue,
+)
+from src.utils.pipeline import Pipeline
+
+
+def run_worker(location, name):
+    """Исполнитель в отдельном процессе"""
+    work_queue = open_queue(location)
+    try:
+        return Worker(work_queue, name=name).run().chunks
+    finally:
+        work_queue.close()
+
+
+class TestDistributed:
+    """Тесты для Coordinator и Worker"""
+
+    @pytest.mark.parametrize("fmt", ["json", "jsonl", "python", "markdown"])
+    def test_matches_pipeline(self, tmp_path, fmt):
+        """Склеенный файл совпадает с файлом конвейера с тем же seed"""
+        work_queue = open_queue(f"sqlite://{tmp_path / 'queue.db'}")
+        coordinator = Coordinator(work_queue)
+        output = str(tmp_path / f"suite.{fmt}")
+        job_id = coordinator.submit(
+            DistributedJob(
+                task_type="searching",
+                output=output,
+                seed=9,
+                normal_cases=45,
+                chunk_size=10,
+                format=fmt,
+            )
+        )
+
+        workers = [Worker(work_queue, name=f"w{i}") for i in range(3)]
+        for worker in workers:
+            worker.run(max_chunks=2)
+        workers[0].run()
+
+        status = coordinator.wait(job_id, timeout=1)
+        assert status.chunks == 6
+        report = coordinator.merge(job_id)
+        assert report.normal_cases == 45
+        assert not (tmp_path / f"suite.{fmt}.shards").exists()
+
+        expected = str(tmp_path / f"expected.{fmt}")
+        Pipeline(GENERATORS["searching"](seed=9), fmt=fmt, chunk_size=7).run(
+            45, expected
+        )
+        with open(output, 'rb') as f, open(expected, 'rb') as g:
+            assert f.read() == g.read()
+
+    def test_lost_chunk_retried(self, tmp_path):
+        """Фрагмент пропавшего исполнителя выдается другому после аренды"""
+        work_queue = open_queue(str(tmp_path / "queue.db"))
+        coordinator = Coordinator(work_queue)
+        job_id = coordinator.submit(
+            DistributedJob(
+                task_type="math",
+                output=str(tmp_path / "suite.jsonl"),
+                seed=1,
+                normal_cases=20,
+                chunk_size=10,
+            )
+        )
+
+        lost = work_queue.claim("lost", lease=0.0)
+        assert lost.seq == 0
+        Worker(work_queue, name="alive").run()
+
+        status = coordinator.wait(job_id, timeout=1)
+        assert status.retries == 1
+        assert all(chunk.worker == "alive" for chunk in work_queue.chunks(job_id))
+
+        coordinator.merge(job_id)
+        manifest = SuiteManifest.load(str(tmp_path / "suite.jsonl"))
+        assert manifest.normal_cases == 20
+        assert manifest.counter_rng and manifest.seed == 1
+
+    def test_failed_chunk(self, tmp_path):
+        """Фрагмент с ошибкой повторяется max_attempts раз, затем задание падает"""
+        work_queue = open_queue(str(tmp_path / "queue.db"))
+        coordinator = Coordinator(work_queue)
+        job_id = coordinator.submit(
+            DistributedJob(
+                task_type="sorting",
+                output=str(tmp_path / "suite.jsonl"),
+                seed=1,
+                params={"unknown": 1},
+                edge_cases=False,
+                max_attempts=2,
+            )
+        )
+
+        report = Worker(work_queue).run()
+        assert report.failures == 2
+        [chunk] = work_queue.chunks(job_id)
+        assert chunk.state == FAILED
+        assert "unknown" in chunk.error
+
+        with pytest.raises(RuntimeError, match="не выполнено"):
+            coordinator.wait(job_id)
+        with pytest.raises(RuntimeError, match="не выполнены фрагменты 0"):
+            coordinator.merge(job_id)
+
+    def test_worker_processes(self, tmp_path):
+        """Исполнители в разных процессах делят фрагменты без повторов"""
+        location = str(tmp_path / "queue.db")
+        work_queue = open_queue(location)
+        coordinator = Coordinator(work_queue)
+        job_id = coordinator.submit(
+            DistributedJob(
+                task_type="sorting",
+                output=str(tmp_path / "suite.jsonl"),
+                seed=4,
+                normal_cases=200,
+                chunk_size=10,
+            )
+        )
+
+        with get_context("spawn").Pool(3) as pool:
+            done = pool.starmap(run_worker, [(location, f"p{i}") for i in range(3)])
+
+        assert sum(done) == 21
+        assert all(chunk.state == DONE for chunk in work_queue.chunks(job_id))
+        assert coordinator.merge(job_id).normal_cases == 200
+
+    def test_invalid_job(self, tmp_path):
+        """Неподдерживаемые задания и очереди отклоняются"""
+        with pytest.raises(ValidationError, match="spec"):
+            DistributedJob(task_type="spec", output="suite.jsonl", seed=1)
+        with pytest.raises(ValidationError, match="parquet"):
+            DistributedJob(
+                task_type="math", output="suite.parquet", seed=1, format="parquet"
+            )
+        with pytest.raises(ValueError, match="неизвестная очередь"):
+            open_queue(f"redis://{tmp_path}")
+
+    def test_rollback_journal(self, tmp_path):
+        """Очередь SQLite не использует WAL, несовместимый с сетевыми ФС"""
+        work_queue = open_queue(str(tmp_path / "q.db"))
+        try:
+            mode = work_queue._connection.execute("PRAGMA journal_mode").fetchone()
+        finally:
+            work_queue.close()
+        assert mode[0] == "delete"
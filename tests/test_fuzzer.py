@@ -0,0 +1,116 @@
+"""
+Тесты для дифференциального фаззинга
+"""
+
+import random
+
+import pytest
+
+from src.generators.math_generator import MathGenerator
+from src.generators.searching_generator import SearchingGenerator
+from src.generators.sorting_generator import SortingGenerator
+from src.utils.fuzzer import (
+    KNOWN_BUGS,
+    DifferentialFuzzer,
+    Mutator,
+    seed_inputs,
+    shrink,
+)
+from src.utils.validator import Validator
+
+
+class TestShrink:
+    """Тесты для shrink и Mutator"""
+
+    def test_shrink_keeps_property(self):
+        """Массив с дубликатом сокращается до двух нулей"""
+        def has_duplicate(arr):
+            return len(set(arr)) < len(arr)
+
+        assert shrink([5, 17, -3, 17, 8], has_duplicate) == [0, 0]
+
+    def test_shrink_related_fields(self):
+        """Связанные поля уменьшаются одновременно"""
+        def found(data):
+            return data["target"] in data["array"]
+
+        smaller = shrink({"array": [4, 97, 120], "target": 97}, found)
+        assert smaller == {"array": [0], "target": 0}
+
+    def test_mutator_keeps_array_sorted(self):
+        """Мутации поиска сохраняют упорядоченность массива"""
+        seed = {"array": [1, 5, 9, 12], "target": 5}
+        mutator = Mutator([seed], random.Random(0))
+
+        for _ in range(500):
+            value = mutator.mutate(seed, rounds=3)
+            assert value["array"] == sorted(value["array"])
+            assert len(value["array"]) <= mutator.max_len
+        assert seed == {"array": [1, 5, 9, 12], "target": 5}
+
+
+class TestDifferentialFuzzer:
+    """Тесты для DifferentialFuzzer"""
+
+    @pytest.mark.parametrize(
+        "generator_class,oracle",
+        [
+            (SearchingGenerator, "searching"),
+            (SortingGenerator, "sorting"),
+            (MathGenerator, "gcd"),
+        ],
+    )
+    def test_finds_known_bugs(self, generator_class, oracle):
+        """Каждая известная ошибка различается небольшим крайним случаем"""
+        random.seed(1)
+        generator = generator_class()
+        reference = generator.ORACLES[oracle]
+        fuzzer = DifferentialFuzzer(reference, KNOWN_BUGS[oracle], seed=0)
+        report = fuzzer.run(seed_inputs(generator, oracle, 20), max_inputs=20000)
+
+        assert report.survivors == []
+        assert set(report.killed) == set(KNOWN_BUGS[oracle])
+        assert len(report.cases) <= len(KNOWN_BUGS[oracle])
+        for case in report.cases:
+            assert case.is_edge_case
+            assert case.expected == reference(case.input)
+            assert len(str(case.input)) < 40
+
+        ok, errors = Validator.validate_test_cases(report.cases)
+        assert ok, errors
+
+    def test_correct_candidate_survives(self):
+        """Верное решение не отличается от эталона"""
+        generator = SortingGenerator(max_len=10)
+        fuzzer = DifferentialFuzzer(sorted, {"copy": lambda arr: sorted(list(arr))})
+        report = fuzzer.run(seed_inputs(generator, "sorting", 5), max_inputs=500)
+
+        assert report.cases == []
+        assert report.survivors == ["copy"]
+        assert report.executed == 500
+
+    def test_invalid_inputs_skipped(self):
+        """Входы, не принятые эталоном, не становятся случаями"""
+        fuzzer = DifferentialFuzzer(
+            MathGenerator.ORACLES["factorial"], KNOWN_BUGS["factorial"], seed=0
+        )
+        report = fuzzer.run([5, 7], max_inputs=2000)
+
+        assert report.invalid > 0
+        assert all(case.input >= 0 for case in report.cases)
+        assert report.cases[0].input == 2
+
+    def test_process_pool(self):
+        """Пакеты проверяются в нескольких процессах"""
+        random.seed(2)
+        generator = SearchingGenerator()
+        fuzzer = DifferentialFuzzer(
+            generator.ORACLES["searching"],
+            KNOWN_BUGS["searching"],
+            batch_size=64,
+            workers=2,
+            seed=0,
+        )
+        report = fuzzer.run(seed_inputs(generator, "searching", 10), max_inputs=5000)
+
+        assert report.survivors == []
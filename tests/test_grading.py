@@ -0,0 +1,115 @@
+"""
+Тесты для прогона решения в пуле прогретых процессов
+"""
+
+import pytest
+
+from src.generators.base_generator import TestCase
+from src.generators.sorting_generator import SortingGenerator
+from src.utils.exporter import Exporter
+from src.utils.grading import GradingRunner
+from src.utils.runner import LatencyStats, SuiteRunner
+
+SUBMISSION = """
+import os
+
+with open(os.environ["GRADING_IMPORTS"], "a") as f:
+    f.write(f"{os.getpid()}\\n")
+
+
+def solve(arr):
+    if arr == [13]:
+        while True:
+            pass
+    if arr == [66]:
+        os._exit(3)
+    if arr == [7]:
+        raise ValueError("плохой вход")
+    if arr == [8]:
+        return [8, 8]
+    return sorted(arr)
+"""
+
+
+@pytest.fixture
+def imports(tmp_path, monkeypatch):
+    """Модуль решения в sys.path; возвращает файл с записями об импорте"""
+    (tmp_path / "submission.py").write_text(SUBMISSION, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    log = tmp_path / "imports.log"
+    monkeypatch.setenv("GRADING_IMPORTS", str(log))
+    return log
+
+
+def make_case(arr):
+    return TestCase(input=arr, expected=sorted(arr), description=f"массив {arr}")
+
+
+class TestGradingRunner:
+    """Тесты для GradingRunner"""
+
+    def test_matches_in_process(self, imports, tmp_path):
+        """Результат совпадает с прогоном в процессе, решение импортируется раз"""
+        suite = str(tmp_path / "suite.jsonl")
+        cases = SortingGenerator(seed=1).generate_all(200)
+        Exporter.to_jsonl(cases, suite)
+
+        report = GradingRunner(
+            "submission:solve", workers=3, batch_size=16, max_cases=50
+        ).run_file(suite)
+        assert report.ok
+        assert report.executed == report.total == len(cases)
+        assert report.latency.count == len(cases)
+        assert report.workers_started > 3 and report.recycled > 0
+        assert len(imports.read_text().split()) == 1
+
+        expected = SuiteRunner(sorted).run_file(suite)
+        assert (report.executed, report.passed) == (expected.executed, expected.passed)
+
+    def test_failures_isolated(self, imports):
+        """Падения, зависания и аварии находятся с точностью до случая"""
+        cases = [make_case([i, 2, 1]) for i in range(40)]
+        for index, arr in [(3, [13]), (10, [66]), (25, [7])]:
+            cases[index] = make_case(arr)
+        cases[30] = TestCase(input=[8], expected=[8], description="неверный ответ")
+
+        report = GradingRunner(
+            "submission:solve", workers=2, batch_size=8, timeout=0.2
+        ).run(cases)
+
+        failures = {failure.index: failure for failure in report.failures}
+        assert sorted(failures) == [3, 10, 25, 30]
+        assert "TimeoutError" in failures[3].error
+        assert "аварийно" in failures[10].error
+        assert failures[25].error == "ValueError: плохой вход"
+        assert failures[30].actual == [8, 8] and failures[30].error is None
+        assert report.passed == 36 and report.lost >= 1
+        assert report.latency.count == 39
+
+    def test_fail_fast(self, imports):
+        """Прогон останавливается, более раннее падение не теряется"""
+        cases = [make_case([i, 1]) for i in range(200)]
+        cases[20] = make_case([7])
+        report = GradingRunner(
+            "submission:solve", workers=2, batch_size=10, fail_fast=True
+        ).run(cases)
+        assert report.aborted
+        assert report.failures[0].index == 20
+        assert report.executed < 200
+
+    def test_load_error(self, imports):
+        """Ошибка импорта решения сообщается до прогона"""
+        with pytest.raises(RuntimeError, match="не удалось загрузить решение"):
+            GradingRunner("submission:missing").run([make_case([1])])
+
+
+class TestLatencyStats:
+    """Тесты для LatencyStats"""
+
+    def test_percentiles(self):
+        """Перцентили по ближайшему рангу"""
+        stats = LatencyStats.from_samples([i / 100 for i in range(100, 0, -1)])
+        assert stats.count == 100
+        assert (stats.p50, stats.p90, stats.p99, stats.max) == (0.5, 0.9, 0.99, 1.0)
+        assert stats.mean == pytest.approx(0.505)
+        assert LatencyStats.from_samples([]).count == 0
@@ -0,0 +1,38 @@
+"""
+Тесты для загрузки наборов тестов
+"""
+
+import pytest
+
+from src.generators.searching_generator import SearchingGenerator
+from src.utils.exporter import Exporter
+from src.utils.loader import detect_format, import_callable, load_test_cases
+
+
+class TestLoader:
+    """Тесты для модуля loader"""
+
+    @pytest.mark.parametrize("fmt,extension", [
+        ("json", "json"),
+        ("jsonl", "jsonl"),
+        ("yaml", "yaml"),
+    ])
+    def test_round_trip(self, tmp_path, fmt, extension):
+        """Загруженный набор совпадает с экспортированным"""
+        cases = SearchingGenerator().generate_all(n_normal=5)
+        path = str(tmp_path / f"suite.{extension}")
+        Exporter.export(cases, path, fmt)
+
+        loaded = load_test_cases(path)
+        assert [c.model_dump() for c in loaded] == [c.model_dump() for c in cases]
+
+    def test_unknown_extension(self):
+        """Неизвестное расширение отклоняется"""
+        with pytest.raises(ValueError):
+            detect_format("suite.py")
+
+    def test_import_callable(self):
+        """Импорт функции по пути module:function"""
+        assert import_callable("builtins:sorted") is sorted
+        with pytest.raises(ValueError):
+            import_callable("builtins.sorted")
@@ -0,0 +1,106 @@
+"""
+Тесты для эталонных решений и кэша ответов
+"""
+
+import random
+
+from src.generators.math_generator import MathGenerator
+from src.generators.oracle import Oracle, OracleCache
+from src.generators.searching_generator import SearchingGenerator
+from src.generators.sorting_generator import SortingGenerator
+
+
+class CountingSolve:
+    """Эталонное решение, считающее свои вызовы"""
+
+    def __init__(self, solve):
+        self.solve = solve
+        self.calls = 0
+
+    def __call__(self, data):
+        self.calls += 1
+        return self.solve(data)
+
+
+class TestOracleCache:
+    """Тесты для Oracle и OracleCache"""
+
+    def test_answers_are_cached(self):
+        """Повторный запрос берется из кэша"""
+        solve = CountingSolve(sorted)
+        oracle = Oracle(solve, name="sort", cache=OracleCache())
+
+        assert oracle.lookup([3, 1, 2]) == ([1, 2, 3], False)
+        assert oracle.lookup([3, 1, 2]) == ([1, 2, 3], True)
+        assert solve.calls == 1
+
+    def test_persistent_between_runs(self, tmp_path):
+        """Ответы сохраняются в файле и доступны после переоткрытия"""
+        path = str(tmp_path / "oracle.sqlite")
+        cache = OracleCache(path)
+        Oracle(sorted, name="sort", cache=cache)([2, 1])
+        cache.close()
+
+        solve = CountingSolve(sorted)
+        cache = OracleCache(path)
+        assert Oracle(solve, name="sort", cache=cache)([2, 1]) == [1, 2]
+        assert solve.calls == 0
+        assert len(cache) == 1
+        cache.close()
+
+    def test_version_invalidates(self):
+        """Смена версии оракула не использует старые ответы"""
+        cache = OracleCache()
+        Oracle(sorted, name="sort", version="1", cache=cache)([2, 1])
+
+        solve = CountingSolve(sorted)
+        Oracle(solve, name="sort", version="2", cache=cache)([2, 1])
+        assert solve.calls == 1
+
+
+class TestGeneratorOracles:
+    """Тесты для оракулов генераторов"""
+
+    def test_set_oracle(self):
+        """Замененное эталонное решение используется генератором"""
+        generator = SortingGenerator(min_len=1, max_len=5)
+        generator.set_oracle("sorting", lambda arr: sorted(arr, reverse=True))
+
+        for case in generator.generate_normal_cases(5):
+            assert case.expected == sorted(case.input, reverse=True)
+
+    def test_edge_cases_use_oracle(self):
+        """Крайний случай с большими числами тоже считается эталоном"""
+        generator = SortingGenerator()
+        generator.set_oracle("sorting", lambda arr: sorted(arr, reverse=True))
+
+        case = [
+            c for c in generator.generate_edge_cases() if "большими" in c.description
+        ][0]
+        assert case.expected == sorted(case.input, reverse=True)
+
+    def test_regeneration_hits_cache(self, tmp_path):
+        """Повторная генерация с тем же seed не вызывает эталон"""
+        path = str(tmp_path / "oracle.sqlite")
+        generator = SearchingGenerator()
+        solve = CountingSolve(generator.ORACLES["searching"])
+        generator.set_oracle("searching", solve)
+        generator.use_oracle_cache(path)
+
+        random.seed(1)
+        first = generator.generate_normal_cases(20)
+        random.seed(1)
+        second = generator.generate_normal_cases(20)
+
+        assert solve.calls == 20
+        assert [c.expected for c in first] == [c.expected for c in second]
+        assert generator.counters["oracle.cache_hits"] == 20
+        generator.oracle_cache.close()
+
+    def test_math_oracles(self):
+        """Ожидаемые результаты математических задач не изменились"""
+        generator = MathGenerator()
+        generator.use_oracle_cache(OracleCache())
+        assert generator._expected("fibonacci", 10) == 55
+        assert generator._expected("gcd", (12, 18)) == 6
+        assert generator._expected("factorial", 5) == 120
@@ -0,0 +1,137 @@
+"""
+Тесты для конвейера генерации
+"""
+
+import json
+
+import pytest
+import yaml
+
+from src.generators.base_generator import BaseGenerator, TestCase
+from src.generators.math_generator import MathGenerator
+from src.generators.sorting_generator import SortingGenerator
+from src.utils.exporter import Exporter
+from src.utils.pipeline import Pipeline
+
+
+class FailingGenerator(BaseGenerator):
+    """Генератор, падающий на втором фрагменте"""
+
+    def generate_normal_cases(self, n, start=0):
+        if start > 0:
+            raise RuntimeError("сбой генерации")
+        return [TestCase(input=i, expected=i, description="x") for i in range(n)]
+
+    def generate_edge_cases(self):
+        return []
+
+
+class TestPipeline:
+    """Тесты для Pipeline"""
+
+    @pytest.mark.parametrize("fmt", ["json", "yaml", "python"])
+    def test_chunked_output_is_valid(self, tmp_path, fmt):
+        """Тест что фрагменты собираются в корректный файл"""
+        output = tmp_path / f"cases.{fmt}"
+        pipeline = Pipeline(
+            SortingGenerator(min_len=1, max_len=10),
+            fmt=fmt,
+            chunk_size=3,
+            generator_workers=2,
+            serializer_workers=2,
+            queue_size=2,
+        )
+        stats = pipeline.run(10, str(output))
+
+        text = output.read_text(encoding="utf-8")
+        assert stats.normal_cases == 10
+        assert stats.edge_cases >= 5
+        assert stats.bytes_written == len(text.encode("utf-8"))
+
+        if fmt == "json":
+            data = json.loads(text)
+        elif fmt == "yaml":
+            data = yaml.safe_load(text)
+        else:
+            assert text.count("def test_case_") == stats.total_cases
+            assert f"def test_case_{stats.total_cases - 1:03d}" in text
+            return
+
+        assert len(data) == stats.total_cases
+        descriptions = [c["description"] for c in data[:10]]
+        assert descriptions[9].startswith("Нормальный случай 10:")
+        assert all(c["is_edge_case"] for c in data[10:])
+
+    def test_stage_stats(self, tmp_path):
+        """Тест статистики стадий"""
+        stats = Pipeline(MathGenerator(), chunk_size=4).run(
+            10, str(tmp_path / "m.json"), include_edge_cases=False
+        )
+
+        names = [stage.name for stage in stats.stages]
+        assert names == ["generation", "serialization", "write"]
+        assert all(stage.chunks == 3 for stage in stats.stages)
+        assert all(stage.cases == 10 for stage in stats.stages)
+
+    def test_empty_suite(self, tmp_path):
+        """Тест пустого набора"""
+        output = tmp_path / "empty.json"
+        Pipeline(MathGenerator()).run(0, str(output), include_edge_cases=False)
+
+        assert json.loads(output.read_text(encoding="utf-8")) == []
+
+    def test_error_propagates(self, tmp_path):
+        """Тест что ошибка стадии не подвешивает конвейер"""
+        pipeline = Pipeline(FailingGenerator(), chunk_size=2, queue_size=1)
+
+        with pytest.raises(RuntimeError, match="сбой генерации"):
+            pipeline.run(10, str(tmp_path / "f.json"))
+
+    def test_unsupported_format(self):
+        """Тест неподдерживаемого формата"""
+        with pytest.raises(ValueError):
+            Pipeline(MathGenerator(), fmt="xml")
+        with pytest.raises(ValueError):
+            Pipeline(MathGenerator(), fmt=["json", "json"])
+
+    def test_multiple_formats(self, tmp_path):
+        """Тест что набор, сгенерированный один раз, пишется во все форматы"""
+        formats = ["json", "yaml", "python", "markdown"]
+        cases = SortingGenerator(min_len=1, max_len=10).generate_all(n_normal=7)
+
+        class FixedGenerator(BaseGenerator):
+            calls = 0
+
+            def generate_normal_cases(self, n, start=0):
+                FixedGenerator.calls += 1
+                return cases[start:start + n]
+
+            def generate_edge_cases(self):
+                return cases[7:]
+
+        stats = Pipeline(FixedGenerator(), fmt=formats, chunk_size=3).run(
+            7, str(tmp_path / "suite.json")
+        )
+
+        assert FixedGenerator.calls == 3
+        names = [stage.name for stage in stats.stages]
+        assert names[2:] == [f"write.{fmt}" for fmt in formats]
+        for fmt in formats:
+            path = tmp_path / f"suite{Exporter.EXTENSIONS[fmt]}"
+            text = path.read_text(encoding="utf-8")
+            assert text == Exporter.dumps(cases, fmt)
+            assert stats.files[str(path)] == len(text.encode("utf-8"))
+        assert stats.bytes_written == sum(stats.files.values())
+
+    def test_chunks_match_full_dump(self):
+        """Тест что фрагменты Exporter совпадают с полной сериализацией"""
+        cases = SortingGenerator().generate_all(n_normal=5)
+
+        for fmt in Exporter.STREAMING_FORMATS:
+            streamed = (
+                Exporter.header(fmt)
+                + Exporter.dumps_chunk(cases[:4], fmt, 0)
+                + Exporter.dumps_chunk(cases[4:], fmt, 4)
+                + Exporter.footer(fmt, len(cases))
+            )
+            assert streamed == Exporter.dumps(cases, fmt)
@@ -0,0 +1,97 @@
+"""
+Тесты для планировщика набора тестов
+"""
+
+import pytest
+
+from src.generators.base_generator import TestCase
+from src.generators.sorting_generator import SortingGenerator
+from src.utils.planner import CostModel, SuitePlanner, input_size
+
+
+def make_case(size, weight=1.0, edge=False):
+    return TestCase(
+        input=list(range(size)),
+        expected=list(range(size)),
+        description=f"массив из {size}",
+        is_edge_case=edge,
+        weight=weight,
+    )
+
+
+class TestCostModel:
+    """Тесты для CostModel"""
+
+    def test_input_size(self):
+        """Размер считается по скалярным значениям"""
+        assert input_size(5) == 1
+        assert input_size([]) == 1
+        assert input_size([1, 2, 3]) == 3
+        assert input_size({"array": [1, 2, 3], "target": 2}) == 4
+        assert input_size([[1, 2], [3]]) == 3
+
+    def test_fit_recovers_linear_model(self):
+        """Подбор восстанавливает коэффициенты линейной зависимости"""
+        samples = [(size, 0.01 + 2e-6 * size) for size in (10, 100, 1000, 5000)]
+        model = CostModel.fit(samples)
+        assert model.overhead == pytest.approx(0.01)
+        assert model.per_unit == pytest.approx(2e-6)
+
+    def test_calibrate_with_reference(self):
+        """Калибровка по эталонному решению дает неотрицательную модель"""
+        cases = [make_case(size) for size in (10, 1000, 100000)]
+        model = CostModel.calibrate(cases, sorted, sample=3, repeats=1)
+        assert model.overhead >= 0
+        assert model.per_unit >= 0
+
+
+class TestSuitePlanner:
+    """Тесты для SuitePlanner"""
+
+    def test_respects_budget(self):
+        """Суммарная оценка времени не превышает бюджет"""
+        model = CostModel(overhead=0.0, per_unit=1.0)
+        cases = [make_case(size) for size in (5, 3, 8, 2, 7)]
+        plan = SuitePlanner(10, cost_model=model).plan(cases)
+
+        assert plan.total_cost <= 10
+        assert plan.skipped == len(cases) - len(plan.cases)
+        assert 0 < plan.coverage < 1
+
+    def test_prefers_weight_per_cost(self):
+        """Отбираются случаи с большим весом на единицу времени"""
+        model = CostModel(overhead=0.0, per_unit=1.0)
+        cases = [make_case(10, weight=1.0), make_case(10, weight=5.0)]
+        plan = SuitePlanner(10, cost_model=model).plan(cases)
+        assert plan.indices == [1]
+
+    def test_single_valuable_case(self):
+        """Один ценный дорогой случай предпочитается мелким дешевым"""
+        model = CostModel(overhead=0.0, per_unit=1.0)
+        cases = [make_case(1, weight=1.0), make_case(10, weight=100.0)]
+        plan = SuitePlanner(10, cost_model=model).plan(cases)
+        assert plan.indices == [1]
+
+    def test_edge_cases_first(self):
+        """Крайние случаи идут первыми, дешевые раньше дорогих"""
+        model = CostModel(overhead=0.0, per_unit=1.0)
+        cases = [
+            make_case(2),
+            make_case(5, edge=True),
+            make_case(1, edge=True),
+        ]
+        plan = SuitePlanner(100, cost_model=model).plan(cases)
+        assert plan.indices == [2, 1, 0]
+
+    def test_generated_suite(self):
+        """План для сгенерированного набора помещается в бюджет"""
+        cases = SortingGenerator(adversarial_size=1000).generate_all(n_normal=20)
+        plan = SuitePlanner(0.03).plan(cases)
+
+        assert plan.total_cost <= 0.03
+        assert plan.cases[0].is_edge_case
+
+    def test_invalid_budget(self):
+        """Неположительный бюджет отклоняется"""
+        with pytest.raises(ValueError):
+            SuitePlanner(0)
@@ -0,0 +1,98 @@
+"""
+Тесты для профилировщика
+"""
+
+import json
+import os
+
+import pytest
+
+from src.generators.math_generator import MathGenerator
+from src.generators.searching_generator import SearchingGenerator
+from src.utils.pipeline import Pipeline
+from src.utils.profiling import Profiler
+
+
+class TestProfiler:
+    """Тесты для Profiler"""
+
+    def test_timers_and_counters(self):
+        """Тест таймеров и счетчиков"""
+        profiler = Profiler()
+
+        with profiler.timer("work"):
+            pass
+        with profiler.timer("work"):
+            pass
+        profiler.count("cases", 3)
+        profiler.count("cases")
+
+        data = profiler.to_dict()
+        assert data["timers"]["work"]["calls"] == 2
+        assert data["timers"]["work"]["min"] <= data["timers"]["work"]["max"]
+        assert data["counters"]["cases"] == 4
+
+    def test_instrument_math_generator(self):
+        """Тест таймеров для отдельных методов генератора"""
+        generator = MathGenerator()
+        profiler = Profiler()
+        profiler.instrument(generator)
+
+        generator.generate_normal_cases(50)
+
+        timers = profiler.to_dict()["timers"]
+        assert timers["generator.generate_normal_cases"]["calls"] == 1
+        per_task = [
+            timer["calls"]
+            for name, timer in timers.items()
+            if name.startswith("generator._generate_")
+        ]
+        assert sum(per_task) == 50
+
+    def test_collect_retries(self):
+        """Тест переноса счетчиков повторов выборки"""
+        generator = SearchingGenerator(min_len=900, max_len=900)
+        generator.generate_normal_cases(1)
+
+        profiler = Profiler()
+        profiler.collect(generator)
+
+        assert profiler.counters["generator.retries.unique_values"] > 0
+
+    def test_prometheus_format(self):
+        """Тест текстового формата Prometheus"""
+        profiler = Profiler()
+        profiler.add_time("stage.write", 0.5)
+        profiler.count("bytes.written", 10)
+
+        text = profiler.to_prometheus()
+        assert 'testgen_timer_seconds_total{name="stage.write"} 0.500000000' in text
+        assert 'testgen_counter_total{name="bytes.written"} 10' in text
+
+    def test_pipeline_profile_dump(self, tmp_path):
+        """Тест профилирования конвейера с cProfile и tracemalloc"""
+        profiler = Profiler(cprofile=True, trace_memory=True)
+        generator = MathGenerator()
+        profiler.instrument(generator)
+
+        profiler.start()
+        Pipeline(generator, chunk_size=10, validate=True, profiler=profiler).run(
+            30, str(tmp_path / "m.json")
+        )
+        profiler.stop()
+
+        out = tmp_path / "profile.json"
+        profiler.dump(str(out))
+        data = json.loads(out.read_text(encoding="utf-8"))
+
+        for stage in ("generation", "validation", "serialization", "write"):
+            assert data["timers"][f"stage.{stage}"]["calls"] == 4
+        assert data["counters"]["cases.normal"] == 30
+        assert data["counters"]["bytes.written"] == os.path.getsize(tmp_path / "m.json")
+        assert data["counters"]["memory.peak_bytes"] > 0
+        assert (tmp_path / "profile.json.pstats").exists()
+
+    def test_unknown_format(self, tmp_path):
+        """Тест неизвестного формата"""
+        with pytest.raises(ValueError):
+            Profiler().dump(str(tmp_path / "p.json"), fmt="xml")
@@ -0,0 +1,166 @@
+"""
+Тесты для внешней эталонной программы
+"""
+
+import sys
+
+import pytest
+
+from src.generators.searching_generator import SearchingGenerator
+from src.generators.sorting_generator import SortingGenerator
+from src.utils.reference import ReferencePool, encode_tokens
+
+# Сортировка входов в кодировке tokens: "длина" и "элементы" по строкам
+SORT_TOKENS = """
+import sys
+read = sys.stdin.readline
+while True:
+    line = read()
+    if not line:
+        break
+    answers = []
+    for _ in range(int(line)):
+        read()
+        answers.append(" ".join(map(str, sorted(map(int, read().split())))))
+    sys.stdout.write("".join(answer + "\\n" for answer in answers) + "#end\\n")
+    sys.stdout.flush()
+"""
+
+# Сортировка входов JSON; при аргументе once обрабатывает один пакет,
+# при аргументе debug печатает лишнюю строку в пакетах из 3 входов
+SORT_JSON = """
+import json, sys
+while True:
+    line = sys.stdin.readline()
+    if not line:
+        break
+    if sys.argv[1:] == ["debug"] and int(line) == 3:
+        print("отладка")
+    for _ in range(int(line)):
+        print(json.dumps(sorted(json.loads(sys.stdin.readline()))))
+    print("#end")
+    sys.stdout.flush()
+    if sys.argv[1:] == ["once"]:
+        break
+"""
+
+CRASH = """
+import sys
+sys.stdin.readline()
+sys.stderr.write("сбой решения\\n")
+sys.exit(3)
+"""
+
+HANG = """
+import sys, time
+sys.stdin.readline()
+time.sleep(30)
+"""
+
+
+def program(tmp_path, name, source, *args):
+    """Команда запуска скрипта текущим интерпретатором"""
+    path = tmp_path / f"{name}.py"
+    path.write_text(source, encoding="utf-8")
+    return [sys.executable, str(path), *args]
+
+
+class TestReferencePool:
+    """Тесты для ReferencePool"""
+
+    def test_encode_tokens(self):
+        """Массивы кодируются длиной и элементами, словари - по значениям"""
+        assert encode_tokens(5) == "5"
+        assert encode_tokens([3, 1]) == "2\n3 1"
+        assert encode_tokens({"array": [1, 2], "target": 2}) == "2\n1 2\n2"
+
+    @pytest.mark.parametrize("processes", [1, 3])
+    def test_persistent_json(self, tmp_path, processes):
+        """Ответы приходят в порядке входов при любом числе процессов"""
+        inputs = [[i % 7, -i, 3] for i in range(50)]
+        with ReferencePool(
+            program(tmp_path, "sort", SORT_JSON), processes=processes, batch_size=8
+        ) as pool:
+            assert pool.solve_many(inputs) == [sorted(data) for data in inputs]
+            assert pool.solve([2, 1]) == [1, 2]
+
+    def test_tokens(self, tmp_path):
+        """Кодировка tokens с ответом ints"""
+        inputs = [[5, 4, 3], [], [1]]
+        with ReferencePool(
+            program(tmp_path, "sort", SORT_TOKENS), encoding="tokens", answer="ints"
+        ) as pool:
+            assert pool.solve_many(inputs) == [[3, 4, 5], [], [1]]
+
+    def test_oneshot(self, tmp_path):
+        """Без persistent каждый пакет получает новый процесс"""
+        command = program(tmp_path, "sort", SORT_JSON, "once")
+        pool = ReferencePool(command, processes=2, batch_size=3, persistent=False)
+        assert pool.solve_many([[2, 1]] * 10) == [[1, 2]] * 10
+
+    def test_batch_framing(self, tmp_path):
+        """Лишняя строка вывода - ошибка пакета, а не сдвиг ответов"""
+        command = program(tmp_path, "sort", SORT_JSON, "debug")
+        with ReferencePool(command, processes=1, batch_size=4) as pool:
+            with pytest.raises(RuntimeError, match="4 ответов вместо 3"):
+                pool.solve_many([[2, 1]] * 7)
+            assert pool.solve_many([[3, 1], [2, 1]]) == [[1, 3], [1, 2]]
+
+    def test_crash(self, tmp_path):
+        """Ошибка программы сообщается вместе с ее stderr"""
+        with ReferencePool(program(tmp_path, "crash", CRASH)) as pool:
+            with pytest.raises(RuntimeError, match="сбой решения"):
+                pool.solve([1])
+
+    def test_timeout(self, tmp_path):
+        """Зависшая программа прерывается по таймауту"""
+        with ReferencePool(program(tmp_path, "hang", HANG), timeout=0.5) as pool:
+            with pytest.raises(TimeoutError):
+                pool.solve([1])
+
+
+class TestBatchedOracle:
+    """Тесты для пакетного вычисления ожидаемых результатов генератора"""
+
+    def test_generator_batches(self, tmp_path):
+        """Случаи совпадают со встроенным оракулом, кэш отвечает без программы"""
+        expected = SortingGenerator(seed=2).generate_normal_cases(30)
+
+        generator = SortingGenerator(seed=2)
+        calls = []
+        with ReferencePool(
+            program(tmp_path, "sort", SORT_TOKENS), encoding="tokens", answer="ints"
+        ) as pool:
+
+            def solve_many(inputs):
+                calls.append(len(inputs))
+                return pool.solve_many(inputs)
+
+            generator.set_oracle("sorting", pool.solve, solve_many=solve_many)
+            generator.use_oracle_cache(str(tmp_path / "oracle.sqlite"))
+            assert generator.generate_normal_cases(30) == expected
+            assert calls == [30]
+
+            assert generator.generate_normal_cases(30) == expected
+            assert calls == [30]
+            assert generator.counters["oracle.cache_hits"] == 30
+            generator.oracle_cache.close()
+
+    def test_searching_queries(self, tmp_path):
+        """Пакетные ответы на запросы поиска подставляются в случаи"""
+        expected = SearchingGenerator(queries=5, seed=1).generate_normal_cases(10)
+
+        generator = SearchingGenerator(queries=5, seed=1)
+        oracle = generator.ORACLES["searching_many"]
+        generator.set_oracle(
+            "searching_many",
+            oracle,
+            solve_many=lambda inputs: [oracle(data) for data in inputs],
+        )
+        cases = generator.generate_normal_cases(10)
+        assert [case.expected for case in cases] == [
+            case.expected for case in expected
+        ]
+        assert [case.description for case in cases] == [
+            case.description for case in expected
+        ]
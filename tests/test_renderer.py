@@ -0,0 +1,129 @@
+"""
+Тесты для формирования условий задач по шаблонам
+"""
+
+import os
+from array import array
+
+import pytest
+
+from src.generators import GENERATORS, SpecGenerator
+from src.generators.base_generator import TestCase
+from src.utils import renderer
+from src.utils.batch import BatchJob, BatchRunner
+from src.utils.renderer import (
+    Template,
+    default_template,
+    format_value,
+    load_template,
+    render_statement,
+    select_samples,
+    statement_context,
+)
+
+
+class TestTemplate:
+    """Тесты для Template и кэша шаблонов"""
+
+    def test_render(self):
+        """Подстановки заменяются значениями, пробелы внутри скобок допустимы"""
+        template = Template("Тестов: {{total_cases}}, крайних: {{ edge_cases }}.")
+
+        assert template.fields == {"total_cases", "edge_cases"}
+        assert template.render({"total_cases": 5, "edge_cases": 2}) == (
+            "Тестов: 5, крайних: 2."
+        )
+
+    def test_missing_field(self):
+        """Незаданная подстановка - ошибка с ее именем"""
+        with pytest.raises(ValueError, match="samples"):
+            Template("{{ samples }}").render({})
+
+    def test_cache_until_modified(self, tmp_path):
+        """Шаблон разбирается повторно только после изменения файла"""
+        path = tmp_path / "t.md"
+        path.write_text("a {{ x }}", encoding="utf-8")
+
+        first = load_template(str(path))
+        assert load_template(str(path)) is first
+
+        path.write_text("b {{ x }}", encoding="utf-8")
+        os.utime(path, (0, os.path.getmtime(path) + 10))
+        assert load_template(str(path)).render({"x": 1}) == "b 1"
+        renderer._TEMPLATE_CACHE.clear()
+
+
+class TestSamples:
+    """Тесты раздела примеров"""
+
+    def test_format_value(self):
+        """Длинные массивы и числа сокращаются, словари раскрываются"""
+        assert format_value(list(range(5))) == "[0, 1, 2, 3, 4]"
+        assert format_value(array('q', range(100)), max_items=4) == (
+            "[0, 1, 2, ..., 99] (100 элементов)"
+        )
+        assert format_value({"array": [1, 2], "target": 2}) == (
+            "array = [1, 2], target = 2"
+        )
+        assert format_value((48, 18)) == "(48, 18)"
+        assert format_value(10**300, max_chars=10) == "1000000000... (301 символов)"
+
+    def test_select_samples(self):
+        """Наименьший обычный случай и наименьшие крайние"""
+        cases = [
+            TestCase(input=[3, 2, 1], expected=[1, 2, 3], description="обычный 3"),
+            TestCase(input=[2, 1], expected=[1, 2], description="обычный 2"),
+            TestCase(input=[], expected=[], description="пустой", is_edge_case=True),
+        ]
+
+        samples = select_samples(cases, 3)
+        descriptions = [tc.description for tc in samples]
+        assert descriptions == ["обычный 2", "пустой", "обычный 3"]
+
+    @pytest.mark.parametrize("task_type", ["sorting", "searching", "math"])
+    def test_default_templates(self, task_type):
+        """Шаблоны задач из templates заполняются полностью"""
+        cases = GENERATORS[task_type]().generate_all(5)
+        text = render_statement(default_template(task_type), cases, samples=2)
+
+        assert "{{" not in text
+        assert "# Пример 2:" in text and "# Пример 3:" not in text
+        assert f"проверяется на {len(cases)} тестах" in text
+
+    def test_spec_template(self):
+        """Шаблон spec получает название и описание из спецификации"""
+        generator = SpecGenerator("examples/binary_search_spec.yaml")
+        cases = generator.generate_all(5)
+        text = render_statement(
+            default_template("spec"),
+            cases,
+            context=statement_context(generator),
+        )
+
+        assert "{{" not in text
+        assert "# Задание: binary_search" in text
+        assert generator.spec.description in text
+
+
+class TestBatchStatements:
+    """Тесты формирования условий в пакетной генерации"""
+
+    def test_statement_from_same_cases(self, tmp_path):
+        """Условие строится по тем же случаям, что и набор тестов"""
+        template = tmp_path / "t.md"
+        template.write_text("{{ total_cases }}\n{{ samples }}\n", encoding="utf-8")
+        job = BatchJob(
+            task_type="sorting",
+            normal_cases=4,
+            output=str(tmp_path / "tests.json"),
+            statement=str(tmp_path / "p" / "statement.md"),
+            template=str(template),
+            samples=1,
+        )
+
+        report = BatchRunner([job], workers=1).run()
+
+        result = report.results[0]
+        text = (tmp_path / "p" / "statement.md").read_text(encoding="utf-8")
+        assert text.startswith(f"{result.cases}\n```python\n# Пример 1:")
+        assert result.statement_bytes == len(text.encode("utf-8"))
@@ -0,0 +1,118 @@
+"""
+Тесты для счетчикового генератора и произвольного доступа к случаям
+"""
+
+import json
+import random
+
+import pytest
+
+from src.generators.base_generator import BaseGenerator
+from src.generators.math_generator import MathGenerator
+from src.generators.rng import case_rng, derive_seed
+from src.generators.searching_generator import SearchingGenerator
+from src.generators.spec_generator import SpecGenerator
+from src.generators.sorting_generator import SortingGenerator
+from src.utils.append import SuiteAppender, SuiteManifest
+from src.utils.exporter import Exporter
+from src.utils.pipeline import Pipeline
+
+
+GENERATOR_CLASSES = [SortingGenerator, SearchingGenerator, MathGenerator]
+
+
+def dump(cases):
+    return [case.model_dump() for case in cases]
+
+
+class TestDeriveSeed:
+    """Тесты для derive_seed и case_rng"""
+
+    def test_pure_function(self):
+        """Начальное значение зависит только от (seed, номер, поток)"""
+        assert derive_seed(42, 7) == derive_seed(42, 7)
+        assert len({derive_seed(42, 7), derive_seed(42, 8), derive_seed(43, 7)}) == 3
+        assert derive_seed(42, 7, stream=1) != derive_seed(42, 7)
+        assert 0 <= derive_seed(2**100, -1) < 2**64
+
+    def test_without_seed(self):
+        """Без seed используется глобальный random"""
+        assert case_rng(None, 5) is random
+        assert case_rng(1, 5).random() == case_rng(1, 5).random()
+
+
+class TestRandomAccess:
+    """Тесты для BaseGenerator.generate_case"""
+
+    @pytest.mark.parametrize("generator_class", GENERATOR_CLASSES)
+    def test_case_matches_suite(self, generator_class):
+        """Случай k совпадает с k-м случаем набора при любом состоянии random"""
+        generator = generator_class(seed=11)
+        random.seed(1)
+        suite = generator.generate_normal_cases(30)
+        random.seed(2)
+
+        assert dump([generator.generate_case(17)]) == dump(suite[17:18])
+        assert dump(generator.generate_normal_cases(10, start=20)) == dump(suite[20:])
+        assert dump(generator.iter_cases(3, 6)) == dump(suite[3:6])
+
+    def test_seed_changes_suite(self):
+        """Разные seed и попытки дают разные случаи"""
+        cases = [
+            SortingGenerator(seed=1).generate_case(5),
+            SortingGenerator(seed=2).generate_case(5),
+            SortingGenerator(seed=1).generate_case(5, attempt=1),
+        ]
+        assert len({json.dumps(case.model_dump()) for case in cases}) == 3
+
+    def test_requires_seed(self):
+        """Без seed произвольный доступ недоступен"""
+        with pytest.raises(ValueError, match="seed"):
+            MathGenerator().generate_case(0)
+
+    def test_batch_only_generator(self):
+        """Генератор без _generate_case не поддерживает произвольный доступ"""
+
+        class BatchOnly(BaseGenerator):
+            def generate_normal_cases(self, n, start=0):
+                return []
+
+            def generate_edge_cases(self):
+                return []
+
+        BatchOnly.seed = 1
+        assert not BatchOnly.supports_random_access()
+        assert not SpecGenerator.supports_random_access()
+        assert all(cls.supports_random_access() for cls in GENERATOR_CLASSES)
+        with pytest.raises(NotImplementedError, match="BatchOnly"):
+            BatchOnly().generate_case(0)
+
+    def test_parallel_pipeline(self, tmp_path):
+        """Результат конвейера не зависит от числа потоков и размера фрагментов"""
+        outputs = []
+        for workers, chunk_size in ((1, 50), (4, 7)):
+            filename = str(tmp_path / f"suite_{workers}.jsonl")
+            pipeline = Pipeline(
+                SearchingGenerator(seed=5),
+                fmt="jsonl",
+                chunk_size=chunk_size,
+                generator_workers=workers,
+            )
+            pipeline.run(200, filename)
+            with open(filename, "r", encoding="utf-8") as f:
+                outputs.append(f.read())
+
+        assert outputs[0] == outputs[1]
+
+    def test_append_by_index(self, tmp_path):
+        """Дозапись продолжает набор по seed из манифеста"""
+        path = str(tmp_path / "suite.jsonl")
+        Exporter.to_jsonl(MathGenerator(seed=3).generate_normal_cases(10), path)
+        SuiteManifest.record(path, 10, 0, task_type="math", seed=3, counter_rng=True)
+
+        random.seed(0)
+        SuiteAppender(MathGenerator(), path, task_type="math").append(25)
+
+        expected = MathGenerator(seed=3).generate_normal_cases(25)
+        with open(path, "r", encoding="utf-8") as f:
+            assert f.read() == Exporter.dumps(expected, "jsonl")
@@ -0,0 +1,105 @@
+"""
+Тесты для прогона решений на наборе тестов
+"""
+
+import pytest
+
+from src.generators.base_generator import TestCase
+from src.generators.sorting_generator import SortingGenerator
+from src.utils.exporter import Exporter
+from src.utils.runner import FailureHistory, SuiteRunner, order_cases
+
+
+def make_case(arr, edge=False):
+    return TestCase(
+        input=arr,
+        expected=sorted(arr),
+        description=f"массив {arr}",
+        is_edge_case=edge,
+    )
+
+
+@pytest.fixture
+def cases():
+    return [
+        make_case([3, 2, 1, 0]),
+        make_case([2, 1]),
+        make_case([], edge=True),
+        make_case([5, 4, 3], edge=True),
+    ]
+
+
+class TestOrdering:
+    """Тесты для стратегий порядка прогона"""
+
+    def test_edge_first(self, cases):
+        """Крайние случаи идут первыми с сохранением порядка"""
+        ordered = order_cases(cases, "edge_first")
+        assert ordered == [cases[2], cases[3], cases[0], cases[1]]
+
+    def test_size_ascending(self, cases):
+        """Случаи упорядочены по размеру входных данных"""
+        ordered = order_cases(cases, "size_ascending")
+        assert [len(tc.input) for tc in ordered] == [0, 2, 3, 4]
+
+    def test_failure_rate(self, cases, tmp_path):
+        """Чаще падавшие случаи идут первыми, история сохраняется"""
+        path = str(tmp_path / "history.json")
+        history = FailureHistory(path)
+        for _ in range(3):
+            history.record(cases[1], failed=True)
+            history.record(cases[2], failed=False)
+        history.save()
+
+        ordered = order_cases(cases, "failure_rate", FailureHistory(path))
+        assert ordered[0] == cases[1]
+        assert ordered[-1] == cases[2]
+
+    def test_unknown_ordering(self, cases):
+        """Неизвестная стратегия отклоняется"""
+        with pytest.raises(ValueError):
+            order_cases(cases, "random")
+
+
+class TestSuiteRunner:
+    """Тесты для SuiteRunner"""
+
+    def test_correct_solution(self, cases):
+        """Верное решение проходит все случаи"""
+        report = SuiteRunner(sorted).run(cases)
+        assert report.ok
+        assert report.executed == report.passed == len(cases)
+
+    def test_fail_fast(self, cases):
+        """С fail_fast прогон останавливается на первом падении"""
+        report = SuiteRunner(list, ordering="edge_first", fail_fast=True).run(cases)
+
+        assert report.aborted
+        assert report.executed == 2
+        assert report.failures[0].index == 3
+
+    def test_exceptions_are_failures(self, cases):
+        """Исключение в решении считается падением"""
+        def broken(arr):
+            raise RuntimeError("сломано")
+
+        report = SuiteRunner(broken).run(cases)
+        assert report.failed == len(cases)
+        assert "RuntimeError" in report.failures[0].error
+
+    def test_history_updated(self, cases):
+        """Прогон обновляет историю падений"""
+        history = FailureHistory()
+        SuiteRunner(list, history=history).run(cases)
+        assert history.failure_rate(cases[0]) > history.failure_rate(cases[2])
+
+    def test_run_file_streams(self, tmp_path):
+        """Набор из файла читается потоково до первого падения"""
+        path = str(tmp_path / "suite.jsonl")
+        Exporter.to_jsonl(SortingGenerator().generate_all(n_normal=10), path)
+
+        assert SuiteRunner(sorted).run_file(path).ok
+
+        report = SuiteRunner(lambda arr: [], fail_fast=True).run_file(path)
+        assert report.aborted
+        assert report.executed < 10
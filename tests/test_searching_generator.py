@@ -106,4 +106,54 @@ class TestSearchingGenerator:
             arr = case.input["array"]
             # Проверяем что все элементы уникальны
             assert len(arr) == len(set(arr)), \
-                f"Массив содержит дубликаты: {arr}"
\ No newline at end of file
+                f"Массив содержит дубликаты: {arr}"
+
+
+class TestMultiQuery:
+    """Тесты для случаев с несколькими запросами к одному массиву"""
+
+    def test_first_occurrence_answers(self):
+        """Ответы - первые вхождения, как у одиночного поиска"""
+        generator = SearchingGenerator(min_len=50, max_len=200, queries=300)
+        cases = generator.generate_normal_cases(5)
+
+        for case in cases:
+            arr = case.input["array"]
+            targets = case.input["targets"]
+            assert len(targets) == 300 and len(case.expected) == 300
+            assert arr == sorted(arr)
+            for target, expected_idx in zip(targets, case.expected):
+                assert expected_idx == (arr.index(target) if target in arr else -1)
+
+        answers = [i for case in cases for i in case.expected]
+        assert -1 in answers and any(i >= 0 for i in answers)
+
+    def test_boundary_targets(self):
+        """Запросы включают границы массива и значения за ними"""
+        case = SearchingGenerator(queries=10).generate_normal_cases(1)[0]
+        arr = case.input["array"]
+
+        assert {arr[0] - 1, arr[0], arr[-1], arr[-1] + 1} <= set(case.input["targets"])
+
+    def test_numpy_matches_list(self):
+        """Ответы через np.searchsorted совпадают с ответами через bisect"""
+        pytest.importorskip("numpy")
+        cases = {
+            array_type: SearchingGenerator(
+                max_len=500, queries=1000, seed=4, array_type=array_type
+            ).generate_normal_cases(3)
+            for array_type in ("list", "numpy")
+        }
+
+        for plain, packed in zip(cases["list"], cases["numpy"]):
+            assert packed.expected.tolist() == plain.expected
+
+    def test_edge_case(self):
+        """Крайний случай с несколькими запросами добавляется при queries > 0"""
+        edge_cases = SearchingGenerator().generate_edge_cases()
+        assert not any("targets" in case.input for case in edge_cases)
+
+        edge_cases = SearchingGenerator(queries=5).generate_edge_cases()
+        case = next(case for case in edge_cases if "targets" in case.input)
+
+        assert case.expected[case.input["targets"].index(2)] == 1
@@ -0,0 +1,114 @@
+"""
+Тесты для сериализаторов JSON и YAML
+"""
+
+import json
+
+import pytest
+import yaml
+
+from src.generators.math_generator import MathGenerator
+from src.generators.sorting_generator import SortingGenerator
+from src.utils.exporter import Exporter
+from src.utils.serializers import (
+    JSON_SERIALIZERS,
+    YamlSerializer,
+    available_json_backends,
+    get_json_serializer,
+)
+
+
+DATA = [
+    {"input": [3, -1, 2], "expected": [-1, 2, 3], "description": "Тест", "weight": 1.5},
+    {"input": (0, 5), "expected": 5, "description": "НОД", "weight": 1.0},
+]
+
+
+class TestSerializers:
+    """Тесты для реализаций сериализаторов"""
+
+    @pytest.mark.parametrize("backend", available_json_backends())
+    def test_json_backends_roundtrip(self, backend):
+        """Тест что все доступные реализации дают корректный JSON"""
+        serializer = get_json_serializer(backend)
+        expected = json.loads(json.dumps(DATA))
+
+        assert json.loads(serializer.dumps(DATA)) == expected
+        assert json.loads(serializer.dumps(DATA, compact=True)) == expected
+
+    @pytest.mark.parametrize("backend", available_json_backends())
+    def test_json_backends_match_stdlib(self, backend):
+        """Тест что форматирование совпадает со стандартным модулем json"""
+        serializer = get_json_serializer(backend)
+
+        assert serializer.dumps(DATA) == json.dumps(DATA, indent=2, ensure_ascii=False)
+        assert "\n" not in serializer.dumps(DATA, compact=True)
+
+    @pytest.mark.parametrize("backend", available_json_backends())
+    def test_big_integers_fallback(self, backend):
+        """Тест чисел больше 64 бит"""
+        serializer = get_json_serializer(backend)
+        data = {"expected": 2**100}
+
+        assert json.loads(serializer.dumps(data)) == data
+
+    def test_auto_backend(self):
+        """Тест автоматического выбора реализации"""
+        serializer = get_json_serializer()
+        assert serializer.name == available_json_backends()[0]
+        assert "json" in available_json_backends()
+
+    def test_unknown_backend(self):
+        """Тест неизвестной реализации"""
+        with pytest.raises(ValueError):
+            get_json_serializer("simdjson")
+
+    def test_unavailable_backend(self):
+        """Тест неустановленной реализации"""
+        missing = [n for n, c in JSON_SERIALIZERS.items() if not c.available()]
+        if not missing:
+            pytest.skip("все реализации JSON установлены")
+        with pytest.raises(ValueError):
+            get_json_serializer(missing[0])
+
+    @pytest.mark.parametrize("use_libyaml", [False, True])
+    def test_yaml_roundtrip(self, use_libyaml):
+        """Тест YAML в обычном и компактном режимах"""
+        if use_libyaml and not hasattr(yaml, "CSafeDumper"):
+            pytest.skip("libyaml не установлен")
+        serializer = YamlSerializer(use_libyaml=use_libyaml)
+        expected = json.loads(json.dumps(DATA))
+
+        assert yaml.safe_load(serializer.dumps(DATA)) == expected
+        assert yaml.safe_load(serializer.dumps(DATA, compact=True)) == expected
+        assert "[3, -1, 2]" in serializer.dumps(DATA, compact=True)
+
+
+class TestExporterCompact:
+    """Тесты компактного экспорта"""
+
+    @pytest.mark.parametrize("fmt", ["json", "yaml"])
+    def test_compact_chunks_match_full_dump(self, fmt):
+        """Тест что компактные фрагменты совпадают с полной сериализацией"""
+        cases = SortingGenerator().generate_all(4) + MathGenerator().generate_all(3)
+
+        streamed = (
+            Exporter.header(fmt)
+            + Exporter.dumps_chunk(cases[:5], fmt, 0, compact=True)
+            + Exporter.dumps_chunk(cases[5:], fmt, 5, compact=True)
+            + Exporter.footer(fmt, len(cases), compact=True)
+        )
+        assert streamed == Exporter.dumps(cases, fmt, compact=True)
+
+    def test_compact_json_is_smaller(self, tmp_path):
+        """Тест что компактный JSON меньше и читается обратно"""
+        cases = SortingGenerator().generate_all(n_normal=5)
+        pretty, compact = tmp_path / "p.json", tmp_path / "c.json"
+
+        Exporter.to_json(cases, str(pretty))
+        Exporter.to_json(cases, str(compact), compact=True)
+
+        assert compact.stat().st_size < pretty.stat().st_size
+        assert json.loads(compact.read_text(encoding="utf-8")) == json.loads(
+            pretty.read_text(encoding="utf-8")
+        )
@@ -0,0 +1,139 @@
+"""
+Тесты для передачи массивов через общую память
+"""
+
+import os
+import pickle
+from array import array
+
+import pytest
+
+from src.generators.base_generator import BaseGenerator, TestCase
+from src.generators.searching_generator import SearchingGenerator
+from src.generators.sorting_generator import SortingGenerator
+from src.utils import columnar
+from src.utils.exporter import Exporter
+from src.utils.pipeline import Pipeline
+from src.utils.shared import SharedBlock, SharedSlice, share_cases
+
+
+class FailingGenerator(BaseGenerator):
+    """Генератор, падающий на втором фрагменте"""
+
+    def generate_normal_cases(self, n, start=0):
+        if start > 0:
+            raise RuntimeError("сбой генерации")
+        return [TestCase(input=i, expected=i, description="x") for i in range(n)]
+
+    def generate_edge_cases(self):
+        return []
+
+
+def shm_blocks():
+    """Имена блоков общей памяти в системе"""
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+class TestSharedCases:
+    """Тесты для share_cases и SharedBlock"""
+
+    def test_round_trip(self):
+        """Длинные массивы переносятся в блок, короткие остаются в случае"""
+        cases = [
+            TestCase(
+                input={"array": list(range(2000)), "target": 7},
+                expected=7,
+                description="поиск",
+            ),
+            TestCase(
+                input=array('q', range(-1500, 0)),
+                expected=list(range(-1500, 0)),
+                description="сортировка",
+            ),
+            TestCase(input=[3, 1], expected=[1, 3], description="короткий"),
+            TestCase(input=[2**70] * 2000, expected=0, description="вне int64"),
+        ]
+
+        name, shared = share_cases(cases, min_items=1000)
+        assert name is not None
+        assert isinstance(shared[0].input["array"], SharedSlice)
+        assert isinstance(shared[1].expected, SharedSlice)
+        assert shared[2].input == [3, 1]
+        assert shared[3].input == [2**70] * 2000
+
+        block, restored = SharedBlock.attach(name, pickle.loads(pickle.dumps(shared)))
+        assert isinstance(restored[1].input, memoryview)
+        assert restored[0].input["array"].tolist() == list(range(2000))
+        assert restored[1].input.tolist() == list(range(-1500, 0))
+        assert restored[1].expected.tolist() == list(range(-1500, 0))
+        assert restored[0].input["target"] == 7
+        block.release()
+
+        with pytest.raises(ValueError):
+            restored[1].input.tolist()
+
+    def test_nothing_to_share(self):
+        """Без длинных массивов блок не создается"""
+        cases = [TestCase(input=[1, 2], expected=[1, 2], description="x")]
+
+        name, shared = share_cases(cases)
+        assert name is None
+        assert SharedBlock.attach(name, shared) == (None, cases)
+
+
+class TestPipelineProcesses:
+    """Тесты для генерации в процессах"""
+
+    @pytest.mark.parametrize("array_type", ["list", "array"])
+    def test_matches_threads(self, tmp_path, array_type):
+        """Файлы совпадают с генерацией в потоках и блоки не остаются в системе"""
+        formats = ["json", "markdown"]
+        if columnar.available():
+            formats.append("parquet")
+        before = shm_blocks()
+
+        outputs = []
+        for processes in (0, 2):
+            generator = SortingGenerator(
+                min_len=1500, max_len=3000, array_type=array_type, seed=3
+            )
+            filename = str(tmp_path / f"suite_{processes}.json")
+            stats = Pipeline(
+                generator, fmt=formats, chunk_size=4, generator_processes=processes
+            ).run(15, filename)
+            assert stats.normal_cases == 15
+            outputs.append(filename)
+
+        names = [Exporter.output_names(name, formats) for name in outputs]
+        for fmt in formats:
+            with open(names[0][fmt], 'rb') as f, open(names[1][fmt], 'rb') as g:
+                assert f.read() == g.read(), fmt
+        assert shm_blocks() <= before
+
+    def test_searching_queries(self, tmp_path):
+        """Запросы и ответы поиска передаются вместе с массивом"""
+        filename = str(tmp_path / "suite.jsonl")
+        stats = Pipeline(
+            SearchingGenerator(min_len=2000, max_len=2000, queries=1500, seed=1),
+            fmt="jsonl",
+            chunk_size=3,
+            generator_processes=2,
+            validate=True,
+        ).run(6, filename)
+        assert stats.validation_errors == []
+
+        expected = str(tmp_path / "expected.jsonl")
+        Pipeline(
+            SearchingGenerator(min_len=2000, max_len=2000, queries=1500, seed=1),
+            fmt="jsonl",
+        ).run(6, expected)
+        with open(filename, 'rb') as f, open(expected, 'rb') as g:
+            assert f.read() == g.read()
+
+    def test_error_propagates(self, tmp_path):
+        """Ошибка в процессе генерации передается вызывающему"""
+        pipeline = Pipeline(
+            FailingGenerator(), fmt="jsonl", chunk_size=2, generator_processes=2
+        )
+        with pytest.raises(RuntimeError, match="сбой генерации"):
+            pipeline.run(10, str(tmp_path / "cases.jsonl"))
@@ -92,4 +92,39 @@ class TestSortingGenerator:
         
         for case in all_cases:
             if isinstance(case.expected, list):
-                assert case.expected == sorted(case.expected)
\ No newline at end of file
+                assert case.expected == sorted(case.expected)
+
+
+class TestStaticEdgeCases:
+    """Тесты для общей таблицы статических крайних случаев"""
+
+    def test_shared_table(self):
+        """Общие случаи строятся раз на класс, случайные - заново"""
+        first = SortingGenerator(seed=1).shared_edge_cases()
+        second = SortingGenerator(seed=2).shared_edge_cases()
+        assert all(a is b for a, b in zip(first[:5], second[:5]))
+        assert first[5].input != second[5].input
+        assert [tc.model_dump() for tc in first] == [
+            tc.model_dump() for tc in SortingGenerator(seed=1).generate_edge_cases()
+        ]
+
+    def test_shared_cases_frozen(self):
+        """Случаи таблицы нельзя изменить, новые случаи от нее не зависят"""
+        shared = SortingGenerator().shared_edge_cases()
+        with pytest.raises(ValueError, match="frozen"):
+            shared[0].description = "изменен"
+
+        cases = SortingGenerator.static_edge_cases()
+        cases[3].input.sort()
+        cases[0].description = "изменен"
+        assert shared[3].input == list(range(100, 0, -1))
+        assert cases[3] is not shared[3]
+
+    def test_subclass_without_table(self):
+        """Подкласс со своими крайними случаями получает их и в общем режиме"""
+
+        class Custom(SortingGenerator):
+            def generate_edge_cases(self):
+                return [TestCase(input=[2, 1], expected=[1, 2], is_edge_case=True)]
+
+        assert Custom().shared_edge_cases()[0].input == [2, 1]
@@ -0,0 +1,203 @@
+"""
+Тесты для генератора по декларативной спецификации
+"""
+
+import random
+
+import pytest
+
+from src.generators.spec_generator import ORACLES, ProblemSpec, SpecGenerator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+BACKENDS = [
+    False,
+    pytest.param(
+        True, marks=pytest.mark.skipif(numpy is None, reason="NumPy не установлен")
+    ),
+]
+
+SEARCH_SPEC = {
+    "name": "binary_search",
+    "input": {
+        "type": "object",
+        "fields": {
+            "array": {
+                "type": "array",
+                "length": {"min": 1, "max": 50},
+                "values": {"min": -100, "max": 100},
+                "unique": True,
+                "sorted": "asc",
+            },
+            "target": {
+                "type": "element_of",
+                "field": "array",
+                "probability": 0.5,
+                "otherwise": {"min": -100, "max": 100},
+            },
+        },
+    },
+    "expected": "index",
+    "edge_cases": [{"input": {"array": [], "target": 1}, "description": "Пусто"}],
+}
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+class TestSpecGenerator:
+    """Тесты для SpecGenerator"""
+
+    def test_array_constraints(self, use_numpy):
+        """Массивы соблюдают длину, диапазон, уникальность и порядок"""
+        generator = SpecGenerator(SEARCH_SPEC, use_numpy=use_numpy)
+        cases = generator.generate_normal_cases(200)
+
+        assert len(cases) == 200
+        for case in cases:
+            arr = case.input["array"]
+            assert 1 <= len(arr) <= 50
+            assert all(-100 <= x <= 100 for x in arr)
+            assert len(set(arr)) == len(arr)
+            assert arr == sorted(arr)
+            assert isinstance(arr[0], int)
+
+    def test_expected_from_oracle(self, use_numpy):
+        """Ожидаемый результат вычисляется эталонным решением"""
+        generator = SpecGenerator(SEARCH_SPEC, use_numpy=use_numpy)
+        found = 0
+
+        for case in generator.generate_normal_cases(200):
+            arr, target = case.input["array"], case.input["target"]
+            expected = arr.index(target) if target in arr else -1
+            assert case.expected == expected
+            found += expected != -1
+
+        assert 0 < found < 200
+
+    def test_distributions(self, use_numpy):
+        """Значения всех распределений остаются в пределах диапазона"""
+        for distribution in ("uniform", "normal", "log_uniform"):
+            spec = {
+                "name": "sum",
+                "input": {
+                    "type": "array",
+                    "length": 20,
+                    "values": {"min": 1, "max": 10 ** 6, "distribution": distribution},
+                },
+                "expected": "sum",
+            }
+            generator = SpecGenerator(spec, use_numpy=use_numpy)
+            for case in generator.generate_normal_cases(20):
+                assert len(case.input) == 20
+                assert all(1 <= x <= 10 ** 6 for x in case.input)
+                assert case.expected == sum(case.input)
+
+    def test_reproducible_with_seed(self, use_numpy):
+        """Одинаковое начальное значение дает одинаковые случаи"""
+        generator = SpecGenerator(SEARCH_SPEC, use_numpy=use_numpy)
+
+        random.seed(7)
+        first = [c.model_dump() for c in generator.generate_normal_cases(20)]
+        random.seed(7)
+        second = [c.model_dump() for c in generator.generate_normal_cases(20)]
+
+        assert first == second
+
+    def test_unique_from_narrow_distribution(self, use_numpy):
+        """Узкое распределение без нужного числа уникальных значений - ошибка"""
+        spec = {
+            "name": "narrow",
+            "input": {
+                "type": "object",
+                "fields": {
+                    "array": {
+                        "type": "array",
+                        "length": 20,
+                        "values": {
+                            "min": 0,
+                            "max": 100,
+                            "distribution": "normal",
+                            "std": 0.1,
+                        },
+                        "unique": True,
+                    },
+                },
+            },
+            "expected": "sum",
+        }
+        generator = SpecGenerator(spec, use_numpy=use_numpy)
+        with pytest.raises(ValueError, match="input.array"):
+            generator.generate_normal_cases(1)
+
+    def test_start_numbering(self, use_numpy):
+        """Нумерация описаний продолжается с start"""
+        generator = SpecGenerator(SEARCH_SPEC, use_numpy=use_numpy)
+        cases = generator.generate_normal_cases(2, start=10)
+        assert cases[0].description.startswith("Нормальный случай 11")
+
+
+class TestProblemSpec:
+    """Тесты для разбора спецификаций"""
+
+    def test_scalar_input_defaults_to_int(self):
+        """Входные данные без type считаются целым числом"""
+        spec = ProblemSpec(
+            name="fib", input={"min": 0, "max": 30}, expected="fibonacci"
+        )
+        generator = SpecGenerator(spec, use_numpy=False)
+
+        for case in generator.generate_normal_cases(10):
+            assert 0 <= case.input <= 30
+            assert case.expected == ORACLES["fibonacci"](case.input)
+
+    def test_edge_cases(self):
+        """Явные крайние случаи получают ожидаемый результат от эталона"""
+        generator = SpecGenerator(SEARCH_SPEC, use_numpy=False)
+        edge = generator.generate_edge_cases()
+
+        assert len(edge) == 1
+        assert edge[0].is_edge_case
+        assert edge[0].expected == -1
+
+    def test_tuple_input(self):
+        """Кортежи генерируются поэлементно"""
+        spec = {
+            "name": "gcd",
+            "input": {
+                "type": "tuple",
+                "items": [{"min": 1, "max": 100}, {"min": 1, "max": 100}],
+            },
+            "expected": "gcd",
+        }
+        for case in SpecGenerator(spec, use_numpy=False).generate_normal_cases(10):
+            a, b = case.input
+            assert case.expected == ORACLES["gcd"]((a, b))
+
+    def test_invalid_specs(self):
+        """Противоречивые спецификации отклоняются"""
+        with pytest.raises(ValueError):
+            SpecGenerator(
+                {"name": "x", "input": {"min": 5, "max": 1}, "expected": "sum"}
+            )
+        with pytest.raises(ValueError):
+            SpecGenerator({"name": "x", "input": {"min": 1}, "expected": "unknown"})
+        with pytest.raises(ValueError):
+            SpecGenerator({
+                "name": "x",
+                "input": {
+                    "type": "array",
+                    "length": 20,
+                    "values": {"min": 0, "max": 5},
+                    "unique": True,
+                },
+                "expected": "sum",
+            })
+
+    def test_spec_from_yaml_file(self):
+        """Загрузка спецификации из примера"""
+        generator = SpecGenerator("examples/binary_search_spec.yaml")
+        cases = generator.generate_all(n_normal=5)
+        assert len(cases) == 5 + len(generator.spec.edge_cases)
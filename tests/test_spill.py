@@ -0,0 +1,97 @@
+"""
+Тесты для массивов, выгруженных на диск
+"""
+
+import json
+import os
+import random
+
+import pytest
+
+from src.generators import spill
+from src.generators.sorting_generator import SortingGenerator
+from src.generators.spill import SpillStore, SpilledArray, external_sort
+from src.utils.exporter import Exporter
+from src.utils.validator import Validator
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Хранилище с минимальным лимитом памяти (серии по 16384 элемента)"""
+    with SpillStore(str(tmp_path), memory_limit=1 << 20) as s:
+        yield s
+
+
+class TestSpilledArray:
+    """Тесты для SpilledArray и внешней сортировки"""
+
+    def test_round_trip(self, store):
+        """Фрагменты записываются и читаются без изменений"""
+        values = [random.randint(-10**12, 10**12) for _ in range(5000)]
+        arr = SpilledArray.from_chunks(store.new_path(), [values[:100], values[100:]])
+
+        assert len(arr) == 5000
+        assert arr.to_list() == values
+        assert arr == values
+
+    @pytest.mark.parametrize("length", [0, 1, 1000, 50000])
+    def test_external_sort(self, store, length):
+        """Внешняя сортировка совпадает со встроенной"""
+        values = [random.randint(-1000, 1000) for _ in range(length)]
+        arr = SpilledArray.from_chunks(store.new_path(), [values])
+
+        result = external_sort(arr, store)
+        assert result.to_list() == sorted(values)
+        assert result.is_sorted()
+
+    def test_merge_without_numpy(self, store, monkeypatch):
+        """Сортировка серий работает и без NumPy"""
+        monkeypatch.setattr(spill, "np", None)
+        values = [random.randint(0, 100) for _ in range(40000)]
+        arr = SpilledArray.from_chunks(store.new_path(), [values])
+        assert external_sort(arr, store).to_list() == sorted(values)
+
+    def test_store_cleanup(self, tmp_path):
+        """Временный каталог удаляется при закрытии"""
+        with SpillStore(str(tmp_path)) as s:
+            path = s.path
+            SpilledArray.from_chunks(s.new_path(), [[1, 2, 3]])
+        assert not os.path.exists(path)
+
+
+class TestStressCase:
+    """Тесты для огромных случаев сортировки"""
+
+    def test_stress_case_valid(self, store):
+        """Случай проходит проверку Validator"""
+        case = SortingGenerator().generate_stress_case(40000, store)
+
+        assert isinstance(case.input, SpilledArray)
+        assert Validator.validate_test_cases([case]) == (True, [])
+
+    def test_stress_case_seed(self, store):
+        """Стресс-тест с seed не зависит от глобального random"""
+        random.seed(1)
+        first = SortingGenerator(seed=5).generate_stress_case(20000, store)
+        random.seed(2)
+        second = SortingGenerator(seed=5).generate_stress_case(20000, store)
+        third = SortingGenerator(seed=6).generate_stress_case(20000, store)
+
+        assert first.input == second.input.to_list()
+        assert first.input != third.input.to_list()
+
+    @pytest.mark.parametrize("fmt", ["json", "jsonl"])
+    def test_export_streams(self, store, tmp_path, fmt):
+        """Экспорт записывает выгруженные массивы как обычный JSON"""
+        case = SortingGenerator().generate_stress_case(20000, store, 0, 99)
+        path = str(tmp_path / f"stress.{fmt}")
+        Exporter.export([case], path, fmt)
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f) if fmt == "json" else json.loads(f.readline())
+        if fmt == "json":
+            data = data[0]
+
+        assert data["input"] == case.input.to_list()
+        assert data["expected"] == sorted(data["input"])
+        assert data["description"] == case.description
@@ -96,7 +96,27 @@ class TestValidator:
         
         assert not is_valid
         assert len(errors) == 2
-    
+
+    def test_validate_multi_query_cases(self):
+        """Тест валидации случаев с несколькими запросами"""
+        data = {"array": [1, 2, 2, 5], "targets": [2, 5, 3]}
+        test_cases = [
+            TestCase(input=data, expected=[1, 3, -1], description="Корректный"),
+            TestCase(input=data, expected=[2, 3, -1], description="Не первое"),
+            TestCase(input=data, expected=[1, 3], description="Не хватает ответов"),
+            TestCase(
+                input={"array": [3, 1], "targets": [1]},
+                expected=[1],
+                description="Массив не отсортирован",
+            ),
+        ]
+
+        is_valid, errors = Validator.validate_test_cases(test_cases)
+
+        assert not is_valid
+        assert len(errors) == 3
+        assert "запрос 0 (2)" in errors[0]
+
     def test_find_duplicates(self):
         """Тест поиска дубликатов"""
         test_cases = [